@@ -4,15 +4,18 @@ IRP Dashboard Web Application
 FastAPI-based dynamic dashboard for viewing batch and cycle data
 """
 
+import asyncio
+import json
 import os
 import sys
+import time
 import traceback
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator, Set
 
-import pandas as pd
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
@@ -20,23 +23,44 @@ from fastapi.templating import Jinja2Templates
 workspace_path = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(workspace_path))
 
-from helpers import database as db
 from helpers.constants import BatchType
 
+sys.path.insert(0, str(Path(__file__).parent))
+from dashboard_data import DashboardData, Subscription, BATCH_CACHE_TTL, CYCLE_CACHE_TTL
+
 
 # ============================================================================
 # APPLICATION SETUP
 # ============================================================================
 
+dashboard_data = DashboardData()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the database pool and batch status listener for the app's lifetime"""
+    await dashboard_data.start()
+    try:
+        yield
+    finally:
+        await dashboard_data.stop()
+
+
 app = FastAPI(
     title="IRP Dashboard",
     description="Interactive dashboard for IRP Notebook Framework batch and cycle data",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Get default schema from environment
 DEFAULT_SCHEMA = os.getenv('DB_SCHEMA', 'demo')
 
+# Live progress streams: batch counts are re-read at most this often, and an SSE
+# comment is sent after this long without events so proxies keep the stream open
+PROGRESS_SUMMARY_INTERVAL = float(os.getenv('DASHBOARD_PROGRESS_SUMMARY_INTERVAL', '2'))
+PROGRESS_KEEPALIVE_INTERVAL = float(os.getenv('DASHBOARD_PROGRESS_KEEPALIVE_INTERVAL', '15'))
+
 # Setup static files and templates
 BASE_DIR = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
@@ -47,7 +71,7 @@ templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
 # DATA SERVICE FUNCTIONS
 # ============================================================================
 
-def get_available_schemas() -> List[str]:
+async def get_available_schemas() -> List[str]:
     """Get list of schemas in the database that contain IRP tables"""
     try:
         query = """
@@ -56,14 +80,13 @@ def get_available_schemas() -> List[str]:
             WHERE table_name = 'irp_cycle'
             ORDER BY table_schema
         """
-        df = db.execute_query(query)
-        return df['table_schema'].tolist() if not df.empty else []
+        return [row['table_schema'] for row in await dashboard_data.fetch(query)]
     except Exception as e:
         print(f"Error getting schemas: {e}")
         return [DEFAULT_SCHEMA]
 
 
-def get_cycle_list(schema: str) -> List[Dict[str, Any]]:
+async def get_cycle_list(schema: str) -> List[Dict[str, Any]]:
     """Get list of all cycles in a schema"""
     query = f"""
         SELECT
@@ -77,22 +100,13 @@ def get_cycle_list(schema: str) -> List[Dict[str, Any]]:
             CASE WHEN status = 'ACTIVE' THEN 0 ELSE 1 END,
             created_ts DESC
     """
-    df = db.execute_query(query)
-
-    if df.empty:
-        return []
-
-    # Convert timestamps to strings to avoid NaT issues in templates
-    cycles = df.to_dict('records')
-    for cycle in cycles:
-        cycle['created_ts'] = format_timestamp(cycle.get('created_ts'))
-        cycle['archived_ts'] = format_timestamp(cycle.get('archived_ts'))
+    return await dashboard_data.cached(
+        ('cycles', schema), CYCLE_CACHE_TTL, lambda: dashboard_data.fetch(query)
+    )
 
-    return cycles
 
-
-def get_current_cycle(schema: str) -> Optional[Dict[str, Any]]:
-    """Get the current (most recent active) cycle"""
+async def get_current_cycle(schema: str) -> Optional[Dict[str, Any]]:
+    """Get the current (most recent active) cycle, or the most recent cycle if none is active"""
     query = f"""
         SELECT
             id,
@@ -100,30 +114,15 @@ def get_current_cycle(schema: str) -> Optional[Dict[str, Any]]:
             status,
             created_ts
         FROM {schema}.irp_cycle
-        WHERE status = 'ACTIVE'
-        ORDER BY created_ts DESC
+        ORDER BY
+            CASE WHEN status = 'ACTIVE' THEN 0 ELSE 1 END,
+            created_ts DESC
         LIMIT 1
     """
-    df = db.execute_query(query)
-
-    # If no active cycle, get most recent cycle
-    if df.empty:
-        query = f"""
-            SELECT
-                id,
-                cycle_name,
-                status,
-                created_ts
-            FROM {schema}.irp_cycle
-            ORDER BY created_ts DESC
-            LIMIT 1
-        """
-        df = db.execute_query(query)
+    return await dashboard_data.fetchrow(query)
 
-    return df.to_dict('records')[0] if not df.empty else None
 
-
-def get_cycle_batches(cycle_name: str, schema: str) -> List[Dict[str, Any]]:
+async def get_cycle_batches(cycle_name: str, schema: str) -> List[Dict[str, Any]]:
     """Get all batches for a cycle with summary statistics"""
     # Use schema-qualified view name
     query = f"""
@@ -152,18 +151,20 @@ def get_cycle_batches(cycle_name: str, schema: str) -> List[Dict[str, Any]]:
         JOIN {schema}.irp_cycle c ON cfg.cycle_id = c.id
         JOIN {schema}.irp_step s ON vb.step_id = s.id
         JOIN {schema}.irp_stage st ON s.stage_id = st.id
-        WHERE c.cycle_name = %s
+        WHERE c.cycle_name = $1
         ORDER BY vb.batch_id
     """
-    df = db.execute_query(query, (cycle_name,))
-    return df.to_dict('records') if not df.empty else []
+    return await dashboard_data.cached(
+        ('cycle_batches', schema, cycle_name), CYCLE_CACHE_TTL,
+        lambda: dashboard_data.fetch(query, cycle_name)
+    )
 
 
-def query_batch_data(batch_id: int, schema: str) -> Optional[Dict[str, Any]]:
+async def query_batch_data(batch_id: int, schema: str) -> Optional[Dict[str, Any]]:
     """Query all data for a specific batch (ported from generate_dashboards.py)"""
 
     # Get batch summary using v_irp_batch view for reporting_status
-    summary_df = db.execute_query(f"""
+    summary_query = f"""
         SELECT
             vb.batch_id,
             vb.batch_type,
@@ -175,39 +176,26 @@ def query_batch_data(batch_id: int, schema: str) -> Optional[Dict[str, Any]]:
             vb.created_ts,
             vb.submitted_ts,
             vb.completed_ts,
-            vb.total_configs,
-            vb.non_skipped_configs as active_configs,
-            vb.fulfilled_configs,
-            vb.unfulfilled_configs,
-            vb.skipped_configs,
-            vb.total_jobs,
-            vb.finished_jobs,
-            vb.skipped_jobs,
-            (vb.total_jobs - COALESCE(vb.skipped_jobs, 0)) as active_jobs,
-            (vb.total_jobs - COALESCE(vb.finished_jobs, 0) - COALESCE(vb.skipped_jobs, 0)) as unfinished_jobs
+            vb.total_configs::INT,
+            vb.non_skipped_configs::INT as active_configs,
+            vb.fulfilled_configs::INT,
+            vb.unfulfilled_configs::INT,
+            vb.skipped_configs::INT,
+            vb.total_jobs::INT,
+            vb.finished_jobs::INT,
+            vb.skipped_jobs::INT,
+            (vb.total_jobs - COALESCE(vb.skipped_jobs, 0))::INT as active_jobs,
+            (vb.total_jobs - COALESCE(vb.finished_jobs, 0) - COALESCE(vb.skipped_jobs, 0))::INT as unfinished_jobs
         FROM {schema}.v_irp_batch vb
         JOIN {schema}.irp_configuration cfg ON vb.configuration_id = cfg.id
         JOIN {schema}.irp_cycle c ON cfg.cycle_id = c.id
         JOIN {schema}.irp_step s ON vb.step_id = s.id
         JOIN {schema}.irp_stage st ON s.stage_id = st.id
-        WHERE vb.batch_id = %s
-    """, (batch_id,))
-
-    if summary_df.empty:
-        return None
-
-    summary = summary_df.to_dict('records')[0]
-
-    # Convert numeric fields to integers
-    int_fields = ['total_configs', 'active_configs', 'fulfilled_configs', 'unfulfilled_configs',
-                  'skipped_configs', 'total_jobs', 'finished_jobs', 'skipped_jobs',
-                  'active_jobs', 'unfinished_jobs']
-    for field in int_fields:
-        if field in summary and summary[field] is not None and not pd.isna(summary[field]):
-            summary[field] = int(summary[field])
+        WHERE vb.batch_id = $1
+    """
 
     # Get jobs
-    jobs_df = db.execute_query(f"""
+    jobs_query = f"""
         SELECT
             j.id,
             j.moodys_workflow_id,
@@ -215,7 +203,7 @@ def query_batch_data(batch_id: int, schema: str) -> Optional[Dict[str, Any]]:
             j.skipped,
             j.report_status,
             j.next_best_action,
-            j.age_hours,
+            j.age_hours::FLOAT,
             j.is_successful,
             j.needs_attention,
             j.parent_job_id,
@@ -232,59 +220,172 @@ def query_batch_data(batch_id: int, schema: str) -> Optional[Dict[str, Any]]:
         FROM {schema}.v_irp_job j
         LEFT JOIN {schema}.irp_job_configuration jc ON j.job_configuration_id = jc.id
         LEFT JOIN {schema}.irp_job parent_j ON j.parent_job_id = parent_j.id
-        WHERE j.batch_id = %s
+        WHERE j.batch_id = $1
         ORDER BY j.id
-    """, (batch_id,))
-
-    jobs = jobs_df.to_dict('records')
-
-    # Convert numeric fields to integers for each job
-    job_int_fields = ['id', 'job_configuration_id', 'parent_job_id']
-    for job in jobs:
-        for field in job_int_fields:
-            if field in job and job[field] is not None and not pd.isna(job[field]):
-                job[field] = int(job[field])
+    """
 
     # Get configurations with active job details
-    configs_df = db.execute_query(f"""
+    configs_query = f"""
         SELECT
             jc.id as config_id,
             jc.job_configuration_data,
             jc.skipped,
             jc.overridden,
             vjc.config_report_status,
-            vjc.total_jobs,
-            vjc.unsubmitted_jobs,
-            vjc.finished_jobs,
-            vjc.failed_jobs,
-            vjc.cancelled_jobs,
-            vjc.error_jobs,
-            vjc.progress_percent,
+            vjc.total_jobs::INT,
+            vjc.unsubmitted_jobs::INT,
+            vjc.finished_jobs::INT,
+            vjc.failed_jobs::INT,
+            vjc.cancelled_jobs::INT,
+            vjc.error_jobs::INT,
+            vjc.progress_percent::FLOAT,
             vjc.has_failures,
             vjc.has_errors,
             vjc.has_unsubmitted,
-            (vjc.total_jobs - vjc.finished_jobs - vjc.failed_jobs - vjc.cancelled_jobs) as active_jobs
+            (vjc.total_jobs - vjc.finished_jobs - vjc.failed_jobs - vjc.cancelled_jobs)::INT as active_jobs
         FROM {schema}.v_irp_job_configuration vjc
         JOIN {schema}.irp_job_configuration jc ON vjc.job_configuration_id = jc.id
-        WHERE vjc.batch_id = %s
+        WHERE vjc.batch_id = $1
         ORDER BY jc.id
-    """, (batch_id,))
+    """
 
-    configs = configs_df.to_dict('records')
+    async def load():
+        # The three page queries run concurrently on separate pooled connections
+        summary, jobs, configs = await asyncio.gather(
+            dashboard_data.fetchrow(summary_query, batch_id),
+            dashboard_data.fetch(jobs_query, batch_id),
+            dashboard_data.fetch(configs_query, batch_id)
+        )
+        if summary is None:
+            return None
+        return {
+            'summary': summary,
+            'jobs': jobs,
+            'configs': configs
+        }
 
-    # Convert numeric fields to integers for each config
-    config_int_fields = ['config_id', 'total_jobs', 'unsubmitted_jobs', 'finished_jobs',
-                        'failed_jobs', 'cancelled_jobs', 'error_jobs', 'active_jobs']
-    for config in configs:
-        for field in config_int_fields:
-            if field in config and config[field] is not None and not pd.isna(config[field]):
-                config[field] = int(config[field])
+    return await dashboard_data.cached(('batch', schema, batch_id), BATCH_CACHE_TTL, load)
 
-    return {
-        'summary': summary,
-        'jobs': jobs,
-        'configs': configs
-    }
+
+async def get_cycle_batch_ids(cycle_name: str, schema: str) -> Set[int]:
+    """Get the ids of all batches in a cycle"""
+    query = f"""
+        SELECT b.id
+        FROM {schema}.irp_batch b
+        JOIN {schema}.irp_configuration cfg ON b.configuration_id = cfg.id
+        JOIN {schema}.irp_cycle c ON cfg.cycle_id = c.id
+        WHERE c.cycle_name = $1
+    """
+    return {row['id'] for row in await dashboard_data.fetch(query, cycle_name)}
+
+
+async def get_batch_progress(batch_ids: List[int], schema: str) -> List[Dict[str, Any]]:
+    """Get the progress counters shown on the cycle and batch pages for a set of batches"""
+    query = f"""
+        SELECT
+            vb.batch_id,
+            vb.batch_status,
+            vb.reporting_status,
+            vb.completed_ts,
+            vb.total_configs::INT,
+            vb.non_skipped_configs::INT as active_configs,
+            vb.fulfilled_configs::INT,
+            vb.unfulfilled_configs::INT,
+            vb.skipped_configs::INT,
+            vb.total_jobs::INT,
+            vb.finished_jobs::INT,
+            vb.failed_jobs::INT,
+            vb.error_jobs::INT,
+            vb.skipped_jobs::INT,
+            (vb.total_jobs - COALESCE(vb.skipped_jobs, 0))::INT as active_jobs,
+            (vb.total_jobs - COALESCE(vb.finished_jobs, 0) - COALESCE(vb.skipped_jobs, 0))::INT as unfinished_jobs
+        FROM {schema}.v_irp_batch vb
+        WHERE vb.batch_id = ANY($1::INT[])
+        ORDER BY vb.batch_id
+    """
+    return await dashboard_data.fetch(query, list(batch_ids))
+
+
+# ============================================================================
+# LIVE PROGRESS (SERVER-SENT EVENTS)
+# ============================================================================
+
+def format_sse(event: str, data: Any) -> str:
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def stream_progress(
+    request: Request,
+    subscription: Subscription,
+    schema: str,
+    batch_ids: Set[int],
+    include_jobs: bool,
+    cycle_name: Optional[str] = None
+) -> AsyncIterator[str]:
+    """
+    Push progress for the subscribed batches until the client disconnects.
+
+    - 'job' events: one per job status change (batch streams only)
+    - 'batch' events: refreshed batch counters, coalesced to one read of v_irp_batch
+      per PROGRESS_SUMMARY_INTERVAL however many jobs changed
+    - 'resync' event: the client fell behind, or a new batch appeared in the cycle;
+      the client should reload the page
+    """
+    try:
+        for progress in await get_batch_progress(sorted(batch_ids), schema):
+            yield format_sse('batch', progress)
+
+        dirty: Set[int] = set()
+        other_batches: Set[int] = set()
+        last_summary = last_sent = time.monotonic()
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(subscription.get(), timeout=PROGRESS_SUMMARY_INTERVAL)
+            except asyncio.TimeoutError:
+                event = None
+
+            if event is not None:
+                if event['type'] == 'resync':
+                    yield format_sse('resync', {})
+                    return
+
+                batch_id = event.get('batch_id')
+                if batch_id not in batch_ids:
+                    # Cycle streams watch the whole schema; a batch created in this cycle
+                    # after the page loaded has no row to update
+                    if cycle_name is None or batch_id in other_batches:
+                        continue
+                    if batch_id in await get_cycle_batch_ids(cycle_name, schema):
+                        yield format_sse('resync', {})
+                        return
+                    other_batches.add(batch_id)
+                    continue
+
+                dirty.add(batch_id)
+                if include_jobs and event['type'] == 'job':
+                    yield format_sse('job', event)
+                    last_sent = time.monotonic()
+
+            now = time.monotonic()
+            if dirty and now - last_summary >= PROGRESS_SUMMARY_INTERVAL:
+                for progress in await get_batch_progress(sorted(dirty), schema):
+                    yield format_sse('batch', progress)
+                dirty.clear()
+                last_summary = last_sent = now
+            elif now - last_sent >= PROGRESS_KEEPALIVE_INTERVAL:
+                yield ": keepalive\n\n"
+                last_sent = now
+    finally:
+        dashboard_data.events.unsubscribe(subscription)
+
+
+def progress_response(generator: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(
+        generator,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 # ============================================================================
@@ -318,7 +419,6 @@ def format_error_details(exc: Exception) -> Dict[str, str]:
 
 def format_timestamp(ts):
     """Format timestamp for display in Eastern Time"""
-    import pandas as pd
     from zoneinfo import ZoneInfo
     from datetime import timezone
 
@@ -326,9 +426,6 @@ def format_timestamp(ts):
         return 'N/A'
     if isinstance(ts, str):
         return ts
-    # Handle pandas NaT (Not a Time)
-    if pd.isna(ts):
-        return 'N/A'
     try:
         # Convert to Eastern Time
         eastern = ZoneInfo('America/New_York')
@@ -356,9 +453,11 @@ async def root(request: Request):
 async def home(request: Request, schema: str):
     """Home page with cycle selector"""
     try:
-        cycles = get_cycle_list(schema)
-        current_cycle = get_current_cycle(schema)
-        available_schemas = get_available_schemas()
+        cycles, current_cycle, available_schemas = await asyncio.gather(
+            get_cycle_list(schema),
+            get_current_cycle(schema),
+            get_available_schemas()
+        )
 
         return templates.TemplateResponse(
             "home.html",
@@ -368,7 +467,8 @@ async def home(request: Request, schema: str):
                 "cycles": cycles,
                 "current_cycle": current_cycle,
                 "available_schemas": available_schemas,
-                "error": None
+                "error": None,
+                "format_timestamp": format_timestamp
             }
         )
     except Exception as e:
@@ -390,7 +490,7 @@ async def home(request: Request, schema: str):
 async def cycle_dashboard(request: Request, schema: str, cycle_name: str):
     """Cycle dashboard showing all batches"""
     try:
-        batches = get_cycle_batches(cycle_name, schema)
+        batches = await get_cycle_batches(cycle_name, schema)
 
         return templates.TemplateResponse(
             "cycle_dashboard.html",
@@ -421,7 +521,7 @@ async def cycle_dashboard(request: Request, schema: str, cycle_name: str):
 async def batch_detail(request: Request, schema: str, cycle_name: str, batch_id: int):
     """Batch detail page showing jobs and configurations"""
     try:
-        data = query_batch_data(batch_id, schema)
+        data = await query_batch_data(batch_id, schema)
 
         if not data:
             raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found in schema '{schema}'")
@@ -461,6 +561,30 @@ async def batch_detail(request: Request, schema: str, cycle_name: str, batch_id:
         )
 
 
+@app.get("/api/{schema}/batch/{batch_id}/events")
+async def batch_events(request: Request, schema: str, batch_id: int):
+    """Live progress stream for one batch: job status deltas plus batch counters"""
+    if not dashboard_data.live:
+        raise HTTPException(status_code=503, detail="Live progress unavailable (no database notifications)")
+
+    # Subscribe before the initial snapshot so no change falls between the two
+    subscription = dashboard_data.events.subscribe(schema, [batch_id])
+    return progress_response(stream_progress(request, subscription, schema, {batch_id}, include_jobs=True))
+
+
+@app.get("/api/{schema}/cycle/{cycle_name}/events")
+async def cycle_events(request: Request, schema: str, cycle_name: str):
+    """Live progress stream for every batch in a cycle: batch counters only"""
+    if not dashboard_data.live:
+        raise HTTPException(status_code=503, detail="Live progress unavailable (no database notifications)")
+
+    batch_ids = await get_cycle_batch_ids(cycle_name, schema)
+    subscription = dashboard_data.events.subscribe(schema)
+    return progress_response(
+        stream_progress(request, subscription, schema, batch_ids, include_jobs=False, cycle_name=cycle_name)
+    )
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint with database info and view verification"""
@@ -474,28 +598,29 @@ async def health_check():
             "schema": os.getenv("DB_SCHEMA", DEFAULT_SCHEMA)
         },
         "connection": "unknown",
-        "views": {}
+        "views": {},
+        "cache": dashboard_data.cache.stats(),
+        "live_progress": {"enabled": dashboard_data.live, **dashboard_data.events.stats()}
     }
 
     try:
         # Test database connection
-        db.execute_query("SELECT 1")
+        await dashboard_data.fetchrow("SELECT 1")
         health_status["connection"] = "connected"
 
         # Check for required views in the schema
         schema = os.getenv("DB_SCHEMA", DEFAULT_SCHEMA)
         required_views = ['v_irp_batch', 'v_irp_job', 'v_irp_job_configuration']
 
-        view_check_query = f"""
+        view_check_query = """
             SELECT table_name
             FROM information_schema.tables
-            WHERE table_schema = '{schema}'
+            WHERE table_schema = $1
             AND table_type = 'VIEW'
             AND table_name IN ('v_irp_batch', 'v_irp_job', 'v_irp_job_configuration')
         """
 
-        views_df = db.execute_query(view_check_query)
-        existing_views = views_df['table_name'].tolist() if not views_df.empty else []
+        existing_views = [row['table_name'] for row in await dashboard_data.fetch(view_check_query, schema)]
 
         for view in required_views:
             health_status["views"][view] = {
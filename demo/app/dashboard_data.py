@@ -0,0 +1,304 @@
+"""
+IRP Dashboard data layer
+
+Async, pooled access to the IRP database for the dashboard app:
+- asyncpg connection pool (no event-loop blocking, no connection per query)
+- Results returned as typed records (ints, datetimes, decoded JSONB) without per-row conversion
+- Short-TTL cache for cycle/batch pages with single-flight loading, so many viewers
+  of the same batch share one set of queries
+- Cache invalidation on batch and job status changes via PostgreSQL LISTEN/NOTIFY
+  (channels irp_batch_status / irp_job_status, raised by triggers in helpers/db/reporting_views.sql);
+  the listener reconnects with backoff and clears the cache after a gap
+- Fan-out of those notifications to live progress streams (server-sent events)
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Set
+
+import asyncpg
+
+
+BATCH_STATUS_CHANNEL = 'irp_batch_status'
+JOB_STATUS_CHANNEL = 'irp_job_status'
+
+POOL_MIN_SIZE = int(os.getenv('DASHBOARD_POOL_MIN_SIZE', '2'))
+POOL_MAX_SIZE = int(os.getenv('DASHBOARD_POOL_MAX_SIZE', '10'))
+CYCLE_CACHE_TTL = float(os.getenv('DASHBOARD_CYCLE_CACHE_TTL', '10'))
+BATCH_CACHE_TTL = float(os.getenv('DASHBOARD_BATCH_CACHE_TTL', '5'))
+EVENT_QUEUE_SIZE = int(os.getenv('DASHBOARD_EVENT_QUEUE_SIZE', '1000'))
+LISTENER_RETRY_MIN = float(os.getenv('DASHBOARD_LISTENER_RETRY_MIN', '1'))
+LISTENER_RETRY_MAX = float(os.getenv('DASHBOARD_LISTENER_RETRY_MAX', '30'))
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class TTLCache:
+    """
+    In-process TTL cache with single-flight loading.
+
+    Concurrent requests for the same missing key await one loader call instead
+    of each running the queries. If that call is cancelled (e.g. the client that
+    started it disconnected), the waiting requests start a new load.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Hashable, tuple] = {}
+        self._loading: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_load(self, key: Hashable, ttl: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, loading it (once) if missing or expired."""
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+
+            pending = self._loading.get(key)
+            if pending is None:
+                break
+            try:
+                value = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The load we were waiting on was cancelled, not this request
+                continue
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            value = await loader()
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure does not log "exception never retrieved"
+            future.exception()
+            raise
+        except BaseException:
+            # Cancelled (or interpreter exit): wake the waiters so they do not hang
+            future.cancel()
+            raise
+        else:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            future.set_result(value)
+            return value
+        finally:
+            if self._loading.get(key) is future:
+                del self._loading[key]
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every cached key matching predicate; returns the number dropped."""
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# ============================================================================
+# LIVE EVENTS
+# ============================================================================
+
+class Subscription:
+    """
+    One live progress stream's view of the event broker.
+
+    Events are queued per subscriber. A subscriber that falls behind by more than
+    the queue size gets a single 'resync' event instead of an unbounded backlog;
+    it should reload the page (or snapshot) and reconnect.
+    """
+
+    def __init__(self, schema: str, batch_ids: Optional[Iterable[int]], maxsize: int = EVENT_QUEUE_SIZE):
+        self.schema = schema
+        self.batch_ids: Optional[Set[int]] = set(batch_ids) if batch_ids is not None else None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def matches(self, schema: str, batch_id: Optional[int]) -> bool:
+        return schema == self.schema and (self.batch_ids is None or batch_id in self.batch_ids)
+
+    def put(self, event: Dict[str, Any]) -> None:
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({'type': 'resync'})
+
+    async def get(self) -> Dict[str, Any]:
+        return await self.queue.get()
+
+
+class EventBroker:
+    """Routes batch/job notifications to the subscriptions watching that schema and batch."""
+
+    def __init__(self):
+        self._subscriptions: Set[Subscription] = set()
+        self.published = 0
+
+    def subscribe(self, schema: str, batch_ids: Optional[Iterable[int]] = None) -> Subscription:
+        """Subscribe to events for batch_ids in schema (all batches in the schema when None)."""
+        subscription = Subscription(schema, batch_ids)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    def publish(self, schema: str, batch_id: Optional[int], event: Dict[str, Any]) -> None:
+        self.published += 1
+        for subscription in list(self._subscriptions):
+            if subscription.matches(schema, batch_id):
+                subscription.put(event)
+
+    def resync(self) -> None:
+        """Tell every subscriber to reload (events may have been missed)."""
+        for subscription in list(self._subscriptions):
+            subscription.put({'type': 'resync'})
+
+    def stats(self) -> Dict[str, int]:
+        return {'subscribers': len(self._subscriptions), 'published': self.published}
+
+
+# ============================================================================
+# DATABASE
+# ============================================================================
+
+def _connect_kwargs() -> Dict[str, Any]:
+    return {
+        'host': os.getenv('DB_SERVER'),
+        'port': int(os.getenv('DB_PORT', '5432')),
+        'database': os.getenv('DB_NAME'),
+        'user': os.getenv('DB_USER'),
+        'password': os.getenv('DB_PASSWORD'),
+    }
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Decode JSON/JSONB columns to Python objects (matching psycopg2 behavior)."""
+    for type_name in ('json', 'jsonb'):
+        await conn.set_type_codec(
+            type_name, encoder=json.dumps, decoder=json.loads, schema='pg_catalog'
+        )
+
+
+class DashboardData:
+    """Owns the connection pool, the page cache, the notification listener and the event broker."""
+
+    def __init__(self):
+        self.pool: Optional[asyncpg.Pool] = None
+        self.cache = TTLCache()
+        self.events = EventBroker()
+        self._listener: Optional[asyncpg.Connection] = None
+        self._listen_task: Optional[asyncio.Task] = None
+
+    @property
+    def live(self) -> bool:
+        """True when notifications are being received (live progress streams are available)."""
+        return self._listener is not None and not self._listener.is_closed()
+
+    async def start(self) -> None:
+        self.pool = await asyncpg.create_pool(
+            min_size=POOL_MIN_SIZE, max_size=POOL_MAX_SIZE, init=_init_connection, **_connect_kwargs()
+        )
+        self._listen_task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except asyncio.CancelledError:
+                pass
+            self._listen_task = None
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    async def _listen(self) -> None:
+        """
+        Keep the status listener connected, reconnecting with backoff when it drops.
+
+        While disconnected the cache still expires by TTL and live streams are disabled.
+        Notifications sent in the gap are lost, so each (re)connect clears the cache
+        and tells live streams to resync.
+        """
+        delay = LISTENER_RETRY_MIN
+        while True:
+            listener = None
+            try:
+                listener = await asyncpg.connect(**_connect_kwargs())
+                lost = asyncio.Event()
+                listener.add_termination_listener(lambda connection: lost.set())
+                await listener.add_listener(BATCH_STATUS_CHANNEL, self._on_batch_status)
+                await listener.add_listener(JOB_STATUS_CHANNEL, self._on_job_status)
+                self._listener = listener
+                self.cache.clear()
+                self.events.resync()
+                delay = LISTENER_RETRY_MIN
+                await lost.wait()
+                print("Status listener connection lost, reconnecting")
+            except Exception as e:
+                print(f"Status listener unavailable, retrying in {delay:.0f}s: {e}")
+            finally:
+                self._listener = None
+                if listener is not None and not listener.is_closed():
+                    listener.terminate()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, LISTENER_RETRY_MAX)
+
+    def _invalidate_batch(self, schema: str, batch_id: Optional[int]) -> None:
+        """Invalidate cached pages for the batch (and its schema's cycle pages)."""
+        self.cache.invalidate(
+            lambda key: key[1] == schema and (
+                key[0] == 'cycle_batches' or (key[0] == 'batch' and key[2] == batch_id)
+            )
+        )
+
+    def _on_batch_status(self, connection, pid, channel, payload: str) -> None:
+        """Handle 'schema:batch_id' batch status notifications."""
+        schema, _, batch_id = payload.partition(':')
+        batch_id = int(batch_id) if batch_id.isdigit() else None
+        self._invalidate_batch(schema, batch_id)
+        self.events.publish(schema, batch_id, {'type': 'batch_status', 'batch_id': batch_id})
+
+    def _on_job_status(self, connection, pid, channel, payload: str) -> None:
+        """Handle JSON job status notifications (see irp_notify_job_status)."""
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            return
+        schema = event.pop('schema', None)
+        self._invalidate_batch(schema, event.get('batch_id'))
+        event['type'] = 'job'
+        self.events.publish(schema, event.get('batch_id'), event)
+
+    async def fetch(self, query: str, *args) -> List[Dict[str, Any]]:
+        """Run a query on a pooled connection and return rows as dicts."""
+        async with self.pool.acquire() as conn:
+            return [dict(row) for row in await conn.fetch(query, *args)]
+
+    async def fetchrow(self, query: str, *args) -> Optional[Dict[str, Any]]:
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(query, *args)
+            return dict(row) if row is not None else None
+
+    async def cached(self, key: tuple, ttl: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+        return await self.cache.get_or_load(key, ttl, loader)
@@ -1,8 +1,79 @@
-// Auto-refresh functionality (1 minute interval, always on)
+// Auto-refresh functionality (1 minute interval, paused while a live progress stream is connected)
 const AUTO_REFRESH_INTERVAL = 60 * 1000; // 1 minute
 
 function startAutoRefresh() {
-    setInterval(() => location.reload(), AUTO_REFRESH_INTERVAL);
+    setInterval(() => {
+        if (!isLiveProgressConnected()) {
+            location.reload();
+        }
+    }, AUTO_REFRESH_INTERVAL);
+}
+
+// Live progress (server-sent events)
+// Pages call startLiveProgress(url, {eventName: handler}) to receive incremental
+// updates instead of reloading the whole page.
+let liveProgressSource = null;
+let liveReloadTimer = null;
+
+function isLiveProgressConnected() {
+    return liveProgressSource !== null && liveProgressSource.readyState === EventSource.OPEN;
+}
+
+function startLiveProgress(url, handlers) {
+    if (!window.EventSource) return;
+
+    const source = new EventSource(url);
+    liveProgressSource = source;
+
+    // Server says we missed updates (or the page structure changed): reload once
+    source.addEventListener('resync', () => {
+        source.close();
+        location.reload();
+    });
+
+    Object.entries(handlers).forEach(([eventName, handler]) => {
+        source.addEventListener(eventName, event => handler(JSON.parse(event.data)));
+    });
+}
+
+// Reload soon, coalescing many triggers (e.g. a burst of new jobs) into one reload
+function scheduleLiveReload(delayMs = 2000) {
+    if (liveReloadTimer === null) {
+        liveReloadTimer = setTimeout(() => location.reload(), delayMs);
+    }
+}
+
+function setStatusBadge(element, status) {
+    if (!element) return;
+    element.className = 'status-badge status-' + status;
+    element.textContent = status;
+}
+
+// Update every [data-progress="<field>"] element inside container from a progress record
+function applyProgress(container, progress) {
+    if (!container) return;
+    container.querySelectorAll('[data-progress]').forEach(element => {
+        const value = progress[element.dataset.progress];
+        if (value === undefined || value === null) return;
+        if (element.classList.contains('status-badge')) {
+            setStatusBadge(element, value);
+        } else {
+            element.textContent = value;
+        }
+    });
+}
+
+// Same display format as the server-side format_timestamp (Eastern Time)
+function formatTimestamp(value) {
+    if (!value) return 'N/A';
+    const date = new Date(value);
+    if (isNaN(date)) return value;
+    const parts = Object.fromEntries(new Intl.DateTimeFormat('en-US', {
+        timeZone: 'America/New_York', hourCycle: 'h23',
+        year: 'numeric', month: '2-digit', day: '2-digit',
+        hour: '2-digit', minute: '2-digit', second: '2-digit'
+    }).formatToParts(date).map(part => [part.type, part.value]));
+    return `${parts.year}-${parts.month}-${parts.day} ${parts.hour}:${parts.minute}:${parts.second} ET`;
 }
 
 // Initialize auto-refresh on page load
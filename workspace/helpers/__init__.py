@@ -1,2 +1,21 @@
-"""IRP Notebook Framework"""
-__version__ = "1.0.0"
\ No newline at end of file
+"""
+IRP Notebook Framework
+
+Submodules are not imported with the package; `import helpers` stays cheap and
+`helpers.<module>` is imported on first attribute access (PEP 562), so a
+notebook only pays for the helpers (and pandas, sqlalchemy, requests, ...) it
+actually uses.
+"""
+from importlib import import_module
+
+__version__ = "1.0.0"
+
+
+def __getattr__(name: str):
+    if not name.startswith('_'):
+        try:
+            return import_module(f'{__name__}.{name}')
+        except ModuleNotFoundError as e:
+            if e.name != f'{__name__}.{name}':
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
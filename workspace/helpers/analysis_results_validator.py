@@ -24,6 +24,7 @@ from typing import Dict, List, Any, Optional, Union
 import pandas as pd
 
 from helpers.irp_integration import IRPClient
+from helpers.irp_integration.streaming import table_records
 
 
 # =============================================================================
@@ -1286,18 +1287,18 @@ class AnalysisResultsValidator:
 
             if not prod_data:
                 # No records in production PLT - check if test also has none
-                test_data = self.irp_client.analysis.get_plt(
+                test_table = self.irp_client.analysis.get_plt_table(
                     test_analysis_id,
                     perspective_code,
                     test_exposure_resource_id
                 )
-                if test_data:
+                if len(test_table):
                     return ComparisonResult(
                         endpoint='PLT',
                         passed=False,
                         total_records_prod=0,
-                        total_records_test=len(test_data),
-                        extra_in_test=[r.get('eventId') for r in test_data]
+                        total_records_test=len(test_table),
+                        extra_in_test=[r.get('eventId') for r in table_records(test_table)]
                     )
                 return ComparisonResult(
                     endpoint='PLT',
@@ -1331,7 +1332,8 @@ class AnalysisResultsValidator:
             event_ids_str = ", ".join(str(eid) for eid in sample_event_ids)
             event_filter = f"eventId IN ({event_ids_str})"
 
-            test_data_all = self.irp_client.analysis.get_plt(
+            # (as a DataFrame: up to 100k records, of which only the sampled keys are kept)
+            test_table = self.irp_client.analysis.get_plt_table(
                 test_analysis_id,
                 perspective_code,
                 test_exposure_resource_id,
@@ -1340,10 +1342,10 @@ class AnalysisResultsValidator:
 
             # Step 5: Filter test data to only include records matching prod's composite keys
             # This is necessary because we can only filter by eventId in the API
-            test_data = [
-                r for r in test_data_all
-                if make_plt_key(r) in prod_keys
-            ]
+            key_columns = test_table.reindex(columns=['eventId', 'periodId', 'eventDate', 'lossDate'])
+            key_columns = key_columns.astype(object).where(key_columns.notna(), None)
+            matching = [key in prod_keys for key in key_columns.itertuples(index=False, name=None)]
+            test_data = table_records(test_table[matching])
 
             # Step 6: Compare by composite key (eventId, periodId, eventDate, lossDate)
             return compare_datasets_composite_key(
@@ -33,14 +33,21 @@ Workflow:
 """
 
 import json
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
 
+from sqlalchemy import text
+
 from helpers.irp_integration import IRPClient
 from helpers.database import (
-    execute_query, execute_command, execute_insert, bulk_insert, DatabaseError
+    execute_query, execute_command, execute_insert, bulk_insert, get_engine, DatabaseError
+)
+from helpers.constants import (
+    BatchStatus, ConfigurationStatus, CycleStatus, JobStatus, BatchType, DEFAULT_DATABASE_SERVER,
+    RDM_EXPORT_SUBMIT_MAX_WORKERS
 )
-from helpers.constants import BatchStatus, ConfigurationStatus, CycleStatus, JobStatus, BatchType, DEFAULT_DATABASE_SERVER
 from helpers.configuration import (
     read_configuration, update_configuration_status,
     create_job_configurations, BATCH_TYPE_TRANSFORMERS,
@@ -48,6 +55,7 @@ from helpers.configuration import (
 )
 from helpers.cycle import get_active_cycle_id
 from helpers.entity_validator import EntityValidator
+from helpers.tracing import traced
 
 
 class BatchError(Exception):
@@ -530,6 +538,7 @@ def create_batch(
         raise BatchError(f"Failed to create batch: {str(e)}")
 
 
+@traced('batch.validate_batch', context=lambda batch_id, *args, **kwargs: {'batch_id': batch_id})
 def validate_batch(
     batch_id: int,
     schema: str = 'public'
@@ -555,7 +564,8 @@ def validate_batch(
     """
     batch = read_batch(batch_id, schema=schema)
     batch_type = batch['batch_type']
-    validator = EntityValidator()
+    # Snapshot lookups: entities are re-checked across several validate_* calls below
+    validator = EntityValidator(use_snapshot=True)
 
     # Get jobs that are ready for submission (INITIATED or ERROR, not skipped)
     # This filters out jobs that already succeeded - we don't need to re-validate those
@@ -686,6 +696,7 @@ def activate_batch(batch_id: int, schema: str = 'public') -> None:
     update_configuration_status(batch['configuration_id'], ConfigurationStatus.ACTIVE, schema=schema)
 
 
+@traced('batch.submit_batch', context=lambda batch_id, *args, **kwargs: {'batch_id': batch_id})
 def submit_batch(
     batch_id: int,
     irp_client: IRPClient,
@@ -700,7 +711,8 @@ def submit_batch(
     2. Validate cycle is ACTIVE
     3. Update batch step_id if provided (for batches submitted in different step than created)
     4. Get all jobs in batch
-    5. For each job in INITIATED status, call submit_job
+    5. For each job in INITIATED status, call submit_job (Portfolio Creation and
+       Create Reinsurance Treaties jobs concurrently, sharing a BulkCreateContext)
     6. Update batch status to ACTIVE
     7. Update batch submitted_ts
     8. Update configuration status to ACTIVE
@@ -718,8 +730,11 @@ def submit_batch(
             'batch_id': int,
             'batch_status': str,
             'submitted_jobs': int,
-            'jobs': [{'job_id': int, 'status': str}, ...]
+            'jobs': [{'job_id': int, 'status': str}, ...],
+            'api_calls': {...}  # Analysis batches only: AnalysisSubmissionPlan.report()
         }
+        RDM export batches with a seed job also return 'seed_job_id',
+        'pending_jobs' and 'database_id' (see _submit_rdm_export_batch_with_seed).
 
     Raises:
         BatchError: If validation fails
@@ -796,6 +811,77 @@ def submit_batch(
             schema=schema
         )
 
+    # Resolve Analysis lookups once for all jobs about to be submitted, so each
+    # submission only POSTs (FAILED jobs are resubmitted as new jobs, unplanned)
+    analysis_plan = None
+    if batch['batch_type'] == BatchType.ANALYSIS:
+        configs_by_id = {jc['id']: jc['job_configuration_data'] for jc in job_configs}
+        analysis_plan = job.plan_analysis_submissions(
+            [
+                configs_by_id[job_record['job_configuration_id']]
+                for job_record in jobs
+                if not job_record['skipped']
+                and job_record['status'] in JobStatus.ready_for_submit()
+                and job_record['status'] != JobStatus.FAILED
+                and job_record['job_configuration_id'] in configs_by_id
+            ],
+            irp_client
+        )
+
+    def submit_ready_job(job_record: Dict[str, Any], bulk_context=None) -> Dict[str, Any]:
+        try:
+            # Jobs that failed in Moody's (FAILED status) need to be resubmitted
+            # This creates a new job, skips the original, and submits the new one
+            if job_record['status'] == JobStatus.FAILED:
+                new_job_id = job.resubmit_job(
+                    job_record['id'],
+                    irp_client,
+                    batch['batch_type'],
+                    schema=schema
+                )
+                return {
+                    'job_id': new_job_id,
+                    'original_job_id': job_record['id'],
+                    'status': 'RESUBMITTED'
+                }
+            # INITIATED or ERROR status - submit normally
+            job.submit_job(
+                job_record['id'],
+                batch['batch_type'],
+                irp_client,
+                schema=schema,
+                analysis_plan=analysis_plan,
+                bulk_context=bulk_context
+            )
+            return {
+                'job_id': job_record['id'],
+                'status': 'SUBMITTED'
+            }
+        except Exception as e:
+            # Log error but continue with other jobs
+            return {
+                'job_id': job_record['id'],
+                'status': 'FAILED',
+                'error': str(e)
+            }
+
+    ready_jobs = [
+        job_record for job_record in jobs
+        if not job_record['skipped'] and job_record['status'] in JobStatus.ready_for_submit()
+    ]
+
+    # Portfolios and treaties are created concurrently, sharing EDM, cedant,
+    # currency and LOB lookups and a POST rate limiter for the whole batch
+    ready_results = {}
+    if batch['batch_type'] in (BatchType.PORTFOLIO_CREATION, BatchType.CREATE_REINSURANCE_TREATIES) and ready_jobs:
+        from helpers.irp_integration.constants import BULK_CREATE_MAX_REQUESTS_PER_SECOND, BULK_CREATE_MAX_WORKERS
+        from helpers.irp_integration.utils import BulkCreateContext
+
+        with BulkCreateContext(BULK_CREATE_MAX_WORKERS, BULK_CREATE_MAX_REQUESTS_PER_SECOND) as bulk_context:
+            with ThreadPoolExecutor(max_workers=max(1, min(BULK_CREATE_MAX_WORKERS, len(ready_jobs)))) as executor:
+                results = executor.map(lambda job_record: submit_ready_job(job_record, bulk_context), ready_jobs)
+                ready_results = {job_record['id']: result for job_record, result in zip(ready_jobs, results)}
+
     # Submit eligible jobs
     submitted_jobs = []
     validator = EntityValidator()
@@ -805,35 +891,10 @@ def submit_batch(
             continue
 
         if job_record['status'] in JobStatus.ready_for_submit():
-            try:
-                # Jobs that failed in Moody's (FAILED status) need to be resubmitted
-                # This creates a new job, skips the original, and submits the new one
-                if job_record['status'] == JobStatus.FAILED:
-                    new_job_id = job.resubmit_job(
-                        job_record['id'],
-                        irp_client,
-                        batch['batch_type'],
-                        schema=schema
-                    )
-                    submitted_jobs.append({
-                        'job_id': new_job_id,
-                        'original_job_id': job_record['id'],
-                        'status': 'RESUBMITTED'
-                    })
-                else:
-                    # INITIATED or ERROR status - submit normally
-                    job.submit_job(job_record['id'], batch['batch_type'], irp_client, schema=schema)
-                    submitted_jobs.append({
-                        'job_id': job_record['id'],
-                        'status': 'SUBMITTED'
-                    })
-            except Exception as e:
-                # Log error but continue with other jobs
-                submitted_jobs.append({
-                    'job_id': job_record['id'],
-                    'status': 'FAILED',
-                    'error': str(e)
-                })
+            if job_record['id'] in ready_results:
+                submitted_jobs.append(ready_results[job_record['id']])
+            else:
+                submitted_jobs.append(submit_ready_job(job_record))
 
         elif job_record['status'] in (JobStatus.FINISHED, JobStatus.CANCELLED):
             # For Data Extraction, always resubmit FINISHED jobs to regenerate CSVs
@@ -915,12 +976,15 @@ def submit_batch(
     # Update configuration status to ACTIVE
     update_configuration_status(batch['configuration_id'], ConfigurationStatus.ACTIVE, schema=schema)
 
-    return {
+    summary = {
         'batch_id': batch_id,
         'batch_status': BatchStatus.ACTIVE,
         'submitted_jobs': len(submitted_jobs),
         'jobs': submitted_jobs
     }
+    if analysis_plan is not None:
+        summary['api_calls'] = analysis_plan.report()
+    return summary
 
 
 def _submit_rdm_export_batch_with_seed(
@@ -932,18 +996,21 @@ def _submit_rdm_export_batch_with_seed(
     schema: str = 'public'
 ) -> Dict[str, Any]:
     """
-    Submit RDM export batch using seed job pattern.
+    Submit RDM export batch using seed job pattern (phase 1 of 2).
 
     When exporting more than 100 analyses to RDM, the Moody's API requires
     multiple requests. To ensure all exports go to the same RDM, we:
     1. Submit seed job (first job with is_seed_job=True, contains 1 analysis)
-    2. Wait for seed job to complete (creates the RDM)
-    3. Get databaseId from created RDM
-    4. Update remaining jobs with databaseId
-    5. Submit remaining jobs (they append to the existing RDM)
+    2. Park the batch: it becomes ACTIVE with the remaining jobs left INITIATED
+
+    The seed job is then tracked like any other job. Once it is FINISHED (it
+    has created the RDM), recon_batch() runs phase 2 (_release_rdm_export_jobs):
+    it gets the databaseId of the created RDM, sets it on the remaining jobs and
+    submits them concurrently (they append to the existing RDM). Nothing waits
+    on the seed job, so several RDM export batches can progress in parallel.
 
-    This introduces a blocking wait for the seed job (~1-5 minutes) but
-    allows the remaining jobs to be tracked asynchronously.
+    If the seed job has already FINISHED (batch submitted again), phase 2 runs
+    straight away. A FAILED seed job is resubmitted as a new job.
 
     Args:
         batch_id: Batch ID
@@ -954,119 +1021,280 @@ def _submit_rdm_export_batch_with_seed(
         schema: Database schema
 
     Returns:
-        Dictionary with submission summary
+        Dictionary with submission summary, including:
+            - seed_job_id: ID of the seed job
+            - pending_jobs: Number of jobs waiting for the seed job to finish
+            - database_id: databaseId of the RDM if the remaining jobs were
+              submitted, otherwise None
 
     Raises:
         BatchError: If seed job not found or submission fails
     """
-    # Separate seed job from remaining jobs
+    # Load all job configurations for the batch at once
+    configs_by_id = {
+        job_config['id']: job_config
+        for job_config in get_batch_job_configurations(batch_id, skipped=False, schema=schema)
+    }
+    seed_job, seed_config, remaining_jobs = _split_rdm_export_jobs(jobs, configs_by_id, job_module, schema)
+
+    if not seed_job:
+        raise BatchError("RDM export batch with multiple jobs must have a seed job")
+
+    submitted_jobs = []
+
+    # 1. Submit seed job (jobs already submitted are left to the batch monitor)
+    try:
+        if seed_job['status'] == JobStatus.FAILED:
+            new_job_id = job_module.resubmit_job(
+                seed_job['id'],
+                irp_client,
+                BatchType.EXPORT_TO_RDM,
+                schema=schema
+            )
+            submitted_jobs.append({
+                'job_id': new_job_id,
+                'original_job_id': seed_job['id'],
+                'status': 'RESUBMITTED',
+                'is_seed': True
+            })
+            seed_job = job_module.read_job(new_job_id, schema=schema)
+        elif seed_job['status'] in JobStatus.ready_for_submit():
+            job_module.submit_job(
+                seed_job['id'],
+                BatchType.EXPORT_TO_RDM,
+                irp_client,
+                schema=schema,
+                job_config=seed_config
+            )
+            submitted_jobs.append({
+                'job_id': seed_job['id'],
+                'status': 'SUBMITTED',
+                'is_seed': True
+            })
+    except Exception as e:
+        raise BatchError(f"Failed to submit seed job {seed_job['id']}: {str(e)}")
+
+    # 2. Park the batch as ACTIVE; recon_batch() submits the rest once the seed finishes
+    query = """
+        UPDATE irp_batch
+        SET status = %s, submitted_ts = NOW()
+        WHERE id = %s
+    """
+    execute_command(query, (BatchStatus.ACTIVE, batch_id), schema=schema)
+
+    # Update configuration status to ACTIVE
+    update_configuration_status(batch['configuration_id'], ConfigurationStatus.ACTIVE, schema=schema)
+
+    summary = {
+        'batch_id': batch_id,
+        'batch_status': BatchStatus.ACTIVE,
+        'seed_job_id': seed_job['id'],
+        'database_id': None,
+        'pending_jobs': len([j for j, _ in remaining_jobs if j['status'] in JobStatus.ready_for_submit()]),
+    }
+
+    if seed_job['status'] == JobStatus.FINISHED:
+        release = _release_rdm_export_jobs(
+            batch_id, seed_config, remaining_jobs, irp_client, job_module, schema=schema
+        )
+        submitted_jobs.extend(release['jobs'])
+        summary.update(database_id=release['database_id'], pending_jobs=0, api_calls=release['api_calls'])
+    elif summary['pending_jobs']:
+        print(f"Seed job {seed_job['id']} submitted; {summary['pending_jobs']} job(s) will be "
+              f"submitted once it finishes (batch monitor)")
+
+    summary.update(submitted_jobs=len(submitted_jobs), jobs=submitted_jobs)
+    return summary
+
+
+def _split_rdm_export_jobs(
+    jobs: List[Dict[str, Any]],
+    configs_by_id: Dict[int, Dict[str, Any]],
+    job_module,
+    schema: str = 'public'
+):
+    """
+    Separate the seed job of an RDM export batch from the remaining jobs.
+
+    Args:
+        jobs: Job records of the batch
+        configs_by_id: Job configuration records by ID (missing ones are read per job)
+        job_module: The helpers.job module
+        schema: Database schema
+
+    Returns:
+        Tuple of (seed_job, seed_config, remaining_jobs) where remaining_jobs is a
+        list of (job_record, job_config) pairs; seed_job is None if there is no
+        seed job. Skipped jobs are left out.
+    """
     seed_job = None
+    seed_config = None
     remaining_jobs = []
 
     for job_record in jobs:
         if job_record['skipped']:
             continue
 
-        # Read job configuration to check is_seed_job flag
-        job_config = job_module.get_job_config(job_record['id'], schema=schema)
+        job_config = configs_by_id.get(job_record['job_configuration_id'])
+        if job_config is None:
+            job_config = job_module.get_job_config(job_record['id'], schema=schema)
         config_data = job_config.get('job_configuration_data', {})
 
         if config_data.get('is_seed_job'):
             seed_job = job_record
+            seed_config = job_config
         else:
-            remaining_jobs.append(job_record)
+            remaining_jobs.append((job_record, job_config))
 
-    if not seed_job:
-        raise BatchError("RDM export batch with multiple jobs must have a seed job")
+    return seed_job, seed_config, remaining_jobs
 
-    submitted_jobs = []
 
-    # 1. Submit seed job
-    try:
-        job_module.submit_job(seed_job['id'], BatchType.EXPORT_TO_RDM, irp_client, schema=schema)
-        submitted_jobs.append({
-            'job_id': seed_job['id'],
-            'status': 'SUBMITTED',
-            'is_seed': True
-        })
-    except Exception as e:
-        raise BatchError(f"Failed to submit seed job {seed_job['id']}: {str(e)}")
+@contextmanager
+def _claim_rdm_export_jobs(batch_id: int, job_ids: List[int], schema: str = 'public') -> Iterator[set]:
+    """
+    Claim the non-seed jobs of an RDM export batch for submission.
 
-    # 2. Wait for seed job to complete
-    # Re-read job to get moodys_workflow_id after submission
-    seed_job_record = job_module.read_job(seed_job['id'], schema=schema)
-    moodys_job_id = seed_job_record['moodys_workflow_id']
+    Holds a transaction-level advisory lock on the batch (on a dedicated
+    connection, released when the block exits) so that concurrent
+    recon_batch() calls - e.g. the scheduled batch monitor and a job events
+    listener - cannot both submit the same exports. Job statuses are read
+    once the lock is held, so jobs submitted by the previous holder are left
+    out.
 
-    if not moodys_job_id:
-        raise BatchError(f"Seed job {seed_job['id']} has no moodys_workflow_id after submission")
+    Args:
+        batch_id: Batch ID
+        job_ids: Candidate job IDs
+        schema: Database schema
 
-    # Poll until complete (blocking wait ~1-5 minutes for single analysis)
-    job_result = irp_client.rdm.poll_rdm_export_job_to_completion(int(moodys_job_id))
+    Yields:
+        IDs of job_ids still ready for submission; empty if another session
+        holds the lock
+    """
+    engine = get_engine()
+    with engine.connect() as conn, conn.begin():
+        acquired = conn.execute(
+            text("SELECT pg_try_advisory_xact_lock(hashtext(:namespace), :batch_id)"),
+            {'namespace': f'{schema}.irp_batch', 'batch_id': batch_id}
+        ).scalar()
+        if not acquired:
+            yield set()
+            return
+        rows = conn.execute(
+            text(f'SELECT id FROM "{schema}".irp_job WHERE id = ANY(:job_ids) AND status = ANY(:statuses)'),
+            {'job_ids': list(job_ids), 'statuses': JobStatus.ready_for_submit()}
+        )
+        yield {row[0] for row in rows}
 
-    # Update seed job status based on result
-    final_status = job_result.get('status', 'FINISHED')
-    if final_status == 'FINISHED':
-        job_module.update_job_status(seed_job['id'], JobStatus.FINISHED, schema=schema)
-        submitted_jobs[0]['status'] = 'FINISHED'
-    else:
-        job_module.update_job_status(seed_job['id'], JobStatus.FAILED, schema=schema)
-        raise BatchError(f"Seed job failed with status: {final_status}")
 
-    # 3. Get databaseId from created RDM
-    seed_config = job_module.get_job_config(seed_job['id'], schema=schema)
+def _release_rdm_export_jobs(
+    batch_id: int,
+    seed_config: Dict[str, Any],
+    remaining_jobs: List[tuple],
+    irp_client: IRPClient,
+    job_module,
+    schema: str = 'public'
+) -> Dict[str, Any]:
+    """
+    Submit the non-seed jobs of an RDM export batch (phase 2 of 2).
+
+    Called once the seed job has FINISHED: claims the jobs ready for
+    submission (see _claim_rdm_export_jobs), gets the databaseId of the RDM
+    the seed job created, sets it on their configurations in one update and
+    submits them concurrently, with names resolved up front for all of them
+    (see job.plan_rdm_export_submissions). Nothing is submitted if another
+    process is releasing the batch.
+
+    Args:
+        batch_id: Batch ID
+        seed_config: Job configuration record of the seed job
+        remaining_jobs: (job_record, job_config) pairs of the non-seed jobs
+        irp_client: IRP client for Moody's API
+        job_module: The helpers.job module
+        schema: Database schema
+
+    Returns:
+        Dict with 'database_id', 'jobs' (per-job submission results) and
+        'api_calls' (RDMExportPlan.report())
+    """
+    candidates = [
+        (job_record, job_config) for job_record, job_config in remaining_jobs
+        if job_record['status'] in JobStatus.ready_for_submit()
+    ]
+    if not candidates:
+        return {'database_id': None, 'jobs': [], 'api_calls': {}}
+
+    with _claim_rdm_export_jobs(batch_id, [job_record['id'] for job_record, _ in candidates], schema) as claimed:
+        ready_jobs = [(job_record, job_config) for job_record, job_config in candidates if job_record['id'] in claimed]
+        if not ready_jobs:
+            print(f"Remaining jobs of batch {batch_id} are already being submitted; nothing to release")
+            return {'database_id': None, 'jobs': [], 'api_calls': {}}
+        return _submit_rdm_export_jobs(seed_config, ready_jobs, irp_client, job_module, schema)
+
+
+def _submit_rdm_export_jobs(
+    seed_config: Dict[str, Any],
+    ready_jobs: List[tuple],
+    irp_client: IRPClient,
+    job_module,
+    schema: str = 'public'
+) -> Dict[str, Any]:
+    """Set databaseId on claimed non-seed jobs and submit them concurrently (see _release_rdm_export_jobs)"""
+    # Get databaseId from created RDM
     rdm_name = seed_config['job_configuration_data'].get('rdm_name')
     server_name = seed_config['job_configuration_data'].get('server_name', DEFAULT_DATABASE_SERVER)
 
     database_id = irp_client.rdm.get_rdm_database_id(rdm_name, server_name)
 
-    # 4. Update remaining jobs with databaseId and submit them
-    total_remaining = len([j for j in remaining_jobs if j['status'] in JobStatus.ready_for_submit()])
-    print(f"Submitting {total_remaining} remaining job(s) to append to RDM...")
+    # Update remaining jobs with databaseId (one statement) and submit them concurrently
+    print(f"Submitting {len(ready_jobs)} remaining job(s) to append to RDM...")
 
-    for job_record in remaining_jobs:
-        if job_record['status'] not in JobStatus.ready_for_submit():
-            continue
+    job_module.update_job_configurations_data(
+        [job_record['job_configuration_id'] for job_record, _ in ready_jobs],
+        {'database_id': database_id},
+        schema=schema
+    )
+
+    # Resolve server and analysis/group lookups for every job about to be submitted
+    export_plan = job_module.plan_rdm_export_submissions(
+        [job_config['job_configuration_data'] for _, job_config in ready_jobs],
+        irp_client
+    )
 
+    def submit_remaining(item):
+        job_record, job_config = item
         try:
-            # Update job configuration with database_id
-            job_module.update_job_configuration_data(
-                job_record['job_configuration_id'],
-                {'database_id': database_id},
-                schema=schema
+            job_config = {
+                **job_config,
+                'job_configuration_data': {**job_config['job_configuration_data'], 'database_id': database_id}
+            }
+            job_module.submit_job(
+                job_record['id'],
+                BatchType.EXPORT_TO_RDM,
+                irp_client,
+                schema=schema,
+                rdm_export_plan=export_plan,
+                job_config=job_config
             )
-
-            # Submit job
-            job_module.submit_job(job_record['id'], BatchType.EXPORT_TO_RDM, irp_client, schema=schema)
-            submitted_jobs.append({
+            return {
                 'job_id': job_record['id'],
                 'status': 'SUBMITTED',
                 'is_seed': False
-            })
+            }
         except Exception as e:
-            submitted_jobs.append({
+            return {
                 'job_id': job_record['id'],
                 'status': 'FAILED',
                 'error': str(e),
                 'is_seed': False
-            })
+            }
 
-    # 5. Update batch status to ACTIVE
-    query = """
-        UPDATE irp_batch
-        SET status = %s, submitted_ts = NOW()
-        WHERE id = %s
-    """
-    execute_command(query, (BatchStatus.ACTIVE, batch_id), schema=schema)
-
-    # Update configuration status to ACTIVE
-    update_configuration_status(batch['configuration_id'], ConfigurationStatus.ACTIVE, schema=schema)
+    with ThreadPoolExecutor(max_workers=max(1, min(RDM_EXPORT_SUBMIT_MAX_WORKERS, len(ready_jobs)))) as executor:
+        submitted_jobs = list(executor.map(submit_remaining, ready_jobs))
 
     return {
-        'batch_id': batch_id,
-        'batch_status': BatchStatus.ACTIVE,
-        'submitted_jobs': len(submitted_jobs),
+        'database_id': database_id,
         'jobs': submitted_jobs,
-        'database_id': database_id
+        'api_calls': export_plan.report()
     }
 
 
@@ -1196,13 +1424,17 @@ def get_batch_job_configurations(
 # BATCH RECONCILIATION
 # ============================================================================
 
-def recon_batch(batch_id: int, schema: str = 'public') -> str:
+@traced('batch.recon_batch', context=lambda batch_id, *args, **kwargs: {'batch_id': batch_id})
+def recon_batch(batch_id: int, schema: str = 'public', irp_client: Optional[IRPClient] = None) -> str:
     """
     Reconcile batch status based on job and configuration states.
 
     Logic:
     1. Get all non-skipped job configurations
     2. Get all non-skipped jobs
+       - RDM export batches parked on their seed job: once the seed job is
+         FINISHED, submit the waiting jobs (see _submit_rdm_export_batch_with_seed);
+         if it failed, the waiting jobs are left out of the checks below
     3. Check if all jobs are in terminal states (FINISHED, FAILED, CANCELLED, ERROR)
     4. Determine batch status:
        - If jobs still in progress: ACTIVE (continue polling)
@@ -1217,6 +1449,8 @@ def recon_batch(batch_id: int, schema: str = 'public') -> str:
     Args:
         batch_id: Batch ID
         schema: Database schema
+        irp_client: IRP client used to submit jobs waiting on an RDM seed job
+            (created on demand if not provided)
 
     Returns:
         New batch status (CANCELLED, FAILED, ERROR, COMPLETED, or ACTIVE)
@@ -1238,6 +1472,28 @@ def recon_batch(batch_id: int, schema: str = 'public') -> str:
     all_jobs = get_batch_jobs(batch_id, schema=schema)
     non_skipped_jobs = [j for j in all_jobs if not j['skipped']]
 
+    # RDM export batches submitted with a seed job park the remaining jobs
+    # (INITIATED) until the seed job has created the RDM
+    waiting_on_seed_job_ids = []
+    if any(c['job_configuration_data'].get('is_seed_job') for c in non_skipped_configs):
+        from helpers import job as job_module
+        seed_job, seed_config, remaining_jobs = _split_rdm_export_jobs(
+            all_jobs, {c['id']: c for c in all_configs}, job_module, schema=schema
+        )
+        waiting_jobs = [j for j, _ in remaining_jobs if j['status'] == JobStatus.INITIATED]
+        if seed_job and waiting_jobs and seed_job['status'] == JobStatus.FINISHED:
+            _release_rdm_export_jobs(
+                batch_id, seed_config, remaining_jobs, irp_client or IRPClient(), job_module, schema=schema
+            )
+            all_jobs = get_batch_jobs(batch_id, schema=schema)
+            non_skipped_jobs = [j for j in all_jobs if not j['skipped']]
+        elif seed_job and waiting_jobs and seed_job['status'] in JobStatus.failed():
+            waiting_on_seed_job_ids = [j['id'] for j in waiting_jobs]
+
+    # Jobs whose status decides the batch status (waiting jobs behind a failed
+    # seed job will not run until the batch is submitted again)
+    tracked_jobs = [j for j in non_skipped_jobs if j['id'] not in waiting_on_seed_job_ids]
+
     # Count jobs by status
     status_counts = {}
     for job in all_jobs:
@@ -1278,8 +1534,8 @@ def recon_batch(batch_id: int, schema: str = 'public') -> str:
 
     # First, check if all non-skipped jobs are in terminal states
     # If any job is still in progress, batch remains ACTIVE
-    all_jobs_terminal = non_skipped_jobs and all(
-        j['status'] in TERMINAL_JOB_STATUSES for j in non_skipped_jobs
+    all_jobs_terminal = tracked_jobs and all(
+        j['status'] in TERMINAL_JOB_STATUSES for j in tracked_jobs
     )
 
     # Handle empty batch (no non-skipped jobs/configs) - immediately COMPLETED
@@ -1293,15 +1549,15 @@ def recon_batch(batch_id: int, schema: str = 'public') -> str:
         # All jobs are in terminal states - determine final batch status
 
         # Check for all CANCELLED
-        if all(j['status'] == JobStatus.CANCELLED for j in non_skipped_jobs):
+        if all(j['status'] == JobStatus.CANCELLED for j in tracked_jobs):
             recon_result = BatchStatus.CANCELLED
 
         # Check for any ERROR
-        elif any(j['status'] == JobStatus.ERROR for j in non_skipped_jobs):
+        elif any(j['status'] == JobStatus.ERROR for j in tracked_jobs):
             recon_result = BatchStatus.ERROR
 
         # Check for any FAILED
-        elif any(j['status'] == JobStatus.FAILED for j in non_skipped_jobs):
+        elif any(j['status'] == JobStatus.FAILED for j in tracked_jobs):
             recon_result = BatchStatus.FAILED
 
         # All jobs finished successfully - check config fulfillment
@@ -1330,6 +1586,8 @@ def recon_batch(batch_id: int, schema: str = 'public') -> str:
         'cancelled_job_ids': cancelled_job_ids,
         'error_job_ids': error_job_ids
     }
+    if waiting_on_seed_job_ids:
+        recon_summary['waiting_on_seed_job_ids'] = waiting_on_seed_job_ids
 
     # Insert recon log
     _insert_recon_log(batch_id, recon_result, recon_summary, schema=schema)
@@ -1396,7 +1654,7 @@ def get_batches_for_configuration(
 
 def delete_batch(batch_id: int, schema: str = 'public') -> bool:
     """
-    Delete a batch and all its associated jobs and job configurations.
+    Delete a batch and all its associated jobs, job configurations and logs.
 
     This operation is irreversible. Use with caution.
 
@@ -1413,36 +1671,35 @@ def delete_batch(batch_id: int, schema: str = 'public') -> bool:
     if not isinstance(batch_id, int) or batch_id <= 0:
         raise BatchError(f"Invalid batch_id: {batch_id}")
 
-    # Verify batch exists
-    batch = read_batch(batch_id, schema=schema)
-    if not batch:
-        raise BatchError(f"Batch {batch_id} not found")
-
-    # Delete in order: jobs → job_configs → batch
-    # Note: job_config deletion is cascaded by FK constraint, but explicit for clarity
-    try:
-        # Delete all jobs for this batch
-        execute_command(
-            "DELETE FROM irp_job WHERE batch_id = %s",
-            (batch_id,),
-            schema=schema
-        )
-
-        # Delete all job configurations for this batch
-        execute_command(
-            "DELETE FROM irp_job_configuration WHERE batch_id = %s",
-            (batch_id,),
-            schema=schema
-        )
-
-        # Delete the batch itself
-        execute_command(
-            "DELETE FROM irp_batch WHERE id = %s",
-            (batch_id,),
-            schema=schema
+    # Delete logs → jobs → job_configs → batch in one set-based statement
+    # (FK checks run at end of statement)
+    query = """
+        WITH deleted_tracking_log AS (
+            DELETE FROM irp_job_tracking_log tl
+            USING irp_job j
+            WHERE tl.job_id = j.id AND j.batch_id = %s
+        ),
+        deleted_recon_log AS (
+            DELETE FROM irp_batch_recon_log
+            WHERE batch_id = %s
+        ),
+        deleted_job AS (
+            DELETE FROM irp_job
+            WHERE batch_id = %s
+        ),
+        deleted_job_configuration AS (
+            DELETE FROM irp_job_configuration
+            WHERE batch_id = %s
         )
-
-        return True
-
+        DELETE FROM irp_batch
+        WHERE id = %s
+    """
+    try:
+        rows = execute_command(query, (batch_id,) * 5, schema=schema)
     except Exception as e:
         raise BatchError(f"Failed to delete batch {batch_id}: {str(e)}")
+
+    if rows == 0:
+        raise BatchError(f"Batch {batch_id} not found")
+
+    return True
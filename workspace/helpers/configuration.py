@@ -13,7 +13,9 @@ TRANSACTION BEHAVIOR:
 - load_configuration_file (Layer 3) performs multiple operations but does NOT use transaction
 """
 
+import hashlib
 import json
+import logging
 import os
 import re
 from pathlib import Path
@@ -28,12 +30,15 @@ import numpy as np
 from helpers.constants import (
     ConfigurationStatus, CONFIGURATION_TAB_LIST,
     EXCEL_VALIDATION_SCHEMAS, VALIDATION_ERROR_CODES, BatchType,
-    DEFAULT_DATABASE_SERVER
+    DEFAULT_DATABASE_SERVER, CONFIGURATION_CACHE_VERSION,
+    DEFAULT_CONFIGURATION_CACHE_DIR, CONFIGURATION_CACHE_DIR_MODE, SUPPORTED_EXCEL_ENGINES
 )
 from helpers.irp_integration import IRPClient
 from helpers.irp_integration.exceptions import IRPAPIError
 from helpers.entity_validator import EntityValidator
 
+logger = logging.getLogger(__name__)
+
 
 class ConfigurationError(Exception):
     """Custom exception for configuration errors"""
@@ -1596,10 +1601,338 @@ def validate_configuration(config_data: Dict[str, Any]) -> bool:
     return True
 
 
+# ============================================================================
+# EXCEL FILE CACHE
+# ============================================================================
+
+def _get_excel_engine() -> Optional[str]:
+    """
+    Get the pandas Excel engine selected via CONFIGURATION_EXCEL_ENGINE.
+
+    Returns None (pandas default, openpyxl) when unset. 'calamine' requires the
+    python-calamine package and pandas >= 2.2; if either is missing we log a
+    warning and fall back to the default engine rather than failing the load.
+
+    Returns:
+        Engine name, or None for the pandas default
+
+    Raises:
+        ConfigurationError: If the engine name is not supported
+    """
+    engine = os.getenv('CONFIGURATION_EXCEL_ENGINE', '').strip().lower()
+    if not engine:
+        return None
+
+    if engine not in SUPPORTED_EXCEL_ENGINES:
+        raise ConfigurationError(
+            f"Unsupported CONFIGURATION_EXCEL_ENGINE '{engine}'. "
+            f"Supported: {SUPPORTED_EXCEL_ENGINES}"
+        )
+
+    if engine == 'calamine':
+        pandas_version = tuple(int(part) for part in pd.__version__.split('.')[:2])
+        try:
+            import python_calamine  # noqa: F401
+        except ImportError:
+            logger.warning("python-calamine is not installed; using default Excel engine")
+            return None
+        if pandas_version < (2, 2):
+            logger.warning(f"calamine engine requires pandas >= 2.2 (found {pd.__version__}); using default Excel engine")
+            return None
+
+    return engine
+
+
+def _is_configuration_cache_enabled() -> bool:
+    """Check CONFIGURATION_CACHE_ENABLED (enabled unless set to 'false')."""
+    return os.getenv('CONFIGURATION_CACHE_ENABLED', 'true').strip().lower() != 'false'
+
+
+def _get_configuration_cache_dir() -> Path:
+    """Get the configuration cache directory (CONFIGURATION_CACHE_DIR override)."""
+    return Path(os.getenv('CONFIGURATION_CACHE_DIR', str(DEFAULT_CONFIGURATION_CACHE_DIR)))
+
+
+def _is_private_cache_dir(cache_dir: Path) -> bool:
+    """
+    Check the cache directory is owned by the current user and closed to everyone else.
+
+    Cache hits skip workbook validation, so entries must not be writable by
+    other users. On platforms without POSIX ownership only existence is checked.
+    """
+    try:
+        st = cache_dir.stat()
+    except OSError:
+        return False
+    if not hasattr(os, 'getuid'):
+        return True
+    return st.st_uid == os.getuid() and (st.st_mode & 0o077) == 0
+
+
+def _ensure_private_cache_dir(cache_dir: Path) -> bool:
+    """
+    Create the cache directory with CONFIGURATION_CACHE_DIR_MODE if needed.
+
+    An existing directory owned by the current user is tightened to
+    CONFIGURATION_CACHE_DIR_MODE; one owned by someone else is left alone and
+    the cache is not used.
+
+    Returns:
+        True if the directory is private to the current user
+    """
+    try:
+        cache_dir.mkdir(mode=CONFIGURATION_CACHE_DIR_MODE, parents=True, exist_ok=True)
+        if hasattr(os, 'getuid') and cache_dir.stat().st_uid == os.getuid():
+            os.chmod(cache_dir, CONFIGURATION_CACHE_DIR_MODE)
+    except OSError as e:
+        logger.warning(f"Could not create configuration cache directory {cache_dir}: {e}")
+        return False
+
+    if not _is_private_cache_dir(cache_dir):
+        logger.warning(f"Configuration cache directory {cache_dir} is not private to the current user; not caching")
+        return False
+    return True
+
+
+def _configuration_cache_key(config_path: Path, engine: Optional[str]) -> str:
+    """
+    Build the cache key for a configuration file.
+
+    The key covers the file content, the validation schemas/error codes,
+    CONFIGURATION_CACHE_VERSION and the Excel engine, so any change to the
+    workbook or to the validation rules produces a new key.
+
+    Args:
+        config_path: Path to Excel configuration file
+        engine: Excel engine used to parse the workbook
+
+    Returns:
+        Hex digest cache key
+    """
+    schema_fingerprint = json.dumps(
+        {
+            'version': CONFIGURATION_CACHE_VERSION,
+            'tabs': CONFIGURATION_TAB_LIST,
+            'schemas': EXCEL_VALIDATION_SCHEMAS,
+            'error_codes': VALIDATION_ERROR_CODES,
+            'engine': engine,
+        },
+        sort_keys=True,
+        default=str
+    )
+
+    digest = hashlib.sha256(schema_fingerprint.encode('utf-8'))
+    with open(config_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_configuration_cache(cache_key: str) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Read cached (config_data, validation_results) for a cache key.
+
+    Returns:
+        Tuple of (config_data, validation_results), or None on cache miss
+    """
+    cache_dir = _get_configuration_cache_dir()
+    if not _is_private_cache_dir(cache_dir):
+        return None
+
+    cache_file = cache_dir / f"{cache_key}.json"
+    try:
+        payload = json.loads(cache_file.read_text(encoding='utf-8'))
+        return payload['config_data'], payload['validation_results']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_configuration_cache(
+    cache_key: str,
+    config_path: Path,
+    config_data: Dict[str, Any],
+    validation_results: Dict[str, Any]
+) -> bool:
+    """
+    Write validated workbook results to the cache.
+
+    Results that do not survive a JSON round trip unchanged (e.g. non-string
+    keys) are not cached, so a cache hit always returns exactly what a fresh
+    parse would. Cache write failures are logged and otherwise ignored.
+
+    Returns:
+        True if the cache file was written, False otherwise
+    """
+    payload = {
+        'source_file': str(config_path),
+        'cached_at': datetime.now().isoformat(),
+        'config_data': config_data,
+        'validation_results': validation_results,
+    }
+    try:
+        serialized = json.dumps(payload)
+        round_trip = json.loads(serialized)
+    except (TypeError, ValueError):
+        return False
+    if round_trip['config_data'] != config_data or round_trip['validation_results'] != validation_results:
+        return False
+
+    cache_dir = _get_configuration_cache_dir()
+    cache_file = cache_dir / f"{cache_key}.json"
+    tmp_file = cache_dir / f"{cache_key}.{os.getpid()}.tmp"
+    if not _ensure_private_cache_dir(cache_dir):
+        return False
+    try:
+        tmp_file.write_text(serialized, encoding='utf-8')
+        os.replace(tmp_file, cache_file)
+        return True
+    except OSError as e:
+        logger.warning(f"Could not write configuration cache {cache_file}: {e}")
+        return False
+
+
+def clear_configuration_cache() -> int:
+    """
+    Delete all cached configuration parse results.
+
+    Returns:
+        Number of cache files removed
+    """
+    cache_dir = _get_configuration_cache_dir()
+    if not cache_dir.exists():
+        return 0
+
+    removed = 0
+    for cache_file in cache_dir.glob('*.json'):
+        try:
+            cache_file.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def _raise_cross_sheet_errors(
+    config_data: Dict[str, Any],
+    validation_results: Dict[str, Any],
+    cross_errors: List[str]
+) -> None:
+    """Record cross-sheet errors in validation results and raise ConfigurationError."""
+    validation_results['_cross_sheet'] = {
+        'status': 'ERROR',
+        'errors': cross_errors,
+        'warnings': [],
+        'validated_at': datetime.now().isoformat()
+    }
+    config_data['_validation'] = validation_results
+    raise ConfigurationError(f"Cross-sheet validation errors:\n" + "\n".join(cross_errors[:10]))
+
+
+def _parse_and_validate_workbook(excel_config_path: str, engine: Optional[str]):
+    """
+    Parse all configuration sheets and run the offline (non-API) validation.
+
+    Covers per-sheet validation and the cross-sheet foreign key, special
+    reference, groupings and business rule checks. The result depends only on
+    the workbook content and validation rules, which makes it cacheable.
+
+    Args:
+        excel_config_path: Path to Excel configuration file
+        engine: pandas Excel engine (None for default)
+
+    Returns:
+        tuple: (config_data, validation_results) - config_data has no '_validation' key
+
+    Raises:
+        ConfigurationError: If any sheet or cross-sheet validation fails
+    """
+    with pd.ExcelFile(excel_config_path, engine=engine) as excel_file:
+        available_tabs = excel_file.sheet_names
+
+        # Check for required sheets
+        missing_tabs = [tab for tab in CONFIGURATION_TAB_LIST if tab not in available_tabs]
+        if missing_tabs:
+            raise ConfigurationError(
+                f"Missing required sheets: {missing_tabs}. "
+                f"Required: {CONFIGURATION_TAB_LIST}, Found: {available_tabs}"
+            )
+
+        # Validate each sheet
+        config_data = {}
+        validation_results = {}
+        all_valid = True
+
+        for sheet_name in CONFIGURATION_TAB_LIST:
+            schema_def = EXCEL_VALIDATION_SCHEMAS.get(sheet_name)
+            if not schema_def:
+                continue  # Skip sheets without schema (e.g., Validations)
+
+            # Parse sheet (with or without header based on schema)
+            try:
+                if schema_def.get('has_header', True):
+                    df = excel_file.parse(sheet_name)
+                else:
+                    df = excel_file.parse(sheet_name, header=None)
+            except Exception as e:
+                validation_results[sheet_name] = {
+                    'status': 'ERROR',
+                    'errors': [f"Failed to parse sheet: {str(e)}"],
+                    'warnings': [],
+                    'row_count': 0,
+                    'column_count': 0,
+                    'validated_at': datetime.now().isoformat()
+                }
+                all_valid = False
+                continue
+
+            # Validate sheet
+            is_valid, errors, warnings, parsed_data = _validate_sheet(df, schema_def, sheet_name)
+
+            # Store validation results
+            validation_results[sheet_name] = {
+                'status': 'SUCCESS' if is_valid else 'ERROR',
+                'errors': errors,
+                'warnings': warnings,
+                'row_count': len(df),
+                'column_count': len(df.columns),
+                'validated_at': datetime.now().isoformat()
+            }
+
+            if is_valid and parsed_data is not None:
+                config_data[sheet_name] = parsed_data
+            else:
+                all_valid = False
+
+    # If any sheet validation failed, stop here
+    if not all_valid:
+        config_data['_validation'] = validation_results
+        error_summary = []
+        for sheet, result in validation_results.items():
+            if result['status'] == 'ERROR':
+                error_summary.extend([f"{sheet}: {err}" for err in result['errors']])
+        raise ConfigurationError(f"Validation errors:\n" + "\n".join(error_summary[:10]))
+
+    # Cross-sheet validation
+    cross_errors = []
+    cross_errors.extend(_validate_foreign_keys(config_data, EXCEL_VALIDATION_SCHEMAS))
+    cross_errors.extend(_validate_special_references(config_data))
+    cross_errors.extend(_validate_groupings_references(config_data))
+    cross_errors.extend(_validate_business_rules(config_data))
+
+    if cross_errors:
+        _raise_cross_sheet_errors(config_data, validation_results, cross_errors)
+
+    return config_data, validation_results
+
+
 def _validate_excel_file(excel_config_path: str, skip_entity_validation: bool = False):
     """
     Internal helper to validate Excel configuration file.
 
+    Offline parsing/validation results are cached on disk by file content hash
+    (see _configuration_cache_key), so unchanged workbooks skip the Excel parse.
+    Moody's entity and reference data validation always runs against the live API.
+
     Args:
         excel_config_path: Path to Excel configuration file
         skip_entity_validation: If True, skip Moody's entity/reference data validation
@@ -1619,109 +1952,46 @@ def _validate_excel_file(excel_config_path: str, skip_entity_validation: bool =
     # Get file last modified timestamp
     file_mtime = datetime.fromtimestamp(config_path.stat().st_mtime)
 
-    # Read Excel file and perform all validation within context manager
-    try:
-        with pd.ExcelFile(excel_config_path) as excel_file:
-            available_tabs = excel_file.sheet_names
-
-            # Check for required sheets
-            missing_tabs = [tab for tab in CONFIGURATION_TAB_LIST if tab not in available_tabs]
-            if missing_tabs:
-                raise ConfigurationError(
-                    f"Missing required sheets: {missing_tabs}. "
-                    f"Required: {CONFIGURATION_TAB_LIST}, Found: {available_tabs}"
-                )
-
-            # Validate each sheet
-            config_data = {}
-            validation_results = {}
-            all_valid = True
-
-            for sheet_name in CONFIGURATION_TAB_LIST:
-                schema_def = EXCEL_VALIDATION_SCHEMAS.get(sheet_name)
-                if not schema_def:
-                    continue  # Skip sheets without schema (e.g., Validations)
-
-                # Parse sheet (with or without header based on schema)
-                try:
-                    if schema_def.get('has_header', True):
-                        df = excel_file.parse(sheet_name)
-                    else:
-                        df = excel_file.parse(sheet_name, header=None)
-                except Exception as e:
-                    validation_results[sheet_name] = {
-                        'status': 'ERROR',
-                        'errors': [f"Failed to parse sheet: {str(e)}"],
-                        'warnings': [],
-                        'row_count': 0,
-                        'column_count': 0,
-                        'validated_at': datetime.now().isoformat()
-                    }
-                    all_valid = False
-                    continue
-
-                # Validate sheet
-                is_valid, errors, warnings, parsed_data = _validate_sheet(df, schema_def, sheet_name)
-
-                # Store validation results
-                validation_results[sheet_name] = {
-                    'status': 'SUCCESS' if is_valid else 'ERROR',
-                    'errors': errors,
-                    'warnings': warnings,
-                    'row_count': len(df),
-                    'column_count': len(df.columns),
-                    'validated_at': datetime.now().isoformat()
-                }
-
-                if is_valid and parsed_data is not None:
-                    config_data[sheet_name] = parsed_data
-                else:
-                    all_valid = False
-
-            # If any sheet validation failed, stop here
-            if not all_valid:
-                config_data['_validation'] = validation_results
-                error_summary = []
-                for sheet, result in validation_results.items():
-                    if result['status'] == 'ERROR':
-                        error_summary.extend([f"{sheet}: {err}" for err in result['errors']])
-                raise ConfigurationError(f"Validation errors:\n" + "\n".join(error_summary[:10]))
-
-            # Cross-sheet validation
-            cross_errors = []
-            cross_errors.extend(_validate_foreign_keys(config_data, EXCEL_VALIDATION_SCHEMAS))
-            cross_errors.extend(_validate_special_references(config_data))
-            cross_errors.extend(_validate_groupings_references(config_data))
-            cross_errors.extend(_validate_business_rules(config_data))
-
-            # Validate entities don't already exist in Moody's
-            # Only run if no cross-sheet errors (avoid unnecessary API calls)
-            # Skip if skip_entity_validation is True (for testing)
-            if not cross_errors and not skip_entity_validation:
-                validator = EntityValidator()
-                entity_errors = validator.validate_config_entities_not_exist(config_data)
-                cross_errors.extend(entity_errors)
-
-            # Validate reference data against Moody's API
-            # Only run if no prior errors (avoid unnecessary API calls)
-            # Skip if skip_entity_validation is True (for testing)
-            if not cross_errors and not skip_entity_validation:
-                analysis_table = config_data.get('Analysis Table', [])
-                api_errors = validate_reference_data_with_api(analysis_table)
-                cross_errors.extend(api_errors)
-
-            if cross_errors:
-                validation_results['_cross_sheet'] = {
-                    'status': 'ERROR',
-                    'errors': cross_errors,
-                    'warnings': [],
-                    'validated_at': datetime.now().isoformat()
-                }
-                config_data['_validation'] = validation_results
-                raise ConfigurationError(f"Cross-sheet validation errors:\n" + "\n".join(cross_errors[:10]))
+    engine = _get_excel_engine()
 
-            # Add validation results to config
-            config_data['_validation'] = validation_results
+    try:
+        cache_key = None
+        cached = None
+        if _is_configuration_cache_enabled():
+            cache_key = _configuration_cache_key(config_path, engine)
+            cached = _read_configuration_cache(cache_key)
+
+        if cached is not None:
+            config_data, validation_results = cached
+        else:
+            config_data, validation_results = _parse_and_validate_workbook(excel_config_path, engine)
+            if cache_key is not None:
+                _write_configuration_cache(cache_key, config_path, config_data, validation_results)
+
+        all_valid = True
+        cross_errors = []
+
+        # Validate entities don't already exist in Moody's
+        # Skip if skip_entity_validation is True (for testing)
+        if not skip_entity_validation:
+            validator = EntityValidator(use_snapshot=True)
+            entity_errors = validator.validate_config_entities_not_exist(config_data)
+            cross_errors.extend(entity_errors)
+            logger.info(f"Entity validation API usage: {validator.get_snapshot_report()}")
+
+        # Validate reference data against Moody's API
+        # Only run if no prior errors (avoid unnecessary API calls)
+        # Skip if skip_entity_validation is True (for testing)
+        if not cross_errors and not skip_entity_validation:
+            analysis_table = config_data.get('Analysis Table', [])
+            api_errors = validate_reference_data_with_api(analysis_table)
+            cross_errors.extend(api_errors)
+
+        if cross_errors:
+            _raise_cross_sheet_errors(config_data, validation_results, cross_errors)
+
+        # Add validation results to config
+        config_data['_validation'] = validation_results
     except ConfigurationError:
         # Re-raise ConfigurationErrors as-is
         raise
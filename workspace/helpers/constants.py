@@ -58,12 +58,54 @@ if _missing_config:
 SYSTEM_USER = os.getenv('SYSTEM_USER', 'notebook_user')
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
+# ============================================================================
+# JOB TRACKING LOG
+# ============================================================================
+
+class TrackingLogMode:
+    """Write modes for irp_job_tracking_log"""
+    FULL = 'full'                      # Every poll stores a row with the full API response
+    STATUS_CHANGE = 'status_change'    # Rows only on status transitions; heartbeats update irp_job.last_tracked_ts
+
+    @classmethod
+    def all(cls):
+        return [cls.FULL, cls.STATUS_CHANGE]
+
+
+TRACKING_LOG_MODE = os.getenv('TRACKING_LOG_MODE', TrackingLogMode.FULL)
+TRACKING_LOG_RETENTION_MONTHS = int(os.getenv('TRACKING_LOG_RETENTION_MONTHS', '12'))
+TRACKING_LOG_PARTITION_MONTHS_AHEAD = 3
+
+# ============================================================================
+# NOTEBOOK EXECUTION CONFIGURATION
+# ============================================================================
+
+class NotebookExecutionBackend:
+    """Backends for executing chained notebooks (see helpers.notebook_executor)"""
+    NBCONVERT = 'nbconvert'        # jupyter nbconvert subprocess per notebook (full isolation)
+    KERNEL_POOL = 'kernel_pool'    # nbclient on pre-warmed kernels reused by a long-lived process
+
+    @classmethod
+    def all(cls):
+        return [cls.NBCONVERT, cls.KERNEL_POOL]
+
+
+NOTEBOOK_EXECUTION_BACKEND = os.getenv('NOTEBOOK_EXECUTION_BACKEND', NotebookExecutionBackend.NBCONVERT)
+NOTEBOOK_KERNEL_POOL_SIZE = int(os.getenv('NOTEBOOK_KERNEL_POOL_SIZE', '1'))
+NOTEBOOK_KERNEL_MAX_RUNS = int(os.getenv('NOTEBOOK_KERNEL_MAX_RUNS', '25'))
+
+# Maximum notebooks run concurrently by helpers.step_scheduler for independent steps
+STEP_SCHEDULER_MAX_WORKERS = int(os.getenv('STEP_SCHEDULER_MAX_WORKERS', '2'))
+
 # ============================================================================
 # MOODY'S RISK MODELER CONFIGURATION
 # ============================================================================
 
 DEFAULT_DATABASE_SERVER = 'databridge-1'
 
+# Maximum RDM export jobs submitted concurrently once the seed job has created the RDM
+RDM_EXPORT_SUBMIT_MAX_WORKERS = int(os.getenv('RDM_EXPORT_SUBMIT_MAX_WORKERS', '8'))
+
 # ============================================================================
 # STATUS ENUMS
 # ============================================================================
@@ -650,6 +692,25 @@ EXCEL_VALIDATION_SCHEMAS = {
     'ExposureGroup <-> Portname': EXPOSURE_GROUP_PORTNAME_SCHEMA
 }
 
+# ============================================================================
+# CONFIGURATION FILE CACHE
+# ============================================================================
+
+# Parsed/validated workbooks are cached on disk, keyed by file content hash.
+# Bump CONFIGURATION_CACHE_VERSION when parsing/validation code changes in a way
+# that is not reflected in the schemas above (schema changes invalidate automatically).
+CONFIGURATION_CACHE_VERSION = 1
+
+# Environment overrides (read at call time):
+# - CONFIGURATION_CACHE_ENABLED: 'false' disables the cache (default: 'true')
+# - CONFIGURATION_CACHE_DIR: cache directory (default: DEFAULT_CONFIGURATION_CACHE_DIR)
+# - CONFIGURATION_EXCEL_ENGINE: pandas Excel engine ('openpyxl' or 'calamine')
+# The cache directory is per user and kept at mode 0700; cached results are trusted
+# on read, so it must never live in a shared location such as the system temp dir.
+DEFAULT_CONFIGURATION_CACHE_DIR = Path.home() / '.cache' / 'irp' / 'configuration'
+CONFIGURATION_CACHE_DIR_MODE = 0o700
+SUPPORTED_EXCEL_ENGINES = ['openpyxl', 'calamine']
+
 # ============================================================================
 # VALIDATION ERROR CODES
 # ============================================================================
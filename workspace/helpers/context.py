@@ -5,18 +5,95 @@ Automatically detects and manages workflow context from notebook path
 
 import re
 import os
+import threading
 from pathlib import Path
-from typing import Optional
-from helpers.cycle import get_cycle_by_name, get_active_cycle, register_cycle
+from typing import Optional, Dict, Any, Tuple
+from helpers.cycle import get_active_cycle, register_cycle
 from helpers.stage import get_or_create_stage
-from helpers.database import DatabaseError
+from helpers.database import DatabaseError, execute_returning, execute_scalar, get_current_schema
 from helpers.constants import NOTEBOOK_PATTERN, STAGE_PATTERN, CycleStatus
+from helpers.tracing import set_trace_context
 
 class WorkContextError(Exception):
     """Custom exception for context errors"""
     pass
 
 
+# Resolves cycle -> stage -> step in one round-trip, creating the stage and
+# step rows when missing. Returns no row if the cycle does not exist; stage and
+# step are only created for an ACTIVE cycle.
+RESOLVE_CONTEXT_QUERY = """
+    WITH cycle AS (
+        SELECT id, status FROM irp_cycle WHERE cycle_name = %s
+    ),
+    existing_stage AS (
+        SELECT s.id FROM irp_stage s JOIN cycle c ON s.cycle_id = c.id
+        WHERE s.stage_num = %s
+    ),
+    new_stage AS (
+        INSERT INTO irp_stage (cycle_id, stage_num, stage_name)
+        SELECT c.id, %s, %s FROM cycle c
+        WHERE c.status = 'ACTIVE' AND NOT EXISTS (SELECT 1 FROM existing_stage)
+        ON CONFLICT (cycle_id, stage_num) DO NOTHING
+        RETURNING id
+    ),
+    stage AS (
+        SELECT id FROM existing_stage
+        UNION ALL
+        SELECT id FROM new_stage
+    ),
+    existing_step AS (
+        SELECT st.id FROM irp_step st JOIN stage s ON st.stage_id = s.id
+        WHERE st.step_num = %s
+    ),
+    new_step AS (
+        INSERT INTO irp_step (stage_id, step_num, step_name, notebook_path)
+        SELECT s.id, %s, %s, %s FROM stage s CROSS JOIN cycle c
+        WHERE c.status = 'ACTIVE' AND NOT EXISTS (SELECT 1 FROM existing_step)
+        ON CONFLICT (stage_id, step_num) DO NOTHING
+        RETURNING id
+    )
+    SELECT
+        c.id AS cycle_id,
+        c.status AS cycle_status,
+        (SELECT id FROM stage LIMIT 1) AS stage_id,
+        (SELECT id FROM existing_step UNION ALL SELECT id FROM new_step LIMIT 1) AS step_id
+    FROM cycle c
+"""
+
+# Re-checked on every cache hit so a cycle archived since it was resolved is refused
+CYCLE_STATUS_QUERY = "SELECT status FROM irp_cycle WHERE id = %s"
+
+# Resolved contexts for this process, keyed by (schema, notebook path)
+_resolved_contexts: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_resolved_contexts_lock = threading.Lock()
+
+# Attributes copied from a cached context (notebook_path is set by the caller)
+_CACHED_ATTRIBUTES = (
+    'cycle_name', 'cycle_id', 'stage_num', 'stage_name', 'stage_id',
+    'step_num', 'step_name', 'step_id'
+)
+
+
+def invalidate_context_cache(notebook_path: str = None) -> None:
+    """
+    Forget resolved WorkContexts so the next WorkContext re-reads the database.
+
+    Call after changing stages or steps outside WorkContext (e.g. resetting a
+    schema). Cache hits re-check that the cycle is still ACTIVE, so archiving
+    a cycle needs no call. The notebook kernel pool calls this before every run.
+
+    Args:
+        notebook_path: Only forget contexts for this path (all paths if None)
+    """
+    with _resolved_contexts_lock:
+        if notebook_path is None:
+            _resolved_contexts.clear()
+        else:
+            for key in [k for k in _resolved_contexts if k[1] == str(notebook_path)]:
+                del _resolved_contexts[key]
+
+
 class WorkContext:
     """
     Automatically creates workflow context from notebook path.
@@ -60,12 +137,33 @@ class WorkContext:
             notebook_path = Path(notebook_path)
 
         self.notebook_path = notebook_path
-        
+
+        # Reuse this process's earlier resolution of the same notebook path
+        cache_key = (get_current_schema(), str(notebook_path))
+        with _resolved_contexts_lock:
+            cached = _resolved_contexts.get(cache_key)
+        if cached is not None and self._cycle_still_active(cached['cycle_id']):
+            self.__dict__.update(cached)
+            self._set_trace_context()
+            return
+        if cached is not None:
+            # Cycle archived or deleted since it was cached - resolve (and raise) as uncached
+            invalidate_context_cache(notebook_path)
+
         # Parse path to extract context
         self._parse_path()
         
         # Get or create database entries
         self._ensure_database_entries()
+
+        with _resolved_contexts_lock:
+            _resolved_contexts[cache_key] = {name: getattr(self, name) for name in _CACHED_ATTRIBUTES}
+
+        self._set_trace_context()
+
+    def _set_trace_context(self):
+        """Tag spans from here on with this notebook's cycle/stage/step ids"""
+        set_trace_context(cycle_id=self.cycle_id, stage_id=self.stage_id, step_id=self.step_id)
         
     
     def _parse_path(self):
@@ -137,6 +235,24 @@ class WorkContext:
         print(f"Context detected: {self.cycle_name} → Stage {self.stage_num} → Step {self.step_num}")
     
     
+    @staticmethod
+    def _cycle_still_active(cycle_id: int) -> bool:
+        """Check a cached context's cycle is still ACTIVE (primary-key lookup)"""
+        try:
+            return execute_scalar(CYCLE_STATUS_QUERY, (cycle_id,)) == CycleStatus.ACTIVE
+        except DatabaseError as e:
+            raise WorkContextError(f"Database error: {str(e)}")
+
+    def _resolve_ids(self) -> Optional[Dict[str, Any]]:
+        """Run RESOLVE_CONTEXT_QUERY; None if the cycle does not exist"""
+        return execute_returning(RESOLVE_CONTEXT_QUERY, (
+            self.cycle_name,
+            self.stage_num,
+            self.stage_num, self.stage_name,
+            self.step_num,
+            self.step_num, self.step_name, str(self.notebook_path)
+        ))
+
     def _ensure_database_entries(self):
         """Ensure cycle, stage, and step exist in database"""
 
@@ -144,10 +260,9 @@ class WorkContext:
         from helpers.step import get_or_create_step
 
         try:
-            # Get or create cycle
-            cycle = get_cycle_by_name(self.cycle_name)
+            row = self._resolve_ids()
 
-            if not cycle:
+            if row is None:
                 # Check if there's an active cycle
                 active = get_active_cycle()
                 if active and active['cycle_name'] != self.cycle_name:
@@ -156,31 +271,31 @@ class WorkContext:
                     )
 
                 # Create cycle
-                self.cycle_id = register_cycle(self.cycle_name)
+                register_cycle(self.cycle_name)
                 print(f"Created cycle: {self.cycle_name}")
-            else:
-                self.cycle_id = cycle['id']
+                row = self._resolve_ids()
 
-                # Verify cycle is active
-                if cycle['status'] != CycleStatus.ACTIVE:
-                    raise WorkContextError(
-                        f"Cycle '{self.cycle_name}' is {cycle['status']}, not active"
-                    )
-
-            # Get or create stage
-            self.stage_id = get_or_create_stage(
-                self.cycle_id,
-                self.stage_num,
-                self.stage_name
-            )
+            # Verify cycle is active
+            if row['cycle_status'] != CycleStatus.ACTIVE:
+                raise WorkContextError(
+                    f"Cycle '{self.cycle_name}' is {row['cycle_status']}, not active"
+                )
 
-            # Get or create step
-            self.step_id = get_or_create_step(
-                self.stage_id,
-                self.step_num,
-                self.step_name,
-                str(self.notebook_path)
-            )
+            self.cycle_id = row['cycle_id']
+            self.stage_id = row['stage_id']
+            self.step_id = row['step_id']
+
+            # Another process created the stage/step between our snapshot and
+            # insert (ON CONFLICT skipped it) - look the rows up directly
+            if self.stage_id is None:
+                self.stage_id = get_or_create_stage(self.cycle_id, self.stage_num, self.stage_name)
+            if self.step_id is None:
+                self.step_id = get_or_create_step(
+                    self.stage_id,
+                    self.step_num,
+                    self.step_name,
+                    str(self.notebook_path)
+                )
 
             print(f"Database entries ready (step_id={self.step_id})")
 
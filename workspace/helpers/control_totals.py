@@ -9,7 +9,10 @@ This module provides functions for:
 import pandas as pd
 from typing import Dict, List, Any, Tuple, Optional
 
+from helpers.tracing import traced
 
+
+@traced('control_totals.validate_geohaz_thresholds')
 def validate_geohaz_thresholds(
     geocoding_results: pd.DataFrame,
     geohaz_thresholds: List[Dict[str, Any]],
@@ -217,6 +220,7 @@ def _is_flood_exposure_group(exposure_group: str) -> bool:
     return exposure_group.startswith('USFL_')
 
 
+@traced('control_totals.compare_3a_vs_3b')
 def compare_3a_vs_3b(
     results_3a: List[pd.DataFrame],
     results_3b: List[pd.DataFrame]
@@ -405,6 +409,7 @@ def compare_3a_vs_3b(
     return comparison_df, all_matched
 
 
+@traced('control_totals.normalize_3d_results')
 def normalize_3d_results(results_3d: List[pd.DataFrame]) -> pd.DataFrame:
     """
     Normalize 3d SQL results (10 result sets) into a single unified DataFrame.
@@ -576,6 +581,7 @@ def normalize_3d_results(results_3d: List[pd.DataFrame]) -> pd.DataFrame:
     return df_combined
 
 
+@traced('control_totals.compare_3b_vs_3d')
 def compare_3b_vs_3d(
     results_3b: List[pd.DataFrame],
     results_3d: List[pd.DataFrame],
@@ -858,6 +864,7 @@ def compare_3a_vs_3b_pivot(
     return pivot_df, all_matched
 
 
+@traced('control_totals.compare_3d_vs_3e')
 def compare_3d_vs_3e(
     results_3d: List[pd.DataFrame],
     results_3e: List[pd.DataFrame],
@@ -34,6 +34,12 @@ class CycleError(Exception):
 # ============================================================================
 # CYCLE CRUD OPERATIONS (Layer 2)
 # ============================================================================
+def _invalidate_work_contexts() -> None:
+    """Drop cached WorkContext resolutions after a cycle is archived or deleted"""
+    # Import here to avoid circular dependency (helpers.context imports this module)
+    from helpers.context import invalidate_context_cache
+    invalidate_context_cache()
+
 
 def get_active_cycle() -> Optional[Dict[str, Any]]:
     """
@@ -176,6 +182,7 @@ def archive_cycle_crud(cycle_id: int) -> bool:
         WHERE id = %s
     """
     rows = execute_command(query, (CycleStatus.ARCHIVED, cycle_id))
+    _invalidate_work_contexts()
     return rows > 0
 
 
@@ -184,7 +191,8 @@ def delete_cycle(cycle_id: int) -> bool:
     Permanently delete a cycle and all associated data.
 
     WARNING: This is a hard delete that will remove ALL related records:
-    - All batches and jobs (must be deleted first due to FK constraints)
+    - All batches, job configurations and jobs
+    - All job tracking and batch reconciliation logs
     - All configurations
     - All stages, steps, and step runs
     - All associated execution history
@@ -220,54 +228,48 @@ def delete_cycle(cycle_id: int) -> bool:
         Use archive_cycle_by_name(): Safer alternative that preserves data
         Use get_cycle_by_name(): To verify before deleting
     """
-    # Get all configuration IDs for this cycle
-    config_query = """
-        SELECT id FROM irp_configuration
-        WHERE cycle_id = %s
-    """
-    config_df = execute_query(config_query, (cycle_id,))
-
-    if not config_df.empty:
-        config_ids = tuple(config_df['id'].tolist())
-
-        # Get all batch IDs for these configurations
-        if len(config_ids) == 1:
-            batch_query = "SELECT id FROM irp_batch WHERE configuration_id = %s"
-            batch_df = execute_query(batch_query, config_ids)
-        else:
-            batch_query = "SELECT id FROM irp_batch WHERE configuration_id IN %s"
-            batch_df = execute_query(batch_query, (config_ids,))
-
-        if not batch_df.empty:
-            batch_ids = tuple(batch_df['id'].tolist())
-
-            # Delete in order: irp_job -> irp_job_configuration -> irp_batch
-            # (irp_job has CASCADE from irp_batch, but we'll be explicit)
-
-            # Delete jobs first
-            if len(batch_ids) == 1:
-                execute_command("DELETE FROM irp_job WHERE batch_id = %s", batch_ids)
-            else:
-                execute_command("DELETE FROM irp_job WHERE batch_id IN %s", (batch_ids,))
-
-            # Delete job configurations
-            if len(batch_ids) == 1:
-                execute_command("DELETE FROM irp_job_configuration WHERE batch_id = %s", batch_ids)
-            else:
-                execute_command("DELETE FROM irp_job_configuration WHERE batch_id IN %s", (batch_ids,))
-
-            # Finally delete batches
-            if len(batch_ids) == 1:
-                execute_command("DELETE FROM irp_batch WHERE id = %s", batch_ids)
-            else:
-                execute_command("DELETE FROM irp_batch WHERE id IN %s", (batch_ids,))
-
-    # Now delete the cycle (which will CASCADE to configurations, stages, steps, etc.)
+    # Remove the whole subtree in one statement (one round-trip, one transaction).
+    # Tracking/recon logs and jobs are deleted set-based here rather than via
+    # per-row ON DELETE CASCADE triggers. FK checks run at end of statement, so
+    # the cycle delete can cascade to configurations/stages/steps after the
+    # batches referencing them are gone.
     query = """
+        WITH target_batch AS (
+            SELECT b.id
+            FROM irp_batch b
+            INNER JOIN irp_configuration c ON c.id = b.configuration_id
+            WHERE c.cycle_id = %s
+        ),
+        deleted_tracking_log AS (
+            DELETE FROM irp_job_tracking_log tl
+            USING irp_job j, target_batch tb
+            WHERE tl.job_id = j.id AND j.batch_id = tb.id
+        ),
+        deleted_recon_log AS (
+            DELETE FROM irp_batch_recon_log rl
+            USING target_batch tb
+            WHERE rl.batch_id = tb.id
+        ),
+        deleted_job AS (
+            DELETE FROM irp_job j
+            USING target_batch tb
+            WHERE j.batch_id = tb.id
+        ),
+        deleted_job_configuration AS (
+            DELETE FROM irp_job_configuration jc
+            USING target_batch tb
+            WHERE jc.batch_id = tb.id
+        ),
+        deleted_batch AS (
+            DELETE FROM irp_batch b
+            USING target_batch tb
+            WHERE b.id = tb.id
+        )
         DELETE FROM irp_cycle
         WHERE id = %s
     """
-    rows = execute_command(query, (cycle_id,))
+    rows = execute_command(query, (cycle_id, cycle_id))
+    _invalidate_work_contexts()
     return rows > 0
 
 
@@ -220,7 +220,19 @@ Functions return different types based on their purpose:
        )
        # Returns: [101, 102, 103] (three new stage IDs)
 
-6. Domain-specific getters -> Optional[Dict[str, Any]]
+6. execute_returning() -> Optional[Dict[str, Any]]
+   - Data-modifying statement (e.g. an upsert CTE) whose first row is returned as a dict
+   - Returns None if the statement returned no rows
+   - Commits like execute_insert()
+
+   Example:
+       row = execute_returning(
+           "INSERT INTO irp_cycle (cycle_name) VALUES (%s) RETURNING id, status",
+           ('Q1-2024',)
+       )
+       # Returns: {'id': 42, 'status': 'ACTIVE'}
+
+7. Domain-specific getters -> Optional[Dict[str, Any]]
    - Functions like get_active_cycle(), get_cycle_by_name(), etc.
    - Return dict with record fields if found
    - Return None if not found
@@ -301,8 +313,9 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.pool import NullPool
 import pandas as pd
 import numpy as np
-from typing import List, Any
+from typing import List, Any, Dict, Optional
 from helpers.constants import DB_CONFIG, StepStatus
+from helpers.tracing import traced, statement_attributes
 
 # ============================================================================
 # SCHEMA CONTEXT MANAGEMENT
@@ -930,6 +943,7 @@ def view_exists(view_name: str, schema: str = 'public') -> bool:
         return False
 
 
+@traced('postgres.execute_query', describe=statement_attributes)
 def execute_query(query: str, params: tuple = None, schema: str = None) -> pd.DataFrame:
     """
     Execute SELECT query and return results as DataFrame
@@ -975,6 +989,7 @@ def execute_query(query: str, params: tuple = None, schema: str = None) -> pd.Da
         raise DatabaseError(f"✗ Query failed: {str(e)}") # pragma: no cover
 
 
+@traced('postgres.execute_scalar', describe=statement_attributes)
 def execute_scalar(query: str, params: tuple = None, schema: str = None) -> Any:
     """
     Execute query and return single scalar value
@@ -1022,6 +1037,7 @@ def execute_scalar(query: str, params: tuple = None, schema: str = None) -> Any:
         raise DatabaseError(f"✗ Scalar query failed: {str(e)}") # pragma: no cover
 
 
+@traced('postgres.execute_command', describe=statement_attributes)
 def execute_command(query: str, params: tuple = None, schema: str = None) -> int:
     """
     Execute INSERT/UPDATE/DELETE and return rows affected
@@ -1074,6 +1090,7 @@ def execute_command(query: str, params: tuple = None, schema: str = None) -> int
         raise DatabaseError(f"✗ Command failed: {str(e)}") # pragma: no cover
 
 
+@traced('postgres.execute_insert', describe=statement_attributes)
 def execute_insert(query: str, params: tuple = None, schema: str = None) -> int:
     """
     Execute INSERT and return new record ID
@@ -1132,6 +1149,44 @@ def execute_insert(query: str, params: tuple = None, schema: str = None) -> int:
         raise DatabaseError(f"✗ Insert failed: {str(e)}") # pragma: no cover
 
 
+@traced('postgres.execute_returning', describe=statement_attributes)
+def execute_returning(query: str, params: tuple = None, schema: str = None) -> Optional[Dict[str, Any]]:
+    """
+    Execute a data-modifying statement (e.g. an upsert CTE) and return its first row
+
+    Args:
+        query: SQL statement string that returns rows (RETURNING or a final SELECT)
+        params: Query parameters (optional)
+        schema: Database schema to use (optional, uses context if not provided)
+
+    Returns:
+        First result row as a dictionary, or None if no rows were returned
+
+    Transaction Behavior:
+        - If called within transaction_context(): Uses shared connection, no commit
+        - If called outside transaction: Creates connection, auto-commits
+    """
+    try:
+        # Convert numpy types to Python native types for psycopg2 compatibility
+        params = _convert_params_to_native_types(params)
+        converted_query, param_dict = _convert_query_params(query, params)
+
+        # Check if we're in a transaction context
+        if hasattr(_context, 'transaction_conn') and _context.transaction_conn is not None:
+            row = _context.transaction_conn.execute(text(converted_query), param_dict).mappings().fetchone()
+        else:
+            active_schema = schema if schema is not None else get_current_schema()
+            engine = get_engine()
+            with engine.connect() as conn:
+                _set_search_path(conn, active_schema)
+                row = conn.execute(text(converted_query), param_dict).mappings().fetchone()
+                conn.commit()
+        return dict(row) if row is not None else None
+    except Exception as e:
+        raise DatabaseError(f"✗ Statement failed: {str(e)}") # pragma: no cover
+
+
+@traced('postgres.bulk_insert', describe=statement_attributes)
 def bulk_insert(query: str, params_list: List[tuple], jsonb_columns: List[int] = None, schema: str = None) -> List[int]:
     """
     Execute bulk INSERT and return list of new record IDs
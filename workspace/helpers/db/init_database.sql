@@ -2,6 +2,8 @@
 -- PostgreSQL
 
 -- Drop tables in correct order (if recreating)
+DROP TABLE IF EXISTS irp_batch_summary CASCADE;
+DROP TABLE IF EXISTS irp_job_configuration_summary CASCADE;
 DROP TABLE IF EXISTS irp_job_tracking_log CASCADE;
 DROP TABLE IF EXISTS irp_batch_recon_log CASCADE;
 DROP TABLE IF EXISTS irp_job CASCADE;
@@ -153,16 +155,34 @@ CREATE TABLE irp_batch_recon_log (
     CONSTRAINT fk_recon_batch FOREIGN KEY (batch_id) REFERENCES irp_batch(id) ON DELETE CASCADE
 );
 
--- Job Tracking Log
+-- Job Tracking Log (range-partitioned by month on tracked_ts)
+-- Monthly partitions are created ahead of time by helpers.tracking_log.ensure_tracking_log_partitions();
+-- rows outside any monthly partition land in the default partition.
 CREATE TABLE irp_job_tracking_log (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     job_id INTEGER NOT NULL,
-    tracked_ts TIMESTAMPTZ DEFAULT NOW(),
+    tracked_ts TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     moodys_workflow_id VARCHAR(50) NOT NULL,
     job_status job_status_enum NOT NULL,
     tracking_data JSONB NULL,
+    PRIMARY KEY (id, tracked_ts),
     CONSTRAINT fk_tracking_job FOREIGN KEY (job_id) REFERENCES irp_job(id) ON DELETE CASCADE
-);
+) PARTITION BY RANGE (tracked_ts);
+
+CREATE TABLE irp_job_tracking_log_default PARTITION OF irp_job_tracking_log DEFAULT;
+
+DO $$
+DECLARE
+    month_start DATE;
+BEGIN
+    FOR i IN 0..3 LOOP
+        month_start := (date_trunc('month', NOW()) + make_interval(months => i))::DATE;
+        EXECUTE 'CREATE TABLE irp_job_tracking_log_' || to_char(month_start, 'YYYY_MM')
+            || ' PARTITION OF irp_job_tracking_log FOR VALUES FROM ('
+            || quote_literal(month_start) || ') TO ('
+            || quote_literal((month_start + INTERVAL '1 month')::DATE) || ')';
+    END LOOP;
+END $$;
 
 -- Create indexes for performance
 CREATE INDEX idx_stage_cycle ON irp_stage(cycle_id);
@@ -172,14 +192,15 @@ CREATE INDEX idx_batch_step ON irp_batch(step_id);
 CREATE INDEX idx_batch_configuration ON irp_batch(configuration_id);
 CREATE INDEX idx_batch_status ON irp_batch(status);
 CREATE INDEX idx_batch_type ON irp_batch(batch_type);
-CREATE INDEX idx_job_batch ON irp_job(batch_id);
+CREATE INDEX idx_job_batch ON irp_job(batch_id, status, skipped) INCLUDE (job_configuration_id);
 CREATE INDEX idx_job_status ON irp_job(status);
 CREATE INDEX idx_job_configuration ON irp_job(job_configuration_id);
+CREATE INDEX idx_job_configuration_batch ON irp_job_configuration(batch_id, skipped);
 CREATE INDEX idx_job_configuration_parent ON irp_job_configuration(parent_job_configuration_id);
 CREATE INDEX idx_job_configuration_override ON irp_job_configuration(override_job_configuration_id);
 CREATE INDEX idx_recon_batch ON irp_batch_recon_log(batch_id);
 CREATE INDEX idx_recon_ts ON irp_batch_recon_log(recon_ts DESC);
-CREATE INDEX idx_tracking_job ON irp_job_tracking_log(job_id);
+CREATE INDEX idx_tracking_job ON irp_job_tracking_log(job_id, tracked_ts);
 CREATE INDEX idx_tracking_ts ON irp_job_tracking_log(tracked_ts DESC);
 
 -- Grant permissions (adjust as needed)
@@ -0,0 +1,103 @@
+-- Migrate an existing irp_job_tracking_log to the monthly range-partitioned
+-- layout created by init_database.sql, keeping its rows.
+--
+-- Steps:
+--   1. Rename the unpartitioned table to irp_job_tracking_log_unpartitioned
+--   2. Create the partitioned irp_job_tracking_log with one partition per month
+--      from the oldest row to TRACKING_LOG_PARTITION_MONTHS_AHEAD (3) months
+--      ahead, plus the default partition
+--   3. Copy the rows with INSERT ... SELECT (ids are kept; the id sequence is
+--      moved to the new table)
+--   4. Recreate the indexes on the new table
+--
+-- Idempotent: if irp_job_tracking_log is already partitioned the script does
+-- nothing. The row count is checked before the script finishes; a mismatch
+-- raises and rolls everything back. irp_job_tracking_log_unpartitioned is kept
+-- for verification; drop it once you are satisfied.
+--
+-- Run in a single transaction while no jobs are being tracked, e.g.
+--   init_database(schema, sql_file_name='migrate_tracking_log_partitions.sql')
+-- or
+--   psql -1 -v ON_ERROR_STOP=1 -f migrate_tracking_log_partitions.sql
+
+DO $$
+DECLARE
+    old_rows BIGINT;
+    new_rows BIGINT;
+    first_month DATE;
+    last_month DATE;
+    month_start DATE;
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = to_regclass('irp_job_tracking_log')) = 'p' THEN
+        RAISE NOTICE 'irp_job_tracking_log is already partitioned; nothing to migrate';
+        RETURN;
+    END IF;
+
+    -- 1. Rename the old table, its primary key and indexes out of the way
+    IF to_regclass('irp_job_tracking_log') IS NOT NULL THEN
+        IF to_regclass('irp_job_tracking_log_unpartitioned') IS NOT NULL THEN
+            RAISE EXCEPTION 'Both irp_job_tracking_log and irp_job_tracking_log_unpartitioned exist; drop or rename irp_job_tracking_log_unpartitioned and re-run';
+        END IF;
+        LOCK TABLE irp_job_tracking_log IN ACCESS EXCLUSIVE MODE;
+        ALTER TABLE irp_job_tracking_log RENAME TO irp_job_tracking_log_unpartitioned;
+        ALTER INDEX IF EXISTS irp_job_tracking_log_pkey RENAME TO irp_job_tracking_log_unpartitioned_pkey;
+        ALTER INDEX IF EXISTS idx_tracking_job RENAME TO idx_tracking_unpartitioned_job;
+        ALTER INDEX IF EXISTS idx_tracking_ts RENAME TO idx_tracking_unpartitioned_ts;
+    ELSIF to_regclass('irp_job_tracking_log_unpartitioned') IS NULL THEN
+        RAISE EXCEPTION 'irp_job_tracking_log does not exist; run init_database instead';
+    END IF;
+
+    -- 2. Create the partitioned table (same definition as init_database.sql)
+    CREATE TABLE irp_job_tracking_log (
+        id INTEGER NOT NULL DEFAULT nextval('irp_job_tracking_log_id_seq'),
+        job_id INTEGER NOT NULL,
+        tracked_ts TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        moodys_workflow_id VARCHAR(50) NOT NULL,
+        job_status job_status_enum NOT NULL,
+        tracking_data JSONB NULL,
+        PRIMARY KEY (id, tracked_ts),
+        CONSTRAINT fk_tracking_job FOREIGN KEY (job_id) REFERENCES irp_job(id) ON DELETE CASCADE
+    ) PARTITION BY RANGE (tracked_ts);
+
+    CREATE TABLE irp_job_tracking_log_default PARTITION OF irp_job_tracking_log DEFAULT;
+
+    SELECT COALESCE(date_trunc('month', MIN(tracked_ts)), date_trunc('month', NOW()))::DATE
+    INTO first_month
+    FROM irp_job_tracking_log_unpartitioned;
+    last_month := (date_trunc('month', NOW()) + INTERVAL '3 months')::DATE;
+
+    month_start := first_month;
+    WHILE month_start <= last_month LOOP
+        EXECUTE 'CREATE TABLE irp_job_tracking_log_' || to_char(month_start, 'YYYY_MM')
+            || ' PARTITION OF irp_job_tracking_log FOR VALUES FROM ('
+            || quote_literal(month_start) || ') TO ('
+            || quote_literal((month_start + INTERVAL '1 month')::DATE) || ')';
+        month_start := (month_start + INTERVAL '1 month')::DATE;
+    END LOOP;
+
+    -- 3. Copy the rows (tracked_ts was nullable before partitioning)
+    INSERT INTO irp_job_tracking_log (id, job_id, tracked_ts, moodys_workflow_id, job_status, tracking_data)
+    SELECT id, job_id, COALESCE(tracked_ts, NOW()), moodys_workflow_id, job_status, tracking_data
+    FROM irp_job_tracking_log_unpartitioned;
+
+    SELECT COUNT(*) INTO old_rows FROM irp_job_tracking_log_unpartitioned;
+    SELECT COUNT(*) INTO new_rows FROM irp_job_tracking_log;
+    IF old_rows <> new_rows THEN
+        RAISE EXCEPTION USING MESSAGE =
+            'Copied ' || new_rows || ' of ' || old_rows || ' tracking log rows; migration rolled back';
+    END IF;
+
+    -- Keep the id sequence when the old table is dropped, and continue after the copied ids
+    ALTER SEQUENCE irp_job_tracking_log_id_seq OWNED BY irp_job_tracking_log.id;
+    PERFORM setval('irp_job_tracking_log_id_seq', COALESCE((SELECT MAX(id) FROM irp_job_tracking_log), 0) + 1, false);
+    ALTER TABLE irp_job_tracking_log_unpartitioned ALTER COLUMN id DROP DEFAULT;
+
+    -- 4. Recreate the indexes
+    CREATE INDEX idx_tracking_job ON irp_job_tracking_log(job_id, tracked_ts);
+    CREATE INDEX idx_tracking_ts ON irp_job_tracking_log(tracked_ts DESC);
+
+    RAISE NOTICE USING MESSAGE =
+        'Migrated ' || new_rows || ' tracking log rows into partitions from ' || first_month || ' to ' || last_month;
+END $$;
+
+ANALYZE irp_job_tracking_log;
@@ -6,6 +6,15 @@
 DROP VIEW IF EXISTS v_irp_batch;
 DROP VIEW IF EXISTS v_irp_job_configuration;
 DROP VIEW IF EXISTS v_irp_job;
+DROP FUNCTION IF EXISTS irp_batch_summary_job_trigger() CASCADE;
+DROP FUNCTION IF EXISTS irp_batch_summary_job_configuration_trigger() CASCADE;
+DROP FUNCTION IF EXISTS irp_batch_summary_batch_trigger() CASCADE;
+DROP FUNCTION IF EXISTS irp_notify_batch_status() CASCADE;
+DROP FUNCTION IF EXISTS irp_notify_job_status() CASCADE;
+DROP FUNCTION IF EXISTS irp_refresh_batch_summary(INTEGER);
+DROP FUNCTION IF EXISTS irp_refresh_job_configuration_summary(INTEGER[]);
+DROP TABLE IF EXISTS irp_batch_summary;
+DROP TABLE IF EXISTS irp_job_configuration_summary;
 DROP TABLE IF EXISTS irp_job_status_rule;
 
 -- Store job-level reporting rules
@@ -86,82 +95,410 @@ LEFT JOIN irp_job_configuration jc
 COMMENT ON VIEW v_irp_job IS 
 'Enhanced job view with derived reporting status, age calculations, and actionable recommendations based on job_status_rule table';
 
+-- Summary tables backing v_irp_job_configuration and v_irp_batch
+-- Aggregates are stored per job configuration / per batch and maintained incrementally by
+-- statement-level triggers on irp_job, irp_job_configuration and irp_batch: only the job
+-- configurations touched by a statement are recomputed, and the difference is added to their
+-- batches' totals, so reporting queries are primary-key / batch_id index lookups instead of
+-- full GROUP BY aggregations.
+CREATE TABLE irp_job_configuration_summary (
+    job_configuration_id INTEGER PRIMARY KEY,
+    batch_id INTEGER NOT NULL,
+    configuration_id INTEGER NOT NULL,
+    config_skipped BOOLEAN,
+    overridden BOOLEAN,
+    parent_job_configuration_id INTEGER,
+    total_jobs BIGINT NOT NULL,
+    unsubmitted_jobs BIGINT NOT NULL,
+    failed_jobs BIGINT NOT NULL,
+    cancelled_jobs BIGINT NOT NULL,
+    error_jobs BIGINT NOT NULL,
+    finished_jobs BIGINT NOT NULL,
+    skipped_jobs BIGINT NOT NULL,
+    has_finished_job BOOLEAN,
+    has_jobs BOOLEAN,
+    config_report_status VARCHAR(50) NOT NULL,
+    has_failures BOOLEAN NOT NULL,
+    has_errors BOOLEAN NOT NULL,
+    has_unsubmitted BOOLEAN NOT NULL,
+    progress_percent NUMERIC NOT NULL,
+    -- Job reporting statuses (v_irp_job report_status), rolled up into irp_batch_summary
+    all_jobs_unsubmitted BOOLEAN NOT NULL,
+    has_error_report_status BOOLEAN,
+    has_failed_report_status BOOLEAN,
+    refreshed_ts TIMESTAMPTZ DEFAULT NOW()
+);
+CREATE INDEX idx_jc_summary_batch ON irp_job_configuration_summary(batch_id, config_report_status);
+
+-- Running totals over a batch's irp_job_configuration_summary rows; v_irp_batch derives the
+-- batch-level flags from the *_configs counters
+CREATE TABLE irp_batch_summary (
+    batch_id INTEGER PRIMARY KEY,
+    total_configs BIGINT NOT NULL,
+    non_skipped_configs BIGINT NOT NULL,
+    fulfilled_configs BIGINT NOT NULL,
+    unfulfilled_configs BIGINT NOT NULL,
+    skipped_configs BIGINT NOT NULL,
+    total_jobs BIGINT NOT NULL,
+    unsubmitted_jobs BIGINT NOT NULL,
+    failed_jobs BIGINT NOT NULL,
+    cancelled_jobs BIGINT NOT NULL,
+    error_jobs BIGINT NOT NULL,
+    finished_jobs BIGINT NOT NULL,
+    skipped_jobs BIGINT NOT NULL,
+    failure_configs BIGINT NOT NULL,
+    error_configs BIGINT NOT NULL,
+    all_unsubmitted_configs BIGINT NOT NULL,
+    reported_configs BIGINT NOT NULL,
+    error_report_configs BIGINT NOT NULL,
+    failed_report_configs BIGINT NOT NULL,
+    refreshed_ts TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Recompute the summary rows of the given job configurations and add the change to their
+-- batches' totals. Only the jobs of these configurations are read.
+CREATE FUNCTION irp_refresh_job_configuration_summary(p_job_configuration_ids INTEGER[]) RETURNS VOID AS $$
+BEGIN
+    IF COALESCE(cardinality(p_job_configuration_ids), 0) = 0 THEN
+        RETURN;
+    END IF;
+
+    -- Serialize refreshes of the same configuration so concurrent job updates never overwrite
+    -- each other; the statement below then sees everything committed while waiting
+    PERFORM 1 FROM irp_job_configuration
+    WHERE id = ANY(p_job_configuration_ids)
+    ORDER BY id
+    FOR NO KEY UPDATE;
+
+    WITH old AS (
+        SELECT
+            job_configuration_id, batch_id, configuration_id, config_skipped, overridden,
+            parent_job_configuration_id, total_jobs, unsubmitted_jobs, failed_jobs, cancelled_jobs,
+            error_jobs, finished_jobs, skipped_jobs, has_finished_job, has_jobs,
+            config_report_status, has_failures, has_errors, has_unsubmitted, progress_percent,
+            all_jobs_unsubmitted, has_error_report_status, has_failed_report_status
+        FROM irp_job_configuration_summary
+        WHERE job_configuration_id = ANY(p_job_configuration_ids)
+    ),
+    fresh AS (
+        SELECT
+            js.job_configuration_id, js.batch_id, js.configuration_id, js.config_skipped,
+            js.overridden, js.parent_job_configuration_id, js.total_jobs, js.unsubmitted_jobs,
+            js.failed_jobs, js.cancelled_jobs, js.error_jobs, js.finished_jobs, js.skipped_jobs,
+            js.has_finished_job, js.has_jobs,
+            -- Derive Job Configuration Reporting Status
+            CASE
+                WHEN js.config_skipped THEN 'SKIPPED'
+                WHEN js.has_finished_job THEN 'FULFILLED'
+                WHEN js.total_jobs > 0 AND NOT js.has_finished_job THEN 'UNFULFILLED'
+                WHEN js.total_jobs = 0 AND NOT js.config_skipped THEN 'UNFULFILLED'
+                ELSE 'UNKNOWN'
+            END AS config_report_status,
+            js.failed_jobs > 0 AS has_failures,
+            js.error_jobs > 0 AS has_errors,
+            js.unsubmitted_jobs > 0 AS has_unsubmitted,
+            CASE
+                WHEN js.total_jobs > 0 THEN
+                    ROUND((js.finished_jobs::NUMERIC / js.total_jobs::NUMERIC) * 100, 2)
+                ELSE 0
+            END AS progress_percent,
+            js.all_jobs_unsubmitted, js.has_error_report_status, js.has_failed_report_status
+        FROM (
+            SELECT
+                jc.id,
+                jc.batch_id,
+                jc.configuration_id,
+                jc.skipped,
+                jc.overridden,
+                jc.parent_job_configuration_id,
+                -- Count jobs by status (excluding skipped jobs)
+                COUNT(*) FILTER (WHERE NOT j.skipped),
+                COUNT(*) FILTER (WHERE NOT j.skipped AND j.status = 'INITIATED'),
+                COUNT(*) FILTER (WHERE NOT j.skipped AND j.status = 'FAILED'),
+                COUNT(*) FILTER (WHERE NOT j.skipped AND j.status = 'CANCELLED'),
+                COUNT(*) FILTER (WHERE NOT j.skipped AND j.status = 'ERROR'),
+                COUNT(*) FILTER (WHERE NOT j.skipped AND j.status = 'FINISHED'),
+                -- Count skipped jobs (where skipped=True AND override_job_configuration_id IS NULL)
+                COUNT(*) FILTER (WHERE j.skipped AND jc.override_job_configuration_id IS NULL),
+                BOOL_OR(j.status = 'FINISHED' AND NOT j.skipped),
+                BOOL_AND(j.id IS NOT NULL OR jc.skipped),
+                BOOL_AND(COALESCE(r.report_status = 'UNSUBMITTED', TRUE)),
+                BOOL_OR(r.report_status = 'ERROR'),
+                BOOL_OR(r.report_status = 'FAILED')
+            FROM irp_job_configuration jc
+            LEFT JOIN irp_job j ON jc.id = j.job_configuration_id
+            LEFT JOIN irp_job_status_rule r
+                ON j.skipped = r.skipped
+                AND j.status::TEXT = r.status
+            WHERE jc.id = ANY(p_job_configuration_ids)
+            GROUP BY jc.id
+        ) AS js (
+            job_configuration_id, batch_id, configuration_id, config_skipped, overridden,
+            parent_job_configuration_id, total_jobs, unsubmitted_jobs, failed_jobs, cancelled_jobs,
+            error_jobs, finished_jobs, skipped_jobs, has_finished_job, has_jobs,
+            all_jobs_unsubmitted, has_error_report_status, has_failed_report_status
+        )
+    ),
+    upserted AS (
+        INSERT INTO irp_job_configuration_summary (
+            job_configuration_id, batch_id, configuration_id, config_skipped, overridden,
+            parent_job_configuration_id, total_jobs, unsubmitted_jobs, failed_jobs, cancelled_jobs,
+            error_jobs, finished_jobs, skipped_jobs, has_finished_job, has_jobs,
+            config_report_status, has_failures, has_errors, has_unsubmitted, progress_percent,
+            all_jobs_unsubmitted, has_error_report_status, has_failed_report_status
+        )
+        SELECT * FROM fresh
+        ON CONFLICT (job_configuration_id) DO UPDATE SET
+            batch_id = EXCLUDED.batch_id,
+            configuration_id = EXCLUDED.configuration_id,
+            config_skipped = EXCLUDED.config_skipped,
+            overridden = EXCLUDED.overridden,
+            parent_job_configuration_id = EXCLUDED.parent_job_configuration_id,
+            total_jobs = EXCLUDED.total_jobs,
+            unsubmitted_jobs = EXCLUDED.unsubmitted_jobs,
+            failed_jobs = EXCLUDED.failed_jobs,
+            cancelled_jobs = EXCLUDED.cancelled_jobs,
+            error_jobs = EXCLUDED.error_jobs,
+            finished_jobs = EXCLUDED.finished_jobs,
+            skipped_jobs = EXCLUDED.skipped_jobs,
+            has_finished_job = EXCLUDED.has_finished_job,
+            has_jobs = EXCLUDED.has_jobs,
+            config_report_status = EXCLUDED.config_report_status,
+            has_failures = EXCLUDED.has_failures,
+            has_errors = EXCLUDED.has_errors,
+            has_unsubmitted = EXCLUDED.has_unsubmitted,
+            progress_percent = EXCLUDED.progress_percent,
+            all_jobs_unsubmitted = EXCLUDED.all_jobs_unsubmitted,
+            has_error_report_status = EXCLUDED.has_error_report_status,
+            has_failed_report_status = EXCLUDED.has_failed_report_status,
+            refreshed_ts = NOW()
+    ),
+    removed AS (
+        -- Configurations deleted by the statement
+        DELETE FROM irp_job_configuration_summary s
+        WHERE s.job_configuration_id = ANY(p_job_configuration_ids)
+            AND NOT EXISTS (SELECT 1 FROM fresh f WHERE f.job_configuration_id = s.job_configuration_id)
+    ),
+    delta AS (
+        -- New contribution of each configuration minus its old one
+        SELECT 1 AS sign, * FROM fresh
+        UNION ALL
+        SELECT -1 AS sign, * FROM old
+    )
+    INSERT INTO irp_batch_summary (
+        batch_id, total_configs, non_skipped_configs, fulfilled_configs, unfulfilled_configs,
+        skipped_configs, total_jobs, unsubmitted_jobs, failed_jobs, cancelled_jobs, error_jobs,
+        finished_jobs, skipped_jobs, failure_configs, error_configs, all_unsubmitted_configs,
+        reported_configs, error_report_configs, failed_report_configs
+    )
+    SELECT
+        d.batch_id,
+        SUM(d.sign),
+        SUM(CASE WHEN NOT d.config_skipped THEN d.sign ELSE 0 END),
+        SUM(CASE WHEN d.config_report_status = 'FULFILLED' THEN d.sign ELSE 0 END),
+        SUM(CASE WHEN d.config_report_status = 'UNFULFILLED' THEN d.sign ELSE 0 END),
+        SUM(CASE WHEN d.config_report_status = 'SKIPPED' THEN d.sign ELSE 0 END),
+        SUM(d.sign * d.total_jobs),
+        SUM(d.sign * d.unsubmitted_jobs),
+        SUM(d.sign * d.failed_jobs),
+        SUM(d.sign * d.cancelled_jobs),
+        SUM(d.sign * d.error_jobs),
+        SUM(d.sign * d.finished_jobs),
+        SUM(d.sign * d.skipped_jobs),
+        SUM(CASE WHEN d.has_failures THEN d.sign ELSE 0 END),
+        SUM(CASE WHEN d.has_errors THEN d.sign ELSE 0 END),
+        SUM(CASE WHEN d.all_jobs_unsubmitted THEN d.sign ELSE 0 END),
+        SUM(CASE WHEN d.has_error_report_status IS NOT NULL THEN d.sign ELSE 0 END),
+        SUM(CASE WHEN d.has_error_report_status THEN d.sign ELSE 0 END),
+        SUM(CASE WHEN d.has_failed_report_status THEN d.sign ELSE 0 END)
+    FROM delta d
+    -- Skip batches deleted by the statement (irp_batch_summary_batch_trigger drops their rows)
+    WHERE EXISTS (SELECT 1 FROM irp_batch b WHERE b.id = d.batch_id)
+    GROUP BY d.batch_id
+    ORDER BY d.batch_id
+    ON CONFLICT (batch_id) DO UPDATE SET
+        total_configs = irp_batch_summary.total_configs + EXCLUDED.total_configs,
+        non_skipped_configs = irp_batch_summary.non_skipped_configs + EXCLUDED.non_skipped_configs,
+        fulfilled_configs = irp_batch_summary.fulfilled_configs + EXCLUDED.fulfilled_configs,
+        unfulfilled_configs = irp_batch_summary.unfulfilled_configs + EXCLUDED.unfulfilled_configs,
+        skipped_configs = irp_batch_summary.skipped_configs + EXCLUDED.skipped_configs,
+        total_jobs = irp_batch_summary.total_jobs + EXCLUDED.total_jobs,
+        unsubmitted_jobs = irp_batch_summary.unsubmitted_jobs + EXCLUDED.unsubmitted_jobs,
+        failed_jobs = irp_batch_summary.failed_jobs + EXCLUDED.failed_jobs,
+        cancelled_jobs = irp_batch_summary.cancelled_jobs + EXCLUDED.cancelled_jobs,
+        error_jobs = irp_batch_summary.error_jobs + EXCLUDED.error_jobs,
+        finished_jobs = irp_batch_summary.finished_jobs + EXCLUDED.finished_jobs,
+        skipped_jobs = irp_batch_summary.skipped_jobs + EXCLUDED.skipped_jobs,
+        failure_configs = irp_batch_summary.failure_configs + EXCLUDED.failure_configs,
+        error_configs = irp_batch_summary.error_configs + EXCLUDED.error_configs,
+        all_unsubmitted_configs = irp_batch_summary.all_unsubmitted_configs + EXCLUDED.all_unsubmitted_configs,
+        reported_configs = irp_batch_summary.reported_configs + EXCLUDED.reported_configs,
+        error_report_configs = irp_batch_summary.error_report_configs + EXCLUDED.error_report_configs,
+        failed_report_configs = irp_batch_summary.failed_report_configs + EXCLUDED.failed_report_configs,
+        refreshed_ts = NOW();
+END;
+$$ LANGUAGE plpgsql SET search_path FROM CURRENT;
+
+-- Trigger functions: refresh the job configurations touched by the statement (transition tables)
+CREATE FUNCTION irp_batch_summary_job_trigger() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM irp_refresh_job_configuration_summary(
+            ARRAY(SELECT DISTINCT job_configuration_id FROM new_rows)
+        );
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM irp_refresh_job_configuration_summary(
+            ARRAY(SELECT DISTINCT job_configuration_id FROM old_rows)
+        );
+    ELSE
+        -- Only status/skipped/configuration changes affect the summaries (heartbeat updates are ignored)
+        PERFORM irp_refresh_job_configuration_summary(ARRAY(
+            SELECT DISTINCT v.job_configuration_id
+            FROM new_rows n
+            JOIN old_rows o ON o.id = n.id
+            CROSS JOIN LATERAL (VALUES (n.job_configuration_id), (o.job_configuration_id))
+                AS v (job_configuration_id)
+            WHERE (n.status, n.skipped, n.job_configuration_id)
+                IS DISTINCT FROM (o.status, o.skipped, o.job_configuration_id)
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SET search_path FROM CURRENT;
+
+CREATE FUNCTION irp_batch_summary_job_configuration_trigger() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM irp_refresh_job_configuration_summary(ARRAY(SELECT id FROM new_rows));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM irp_refresh_job_configuration_summary(ARRAY(SELECT id FROM old_rows));
+    ELSE
+        PERFORM irp_refresh_job_configuration_summary(ARRAY(
+            SELECT n.id
+            FROM new_rows n
+            JOIN old_rows o ON o.id = n.id
+            WHERE (n.batch_id, n.configuration_id, n.skipped, n.overridden,
+                   n.parent_job_configuration_id, n.override_job_configuration_id)
+                IS DISTINCT FROM (o.batch_id, o.configuration_id, o.skipped, o.overridden,
+                   o.parent_job_configuration_id, o.override_job_configuration_id)
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SET search_path FROM CURRENT;
+
+CREATE FUNCTION irp_batch_summary_batch_trigger() RETURNS TRIGGER AS $$
+BEGIN
+    DELETE FROM irp_job_configuration_summary s USING old_rows o WHERE s.batch_id = o.id;
+    DELETE FROM irp_batch_summary s USING old_rows o WHERE s.batch_id = o.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SET search_path FROM CURRENT;
+
+CREATE TRIGGER trg_job_summary_insert AFTER INSERT ON irp_job
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION irp_batch_summary_job_trigger();
+CREATE TRIGGER trg_job_summary_update AFTER UPDATE ON irp_job
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION irp_batch_summary_job_trigger();
+CREATE TRIGGER trg_job_summary_delete AFTER DELETE ON irp_job
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION irp_batch_summary_job_trigger();
+
+CREATE TRIGGER trg_job_configuration_summary_insert AFTER INSERT ON irp_job_configuration
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION irp_batch_summary_job_configuration_trigger();
+CREATE TRIGGER trg_job_configuration_summary_update AFTER UPDATE ON irp_job_configuration
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION irp_batch_summary_job_configuration_trigger();
+CREATE TRIGGER trg_job_configuration_summary_delete AFTER DELETE ON irp_job_configuration
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION irp_batch_summary_job_configuration_trigger();
+
+CREATE TRIGGER trg_batch_summary_delete AFTER DELETE ON irp_batch
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION irp_batch_summary_batch_trigger();
+
+-- Notify listeners (e.g. the dashboard cache) when a batch changes status
+-- Payload: '<schema>:<batch_id>' on channel irp_batch_status
+CREATE FUNCTION irp_notify_batch_status() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('irp_batch_status', TG_TABLE_SCHEMA || ':' || NEW.id);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_batch_status_notify AFTER UPDATE OF status ON irp_batch
+    FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+    EXECUTE FUNCTION irp_notify_batch_status();
+
+-- Notify listeners (dashboard live progress streams, notebooks) of job status deltas.
+-- Payload is a small JSON document; clients re-read anything else they need.
+CREATE FUNCTION irp_notify_job_status() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('irp_job_status', json_build_object(
+        'schema', TG_TABLE_SCHEMA,
+        'batch_id', NEW.batch_id,
+        'job_id', NEW.id,
+        'job_configuration_id', NEW.job_configuration_id,
+        'status', NEW.status,
+        'skipped', NEW.skipped,
+        'moodys_workflow_id', NEW.moodys_workflow_id,
+        'updated_ts', NEW.updated_ts,
+        'op', TG_OP
+    )::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_job_status_notify_insert AFTER INSERT ON irp_job
+    FOR EACH ROW EXECUTE FUNCTION irp_notify_job_status();
+
+CREATE TRIGGER trg_job_status_notify_update AFTER UPDATE OF status, skipped ON irp_job
+    FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status OR OLD.skipped IS DISTINCT FROM NEW.skipped)
+    EXECUTE FUNCTION irp_notify_job_status();
+
+-- Backfill summaries for existing job configurations
+SELECT irp_refresh_job_configuration_summary(ARRAY(SELECT id FROM irp_job_configuration));
+
 -- View for job configuration-level reporting
--- This view aggregates job-level data to provide configuration-level reporting metrics and status
+-- Aggregated job statistics come from irp_job_configuration_summary
 CREATE VIEW v_irp_job_configuration AS
-WITH job_stats AS (
-    SELECT 
-        jc.id AS job_configuration_id,
-        jc.batch_id,
-        jc.configuration_id,
-        jc.skipped AS config_skipped,
-        jc.overridden,
-        jc.parent_job_configuration_id,
-        -- Count jobs by status (excluding skipped jobs)
-        COUNT(*) FILTER (WHERE NOT j.skipped) AS total_jobs,
-        COUNT(*) FILTER (WHERE NOT j.skipped AND j.status = 'INITIATED') AS unsubmitted_jobs,
-        COUNT(*) FILTER (WHERE NOT j.skipped AND j.status = 'FAILED') AS failed_jobs,
-        COUNT(*) FILTER (WHERE NOT j.skipped AND j.status = 'CANCELLED') AS cancelled_jobs,
-        COUNT(*) FILTER (WHERE NOT j.skipped AND j.status = 'ERROR') AS error_jobs,
-        COUNT(*) FILTER (WHERE NOT j.skipped AND j.status = 'FINISHED') AS finished_jobs,
-        -- Count skipped jobs (where skipped=True AND override_job_configuration_id IS NULL)
-        COUNT(*) FILTER (WHERE j.skipped AND jc.override_job_configuration_id IS NULL) AS skipped_jobs,
-        -- Check if any job is finished
-        BOOL_OR(j.status = 'FINISHED' AND NOT j.skipped) AS has_finished_job,
-        -- Check if all non-skipped jobs exist
-        BOOL_AND(j.id IS NOT NULL OR jc.skipped) AS has_jobs
-    FROM irp_job_configuration jc
-    LEFT JOIN irp_job j ON jc.id = j.job_configuration_id
-    GROUP BY jc.id, jc.batch_id, jc.configuration_id, jc.skipped, 
-             jc.overridden, jc.parent_job_configuration_id
-)
-SELECT 
-    js.*,
-    -- Derive Job Configuration Reporting Status (per Image 2 rules)
-    CASE 
-        -- Rule 1: Skipped configurations
-        WHEN js.config_skipped THEN 'SKIPPED'
-        -- Rule 2: Has at least one FINISHED job
-        WHEN js.has_finished_job THEN 'FULFILLED'
-        -- Rule 3: Has jobs but none are FINISHED
-        WHEN js.total_jobs > 0 AND NOT js.has_finished_job THEN 'UNFULFILLED'
-        -- Rule 4: No jobs at all for non-skipped config
-        WHEN js.total_jobs = 0 AND NOT js.config_skipped THEN 'UNFULFILLED'
-        ELSE 'UNKNOWN'
-    END AS config_report_status,
-    -- Additional derived metrics
-    CASE 
-        WHEN js.failed_jobs > 0 THEN TRUE
-        ELSE FALSE
-    END AS has_failures,
-    CASE 
-        WHEN js.error_jobs > 0 THEN TRUE
-        ELSE FALSE
-    END AS has_errors,
-    CASE 
-        WHEN js.unsubmitted_jobs > 0 THEN TRUE
-        ELSE FALSE
-    END AS has_unsubmitted,
-    -- Progress percentage (finished / total non-skipped jobs)
-    CASE 
-        WHEN js.total_jobs > 0 THEN 
-            ROUND((js.finished_jobs::NUMERIC / js.total_jobs::NUMERIC) * 100, 2)
-        ELSE 0
-    END AS progress_percent,
+SELECT
+    s.job_configuration_id,
+    s.batch_id,
+    s.configuration_id,
+    s.config_skipped,
+    s.overridden,
+    s.parent_job_configuration_id,
+    s.total_jobs,
+    s.unsubmitted_jobs,
+    s.failed_jobs,
+    s.cancelled_jobs,
+    s.error_jobs,
+    s.finished_jobs,
+    s.skipped_jobs,
+    s.has_finished_job,
+    s.has_jobs,
+    s.config_report_status,
+    s.has_failures,
+    s.has_errors,
+    s.has_unsubmitted,
+    s.progress_percent,
     jc.job_configuration_data,
     jc.skipped_reason_txt,
     jc.override_reason_txt,
     jc.override_job_configuration_id,
     jc.created_ts,
     jc.updated_ts
-FROM job_stats js
-JOIN irp_job_configuration jc ON js.job_configuration_id = jc.id;
+FROM irp_job_configuration_summary s
+JOIN irp_job_configuration jc ON s.job_configuration_id = jc.id;
 
 COMMENT ON VIEW v_irp_job_configuration IS 
 'Job configuration view with aggregated job statistics and derived reporting status (FULFILLED/UNFULFILLED/SKIPPED)';
 
 -- View for batch-level reporting
--- This view aggregates job configuration and job-level data to provide batch-level reporting metrics and status
+-- Aggregated configuration and job statistics come from irp_batch_summary
 CREATE VIEW v_irp_batch AS
 WITH batch_stats AS (
     SELECT
@@ -170,40 +507,37 @@ WITH batch_stats AS (
         b.configuration_id,
         b.batch_type,
         b.status AS batch_status,
-        -- Configuration stats
-        COUNT(DISTINCT jc.id) AS total_configs,
-        COUNT(DISTINCT jc.id) FILTER (WHERE NOT jc.skipped) AS non_skipped_configs,
-        COUNT(DISTINCT jc.id) FILTER (WHERE vjc.config_report_status = 'FULFILLED') AS fulfilled_configs,
-        COUNT(DISTINCT jc.id) FILTER (WHERE vjc.config_report_status = 'UNFULFILLED') AS unfulfilled_configs,
-        COUNT(DISTINCT jc.id) FILTER (WHERE vjc.config_report_status = 'SKIPPED') AS skipped_configs,
-        -- Job stats (from v_irp_job_configuration)
-        -- Use COALESCE to handle empty batches (no job configs) where SUM returns NULL
-        COALESCE(SUM(vjc.total_jobs), 0) AS total_jobs,
-        COALESCE(SUM(vjc.unsubmitted_jobs), 0) AS unsubmitted_jobs,
-        COALESCE(SUM(vjc.failed_jobs), 0) AS failed_jobs,
-        COALESCE(SUM(vjc.cancelled_jobs), 0) AS cancelled_jobs,
-        COALESCE(SUM(vjc.error_jobs), 0) AS error_jobs,
-        COALESCE(SUM(vjc.finished_jobs), 0) AS finished_jobs,
-        COALESCE(SUM(vjc.skipped_jobs), 0) AS skipped_jobs,
-        -- Aggregate flags
-        BOOL_OR(vjc.has_failures) AS has_any_failures,
-        BOOL_OR(vjc.has_errors) AS has_any_errors,
-        -- Check if all jobs are UNSUBMITTED (using v_irp_job report_status)
-        BOOL_AND(COALESCE(vj.report_status = 'UNSUBMITTED', TRUE)) AS all_jobs_unsubmitted,
-        -- Check if at least one job has ERROR reporting status
-        BOOL_OR(vj.report_status = 'ERROR') AS has_error_report_status,
-        -- Check if at least one job has FAILED reporting status
-        BOOL_OR(vj.report_status = 'FAILED') AS has_failed_report_status,
+        -- Batches without a summary row have no job configurations yet
+        COALESCE(s.total_configs, 0) AS total_configs,
+        COALESCE(s.non_skipped_configs, 0) AS non_skipped_configs,
+        COALESCE(s.fulfilled_configs, 0) AS fulfilled_configs,
+        COALESCE(s.unfulfilled_configs, 0) AS unfulfilled_configs,
+        COALESCE(s.skipped_configs, 0) AS skipped_configs,
+        COALESCE(s.total_jobs, 0) AS total_jobs,
+        COALESCE(s.unsubmitted_jobs, 0) AS unsubmitted_jobs,
+        COALESCE(s.failed_jobs, 0) AS failed_jobs,
+        COALESCE(s.cancelled_jobs, 0) AS cancelled_jobs,
+        COALESCE(s.error_jobs, 0) AS error_jobs,
+        COALESCE(s.finished_jobs, 0) AS finished_jobs,
+        COALESCE(s.skipped_jobs, 0) AS skipped_jobs,
+        CASE WHEN s.total_configs > 0 THEN s.failure_configs > 0 END AS has_any_failures,
+        CASE WHEN s.total_configs > 0 THEN s.error_configs > 0 END AS has_any_errors,
+        COALESCE(s.all_unsubmitted_configs = s.total_configs, TRUE) AS all_jobs_unsubmitted,
+        -- Job reporting statuses (v_irp_job report_status) across the batch's configurations
+        CASE
+            WHEN s.error_report_configs > 0 THEN TRUE
+            WHEN s.reported_configs > 0 THEN FALSE
+        END AS has_error_report_status,
+        CASE
+            WHEN s.failed_report_configs > 0 THEN TRUE
+            WHEN s.reported_configs > 0 THEN FALSE
+        END AS has_failed_report_status,
         b.created_ts,
         b.submitted_ts,
         b.completed_ts,
         b.updated_ts
     FROM irp_batch b
-    LEFT JOIN irp_job_configuration jc ON b.id = jc.batch_id
-    LEFT JOIN v_irp_job_configuration vjc ON jc.id = vjc.job_configuration_id
-    LEFT JOIN v_irp_job vj ON jc.id = vj.job_configuration_id
-    GROUP BY b.id, b.step_id, b.configuration_id, b.batch_type,
-             b.status, b.created_ts, b.submitted_ts, b.completed_ts, b.updated_ts
+    LEFT JOIN irp_batch_summary s ON s.batch_id = b.id
 )
 SELECT
     bs.*,
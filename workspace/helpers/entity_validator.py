@@ -5,12 +5,19 @@ Validates that entities from configuration files don't already exist in Moody's.
 Used during configuration file validation to prevent conflicts with existing data.
 """
 
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Hashable, TYPE_CHECKING
 
 from helpers.constants import DEFAULT_DATABASE_SERVER, BatchType
-from helpers.irp_integration.client import Client
+from helpers.irp_integration.constants import NAME_FILTER_CHUNK_SIZE
 from helpers.irp_integration.exceptions import IRPAPIError
-from helpers.irp_integration.portfolio import resolve_cycle_type_directory
+from helpers.irp_integration.utils import LookupCache, chunk_list, name_in_filter, quote_filter_value
+
+if TYPE_CHECKING:
+    from helpers.irp_integration.client import Client
+
+
+# Maximum concurrent searches issued by an EntitySnapshot
+ENTITY_SNAPSHOT_MAX_WORKERS = 8
 
 
 def _format_entity_list(entities: List[str], indent: str = "  \n- ") -> str:
@@ -18,17 +25,178 @@ def _format_entity_list(entities: List[str], indent: str = "  \n- ") -> str:
     return "\n" + "\n".join(f"{indent}{e}" for e in entities)
 
 
+class EntitySnapshot(LookupCache):
+    """
+    Per-validation-session cache of Moody's entity lookups.
+
+    Caches EDMs by name, portfolios and treaties by (exposure ID, name),
+    analyses by (EDM name, name), plus account/location probes per portfolio
+    and cedants per EDM. Both found and not-found results are cached, so repeated validate_*
+    calls within a session answer from the snapshot. Uncached names are
+    fetched in chunked IN-filter searches run concurrently (see LookupCache).
+
+    Failed searches are not cached; the next lookup retries and raises.
+    """
+
+    def __init__(
+        self,
+        validator: 'EntityValidator',
+        max_workers: int = ENTITY_SNAPSHOT_MAX_WORKERS,
+        chunk_size: int = NAME_FILTER_CHUNK_SIZE
+    ):
+        """
+        Initialize an empty snapshot.
+
+        Args:
+            validator: EntityValidator whose managers are used for API calls
+            max_workers: Maximum concurrent searches
+            chunk_size: Maximum names per IN-filter search
+        """
+        super().__init__(max_workers, chunk_size)
+        self._validator = validator
+
+        self._edms: Dict[Tuple[Hashable, str], List[Dict[str, Any]]] = {}
+        self._portfolios: Dict[Tuple[Hashable, str], List[Dict[str, Any]]] = {}
+        self._treaties: Dict[Tuple[Hashable, str], List[Dict[str, Any]]] = {}
+        self._analyses: Dict[Tuple[Hashable, str], List[Dict[str, Any]]] = {}
+        self._has_accounts: Dict[Hashable, bool] = {}
+        self._location_status: Dict[Hashable, Dict[str, bool]] = {}
+        self._cedants: Dict[Hashable, List[Dict[str, Any]]] = {}
+
+    # -------------------------------------------------------------------------
+    # Search functions (one chunk per call)
+    # -------------------------------------------------------------------------
+
+    def _search_edms(self, _scope, names: List[str]) -> List[Dict[str, Any]]:
+        return self._validator.edm_manager.search_edms_paginated(
+            filter=name_in_filter('exposureName', names)
+        )
+
+    def _search_portfolios(self, exposure_id, names: List[str]) -> List[Dict[str, Any]]:
+        return self._validator.portfolio_manager.search_portfolios_paginated(
+            exposure_id=exposure_id,
+            filter=name_in_filter('portfolioName', names)
+        )
+
+    def _search_treaties(self, exposure_id, names: List[str]) -> List[Dict[str, Any]]:
+        return self._validator.treaty_manager.search_treaties_paginated(
+            exposure_id=exposure_id,
+            filter=name_in_filter('treatyName', names)
+        )
+
+    def _search_analyses(self, edm_name, names: List[str]) -> List[Dict[str, Any]]:
+        filter_str = name_in_filter('analysisName', names)
+        if edm_name:
+            filter_str += f' AND exposureName = {quote_filter_value(edm_name)}'
+        return self._validator.analysis_manager.search_analyses_paginated(filter=filter_str)
+
+    def _portfolio_has_accounts(self, key: Tuple[int, int]) -> bool:
+        exposure_id, portfolio_id = key
+        return self._validator.portfolio_manager.portfolio_has_accounts(
+            exposure_id=exposure_id,
+            portfolio_id=portfolio_id
+        )
+
+    def _get_location_status(self, key: Tuple[int, int]) -> Dict[str, bool]:
+        exposure_id, portfolio_id = key
+        return self._validator.portfolio_manager.get_location_status(
+            exposure_id=exposure_id,
+            portfolio_id=portfolio_id
+        )
+
+    def _get_cedants(self, exposure_id: int) -> List[Dict[str, Any]]:
+        return self._validator.edm_manager.get_cedants_by_edm(exposure_id) or []
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+
+    def find_edms(self, edm_names: List[str]) -> List[Dict[str, Any]]:
+        """Get EDM records for the given names (missing names are omitted)."""
+        return self.lookup_names(self._edms, None, edm_names, self._search_edms, 'exposureName')
+
+    def find_portfolios(self, exposure_id: int, portfolio_names: List[str]) -> List[Dict[str, Any]]:
+        """Get portfolio records for the given names within an EDM."""
+        return self.lookup_names(
+            self._portfolios, exposure_id, portfolio_names, self._search_portfolios, 'portfolioName'
+        )
+
+    def find_treaties(self, exposure_id: int, treaty_names: List[str]) -> List[Dict[str, Any]]:
+        """Get treaty records for the given names within an EDM."""
+        return self.lookup_names(
+            self._treaties, exposure_id, treaty_names, self._search_treaties, 'treatyName'
+        )
+
+    def find_analyses(self, analysis_names: List[str], edm_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get analysis records by name, optionally scoped to an EDM (exposureName).
+
+        Unscoped lookups return matching analyses and groups across all EDMs.
+        """
+        return self.lookup_names(
+            self._analyses, edm_name, analysis_names, self._search_analyses, 'analysisName',
+            legacy_calls=len(chunk_list(analysis_names, self.chunk_size))
+        )
+
+    def portfolio_has_accounts(self, exposure_id: int, portfolio_id: int) -> bool:
+        """Check whether a portfolio has any accounts."""
+        return self.lookup_key(self._has_accounts, (exposure_id, portfolio_id), self._portfolio_has_accounts)
+
+    def get_location_status(self, exposure_id: int, portfolio_id: int) -> Dict[str, bool]:
+        """Check whether a portfolio has accounts and locations."""
+        return self.lookup_key(self._location_status, (exposure_id, portfolio_id), self._get_location_status)
+
+    def get_cedants(self, exposure_id: int) -> List[Dict[str, Any]]:
+        """Get cedants for an EDM."""
+        return self.lookup_key(self._cedants, exposure_id, self._get_cedants)
+
+    # -------------------------------------------------------------------------
+    # Concurrent prefetch (errors are left for the per-scope lookup to report)
+    # -------------------------------------------------------------------------
+
+    def prefetch_portfolios(self, names_by_exposure_id: Dict[int, List[str]]) -> None:
+        """Fetch portfolios for several EDMs concurrently."""
+        self.fetch_names(self._portfolios, names_by_exposure_id, self._search_portfolios, 'portfolioName')
+
+    def prefetch_treaties(self, names_by_exposure_id: Dict[int, List[str]]) -> None:
+        """Fetch treaties for several EDMs concurrently."""
+        self.fetch_names(self._treaties, names_by_exposure_id, self._search_treaties, 'treatyName')
+
+    def prefetch_analyses(self, names_by_edm: Dict[Optional[str], List[str]]) -> None:
+        """Fetch analyses for several EDMs concurrently (None key = unscoped)."""
+        self.fetch_names(self._analyses, names_by_edm, self._search_analyses, 'analysisName')
+
+    def prefetch_has_accounts(self, portfolio_keys: List[Tuple[int, int]]) -> None:
+        """Probe accounts for several (exposure_id, portfolio_id) pairs concurrently."""
+        self.fetch_keys(self._has_accounts, portfolio_keys, self._portfolio_has_accounts)
+
+    def prefetch_location_status(self, portfolio_keys: List[Tuple[int, int]]) -> None:
+        """Probe accounts and locations for several (exposure_id, portfolio_id) pairs concurrently."""
+        self.fetch_keys(self._location_status, portfolio_keys, self._get_location_status)
+
+    def prefetch_cedants(self, exposure_ids: List[int]) -> None:
+        """Fetch cedants for several EDMs concurrently."""
+        self.fetch_keys(self._cedants, exposure_ids, self._get_cedants)
+
+
 class EntityValidator:
     """Validates entity existence in Moody's Risk Modeler."""
 
-    def __init__(self, client: Optional[Client] = None):
+    def __init__(self, client: Optional['Client'] = None, use_snapshot: bool = False):
         """
         Initialize entity validator.
 
         Args:
             client: Optional IRP API client instance. If not provided, one will be created.
-        """
-        self.client = client or Client()
+            use_snapshot: If True, answer lookups from a per-session EntitySnapshot so
+                          repeated validations don't re-query Moody's. Create a new
+                          validator (or call reset_snapshot) to start a fresh session.
+        """
+        if client is None:
+            from helpers.irp_integration.client import Client
+            client = Client()
+        self.client = client
+        self.snapshot: Optional[EntitySnapshot] = EntitySnapshot(self) if use_snapshot else None
         self._edm_manager = None
         self._portfolio_manager = None
         self._treaty_manager = None
@@ -84,6 +252,117 @@ class EntityValidator:
             self._reference_data_manager = ReferenceDataManager(self.client)
         return self._reference_data_manager
 
+    def reset_snapshot(self) -> None:
+        """Discard cached lookups and start a new snapshot session."""
+        self.snapshot = EntitySnapshot(self)
+
+    def get_snapshot_report(self) -> Optional[Dict[str, int]]:
+        """Get API usage report for the snapshot session (None if snapshots are disabled)."""
+        return self.snapshot.report() if self.snapshot is not None else None
+
+    # =========================================================================
+    # Entity Lookups (direct API calls, or the session snapshot when enabled)
+    # =========================================================================
+
+    def _find_edms(self, edm_names: List[str]) -> List[Dict[str, Any]]:
+        """Search EDMs by name."""
+        if self.snapshot is not None:
+            return self.snapshot.find_edms(edm_names)
+        return self.edm_manager.search_edms_paginated(
+            filter=name_in_filter('exposureName', edm_names)
+        )
+
+    def _find_portfolios(self, exposure_id: int, portfolio_names: List[str]) -> List[Dict[str, Any]]:
+        """Search portfolios by name within an EDM."""
+        if self.snapshot is not None:
+            return self.snapshot.find_portfolios(exposure_id, portfolio_names)
+        return self.portfolio_manager.search_portfolios_paginated(
+            exposure_id=exposure_id,
+            filter=name_in_filter('portfolioName', portfolio_names)
+        )
+
+    def _find_treaties(self, exposure_id: int, treaty_names: List[str]) -> List[Dict[str, Any]]:
+        """Search treaties by name within an EDM."""
+        if self.snapshot is not None:
+            return self.snapshot.find_treaties(exposure_id, treaty_names)
+        return self.treaty_manager.search_treaties_paginated(
+            exposure_id=exposure_id,
+            filter=name_in_filter('treatyName', treaty_names)
+        )
+
+    def _find_analyses(
+        self,
+        analysis_names: List[str],
+        edm_name: Optional[str] = None,
+        groups_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Search analyses (or groups) by name, in chunks of NAME_FILTER_CHUNK_SIZE.
+
+        Args:
+            analysis_names: Analysis/group names
+            edm_name: Optional EDM name (exposureName) to scope the search
+            groups_only: Only return groups (engineType = "Group")
+        """
+        if self.snapshot is not None:
+            found = self.snapshot.find_analyses(analysis_names, edm_name)
+            if groups_only:
+                found = [a for a in found if a.get('engineType') == 'Group']
+            return found
+
+        found = []
+        for batch in chunk_list(analysis_names, NAME_FILTER_CHUNK_SIZE):
+            filter_str = name_in_filter('analysisName', batch)
+            if edm_name:
+                filter_str += f' AND exposureName = {quote_filter_value(edm_name)}'
+            if groups_only:
+                # Groups are stored as analyses in Moody's but have engineType = "Group"
+                filter_str += ' AND engineType = "Group"'
+            found.extend(self.analysis_manager.search_analyses_paginated(filter=filter_str))
+        return found
+
+    def _portfolio_has_accounts(self, exposure_id: int, portfolio_id: int) -> bool:
+        """Check whether a portfolio has accounts (fetches at most one)."""
+        if self.snapshot is not None:
+            return self.snapshot.portfolio_has_accounts(exposure_id, portfolio_id)
+        return self.portfolio_manager.portfolio_has_accounts(
+            exposure_id=exposure_id,
+            portfolio_id=portfolio_id
+        )
+
+    def _get_location_status(self, exposure_id: int, portfolio_id: int) -> Dict[str, bool]:
+        """Check whether a portfolio has accounts and locations (shared with GeoHaz submission)."""
+        if self.snapshot is not None:
+            return self.snapshot.get_location_status(exposure_id, portfolio_id)
+        return self.portfolio_manager.get_location_status(
+            exposure_id=exposure_id,
+            portfolio_id=portfolio_id
+        )
+
+    def _get_cedants(self, exposure_id: int) -> List[Dict[str, Any]]:
+        """Get cedants for an EDM."""
+        if self.snapshot is not None:
+            return self.snapshot.get_cedants(exposure_id)
+        return self.edm_manager.get_cedants_by_edm(exposure_id)
+
+    def _prefetch_portfolio_probes(self, portfolio_ids: Dict[str, Dict[str, int]], locations: bool = False) -> None:
+        """Probe accounts (or locations) for all portfolios concurrently when a snapshot is active."""
+        if self.snapshot is None:
+            return
+        keys = [
+            (ids.get('exposure_id'), ids.get('portfolio_id'))
+            for ids in portfolio_ids.values()
+            if ids.get('exposure_id') and ids.get('portfolio_id')
+        ]
+        if locations:
+            self.snapshot.prefetch_location_status(keys)
+        else:
+            self.snapshot.prefetch_has_accounts(keys)
+
+    # =========================================================================
+    # Entity Existence Validations
+    # =========================================================================
+
     def validate_edms_not_exist(self, edm_names: List[str]) -> Tuple[List[str], List[str]]:
         """
         Check that EDM names don't already exist in Moody's.
@@ -100,12 +379,8 @@ class EntityValidator:
         errors = []
         existing = []
 
-        # Build IN filter for efficiency
-        quoted = ", ".join(f'"{name}"' for name in edm_names)
-        filter_str = f"exposureName IN ({quoted})"
-
         try:
-            edms = self.edm_manager.search_edms_paginated(filter=filter_str)
+            edms = self._find_edms(edm_names)
             existing = [edm['exposureName'] for edm in edms if edm.get('exposureName') in edm_names]
 
             if existing:
@@ -134,13 +409,10 @@ class EntityValidator:
         errors = []
         edm_exposure_ids = {}
 
-        # Build IN filter for efficiency
         unique_names = list(set(edm_names))
-        quoted = ", ".join(f'"{name}"' for name in unique_names)
-        filter_str = f"exposureName IN ({quoted})"
 
         try:
-            edms = self.edm_manager.search_edms_paginated(filter=filter_str)
+            edms = self._find_edms(unique_names)
             for edm in edms:
                 name = edm.get('exposureName')
                 exposure_id = edm.get('exposureId')
@@ -212,20 +484,19 @@ class EntityValidator:
             if edm and portfolio:
                 by_edm.setdefault(edm, []).append(portfolio)
 
+        if self.snapshot is not None:
+            self.snapshot.prefetch_portfolios({
+                edm_exposure_ids[edm]: names for edm, names in by_edm.items()
+                if edm_exposure_ids.get(edm)
+            })
+
         for edm_name, portfolio_names in by_edm.items():
             exposure_id = edm_exposure_ids.get(edm_name)
             if not exposure_id:
                 continue  # EDM doesn't exist in Moody's, so portfolios can't exist either
 
             try:
-                # Build IN filter for all portfolio names in this EDM
-                quoted = ", ".join(f'"{name}"' for name in portfolio_names)
-                filter_str = f"portfolioName IN ({quoted})"
-
-                found = self.portfolio_manager.search_portfolios_paginated(
-                    exposure_id=exposure_id,
-                    filter=filter_str
-                )
+                found = self._find_portfolios(exposure_id, portfolio_names)
 
                 for p in found:
                     name = p.get('portfolioName')
@@ -273,6 +544,12 @@ class EntityValidator:
             if edm and portfolio:
                 by_edm.setdefault(edm, []).append(portfolio)
 
+        if self.snapshot is not None:
+            self.snapshot.prefetch_portfolios({
+                edm_exposure_ids[edm]: names for edm, names in by_edm.items()
+                if edm_exposure_ids.get(edm)
+            })
+
         for edm_name, portfolio_names in by_edm.items():
             exposure_id = edm_exposure_ids.get(edm_name)
             if not exposure_id:
@@ -282,14 +559,7 @@ class EntityValidator:
                 continue
 
             try:
-                # Build IN filter for all portfolio names in this EDM
-                quoted = ", ".join(f'"{name}"' for name in portfolio_names)
-                filter_str = f"portfolioName IN ({quoted})"
-
-                found = self.portfolio_manager.search_portfolios_paginated(
-                    exposure_id=exposure_id,
-                    filter=filter_str
-                )
+                found = self._find_portfolios(exposure_id, portfolio_names)
 
                 # Build set of found portfolio names
                 found_names = {p.get('portfolioName'): p.get('portfolioId') for p in found}
@@ -332,6 +602,7 @@ class EntityValidator:
 
         errors = []
         has_accounts = []
+        self._prefetch_portfolio_probes(portfolio_ids)
 
         for portfolio_key, ids in portfolio_ids.items():
             exposure_id = ids.get('exposure_id')
@@ -341,12 +612,7 @@ class EntityValidator:
                 continue
 
             try:
-                accounts = self.portfolio_manager.search_accounts_by_portfolio(
-                    exposure_id=exposure_id,
-                    portfolio_id=portfolio_id
-                )
-
-                if accounts and len(accounts) > 0:
+                if self._portfolio_has_accounts(exposure_id, portfolio_id):
                     has_accounts.append(portfolio_key)
 
             except IRPAPIError as e:
@@ -378,6 +644,7 @@ class EntityValidator:
 
         errors = []
         no_locations = []
+        self._prefetch_portfolio_probes(portfolio_exposure_map, locations=True)
 
         for portfolio_key, ids in portfolio_exposure_map.items():
             exposure_id = ids.get('exposure_id')
@@ -387,20 +654,12 @@ class EntityValidator:
                 continue
 
             try:
-                accounts = self.portfolio_manager.search_accounts_by_portfolio(
-                    exposure_id=exposure_id,
-                    portfolio_id=portfolio_id
-                )
+                location_status = self._get_location_status(exposure_id, portfolio_id)
 
-                if not accounts or len(accounts) == 0:
+                if not location_status['has_accounts']:
                     no_locations.append(f"{portfolio_key} (no accounts)")
-                else:
-                    # Sum up locations count from all accounts
-                    total_locations = sum(
-                        acc.get('locationsCount', 0) for acc in accounts
-                    )
-                    if total_locations == 0:
-                        no_locations.append(f"{portfolio_key} (0 locations)")
+                elif not location_status['has_locations']:
+                    no_locations.append(f"{portfolio_key} (0 locations)")
 
             except IRPAPIError as e:
                 errors.append(f"ENT-API-001: Failed to check locations for {portfolio_key}: {e}")
@@ -431,6 +690,7 @@ class EntityValidator:
 
         errors = []
         no_accounts = []
+        self._prefetch_portfolio_probes(portfolio_exposure_map)
 
         for portfolio_key, ids in portfolio_exposure_map.items():
             exposure_id = ids.get('exposure_id')
@@ -440,12 +700,7 @@ class EntityValidator:
                 continue
 
             try:
-                accounts = self.portfolio_manager.search_accounts_by_portfolio(
-                    exposure_id=exposure_id,
-                    portfolio_id=portfolio_id
-                )
-
-                if not accounts or len(accounts) == 0:
+                if not self._portfolio_has_accounts(exposure_id, portfolio_id):
                     no_accounts.append(portfolio_key)
 
             except IRPAPIError as e:
@@ -480,9 +735,12 @@ class EntityValidator:
         no_cedants = []
         multiple_cedants = []
 
+        if self.snapshot is not None:
+            self.snapshot.prefetch_cedants(list(edm_exposure_ids.values()))
+
         for edm_name, exposure_id in edm_exposure_ids.items():
             try:
-                cedants = self.edm_manager.get_cedants_by_edm(exposure_id)
+                cedants = self._get_cedants(exposure_id)
 
                 if not cedants:
                     no_cedants.append(edm_name)
@@ -539,20 +797,19 @@ class EntityValidator:
             if edm and treaty_name:
                 by_edm.setdefault(edm, []).append(treaty_name)
 
+        if self.snapshot is not None:
+            self.snapshot.prefetch_treaties({
+                edm_exposure_ids[edm]: names for edm, names in by_edm.items()
+                if edm_exposure_ids.get(edm)
+            })
+
         for edm_name, treaty_names in by_edm.items():
             exposure_id = edm_exposure_ids.get(edm_name)
             if not exposure_id:
                 continue  # EDM doesn't exist in Moody's, so treaties can't exist either
 
             try:
-                # Build IN filter for all treaty names in this EDM
-                quoted = ", ".join(f'"{name}"' for name in treaty_names)
-                filter_str = f"treatyName IN ({quoted})"
-
-                found = self.treaty_manager.search_treaties_paginated(
-                    exposure_id=exposure_id,
-                    filter=filter_str
-                )
+                found = self._find_treaties(exposure_id, treaty_names)
 
                 for t in found:
                     name = t.get('treatyName')
@@ -601,6 +858,12 @@ class EntityValidator:
             if edm and treaty_name:
                 by_edm.setdefault(edm, []).append(treaty_name)
 
+        if self.snapshot is not None:
+            self.snapshot.prefetch_treaties({
+                edm_exposure_ids[edm]: names for edm, names in by_edm.items()
+                if edm_exposure_ids.get(edm)
+            })
+
         for edm_name, treaty_names in by_edm.items():
             exposure_id = edm_exposure_ids.get(edm_name)
             if not exposure_id:
@@ -610,15 +873,8 @@ class EntityValidator:
                 continue
 
             try:
-                # Build IN filter for all treaty names in this EDM
                 unique_names = list(set(treaty_names))
-                quoted = ", ".join(f'"{name}"' for name in unique_names)
-                filter_str = f"treatyName IN ({quoted})"
-
-                found = self.treaty_manager.search_treaties_paginated(
-                    exposure_id=exposure_id,
-                    filter=filter_str
-                )
+                found = self._find_treaties(exposure_id, unique_names)
 
                 # Build set of found treaty names
                 found_names = {t.get('treatyName') for t in found}
@@ -669,24 +925,18 @@ class EntityValidator:
             if edm and analysis_name:
                 by_edm.setdefault(edm, []).append(analysis_name)
 
-        # Batch the lookups to avoid "Request Header Fields Too Large" errors
-        BATCH_SIZE = 25
+        if self.snapshot is not None:
+            self.snapshot.prefetch_analyses(by_edm)
 
         for edm_name, analysis_names in by_edm.items():
             analysis_names_set = set(analysis_names)
             try:
-                # Process in batches
-                for i in range(0, len(analysis_names), BATCH_SIZE):
-                    batch = analysis_names[i:i + BATCH_SIZE]
-                    quoted = ", ".join(f'"{name}"' for name in batch)
-                    filter_str = f'analysisName IN ({quoted}) AND exposureName = "{edm_name}"'
-
-                    found = self.analysis_manager.search_analyses_paginated(filter=filter_str)
+                found = self._find_analyses(analysis_names, edm_name=edm_name)
 
-                    for a in found:
-                        name = a.get('analysisName')
-                        if name in analysis_names_set:
-                            existing.append(f"{edm_name}/{name}")
+                for a in found:
+                    name = a.get('analysisName')
+                    if name in analysis_names_set:
+                        existing.append(f"{edm_name}/{name}")
 
             except IRPAPIError as e:
                 errors.append(f"ENT-API-001: Failed to check analyses in {edm_name}: {e}")
@@ -727,23 +977,15 @@ class EntityValidator:
         if not group_names:
             return [], []
 
-        # Batch the lookups to avoid "Request Header Fields Too Large" errors
-        # when there are many group names (URL query string has size limits)
-        BATCH_SIZE = 25
         group_names_set = set(group_names)
 
         try:
-            for i in range(0, len(group_names), BATCH_SIZE):
-                batch = group_names[i:i + BATCH_SIZE]
-                quoted = ", ".join(f'"{name}"' for name in batch)
-                filter_str = f"analysisName IN ({quoted})"
-
-                found = self.analysis_manager.search_analyses_paginated(filter=filter_str)
+            found = self._find_analyses(group_names)
 
-                for g in found:
-                    name = g.get('analysisName')
-                    if name in group_names_set:
-                        existing.append(name)
+            for g in found:
+                name = g.get('analysisName')
+                if name in group_names_set:
+                    existing.append(name)
 
         except IRPAPIError as e:
             errors.append(f"ENT-API-001: Failed to check group existence: {e}")
@@ -787,21 +1029,13 @@ class EntityValidator:
                 # No EDM mapping - can't look up
                 missing.append(f"?/{analysis_name} (no EDM mapping)")
 
-        # Batch the lookups to avoid "Request Header Fields Too Large" errors
-        BATCH_SIZE = 25
+        if self.snapshot is not None:
+            self.snapshot.prefetch_analyses(by_edm)
 
         for edm_name, names in by_edm.items():
             try:
-                found_names = set()
-
-                # Process in batches
-                for i in range(0, len(names), BATCH_SIZE):
-                    batch = names[i:i + BATCH_SIZE]
-                    quoted = ", ".join(f'"{name}"' for name in batch)
-                    filter_str = f'analysisName IN ({quoted}) AND exposureName = "{edm_name}"'
-
-                    found = self.analysis_manager.search_analyses_paginated(filter=filter_str)
-                    found_names.update(a.get('analysisName') for a in found)
+                found = self._find_analyses(names, edm_name=edm_name)
+                found_names = {a.get('analysisName') for a in found}
 
                 for name in names:
                     if name not in found_names:
@@ -839,21 +1073,10 @@ class EntityValidator:
         errors = []
         missing = []
 
-        # Batch the lookups to avoid "Request Header Fields Too Large" errors
-        BATCH_SIZE = 25
-
         try:
-            found_names = set()
-
-            for i in range(0, len(group_names), BATCH_SIZE):
-                batch = group_names[i:i + BATCH_SIZE]
-                quoted = ", ".join(f'"{name}"' for name in batch)
-                # Must filter by engineType = "Group" to find groups specifically
-                # (groups are stored as analyses in Moody's but have engineType = "Group")
-                filter_str = f'analysisName IN ({quoted}) AND engineType = "Group"'
-
-                found = self.analysis_manager.search_analyses_paginated(filter=filter_str)
-                found_names.update(g.get('analysisName') for g in found)
+            # Must filter by engineType = "Group" to find groups specifically
+            found = self._find_analyses(group_names, groups_only=True)
+            found_names = {g.get('analysisName') for g in found}
 
             for name in group_names:
                 if name not in found_names:
@@ -923,12 +1146,8 @@ class EntityValidator:
         if not edm_names:
             return result
 
-        # Build IN filter for efficiency
-        quoted = ", ".join(f'"{name}"' for name in edm_names)
-        filter_str = f"exposureName IN ({quoted})"
-
         try:
-            edms = self.edm_manager.search_edms_paginated(filter=filter_str)
+            edms = self._find_edms(edm_names)
             for edm in edms:
                 name = edm.get('exposureName')
                 exposure_id = edm.get('exposureId')
@@ -1375,6 +1594,7 @@ class EntityValidator:
             return errors
 
         # Validate that cycle type directory exists using shared function
+        from helpers.irp_integration.portfolio import resolve_cycle_type_directory
         try:
             resolve_cycle_type_directory(cycle_type)
         except Exception as e:
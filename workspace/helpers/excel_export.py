@@ -2,13 +2,25 @@
 Excel Export Helper Module
 
 Provides functionality to export pandas DataFrames to Excel files with formatting.
+
+Workbooks are streamed with xlsxwriter in constant_memory mode: each row is
+flushed to disk as soon as the next one starts, so memory use does not grow with
+sheet size. Formatting is decided before any row is written - column formats and
+widths up front, Status colouring as conditional format rules - instead of
+re-visiting every cell after the data is written.
 """
 
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Sequence, Tuple, Union
 import pandas as pd
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.utils import get_column_letter
+
+
+# Status cell fills (Excel's built-in "Good" / "Bad" colours)
+GOOD_FILL_COLOR = '#C6EFCE'
+BAD_FILL_COLOR = '#FFC7CE'
+
+# Rows converted to Python values per write batch (bounds the temporary copy)
+WRITE_CHUNK_ROWS = 50_000
 
 
 def _get_peril_from_import_file(import_file: str) -> str:
@@ -85,84 +97,116 @@ def save_geohaz_validation_to_excel(
     filename = f"GeoHaz_Validation_{date_value}_{cycle_type}.xlsx"
     file_path = output_dir / filename
 
-    # Add Peril column based on Import File
-    results_with_peril = validation_results.copy()
-    results_with_peril['Peril'] = results_with_peril['Import File'].apply(_get_peril_from_import_file)
-
-    # Get unique Perils
-    perils = results_with_peril['Peril'].unique()
+    # Peril per row, resolved once per distinct Import File
+    import_files = validation_results['Import File']
+    perils = import_files.map({name: _get_peril_from_import_file(name) for name in import_files.unique()})
 
-    # Create Excel writer
-    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-        for peril in perils:
-            # Filter data for this Peril
-            sheet_data = results_with_peril[
-                results_with_peril['Peril'] == peril
-            ].copy()
+    # One sheet per Peril, in order of first appearance
+    with _open_workbook(file_path) as workbook:
+        for peril, sheet_data in validation_results.groupby(perils, sort=False):
+            _write_validation_sheet(workbook, peril, sheet_data)
 
-            # Drop the Peril column (redundant - it's the sheet name)
-            sheet_data = sheet_data.drop(columns=['Peril'])
-
-            # Write DataFrame to sheet
-            sheet_data.to_excel(writer, sheet_name=peril, index=False)
+    return file_path
 
-            # Get the worksheet for formatting
-            worksheet = writer.sheets[peril]
 
-            # Apply formatting
-            _format_validation_sheet(worksheet, sheet_data)
+def _open_workbook(file_path: Path):
+    """
+    Create an xlsxwriter Workbook in constant_memory mode.
 
-    return file_path
+    Strings are written as-is (no formula or URL detection), as the openpyxl
+    writer did.
+    """
+    # xlsxwriter is imported here (not at module import) so notebooks that import
+    # this module without exporting don't pay for it
+    import xlsxwriter
+
+    return xlsxwriter.Workbook(str(file_path), {
+        'constant_memory': True,
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+    })
+
+
+def _column_widths(data: pd.DataFrame) -> List[int]:
+    """Auto-fit widths: longest of the header and the values as text, plus padding"""
+    widths = []
+    for column in data.columns:
+        values = data[column].dropna()
+        longest = int(values.astype(str).str.len().max()) if not values.empty else 0
+        widths.append(max(len(str(column)), longest) + 2)
+    return widths
+
+
+def _write_sheet(
+    workbook,
+    sheet_name: str,
+    data: pd.DataFrame,
+    column_formats: Sequence,
+    status_rules: Sequence[Tuple[str, str, object]] = ()
+) -> None:
+    """
+    Stream a DataFrame to a new worksheet with its formatting.
 
+    In constant_memory mode rows are written once, in order, so everything is
+    set before the first row: column formats (applied to every data cell that
+    has no format of its own), widths, and the Status conditional format rules.
 
-def _format_validation_sheet(worksheet, data: pd.DataFrame) -> None:
+    Args:
+        workbook: Workbook from _open_workbook()
+        sheet_name: Name of the sheet to add
+        data: DataFrame to write (header row, then one row per record)
+        column_formats: Format for the data cells of each column, in column order
+        status_rules: (criteria, value, format) conditional format rules for the
+            Status column, e.g. ('==', 'PASS', good_format)
+    """
+    worksheet = workbook.add_worksheet(sheet_name)
+    header_format = workbook.add_format({'bold': True, 'align': 'center'})
+
+    for col_idx, (width, cell_format) in enumerate(zip(_column_widths(data), column_formats)):
+        worksheet.set_column(col_idx, col_idx, width, cell_format)
+
+    if status_rules and 'Status' in data.columns and len(data):
+        status_col_idx = data.columns.get_loc('Status')
+        for criteria, value, cell_format in status_rules:
+            worksheet.conditional_format(1, status_col_idx, len(data), status_col_idx, {
+                'type': 'cell',
+                'criteria': criteria,
+                'value': f'"{value}"',
+                'format': cell_format,
+            })
+
+    worksheet.write_row(0, 0, [str(column) for column in data.columns], header_format)
+
+    # Convert to Python values (NaN -> None, written as an empty cell) a chunk at a time
+    row_idx = 1
+    for start in range(0, len(data), WRITE_CHUNK_ROWS):
+        chunk = data.iloc[start:start + WRITE_CHUNK_ROWS]
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        for values in chunk.itertuples(index=False, name=None):
+            worksheet.write_row(row_idx, 0, values)
+            row_idx += 1
+
+
+def _write_validation_sheet(workbook, sheet_name: str, data: pd.DataFrame) -> None:
     """
-    Apply formatting to a GeoHaz validation worksheet.
+    Write a GeoHaz validation sheet.
+
+    Bold centered headers, centered data, Status green for PASS and red otherwise.
 
     Args:
-        worksheet: openpyxl worksheet object
-        data: DataFrame that was written to the sheet (for column info)
+        workbook: Workbook from _open_workbook()
+        sheet_name: Name of the sheet to add
+        data: Validation results for the sheet
     """
-    # Define styles
-    header_font = Font(bold=True)
-    pass_fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-    fail_fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-    center_align = Alignment(horizontal='center')
-
-    # Get column count and find Status column index
-    num_cols = len(data.columns)
-    status_col_idx = list(data.columns).index('Status') + 1  # 1-indexed for openpyxl
-
-    # Format header row (row 1)
-    for col in range(1, num_cols + 1):
-        cell = worksheet.cell(row=1, column=col)
-        cell.font = header_font
-        cell.alignment = center_align
-
-    # Apply center alignment to data cells and conditional formatting to Status cell only
-    for row in range(2, len(data) + 2):  # Start from row 2 (after header)
-        # Center align all cells in the row
-        for col in range(1, num_cols + 1):
-            cell = worksheet.cell(row=row, column=col)
-            cell.alignment = center_align
-
-        # Apply conditional fill to Status cell only
-        status_cell = worksheet.cell(row=row, column=status_col_idx)
-        status_value = status_cell.value
-        status_cell.fill = pass_fill if status_value == 'PASS' else fail_fill
-
-    # Auto-fit column widths
-    for col_idx, column in enumerate(data.columns, 1):
-        # Calculate max width needed
-        max_length = len(str(column))  # Header length
-        for row in range(2, len(data) + 2):
-            cell_value = worksheet.cell(row=row, column=col_idx).value
-            if cell_value is not None:
-                max_length = max(max_length, len(str(cell_value)))
-
-        # Set column width with a little padding
-        adjusted_width = max_length + 2
-        worksheet.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
+    center = workbook.add_format({'align': 'center'})
+    good = workbook.add_format({'bg_color': GOOD_FILL_COLOR})
+    bad = workbook.add_format({'bg_color': BAD_FILL_COLOR})
+
+    _write_sheet(
+        workbook, sheet_name, data,
+        column_formats=[center] * len(data.columns),
+        status_rules=[('==', 'PASS', good), ('!=', 'PASS', bad)]
+    )
 
 
 def _is_flood_exposure_group(exposure_group: str) -> bool:
@@ -275,85 +319,40 @@ def save_data_extraction_control_totals_to_excel(
     if not flood_results.empty:
         flood_results = flood_results[flood_columns]
 
-    # Create Excel writer
-    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+    with _open_workbook(file_path) as workbook:
         # Write Non-Flood sheet
         if not non_flood_results.empty:
-            non_flood_results.to_excel(writer, sheet_name='3a_vs_3b_NonFlood', index=False)
-            worksheet = writer.sheets['3a_vs_3b_NonFlood']
-            _format_comparison_sheet(worksheet, non_flood_results)
+            _write_comparison_sheet(workbook, '3a_vs_3b_NonFlood', non_flood_results)
 
         # Write Flood sheet
         if not flood_results.empty:
-            flood_results.to_excel(writer, sheet_name='3a_vs_3b_Flood', index=False)
-            worksheet = writer.sheets['3a_vs_3b_Flood']
-            _format_comparison_sheet(worksheet, flood_results)
+            _write_comparison_sheet(workbook, '3a_vs_3b_Flood', flood_results)
 
     return file_path
 
 
-def _format_comparison_sheet(worksheet, data: pd.DataFrame) -> None:
+def _write_comparison_sheet(workbook, sheet_name: str, data: pd.DataFrame) -> None:
     """
-    Apply formatting to a control totals comparison worksheet.
+    Write a control totals comparison sheet.
+
+    Bold centered headers, right-aligned *_Diff columns, other columns centered,
+    Status green for MATCH and red for MISMATCH.
 
     Args:
-        worksheet: openpyxl worksheet object
-        data: DataFrame that was written to the sheet (for column info)
+        workbook: Workbook from _open_workbook()
+        sheet_name: Name of the sheet to add
+        data: Comparison results for the sheet
     """
-    # Define styles
-    header_font = Font(bold=True)
-    match_fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-    mismatch_fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-    center_align = Alignment(horizontal='center')
-    right_align = Alignment(horizontal='right')
-
-    # Get column count
-    num_cols = len(data.columns)
-
-    # Find Status column index (if it exists)
-    status_col_idx = None
-    if 'Status' in data.columns:
-        status_col_idx = list(data.columns).index('Status') + 1  # 1-indexed for openpyxl
-
-    # Format header row (row 1)
-    for col in range(1, num_cols + 1):
-        cell = worksheet.cell(row=1, column=col)
-        cell.font = header_font
-        cell.alignment = center_align
-
-    # Apply formatting to data cells
-    for row in range(2, len(data) + 2):  # Start from row 2 (after header)
-        for col in range(1, num_cols + 1):
-            cell = worksheet.cell(row=row, column=col)
-            col_name = data.columns[col - 1]
-
-            # Right-align numeric columns (those ending with _Diff)
-            if col_name.endswith('_Diff'):
-                cell.alignment = right_align
-            else:
-                cell.alignment = center_align
-
-        # Apply conditional fill to Status cell only
-        if status_col_idx:
-            status_cell = worksheet.cell(row=row, column=status_col_idx)
-            status_value = status_cell.value
-            if status_value == 'MATCH':
-                status_cell.fill = match_fill
-            elif status_value == 'MISMATCH':
-                status_cell.fill = mismatch_fill
-
-    # Auto-fit column widths
-    for col_idx, column in enumerate(data.columns, 1):
-        # Calculate max width needed
-        max_length = len(str(column))  # Header length
-        for row in range(2, len(data) + 2):
-            cell_value = worksheet.cell(row=row, column=col_idx).value
-            if cell_value is not None:
-                max_length = max(max_length, len(str(cell_value)))
-
-        # Set column width with a little padding
-        adjusted_width = max_length + 2
-        worksheet.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
+    center = workbook.add_format({'align': 'center'})
+    right = workbook.add_format({'align': 'right'})
+    good = workbook.add_format({'bg_color': GOOD_FILL_COLOR})
+    bad = workbook.add_format({'bg_color': BAD_FILL_COLOR})
+
+    _write_sheet(
+        workbook, sheet_name, data,
+        column_formats=[right if str(column).endswith('_Diff') else center for column in data.columns],
+        status_rules=[('==', 'MATCH', good), ('==', 'MISMATCH', bad)]
+    )
 
 
 def save_data_import_control_totals_to_excel(
@@ -430,8 +429,7 @@ def save_data_import_control_totals_to_excel(
     filename = f"Data_Import_Control_Totals_{date_value}_{cycle_type}.xlsx"
     file_path = output_dir / filename
 
-    # Create Excel writer
-    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
+    with _open_workbook(file_path) as workbook:
         # Write 3b vs 3d sheets if data exists
         if has_3b_vs_3d:
             # Split results into Flood and Non-Flood
@@ -482,15 +480,11 @@ def save_data_import_control_totals_to_excel(
 
             # Write Non-Flood sheet
             if not non_flood_results.empty:
-                non_flood_results.to_excel(writer, sheet_name='3b_vs_3d_NonFlood', index=False)
-                worksheet = writer.sheets['3b_vs_3d_NonFlood']
-                _format_comparison_sheet(worksheet, non_flood_results)
+                _write_comparison_sheet(workbook, '3b_vs_3d_NonFlood', non_flood_results)
 
             # Write Flood sheet
             if not flood_results.empty:
-                flood_results.to_excel(writer, sheet_name='3b_vs_3d_Flood', index=False)
-                worksheet = writer.sheets['3b_vs_3d_Flood']
-                _format_comparison_sheet(worksheet, flood_results)
+                _write_comparison_sheet(workbook, '3b_vs_3d_Flood', flood_results)
 
         # Write 3d vs 3e sheet if data exists (single sheet, no Flood/Non-Flood split)
         if has_3d_vs_3e:
@@ -510,8 +504,6 @@ def save_data_import_control_totals_to_excel(
             results_3d_vs_3e = comparison_results_3d_vs_3e[columns_3d_vs_3e].copy()
 
             # Write single sheet with all portfolios
-            results_3d_vs_3e.to_excel(writer, sheet_name='3d_vs_3e', index=False)
-            worksheet = writer.sheets['3d_vs_3e']
-            _format_comparison_sheet(worksheet, results_3d_vs_3e)
+            _write_comparison_sheet(workbook, '3d_vs_3e', results_3d_vs_3e)
 
     return file_path
\ No newline at end of file
@@ -1,30 +1,92 @@
-from .job import JobManager
-from .client import Client
-from .edm import EDMManager
-from .portfolio import PortfolioManager
-from .mri_import import MRIImportManager
-from .analysis import AnalysisManager
-from .treaty import TreatyManager
-from .reference_data import ReferenceDataManager
-from .rdm import RDMManager
+"""
+IRP Integration - Moody's Risk Modeler API client and managers.
+
+Importing this package is cheap: the managers (and requests, boto3, pandas and
+SQL Server support behind them) are only imported when first used, either by
+accessing a manager on IRPClient or a class name on the package (PEP 562).
+"""
+
+from importlib import import_module
+from typing import Any, Dict, Tuple
+
+
+# Lazily imported public classes: name -> (submodule, attribute)
+_LAZY_EXPORTS: Dict[str, Tuple[str, str]] = {
+    'Client': ('.client', 'Client'),
+    'JobManager': ('.job', 'JobManager'),
+    'EDMManager': ('.edm', 'EDMManager'),
+    'PortfolioManager': ('.portfolio', 'PortfolioManager'),
+    'MRIImportManager': ('.mri_import', 'MRIImportManager'),
+    'AnalysisManager': ('.analysis', 'AnalysisManager'),
+    'TreatyManager': ('.treaty', 'TreatyManager'),
+    'ReferenceDataManager': ('.reference_data', 'ReferenceDataManager'),
+    'RDMManager': ('.rdm', 'RDMManager'),
+    'BulkDeleteManager': ('.bulk_delete', 'BulkDeleteManager'),
+}
+
+
+def _load(name: str) -> Any:
+    """Return a lazily exported class, importing it and caching it as a module global on first use"""
+    if name in globals():
+        return globals()[name]
+    module_name, attribute = _LAZY_EXPORTS[name]
+    value = getattr(import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        return _load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 class IRPClient:
     """Main client for IRP integration providing access to all managers"""
-    
+
+    # Manager attribute -> class name in _LAZY_EXPORTS; each is created on first access
+    _MANAGERS = {
+        'edm': 'EDMManager',
+        'portfolio': 'PortfolioManager',
+        'mri_import': 'MRIImportManager',
+        'analysis': 'AnalysisManager',
+        'treaty': 'TreatyManager',
+        'reference_data': 'ReferenceDataManager',
+        'rdm': 'RDMManager',
+        'job': 'JobManager',
+    }
+
     def __init__(self):
-        self._client = Client()
-        self.edm = EDMManager(self._client)
-        self.portfolio = PortfolioManager(self._client)
-        self.mri_import = MRIImportManager(self._client)
-        self.analysis = AnalysisManager(self._client)
-        self.treaty = TreatyManager(self._client)
-        self.reference_data = ReferenceDataManager(self._client)
-        self.rdm = RDMManager(self.client)
-        self.job = JobManager(self.client)
+        self._client = _load('Client')()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not set yet: build the manager and cache it
+        # on the instance, so later accesses (and assignments) bypass this
+        if name in self._MANAGERS:
+            manager = _load(self._MANAGERS[name])(self._client)
+        elif name == 'bulk_delete':
+            manager = _load('BulkDeleteManager')(
+                self._client,
+                analysis_manager=self.analysis,
+                edm_manager=self.edm,
+                rdm_manager=self.rdm,
+                job_manager=self.job
+            )
+        else:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        setattr(self, name, manager)
+        return manager
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._MANAGERS) | {'bulk_delete'})
 
     @property
     def client(self):
         """Get the underlying API client"""
         return self._client
 
-__all__ = ['IRPClient']
\ No newline at end of file
+__all__ = ['IRPClient']
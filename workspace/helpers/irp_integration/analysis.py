@@ -6,7 +6,7 @@ Handles portfolio analysis submission, job tracking, and analysis group creation
 
 import json
 import time
-from typing import Dict, List, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Any, Optional, Tuple
 from .client import Client
 from .constants import (
     CREATE_ANALYSIS_JOB, DELETE_ANALYSIS, GET_ANALYSIS_GROUPING_JOB,
@@ -14,11 +14,16 @@ from .constants import (
     SEARCH_ANALYSIS_JOBS, SEARCH_ANALYSIS_RESULTS,
     WORKFLOW_COMPLETED_STATUSES, WORKFLOW_IN_PROGRESS_STATUSES,
     GET_ANALYSIS_ELT, GET_ANALYSIS_EP, GET_ANALYSIS_STATS, GET_ANALYSIS_PLT,
-    GET_ANALYSIS_REGIONS, PERSPECTIVE_CODES
+    GET_ANALYSIS_REGIONS, PERSPECTIVE_CODES,
+    ANALYSIS_PLAN_MAX_WORKERS, LOSS_STORE_PAGE_SIZE, LOSS_TABLE_DEFAULT_LIMIT, NAME_FILTER_CHUNK_SIZE
 )
 from .exceptions import IRPAPIError, IRPJobError, IRPReferenceDataError, IRPValidationError
 from .validators import validate_non_empty_string, validate_positive_int, validate_list_not_empty
-from .utils import extract_id_from_location_header
+from .pagination import fetch_all_pages, iter_paginated
+from .utils import LookupCache, extract_id_from_location_header, get_total_count, name_in_filter, quote_filter_value
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class AnalysisManager:
     """Manager for analysis operations."""
@@ -29,7 +34,8 @@ class AnalysisManager:
             reference_data_manager: Optional[Any] = None, 
             treaty_manager: Optional[Any] = None,
             edm_manager: Optional[Any] = None,
-            portfolio_manager: Optional[Any] = None
+            portfolio_manager: Optional[Any] = None,
+            loss_store: Optional[Any] = None
     ) -> None:
         """
         Initialize analysis manager.
@@ -37,12 +43,15 @@ class AnalysisManager:
         Args:
             client: IRP API client instance
             reference_data_manager: Optional ReferenceDataManager instance
+            loss_store: Optional LossTableStore for ELT/PLT/EP/stats results
+                (default: the shared store when RISK_MODELER_LOSS_STORE is set)
         """
         self.client = client
         self._reference_data_manager = reference_data_manager
         self._treaty_manager = treaty_manager
         self._edm_manager = edm_manager
         self._portfolio_manager = portfolio_manager
+        self._loss_store = loss_store
 
     @property
     def reference_data_manager(self):
@@ -76,6 +85,14 @@ class AnalysisManager:
             self._portfolio_manager = PortfolioManager(self.client)
         return self._portfolio_manager
 
+    @property
+    def loss_store(self):
+        """Local loss-table store (see loss_store.py), or None when not enabled."""
+        if self._loss_store is None:
+            from .loss_store import get_loss_store
+            self._loss_store = get_loss_store()
+        return self._loss_store
+
 
     def get_analysis_by_id(self, analysis_id: int) -> Dict[str, Any]:
         """
@@ -125,10 +142,10 @@ class AnalysisManager:
 
         # Pre-validate that no analysis names already exist
         analysis_names = list(a['job_name'] for a in analysis_data_list)
-        for name in analysis_names:
-            analysis_response = self.search_analyses(filter=f"analysisName = \"{name}\"")
-            if len(analysis_response) > 0:
-                raise IRPAPIError(f"Analysis with this name already exists: {name}")
+        plan = self.plan_portfolio_analysis_jobs(analysis_data_list)
+        existing_analyses = plan.find_analyses(analysis_names)
+        if existing_analyses:
+            raise IRPAPIError(f"Analysis with this name already exists: {existing_analyses[0]['analysisName']}")
 
         job_ids = []
         for analysis_data in analysis_data_list:
@@ -143,7 +160,8 @@ class AnalysisManager:
                     event_rate_scheme_name=analysis_data['event_rate_scheme_name'],
                     treaty_names=analysis_data['treaty_names'],
                     tag_names=analysis_data['tag_names'],
-                    skip_duplicate_check=True  # Already validated above
+                    skip_duplicate_check=True,  # Already validated above
+                    plan=plan
                 )
                 job_ids.append(job_id)
             except KeyError as e:
@@ -151,6 +169,25 @@ class AnalysisManager:
 
         return job_ids
 
+    def plan_portfolio_analysis_jobs(self, analysis_data_list: List[Dict[str, Any]]) -> 'AnalysisSubmissionPlan':
+        """
+        Resolve the lookups for a batch of portfolio analysis submissions up front.
+
+        Per job, submit_portfolio_analysis_job otherwise searches for the EDM,
+        portfolio, treaties and existing analyses and looks up the profiles, event
+        rate scheme, tags and currency. The plan resolves each distinct name once,
+        with chunked IN-filter searches where the API supports them; pass it as
+        plan= to each submission.
+
+        Args:
+            analysis_data_list: Analysis job data dicts (see submit_portfolio_analysis_jobs)
+
+        Returns:
+            AnalysisSubmissionPlan; plan.report() gives the API calls issued versus
+            the per-job lookups it replaced
+        """
+        return AnalysisSubmissionPlan(self).resolve(analysis_data_list)
+
     def submit_portfolio_analysis_job(
         self,
         edm_name: str,
@@ -166,7 +203,8 @@ class AnalysisManager:
         franchise_deductible: bool = False,
         min_loss_threshold: float = 1.0,
         treat_construction_occupancy_as_unknown: bool = True,
-        num_max_loss_event: int = 1
+        num_max_loss_event: int = 1,
+        plan: Optional['AnalysisSubmissionPlan'] = None
     ) -> Tuple[int, Dict[str, Any]]:
         """
         Submit portfolio analysis job (submits but doesn't wait).
@@ -186,6 +224,8 @@ class AnalysisManager:
             min_loss_threshold: Minimum loss threshold value (default: 0)
             treat_construction_occupancy_as_unknown: Treat construction/occupancy as unknown (default: True)
             num_max_loss_event: Number of max loss events to include (default: 1)
+            plan: Optional AnalysisSubmissionPlan (from plan_portfolio_analysis_jobs) to
+                  answer lookups from, so a batch of submissions only has to POST
 
         Returns:
             Tuple of (job_id, request_body) where request_body is the HTTP request payload
@@ -203,12 +243,18 @@ class AnalysisManager:
 
         # Check if analysis name already exists (unless skipped for batch operations)
         if not skip_duplicate_check:
-            analysis_response = self.search_analyses(filter=f"analysisName = \"{job_name}\" AND exposureName = \"{edm_name}\"")
+            if plan is not None:
+                analysis_response = plan.find_analyses([job_name], edm_name)
+            else:
+                analysis_response = self.search_analyses(filter=f"analysisName = \"{job_name}\" AND exposureName = \"{edm_name}\"")
             if len(analysis_response) > 0:
                 raise IRPAPIError(f"Analysis with name '{job_name}' already exists for EDM '{edm_name}'")
 
         # Look up EDM to get exposure_id
-        edms = self.edm_manager.search_edms(filter=f"exposureName=\"{edm_name}\"")
+        if plan is not None:
+            edms = plan.find_edms(edm_name)
+        else:
+            edms = self.edm_manager.search_edms(filter=f"exposureName=\"{edm_name}\"")
         if len(edms) != 1:
             raise IRPAPIError(f"Expected 1 EDM with name {edm_name}, found {len(edms)}")
         try:
@@ -219,10 +265,13 @@ class AnalysisManager:
             ) from e
 
         # Look up portfolio to get portfolio_uri
-        portfolios = self.portfolio_manager.search_portfolios(
-            exposure_id=exposure_id,
-            filter=f"portfolioName=\"{portfolio_name}\""
-        )
+        if plan is not None:
+            portfolios = plan.find_portfolios(exposure_id, portfolio_name)
+        else:
+            portfolios = self.portfolio_manager.search_portfolios(
+                exposure_id=exposure_id,
+                filter=f"portfolioName=\"{portfolio_name}\""
+            )
         if len(portfolios) != 1:
             raise IRPAPIError(f"Expected 1 portfolio with name {portfolio_name}, found {len(portfolios)}")
         try:
@@ -235,12 +284,15 @@ class AnalysisManager:
         # Look up treaties by name
         if treaty_names:
             try:
-                quoted = ", ".join(json.dumps(s) for s in treaty_names)
-                filter_statement = f"treatyName IN ({quoted})"
-                treaties_response = self.treaty_manager.search_treaties(
-                    exposure_id=exposure_id,
-                    filter=filter_statement
-                )
+                if plan is not None:
+                    treaties_response = plan.find_treaties(exposure_id, treaty_names)
+                else:
+                    quoted = ", ".join(json.dumps(s) for s in treaty_names)
+                    filter_statement = f"treatyName IN ({quoted})"
+                    treaties_response = self.treaty_manager.search_treaties(
+                        exposure_id=exposure_id,
+                        filter=filter_statement
+                    )
             except Exception as e:
                 raise IRPAPIError(f"Failed to search treaties with names {treaty_names}: {e}")
 
@@ -256,8 +308,12 @@ class AnalysisManager:
             treaty_ids = []
 
         # Look up reference data - model profile first to determine job type
-        model_profile_response = self.reference_data_manager.get_model_profile_by_name(analysis_profile_name)
-        output_profile_response = self.reference_data_manager.get_output_profile_by_name(output_profile_name)
+        if plan is not None:
+            model_profile_response = plan.get_model_profile(analysis_profile_name)
+            output_profile_response = plan.get_output_profile(output_profile_name)
+        else:
+            model_profile_response = self.reference_data_manager.get_model_profile_by_name(analysis_profile_name)
+            output_profile_response = self.reference_data_manager.get_output_profile_by_name(output_profile_name)
 
         if model_profile_response.get('count', 0) == 0:
             raise IRPReferenceDataError(f"Analysis profile '{analysis_profile_name}' not found")
@@ -290,7 +346,11 @@ class AnalysisManager:
         # Use perilCode and modelRegionCode from model profile to filter the correct event rate scheme
         event_rate_scheme_id = None
         if event_rate_scheme_name:
-            event_rate_scheme_response = self.reference_data_manager.get_event_rate_scheme_by_name(
+            get_event_rate_scheme = (
+                plan.get_event_rate_scheme if plan is not None
+                else self.reference_data_manager.get_event_rate_scheme_by_name
+            )
+            event_rate_scheme_response = get_event_rate_scheme(
                 event_rate_scheme_name,
                 peril_code=model_peril_code,
                 model_region_code=model_region_code
@@ -309,12 +369,15 @@ class AnalysisManager:
 
         # Look up tag IDs
         try:
-            tag_ids = self.reference_data_manager.get_tag_ids_from_tag_names(tag_names)
+            if plan is not None:
+                tag_ids = plan.get_tag_ids(tag_names)
+            else:
+                tag_ids = self.reference_data_manager.get_tag_ids_from_tag_names(tag_names)
         except IRPAPIError as e:
             raise IRPAPIError(f"Failed to get tag ids for tag names {tag_names}: {e}")
 
         if currency is None:
-            currency = self.reference_data_manager.get_analysis_currency()
+            currency = plan.get_currency() if plan is not None else self.reference_data_manager.get_analysis_currency()
 
         settings = {
             "name": job_name,
@@ -1165,13 +1228,18 @@ class AnalysisManager:
         Raises:
             IRPAPIError: If search fails
         """
+        return self._search_analyses_page(filter, limit, offset)[0]
+
+    def _search_analyses_page(self, filter: str, limit: int, offset: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Fetch one page of analysis results, returning (records, total_count or None)."""
         params: Dict[str, Any] = {'limit': limit, 'offset': offset}
         if filter:
             params['filter'] = filter
 
         try:
             response = self.client.request('GET', SEARCH_ANALYSIS_RESULTS, params=params)
-            return response.json()
+            records = response.json()
+            return records, get_total_count(response, records)
         except Exception as e:
             raise IRPAPIError(f"Failed to search analysis results : {e}")
 
@@ -1190,20 +1258,22 @@ class AnalysisManager:
         Raises:
             IRPAPIError: If search fails
         """
-        all_results = []
-        offset = 0
-        limit = 100
+        return fetch_all_pages(lambda offset, limit: self._search_analyses_page(filter, limit, offset))
 
-        while True:
-            results = self.search_analyses(filter=filter, limit=limit, offset=offset)
-            all_results.extend(results)
+    def iter_analyses(self, filter: str = "") -> Iterator[Dict[str, Any]]:
+        """
+        Stream all analysis results matching the filter, fetching pages concurrently.
 
-            # If we got fewer results than the limit, we've reached the end
-            if len(results) < limit:
-                break
-            offset += limit
+        Args:
+            filter: Optional filter string (default: "")
 
-        return all_results
+        Yields:
+            Analysis result dicts in result order
+
+        Raises:
+            IRPAPIError: If search fails
+        """
+        yield from iter_paginated(lambda offset, limit: self._search_analyses_page(filter, limit, offset))
 
     def get_analysis_by_name(self, analysis_name: str, edm_name: str) -> Dict[str, Any]:
         """
@@ -1252,6 +1322,9 @@ class AnalysisManager:
         except Exception as e:
             raise IRPAPIError(f"Failed to delete analysis : {e}")
 
+        if self.loss_store is not None:
+            self.loss_store.remove(analysis_id)
+
     def get_analysis_by_app_analysis_id(self, app_analysis_id: int) -> Dict[str, Any]:
         """
         Retrieve analysis by appAnalysisId (the ID used in the application/UI).
@@ -1312,7 +1385,7 @@ class AnalysisManager:
             perspective_code: One of 'GR' (Gross), 'GU' (Ground-Up), 'RL' (Reinsurance Layer)
             exposure_resource_id: Exposure resource ID (portfolio ID from analysis)
             filter: Optional filter string (e.g., "eventId IN (1, 2, 3)" or "eventId = 123")
-            limit: Optional maximum number of records to return
+            limit: Optional maximum number of records to return (default: 100000)
             offset: Optional number of records to skip (for pagination)
 
         Returns:
@@ -1325,18 +1398,13 @@ class AnalysisManager:
         validate_positive_int(analysis_id, "analysis_id")
         self._validate_perspective_code(perspective_code)
 
-        params = {
-            'perspectiveCode': perspective_code,
-            'exposureResourceType': 'PORTFOLIO',
-            'exposureResourceId': exposure_resource_id
-        }
+        limit = limit if limit is not None else LOSS_TABLE_DEFAULT_LIMIT
+        stored = self._stored_loss_table('elt', analysis_id, perspective_code, exposure_resource_id, filter, limit, offset)
+        if stored is not None:
+            from .streaming import table_records
+            return table_records(stored)
 
-        if filter is not None:
-            params['filter'] = filter
-        if limit is not None:
-            params['limit'] = limit
-        if offset is not None:
-            params['offset'] = offset
+        params = self._loss_table_params(perspective_code, exposure_resource_id, filter, limit, offset)
 
         try:
             response = self.client.request(
@@ -1348,6 +1416,43 @@ class AnalysisManager:
         except Exception as e:
             raise IRPAPIError(f"Failed to get ELT for analysis {analysis_id}: {e}")
 
+    def get_elt_table(
+        self,
+        analysis_id: int,
+        perspective_code: str,
+        exposure_resource_id: int,
+        filter: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> 'pd.DataFrame':
+        """
+        Retrieve Event Loss Table (ELT) for an analysis as a DataFrame.
+
+        Same request as get_elt() (limit defaults to 100000), but the response
+        is streamed and decoded in batches into typed columns (see
+        streaming.py), without building a dict per record.
+
+        Args:
+            See get_elt()
+
+        Returns:
+            DataFrame with one row per ELT record (empty if there are none)
+
+        Raises:
+            IRPValidationError: If parameters are invalid
+            IRPAPIError: If request fails
+        """
+        validate_positive_int(analysis_id, "analysis_id")
+        self._validate_perspective_code(perspective_code)
+
+        limit = limit if limit is not None else LOSS_TABLE_DEFAULT_LIMIT
+        stored = self._stored_loss_table('elt', analysis_id, perspective_code, exposure_resource_id, filter, limit, offset)
+        if stored is not None:
+            return stored
+
+        params = self._loss_table_params(perspective_code, exposure_resource_id, filter, limit, offset)
+        return self._get_table(GET_ANALYSIS_ELT.format(analysisId=analysis_id), params, f"ELT for analysis {analysis_id}")
+
     def get_ep(
         self,
         analysis_id: int,
@@ -1378,15 +1483,18 @@ class AnalysisManager:
             'exposureResourceId': exposure_resource_id
         }
 
-        try:
-            response = self.client.request(
-                'GET',
-                GET_ANALYSIS_EP.format(analysisId=analysis_id),
-                params=params
-            )
-            return response.json()
-        except Exception as e:
-            raise IRPAPIError(f"Failed to get EP metrics for analysis {analysis_id}: {e}")
+        def fetch() -> List[Dict[str, Any]]:
+            try:
+                response = self.client.request(
+                    'GET',
+                    GET_ANALYSIS_EP.format(analysisId=analysis_id),
+                    params=params
+                )
+                return response.json()
+            except Exception as e:
+                raise IRPAPIError(f"Failed to get EP metrics for analysis {analysis_id}: {e}")
+
+        return self._stored_loss_records('ep', analysis_id, perspective_code, exposure_resource_id, fetch)
 
     def get_stats(
         self,
@@ -1418,15 +1526,18 @@ class AnalysisManager:
             'exposureResourceId': exposure_resource_id
         }
 
-        try:
-            response = self.client.request(
-                'GET',
-                GET_ANALYSIS_STATS.format(analysisId=analysis_id),
-                params=params
-            )
-            return response.json()
-        except Exception as e:
-            raise IRPAPIError(f"Failed to get statistics for analysis {analysis_id}: {e}")
+        def fetch() -> List[Dict[str, Any]]:
+            try:
+                response = self.client.request(
+                    'GET',
+                    GET_ANALYSIS_STATS.format(analysisId=analysis_id),
+                    params=params
+                )
+                return response.json()
+            except Exception as e:
+                raise IRPAPIError(f"Failed to get statistics for analysis {analysis_id}: {e}")
+
+        return self._stored_loss_records('stats', analysis_id, perspective_code, exposure_resource_id, fetch)
 
     def get_plt(
         self,
@@ -1460,17 +1571,13 @@ class AnalysisManager:
         validate_positive_int(analysis_id, "analysis_id")
         self._validate_perspective_code(perspective_code)
 
-        params = {
-            'perspectiveCode': perspective_code,
-            'exposureResourceType': 'PORTFOLIO',
-            'exposureResourceId': exposure_resource_id,
-            'limit': limit if limit is not None else 100000
-        }
+        limit = limit if limit is not None else LOSS_TABLE_DEFAULT_LIMIT
+        stored = self._stored_loss_table('plt', analysis_id, perspective_code, exposure_resource_id, filter, limit, offset)
+        if stored is not None:
+            from .streaming import table_records
+            return table_records(stored)
 
-        if filter is not None:
-            params['filter'] = filter
-        if offset is not None:
-            params['offset'] = offset
+        params = self._loss_table_params(perspective_code, exposure_resource_id, filter, limit, offset)
 
         try:
             response = self.client.request(
@@ -1482,6 +1589,156 @@ class AnalysisManager:
         except Exception as e:
             raise IRPAPIError(f"Failed to get PLT for analysis {analysis_id}: {e}")
 
+    def get_plt_table(
+        self,
+        analysis_id: int,
+        perspective_code: str,
+        exposure_resource_id: int,
+        filter: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> 'pd.DataFrame':
+        """
+        Retrieve Period Loss Table (PLT) for an analysis as a DataFrame.
+
+        Same request as get_plt() (limit defaults to 100000), but the response
+        is streamed and decoded in batches into typed columns (see
+        streaming.py), without building a dict per record.
+
+        Args:
+            See get_plt()
+
+        Returns:
+            DataFrame with one row per PLT record (empty if there are none)
+
+        Raises:
+            IRPValidationError: If parameters are invalid
+            IRPAPIError: If request fails
+        """
+        validate_positive_int(analysis_id, "analysis_id")
+        self._validate_perspective_code(perspective_code)
+
+        limit = limit if limit is not None else LOSS_TABLE_DEFAULT_LIMIT
+        stored = self._stored_loss_table('plt', analysis_id, perspective_code, exposure_resource_id, filter, limit, offset)
+        if stored is not None:
+            return stored
+
+        params = self._loss_table_params(perspective_code, exposure_resource_id, filter, limit, offset)
+        return self._get_table(GET_ANALYSIS_PLT.format(analysisId=analysis_id), params, f"PLT for analysis {analysis_id}")
+
+    def _loss_table_params(
+        self,
+        perspective_code: str,
+        exposure_resource_id: int,
+        filter: Optional[str],
+        limit: Optional[int],
+        offset: Optional[int]
+    ) -> Dict[str, Any]:
+        """Query parameters for ELT/PLT requests."""
+        params = {
+            'perspectiveCode': perspective_code,
+            'exposureResourceType': 'PORTFOLIO',
+            'exposureResourceId': exposure_resource_id
+        }
+        if filter is not None:
+            params['filter'] = filter
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return params
+
+    def _get_table(self, path: str, params: Dict[str, Any], description: str) -> 'pd.DataFrame':
+        """GET a JSON array of records, streamed into a DataFrame."""
+        from .streaming import read_json_table
+
+        try:
+            response = self.client.request('GET', path, params=params, stream=True)
+            with response:
+                return read_json_table(response)
+        except Exception as e:
+            raise IRPAPIError(f"Failed to get {description}: {e}")
+
+    def _stored_loss_table(
+        self,
+        table: str,
+        analysis_id: int,
+        perspective_code: str,
+        exposure_resource_id: int,
+        filter: Optional[str],
+        limit: Optional[int],
+        offset: Optional[int]
+    ) -> Optional['pd.DataFrame']:
+        """
+        Answer an ELT/PLT request from the loss store, downloading the whole
+        table into it on first use.
+
+        Returns:
+            The requested rows, or None when there is no store, the filter is
+            not an eventId filter, or the table is empty (not stored)
+        """
+        store = self.loss_store
+        if store is None:
+            return None
+        from .loss_store import LossTableKey, event_ids_from_filter
+
+        event_ids = None
+        if filter is not None:
+            event_ids = event_ids_from_filter(filter)
+            if event_ids is None:
+                return None
+
+        key = LossTableKey(analysis_id, perspective_code, exposure_resource_id, table)
+        with store.lock(key):
+            rows = store.get_table(key, event_ids)
+            if rows is None:
+                if not store.put_table(key, self._download_loss_table(key)):
+                    return None
+                # Already counted as a miss
+                rows = store.get_table(key, event_ids, count=False)
+
+        start = offset or 0
+        return rows.iloc[start:start + limit if limit is not None else None].reset_index(drop=True)
+
+    def _download_loss_table(self, key: Any) -> 'pd.DataFrame':
+        """Fetch a whole ELT/PLT, LOSS_STORE_PAGE_SIZE records per request."""
+        from .streaming import concat_tables
+
+        path = (GET_ANALYSIS_ELT if key.table == 'elt' else GET_ANALYSIS_PLT).format(analysisId=key.analysis_id)
+        pages = []
+        offset = 0
+        while True:
+            params = self._loss_table_params(
+                key.perspective_code, key.exposure_resource_id, None, LOSS_STORE_PAGE_SIZE, offset
+            )
+            page = self._get_table(path, params, f"{key.table.upper()} for analysis {key.analysis_id}")
+            pages.append(page)
+            if len(page) < LOSS_STORE_PAGE_SIZE:
+                return concat_tables(pages)
+            offset += LOSS_STORE_PAGE_SIZE
+
+    def _stored_loss_records(
+        self,
+        table: str,
+        analysis_id: int,
+        perspective_code: str,
+        exposure_resource_id: int,
+        fetch: Callable[[], Any]
+    ) -> Any:
+        """EP/stats from the loss store, or fetch() (stored for next time)."""
+        store = self.loss_store
+        if store is None:
+            return fetch()
+        from .loss_store import LossTableKey
+
+        key = LossTableKey(analysis_id, perspective_code, exposure_resource_id, table)
+        with store.lock(key):
+            records = store.get_records(key)
+            if records is None:
+                records = fetch()
+                store.put_records(key, records)
+        return records
+
     def get_regions(
         self,
         analysis_id: int
@@ -1525,3 +1782,226 @@ class AnalysisManager:
             return response.json()
         except Exception as e:
             raise IRPAPIError(f"Failed to get regions for analysis {analysis_id}: {e}")
+
+
+class AnalysisSubmissionPlan(LookupCache):
+    """
+    Pre-resolved lookups for a batch of portfolio analysis submissions.
+
+    Built by AnalysisManager.plan_portfolio_analysis_jobs(): EDMs, portfolios,
+    treaties and existing analyses are fetched with chunked IN-filter searches
+    run concurrently, and each distinct model profile, output profile, event
+    rate scheme and tag is looked up once, as is the analysis currency (see
+    LookupCache). submit_portfolio_analysis_job(plan=...) then only has to POST
+    the job.
+
+    Lookups that were not planned, or whose search failed while planning, are
+    made when a job needs them, so errors are raised for that job only.
+    """
+
+    def __init__(
+        self,
+        manager: 'AnalysisManager',
+        max_workers: int = ANALYSIS_PLAN_MAX_WORKERS,
+        chunk_size: int = NAME_FILTER_CHUNK_SIZE
+    ):
+        """
+        Initialize an empty plan.
+
+        Args:
+            manager: AnalysisManager whose managers are used for API calls
+            max_workers: Maximum concurrent lookups while planning
+            chunk_size: Maximum names per IN-filter search
+        """
+        super().__init__(max_workers, chunk_size)
+        self._manager = manager
+
+        # Name searches, keyed by (scope, name): scope is None for EDMs, the
+        # exposure ID for portfolios/treaties and the EDM name for analyses
+        self._edms: Dict[Tuple[Any, str], List[Dict[str, Any]]] = {}
+        self._portfolios: Dict[Tuple[Any, str], List[Dict[str, Any]]] = {}
+        self._treaties: Dict[Tuple[Any, str], List[Dict[str, Any]]] = {}
+        self._analyses: Dict[Tuple[Any, str], List[Dict[str, Any]]] = {}
+
+        # Reference data responses, keyed by name (event rate schemes by
+        # (name, perilCode, modelRegionCode)); the currency is keyed by 'currency'
+        self._model_profiles: Dict[str, Dict[str, Any]] = {}
+        self._output_profiles: Dict[str, List[Dict[str, Any]]] = {}
+        self._event_rate_schemes: Dict[Tuple[str, Optional[str], Optional[str]], Dict[str, Any]] = {}
+        self._tag_ids: Dict[str, int] = {}
+        self._currency: Dict[str, Dict[str, str]] = {}
+
+    # -------------------------------------------------------------------------
+    # Planning
+    # -------------------------------------------------------------------------
+
+    def resolve(self, analysis_data_list: List[Dict[str, Any]]) -> 'AnalysisSubmissionPlan':
+        """
+        Resolve everything the given submissions need.
+
+        Args:
+            analysis_data_list: Analysis job data dicts, with the same keys as
+                the submit_portfolio_analysis_job arguments (edm_name,
+                portfolio_name, job_name, analysis_profile_name,
+                output_profile_name, event_rate_scheme_name, treaty_names,
+                tag_names)
+
+        Returns:
+            This plan
+        """
+        jobs = [data for data in analysis_data_list if isinstance(data, dict)]
+
+        self.fetch_names(
+            self._edms, {None: [data.get('edm_name') for data in jobs]}, self._search_edms, 'exposureName'
+        )
+
+        analysis_names_by_edm: Dict[str, List[str]] = {}
+        portfolio_names_by_exposure: Dict[int, List[str]] = {}
+        treaty_names_by_exposure: Dict[int, List[str]] = {}
+        for data in jobs:
+            edm_name = data.get('edm_name')
+            if edm_name and data.get('job_name'):
+                analysis_names_by_edm.setdefault(edm_name, []).append(data['job_name'])
+            edms = self._edms.get((None, edm_name), [])
+            if len(edms) != 1 or 'exposureId' not in edms[0]:
+                continue
+            exposure_id = edms[0]['exposureId']
+            portfolio_names_by_exposure.setdefault(exposure_id, []).append(data.get('portfolio_name'))
+            treaty_names_by_exposure.setdefault(exposure_id, []).extend(data.get('treaty_names') or [])
+
+        self.fetch_names(self._analyses, analysis_names_by_edm, self._search_analyses, 'analysisName')
+        self.fetch_names(self._portfolios, portfolio_names_by_exposure, self._search_portfolios, 'portfolioName')
+        self.fetch_names(self._treaties, treaty_names_by_exposure, self._search_treaties, 'treatyName')
+
+        reference_data = self._manager.reference_data_manager
+        self.fetch_keys(
+            self._model_profiles,
+            [data.get('analysis_profile_name') for data in jobs],
+            reference_data.get_model_profile_by_name
+        )
+        self.fetch_keys(
+            self._output_profiles,
+            [data.get('output_profile_name') for data in jobs],
+            reference_data.get_output_profile_by_name
+        )
+
+        # Event rate schemes are filtered by the model profile's peril and region
+        scheme_keys = []
+        for data in jobs:
+            model_profile = self._model_profiles.get(data.get('analysis_profile_name'))
+            if not data.get('event_rate_scheme_name') or not model_profile or not model_profile.get('items'):
+                continue
+            item = model_profile['items'][0]
+            scheme_keys.append(
+                (data['event_rate_scheme_name'], item.get('perilCode'), item.get('modelRegionCode'))
+            )
+        self.fetch_keys(self._event_rate_schemes, scheme_keys, self._get_event_rate_scheme)
+
+        self.fetch_keys(
+            self._tag_ids,
+            [tag for data in jobs for tag in (data.get('tag_names') or [])],
+            self._get_tag_id
+        )
+        self.fetch_keys(self._currency, ['currency'], lambda _: reference_data.get_analysis_currency())
+        return self
+
+    # -------------------------------------------------------------------------
+    # Search and fetch functions
+    # -------------------------------------------------------------------------
+
+    def _search_edms(self, _scope, names: List[str]) -> List[Dict[str, Any]]:
+        return self._manager.edm_manager.search_edms_paginated(
+            filter=name_in_filter('exposureName', names)
+        )
+
+    def _search_portfolios(self, exposure_id, names: List[str]) -> List[Dict[str, Any]]:
+        return self._manager.portfolio_manager.search_portfolios_paginated(
+            exposure_id=exposure_id,
+            filter=name_in_filter('portfolioName', names)
+        )
+
+    def _search_treaties(self, exposure_id, names: List[str]) -> List[Dict[str, Any]]:
+        return self._manager.treaty_manager.search_treaties_paginated(
+            exposure_id=exposure_id,
+            filter=name_in_filter('treatyName', names)
+        )
+
+    def _search_analyses(self, edm_name, names: List[str]) -> List[Dict[str, Any]]:
+        filter_str = name_in_filter('analysisName', names)
+        if edm_name:
+            filter_str += f' AND exposureName = {quote_filter_value(edm_name)}'
+        return self._manager.search_analyses_paginated(filter=filter_str)
+
+    def _get_event_rate_scheme(self, key: Tuple[str, Optional[str], Optional[str]]) -> Dict[str, Any]:
+        name, peril_code, model_region_code = key
+        return self._manager.reference_data_manager.get_event_rate_scheme_by_name(
+            name,
+            peril_code=peril_code,
+            model_region_code=model_region_code
+        )
+
+    def _get_tag_id(self, tag_name: str) -> int:
+        return self._manager.reference_data_manager.get_tag_ids_from_tag_names([tag_name])[0]
+
+    # -------------------------------------------------------------------------
+    # Lookups (used by submit_portfolio_analysis_job)
+    # -------------------------------------------------------------------------
+
+    def find_analyses(self, analysis_names: List[str], edm_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get existing analyses by name, optionally scoped to an EDM (exposureName)."""
+        return self.lookup_names(
+            self._analyses, edm_name, analysis_names, self._search_analyses, 'analysisName',
+            legacy_calls=len(analysis_names)
+        )
+
+    def find_edms(self, edm_name: str) -> List[Dict[str, Any]]:
+        """Get EDM records with the given name."""
+        return self.lookup_names(self._edms, None, [edm_name], self._search_edms, 'exposureName', legacy_calls=1)
+
+    def find_portfolios(self, exposure_id: int, portfolio_name: str) -> List[Dict[str, Any]]:
+        """Get portfolio records with the given name within an EDM."""
+        return self.lookup_names(
+            self._portfolios, exposure_id, [portfolio_name], self._search_portfolios, 'portfolioName',
+            legacy_calls=1
+        )
+
+    def find_treaties(self, exposure_id: int, treaty_names: List[str]) -> List[Dict[str, Any]]:
+        """Get treaty records for the given names within an EDM."""
+        return self.lookup_names(
+            self._treaties, exposure_id, treaty_names, self._search_treaties, 'treatyName',
+            legacy_calls=1
+        )
+
+    def get_model_profile(self, profile_name: str) -> Dict[str, Any]:
+        """Get the model profile search response for a name."""
+        return self.lookup_key(
+            self._model_profiles, profile_name, self._manager.reference_data_manager.get_model_profile_by_name
+        )
+
+    def get_output_profile(self, profile_name: str) -> List[Dict[str, Any]]:
+        """Get the output profile search response for a name."""
+        return self.lookup_key(
+            self._output_profiles, profile_name, self._manager.reference_data_manager.get_output_profile_by_name
+        )
+
+    def get_event_rate_scheme(
+        self,
+        scheme_name: str,
+        peril_code: Optional[str] = None,
+        model_region_code: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get the event rate scheme search response for a name, peril and region."""
+        return self.lookup_key(
+            self._event_rate_schemes, (scheme_name, peril_code, model_region_code), self._get_event_rate_scheme
+        )
+
+    def get_tag_ids(self, tag_names: List[str]) -> List[int]:
+        """Get (or create) tag IDs for the given names."""
+        validate_list_not_empty(tag_names, "tag_names")
+        return [self.lookup_key(self._tag_ids, tag_name, self._get_tag_id) for tag_name in tag_names]
+
+    def get_currency(self) -> Dict[str, str]:
+        """Get the currency dict for analysis requests."""
+        return self.lookup_key(
+            self._currency, 'currency', lambda _: self._manager.reference_data_manager.get_analysis_currency()
+        )
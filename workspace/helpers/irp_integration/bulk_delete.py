@@ -0,0 +1,612 @@
+"""
+Bulk deletion of Moody's entities (analyses, groups, RDMs, EDMs).
+
+Used for cycle resets and the _Tools/Bulk Delete workflows. Deletion runs in
+two phases:
+
+1. plan(): resolve all target names to IDs with chunked IN-filter searches
+   (issued concurrently), recording each target in a BulkDeleteReport.
+2. execute(): submit deletions concurrently under a shared RateLimiter, in
+   dependency order (groups, analyses, RDMs, then EDMs), then poll the EDM
+   risk data jobs as one batch and the RDM databridge jobs as one group.
+
+The report can be saved to a JSON file after every change. Re-running with the
+same report path is idempotent: targets already deleted (or never found) are
+skipped, and submitted-but-unfinished jobs are polled instead of resubmitted.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .client import Client
+from .constants import (
+    BULK_DELETE_MAX_REQUESTS_PER_SECOND,
+    BULK_DELETE_MAX_WORKERS,
+    NAME_FILTER_CHUNK_SIZE,
+)
+from .exceptions import IRPAPIError, IRPJobError
+from .utils import RateLimiter, chunk_list, map_concurrently, name_in_filter, quote_filter_value
+from .validators import validate_positive_int
+
+
+# Databridge job statuses (delete RDM)
+DATABRIDGE_IN_PROGRESS_STATUSES = {'Enqueued', 'Processing'}
+DATABRIDGE_SUCCESS_STATUS = 'Succeeded'
+
+
+class BulkDeleteStatus:
+    """Per-target deletion status."""
+    PENDING = 'PENDING'        # Resolved, not yet deleted
+    NOT_FOUND = 'NOT_FOUND'    # Doesn't exist in Moody's (nothing to do)
+    SUBMITTED = 'SUBMITTED'    # Delete job submitted, not yet complete
+    DELETED = 'DELETED'
+    FAILED = 'FAILED'
+
+    @classmethod
+    def done(cls) -> List[str]:
+        """Statuses that need no further work on re-run."""
+        return [cls.NOT_FOUND, cls.DELETED]
+
+
+class BulkDeleteReport:
+    """
+    Resumable record of a bulk deletion.
+
+    Targets are keyed by type and name ('analysis:EDM/Name', 'group:Name',
+    'edm:Name', 'rdm:Name'). When a path is set, the report is written to it
+    (atomically) after every status change.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """
+        Initialize an empty report.
+
+        Args:
+            path: Optional JSON file path to persist the report to
+        """
+        self.path = path
+        self.targets: Dict[str, Dict[str, Any]] = {}
+        self.created_at = datetime.now().isoformat()
+        self._lock = threading.RLock()
+
+    @classmethod
+    def load(cls, path: str) -> 'BulkDeleteReport':
+        """
+        Load a report from a JSON file, or start a new one if the file doesn't exist.
+
+        Args:
+            path: JSON file path
+
+        Returns:
+            BulkDeleteReport bound to path
+        """
+        report = cls(path)
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') != cls.VERSION:
+                raise IRPAPIError(f"Unsupported bulk delete report version in {path}: {data.get('version')}")
+            report.created_at = data.get('created_at', report.created_at)
+            report.targets = data.get('targets', {})
+        return report
+
+    @staticmethod
+    def target_key(target_type: str, name: str, edm_name: Optional[str] = None) -> str:
+        """Build the report key for a target."""
+        if target_type == 'analysis':
+            return f"analysis:{edm_name}/{name}"
+        return f"{target_type}:{name}"
+
+    def add_target(self, target_type: str, name: str, edm_name: Optional[str] = None, **extra: Any) -> Dict[str, Any]:
+        """
+        Add a target (no-op if already present, preserving its status).
+
+        Args:
+            target_type: 'analysis', 'group', 'edm' or 'rdm'
+            name: Entity name
+            edm_name: EDM name (analyses only)
+            **extra: Additional fields to store on a new target (e.g. server_name)
+
+        Returns:
+            The target record
+        """
+        key = self.target_key(target_type, name, edm_name)
+        with self._lock:
+            if key not in self.targets:
+                self.targets[key] = {
+                    'type': target_type,
+                    'name': name,
+                    'edm_name': edm_name,
+                    'ids': [],
+                    'job_ids': [],
+                    'status': BulkDeleteStatus.PENDING,
+                    'error': None,
+                    **extra,
+                }
+            return self.targets[key]
+
+    def update(self, key: str, **fields: Any) -> None:
+        """Update a target's fields and persist the report."""
+        with self._lock:
+            self.targets[key].update(fields)
+            self.targets[key]['updated_at'] = datetime.now().isoformat()
+            self.save()
+
+    def select(self, target_type: Optional[str] = None, statuses: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Get targets filtered by type and/or status."""
+        statuses = set(statuses) if statuses is not None else None
+        with self._lock:
+            return {
+                key: t for key, t in self.targets.items()
+                if (target_type is None or t['type'] == target_type)
+                and (statuses is None or t['status'] in statuses)
+            }
+
+    def save(self) -> None:
+        """Write the report to its path (no-op if no path)."""
+        if not self.path:
+            return
+        with self._lock:
+            data = {'version': self.VERSION, 'created_at': self.created_at, 'targets': self.targets}
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
+            os.replace(tmp_path, self.path)
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """
+        Count targets by type and status.
+
+        Returns:
+            Dict of target type -> {status: count}
+        """
+        counts: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            for t in self.targets.values():
+                by_status = counts.setdefault(t['type'], {})
+                by_status[t['status']] = by_status.get(t['status'], 0) + 1
+        return counts
+
+    def errors(self) -> List[str]:
+        """Get error messages for failed targets."""
+        with self._lock:
+            return [
+                f"{key}: {t['error']}" for key, t in self.targets.items()
+                if t['status'] == BulkDeleteStatus.FAILED
+            ]
+
+    @property
+    def is_complete(self) -> bool:
+        """True if every target is deleted or was not found."""
+        with self._lock:
+            return all(t['status'] in BulkDeleteStatus.done() for t in self.targets.values())
+
+
+class BulkDeleteManager:
+    """Manager for bulk deletion of Moody's entities."""
+
+    def __init__(
+        self,
+        client: Client,
+        analysis_manager: Optional[Any] = None,
+        edm_manager: Optional[Any] = None,
+        rdm_manager: Optional[Any] = None,
+        job_manager: Optional[Any] = None,
+        max_workers: int = BULK_DELETE_MAX_WORKERS,
+        max_requests_per_second: float = BULK_DELETE_MAX_REQUESTS_PER_SECOND
+    ) -> None:
+        """
+        Initialize bulk delete manager.
+
+        Args:
+            client: IRP API client instance
+            analysis_manager: Optional AnalysisManager instance
+            edm_manager: Optional EDMManager instance
+            rdm_manager: Optional RDMManager instance
+            job_manager: Optional JobManager instance
+            max_workers: Maximum concurrent searches/deletions
+            max_requests_per_second: Rate limit for deletion requests
+        """
+        self.client = client
+        self._analysis_manager = analysis_manager
+        self._edm_manager = edm_manager
+        self._rdm_manager = rdm_manager
+        self._job_manager = job_manager
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(max_requests_per_second)
+
+    @property
+    def analysis_manager(self):
+        """Lazy-loaded analysis manager to avoid circular imports."""
+        if self._analysis_manager is None:
+            from .analysis import AnalysisManager
+            self._analysis_manager = AnalysisManager(self.client)
+        return self._analysis_manager
+
+    @property
+    def edm_manager(self):
+        """Lazy-loaded edm manager to avoid circular imports."""
+        if self._edm_manager is None:
+            from .edm import EDMManager
+            self._edm_manager = EDMManager(self.client)
+        return self._edm_manager
+
+    @property
+    def rdm_manager(self):
+        """Lazy-loaded rdm manager to avoid circular imports."""
+        if self._rdm_manager is None:
+            from .rdm import RDMManager
+            self._rdm_manager = RDMManager(self.client)
+        return self._rdm_manager
+
+    @property
+    def job_manager(self):
+        """Lazy-loaded job manager to avoid circular imports."""
+        if self._job_manager is None:
+            from .job import JobManager
+            self._job_manager = JobManager(self.client)
+        return self._job_manager
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def plan(
+        self,
+        analyses: Optional[List[Tuple[str, str]]] = None,
+        groups: Optional[List[str]] = None,
+        edms: Optional[List[str]] = None,
+        rdms: Optional[List[str]] = None,
+        server_name: str = "databridge-1",
+        include_edm_analyses: bool = True,
+        all_matches: bool = False,
+        report_path: Optional[str] = None
+    ) -> BulkDeleteReport:
+        """
+        Resolve deletion targets to Moody's IDs without deleting anything.
+
+        Args:
+            analyses: List of (edm_name, analysis_name) tuples
+            groups: List of analysis group names
+            edms: List of EDM names
+            rdms: List of RDM names (prefix match, as in RDMManager)
+            server_name: Database server for RDMs (default: "databridge-1")
+            include_edm_analyses: Also delete all analyses in the listed EDMs
+                (EDM deletion fails while analyses exist)
+            all_matches: Delete every analysis/group matching a listed name. By
+                default only the first match is deleted, as in the per-job
+                delete helpers. Analyses added by include_edm_analyses always
+                delete every match.
+            report_path: Optional JSON report path; an existing report there is resumed
+
+        Returns:
+            BulkDeleteReport with each target PENDING (with IDs), NOT_FOUND,
+            or carried over from a previous run
+        """
+        report = BulkDeleteReport.load(report_path) if report_path else BulkDeleteReport()
+
+        for edm_name, analysis_name in analyses or []:
+            report.add_target('analysis', analysis_name, edm_name, all_matches=all_matches)
+        for group_name in groups or []:
+            report.add_target('group', group_name, all_matches=all_matches)
+        for edm_name in edms or []:
+            report.add_target('edm', edm_name)
+        for rdm_name in rdms or []:
+            report.add_target('rdm', rdm_name, server_name=server_name)
+
+        if include_edm_analyses and edms:
+            for analysis in self._search_chunked(
+                list(dict.fromkeys(edms)),
+                lambda chunk: self.analysis_manager.search_analyses_paginated(
+                    filter=name_in_filter('exposureName', chunk)
+                )
+            ):
+                if analysis.get('engineType') == 'Group' or not analysis.get('analysisName'):
+                    continue
+                # Everything in the EDM goes, including same-named duplicates
+                target = report.add_target('analysis', analysis.get('analysisName'), analysis.get('exposureName'))
+                target['all_matches'] = True
+
+        self._resolve_groups(report)
+        self._resolve_analyses(report)
+        self._resolve_edms(report)
+        self._resolve_rdms(report)
+        report.save()
+        return report
+
+    def execute(
+        self,
+        report: BulkDeleteReport,
+        poll_interval: int = 20,
+        timeout: int = 600000
+    ) -> BulkDeleteReport:
+        """
+        Delete all PENDING targets in a report and wait for delete jobs to finish.
+
+        Args:
+            report: Report from plan()
+            poll_interval: Polling interval in seconds for EDM/RDM delete jobs
+            timeout: Maximum time in seconds to wait for delete jobs
+
+        Returns:
+            The updated report
+        """
+        validate_positive_int(poll_interval, "poll_interval")
+        validate_positive_int(timeout, "timeout")
+
+        # Dependency order: groups reference analyses, and EDMs can't be
+        # deleted while they still have analyses
+        self._delete_analyses(report, 'group')
+        self._delete_analyses(report, 'analysis')
+
+        self._submit(report, 'rdm', self._submit_rdm_delete)
+        self._poll_rdm_jobs(report, poll_interval, timeout)
+
+        self._submit(report, 'edm', self._submit_edm_delete)
+        self._poll_edm_jobs(report, poll_interval, timeout)
+
+        report.save()
+        return report
+
+    def delete(
+        self,
+        analyses: Optional[List[Tuple[str, str]]] = None,
+        groups: Optional[List[str]] = None,
+        edms: Optional[List[str]] = None,
+        rdms: Optional[List[str]] = None,
+        server_name: str = "databridge-1",
+        include_edm_analyses: bool = True,
+        all_matches: bool = False,
+        report_path: Optional[str] = None
+    ) -> BulkDeleteReport:
+        """
+        Resolve and delete targets (plan() followed by execute()).
+
+        See plan() for arguments.
+
+        Returns:
+            The final BulkDeleteReport
+        """
+        report = self.plan(
+            analyses=analyses,
+            groups=groups,
+            edms=edms,
+            rdms=rdms,
+            server_name=server_name,
+            include_edm_analyses=include_edm_analyses,
+            all_matches=all_matches,
+            report_path=report_path
+        )
+        return self.execute(report)
+
+    # =========================================================================
+    # Resolution
+    # =========================================================================
+
+    def _map(self, fn: Callable[[Any], Any], items: List[Any]) -> List[Tuple[Any, Any, Optional[Exception]]]:
+        """Run fn over items concurrently, returning (item, result, error) in input order."""
+        return map_concurrently(fn, items, self.max_workers)
+
+    def _search_chunked(
+        self,
+        names: List[str],
+        search: Callable[[List[str]], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Run a name IN-filter search over chunks of names concurrently; raises on first error."""
+        results = []
+        for _, found, error in self._map(search, chunk_list(names, NAME_FILTER_CHUNK_SIZE)):
+            if error is not None:
+                raise error
+            results.extend(found)
+        return results
+
+    def _resolve_by_name(
+        self,
+        report: BulkDeleteReport,
+        targets: Dict[str, Dict[str, Any]],
+        search: Callable[[List[str]], List[Dict[str, Any]]],
+        record_name: Callable[[Dict[str, Any]], Any],
+        target_name: Callable[[Dict[str, Any]], Any],
+        record_id: str
+    ) -> None:
+        """
+        Resolve targets to IDs with a chunked name search, marking them PENDING or NOT_FOUND.
+
+        A target keeps only the first matching ID unless it was added with all_matches.
+        """
+        if not targets:
+            return
+        names = list(dict.fromkeys(t['name'] for t in targets.values()))
+        try:
+            found = self._search_chunked(names, search)
+        except Exception as e:
+            for key in targets:
+                report.update(key, status=BulkDeleteStatus.FAILED, error=f"Lookup failed: {e}")
+            return
+
+        ids_by_name: Dict[Any, List[Any]] = {}
+        for record in found:
+            ids_by_name.setdefault(record_name(record), []).append(record.get(record_id))
+
+        for key, target in targets.items():
+            ids = ids_by_name.get(target_name(target), [])
+            if not target.get('all_matches'):
+                ids = ids[:1]
+            if ids:
+                report.update(key, ids=ids, status=BulkDeleteStatus.PENDING, error=None)
+            else:
+                report.update(key, ids=[], status=BulkDeleteStatus.NOT_FOUND, error=None)
+
+    def _unresolved(self, report: BulkDeleteReport, target_type: str) -> Dict[str, Dict[str, Any]]:
+        """Targets that still need an ID lookup (not done and not awaiting a job)."""
+        return report.select(target_type, [BulkDeleteStatus.PENDING, BulkDeleteStatus.FAILED])
+
+    def _resolve_groups(self, report: BulkDeleteReport) -> None:
+        """Resolve group names (groups are analyses with engineType = "Group")."""
+        self._resolve_by_name(
+            report,
+            self._unresolved(report, 'group'),
+            lambda chunk: self.analysis_manager.search_analyses_paginated(
+                filter=f'{name_in_filter("analysisName", chunk)} AND engineType = "Group"'
+            ),
+            record_name=lambda r: r.get('analysisName'),
+            target_name=lambda t: t['name'],
+            record_id='analysisId'
+        )
+
+    def _resolve_analyses(self, report: BulkDeleteReport) -> None:
+        """Resolve analysis names, one chunked search per EDM, EDMs in parallel."""
+        by_edm: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for key, target in self._unresolved(report, 'analysis').items():
+            by_edm.setdefault(target['edm_name'], {})[key] = target
+
+        def resolve(edm_name: str) -> None:
+            self._resolve_by_name(
+                report,
+                by_edm[edm_name],
+                lambda chunk: self.analysis_manager.search_analyses_paginated(
+                    filter=f'{name_in_filter("analysisName", chunk)} AND exposureName = {quote_filter_value(edm_name)}'
+                ),
+                record_name=lambda r: (r.get('exposureName'), r.get('analysisName')),
+                target_name=lambda t: (t['edm_name'], t['name']),
+                record_id='analysisId'
+            )
+
+        self._map(resolve, list(by_edm))
+
+    def _resolve_edms(self, report: BulkDeleteReport) -> None:
+        """Resolve EDM names to exposure IDs."""
+        self._resolve_by_name(
+            report,
+            self._unresolved(report, 'edm'),
+            lambda chunk: self.edm_manager.search_edms_paginated(filter=name_in_filter('exposureName', chunk)),
+            record_name=lambda r: r.get('exposureName'),
+            target_name=lambda t: t['name'],
+            record_id='exposureId'
+        )
+
+    def _resolve_rdms(self, report: BulkDeleteReport) -> None:
+        """
+        Resolve RDM name prefixes to full database names.
+
+        RDM names carry a random suffix, so each needs its own LIKE search;
+        these run concurrently.
+        """
+        targets = self._unresolved(report, 'rdm')
+
+        def resolve(key: str) -> None:
+            target = targets[key]
+            databases = self.rdm_manager.search_databases_paginated(
+                server_name=target.get('server_name', 'databridge-1'),
+                filter=f"databaseName LIKE \"{target['name']}*\""
+            )
+            if not databases:
+                report.update(key, ids=[], status=BulkDeleteStatus.NOT_FOUND, error=None)
+            elif len(databases) > 1:
+                report.update(key, status=BulkDeleteStatus.FAILED,
+                              error=f"Multiple RDMs found with name '{target['name']}'")
+            else:
+                report.update(key, ids=[databases[0].get('databaseName')],
+                              status=BulkDeleteStatus.PENDING, error=None)
+
+        for key, _, error in self._map(resolve, list(targets)):
+            if error is not None:
+                report.update(key, status=BulkDeleteStatus.FAILED, error=f"Lookup failed: {error}")
+
+    # =========================================================================
+    # Deletion
+    # =========================================================================
+
+    def _delete_analyses(self, report: BulkDeleteReport, target_type: str) -> None:
+        """Delete analyses or groups (synchronous DELETE per ID), concurrently."""
+        def delete(key: str) -> None:
+            for analysis_id in report.targets[key]['ids']:
+                self.rate_limiter.acquire()
+                self.analysis_manager.delete_analysis(analysis_id)
+            report.update(key, status=BulkDeleteStatus.DELETED, error=None)
+
+        pending = list(report.select(target_type, [BulkDeleteStatus.PENDING]))
+        for key, _, error in self._map(delete, pending):
+            if error is not None:
+                report.update(key, status=BulkDeleteStatus.FAILED, error=str(error))
+
+    def _submit(self, report: BulkDeleteReport, target_type: str, submit: Callable[[Dict[str, Any]], Any]) -> None:
+        """Submit delete jobs for PENDING targets concurrently, marking them SUBMITTED."""
+        def run(key: str) -> None:
+            self.rate_limiter.acquire()
+            job_id = submit(report.targets[key])
+            report.update(key, job_ids=[job_id], status=BulkDeleteStatus.SUBMITTED, error=None)
+
+        pending = list(report.select(target_type, [BulkDeleteStatus.PENDING]))
+        for key, _, error in self._map(run, pending):
+            if error is not None:
+                report.update(key, status=BulkDeleteStatus.FAILED, error=str(error))
+
+    def _submit_edm_delete(self, target: Dict[str, Any]) -> int:
+        return self.edm_manager.submit_delete_edm_job(target['ids'][0])
+
+    def _submit_rdm_delete(self, target: Dict[str, Any]) -> str:
+        return self.rdm_manager.submit_delete_rdm_job_by_full_name(
+            target['ids'][0], target.get('server_name', 'databridge-1')
+        )
+
+    def _poll_edm_jobs(self, report: BulkDeleteReport, interval: int, timeout: int) -> None:
+        """Poll all submitted EDM delete jobs as one risk data job batch."""
+        submitted = report.select('edm', [BulkDeleteStatus.SUBMITTED])
+        if not submitted:
+            return
+        key_by_job_id = {int(t['job_ids'][0]): key for key, t in submitted.items()}
+
+        try:
+            final_statuses = self.job_manager.poll_risk_data_job_batch_to_completion(
+                list(key_by_job_id), interval=interval, timeout=timeout
+            )
+        except (IRPAPIError, IRPJobError) as e:
+            for key in submitted:
+                report.update(key, error=f"Polling failed (job still tracked): {e}")
+            return
+
+        for job in final_statuses:
+            key = key_by_job_id.get(int(job.get('jobId', 0)))
+            if key is None:
+                continue
+            status = job.get('status')
+            if status == 'FINISHED':
+                report.update(key, status=BulkDeleteStatus.DELETED, error=None)
+            else:
+                report.update(key, status=BulkDeleteStatus.FAILED, error=f"Delete job finished with status {status}")
+
+    def _poll_rdm_jobs(self, report: BulkDeleteReport, interval: int, timeout: int) -> None:
+        """Poll all submitted RDM (databridge) delete jobs together until each finishes."""
+        remaining = report.select('rdm', [BulkDeleteStatus.SUBMITTED])
+        start = time.time()
+        while remaining:
+            print(f"Polling {len(remaining)} delete RDM job(s)")
+            for key, status, error in self._map(
+                lambda k: self.rdm_manager.get_databridge_job(remaining[k]['job_ids'][0]),
+                list(remaining)
+            ):
+                if error is not None:
+                    continue
+                if status == DATABRIDGE_SUCCESS_STATUS:
+                    report.update(key, status=BulkDeleteStatus.DELETED, error=None)
+                elif status not in DATABRIDGE_IN_PROGRESS_STATUSES:
+                    report.update(key, status=BulkDeleteStatus.FAILED, error=f"Delete job failed with status: {status}")
+
+            remaining = report.select('rdm', [BulkDeleteStatus.SUBMITTED])
+            if not remaining:
+                return
+            if time.time() - start > timeout:
+                for key in remaining:
+                    report.update(key, error=f"Delete job did not complete within {timeout} seconds (job still tracked)")
+                return
+            time.sleep(interval)
@@ -0,0 +1,260 @@
+"""
+Opt-in HTTP response cache for read-heavy Moody's API endpoints.
+
+The same searches and lookups (EDMs, portfolios, analyses, regions, EP and
+stats results, reference data) are requested repeatedly across validation,
+submission, grouping payload builds and results validation. With the cache
+enabled, Client.request serves repeated GETs of those endpoints from memory:
+
+- Only GET endpoints listed in RESPONSE_CACHE_TTLS are cached, keyed by URL,
+  query parameters and extra headers. Job/workflow status is never cached.
+- A cached response is served without contacting the API for its path's TTL.
+  After that, if the server sent an ETag or Last-Modified header, it is
+  revalidated with If-None-Match / If-Modified-Since and reused on a 304.
+- Empty search results are not cached: they usually mean the entity is still
+  being created by a running job.
+- POST/PUT/PATCH/DELETE requests drop cached responses of the same resource
+  family (e.g. /platform/riskdata/v1/analyses) and of related families
+  (RESPONSE_CACHE_RELATED_FAMILIES, e.g. model jobs create analyses).
+
+Enable it for every Client in the process with RISK_MODELER_RESPONSE_CACHE=true
+(one cache shared by all clients), or pass a ResponseCache to Client().
+Step reports the round-trips and bytes saved by the shared cache during each
+step run.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .constants import RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_RELATED_FAMILIES, RESPONSE_CACHE_TTLS
+
+
+# Response header -> conditional request header
+_VALIDATORS = {'ETag': 'If-None-Match', 'Last-Modified': 'If-Modified-Since'}
+
+_VERSION_SEGMENT = re.compile(r'v\d+$')
+
+STAT_NAMES = ('hits', 'revalidated', 'misses', 'invalidated', 'round_trips_saved', 'bytes_saved')
+
+
+def _template_pattern(template: str) -> 're.Pattern':
+    """Regex matching URL paths that end with an endpoint template ('{id}' matches one segment)"""
+    parts = re.split(r'\{[^}]+\}', '/' + template.lstrip('/'))
+    return re.compile('[^/]+'.join(re.escape(part) for part in parts) + '$')
+
+
+def resource_family(path: str) -> str:
+    """
+    Resource family of an API path: the path up to the first resource after
+    the version segment, e.g. /platform/riskdata/v1/analyses/12/ep ->
+    /platform/riskdata/v1/analyses. Paths without a version segment use their
+    first two segments (/data-store/referencetables/currency ->
+    /data-store/referencetables).
+    """
+    segments = [segment for segment in path.split('/') if segment]
+    for i, segment in enumerate(segments):
+        if _VERSION_SEGMENT.match(segment):
+            return '/' + '/'.join(segments[:i + 2])
+    return '/' + '/'.join(segments[:2])
+
+
+@dataclass
+class _CacheEntry:
+    response: Any
+    expires: float
+    validators: Dict[str, str]
+    size: int
+
+
+class ResponseCache:
+    """
+    In-memory cache of GET responses (see module docstring). Thread-safe;
+    the least recently used entries are dropped beyond max_entries.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        related_families: Optional[Dict[str, List[str]]] = None
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            ttls: Endpoint path template -> seconds (default: RESPONSE_CACHE_TTLS)
+            max_entries: Maximum cached responses
+            related_families: Resource family -> families its writes invalidate
+                (default: RESPONSE_CACHE_RELATED_FAMILIES)
+        """
+        ttls = RESPONSE_CACHE_TTLS if ttls is None else ttls
+        self._rules: List[Tuple['re.Pattern', float]] = [
+            (_template_pattern(template), ttl) for template, ttl in ttls.items()
+        ]
+        self.max_entries = max_entries
+        self.related_families = RESPONSE_CACHE_RELATED_FAMILIES if related_families is None else related_families
+        self._entries: 'OrderedDict[Tuple, _CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(STAT_NAMES, 0)
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        """Seconds responses for url may be served from the cache, or None if it is not cached"""
+        path = urlsplit(url).path
+        for pattern, ttl in self._rules:
+            if pattern.search(path):
+                return ttl
+        return None
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        send: Callable[[Dict[str, str]], Any]
+    ) -> Any:
+        """
+        Return the response for a GET, from the cache when possible.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            headers: Extra request headers (part of the cache key)
+            send: Performs the request; called with conditional headers to add
+
+        Returns:
+            requests.Response (a cached one is shared between callers)
+        """
+        ttl = self.ttl_for(url)
+        if ttl is None:
+            return send({})
+
+        key = (url, _freeze(params), _freeze(headers))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._count(hits=1, round_trips_saved=1, bytes_saved=entry.size)
+                    return entry.response
+                if not entry.validators:
+                    del self._entries[key]
+                    entry = None
+
+        conditional = {_VALIDATORS[name]: value for name, value in entry.validators.items()} if entry else {}
+        response = send(conditional)
+
+        if entry is not None and response.status_code == 304:
+            with self._lock:
+                entry.expires = time.monotonic() + ttl
+                entry.validators.update(
+                    {name: response.headers[name] for name in _VALIDATORS if response.headers.get(name)}
+                )
+                self._store(key, entry)
+                self._count(revalidated=1, bytes_saved=entry.size)
+            return entry.response
+
+        with self._lock:
+            self._count(misses=1)
+            if _cacheable(response):
+                validators = {name: response.headers[name] for name in _VALIDATORS if response.headers.get(name)}
+                self._store(key, _CacheEntry(response, time.monotonic() + ttl, validators, len(response.content)))
+        return response
+
+    def invalidate(self, url: str) -> int:
+        """
+        Drop cached responses in the resource family of url and its related families.
+
+        Returns:
+            Number of responses dropped
+        """
+        family = resource_family(urlsplit(url).path)
+        families = {family, *self.related_families.get(family, [])}
+        with self._lock:
+            stale = [key for key in self._entries if resource_family(urlsplit(key[0]).path) in families]
+            for key in stale:
+                del self._entries[key]
+            self._count(invalidated=len(stale))
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached response (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self, since: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+        """
+        Cache statistics.
+
+        Args:
+            since: Earlier stats() result; counts are returned relative to it
+
+        Returns:
+            Dict of STAT_NAMES counts
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        if since:
+            stats = {name: count - since.get(name, 0) for name, count in stats.items()}
+        return stats
+
+    def _store(self, key: Tuple, entry: _CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _count(self, **counts: int) -> None:
+        for name, count in counts.items():
+            self._stats[name] += count
+
+
+def format_stats(stats: Dict[str, int]) -> str:
+    """One-line summary of stats() for step output."""
+    return (
+        f"API response cache: {stats['hits']} hits, {stats['revalidated']} revalidated, "
+        f"{stats['misses']} misses; saved {stats['round_trips_saved']} round-trips "
+        f"and {stats['bytes_saved'] / 1024:.1f} KB"
+    )
+
+
+def _freeze(mapping: Optional[Dict[str, Any]]) -> Tuple:
+    return tuple(sorted((str(name), str(value)) for name, value in (mapping or {}).items()))
+
+
+def _cacheable(response: Any) -> bool:
+    """200 responses with a non-empty body the server allows storing"""
+    if response.status_code != 200:
+        return False
+    if 'no-store' in response.headers.get('Cache-Control', ''):
+        return False
+    return response.content.strip() not in (b'', b'[]', b'{}')
+
+
+# Cache shared by every Client when RISK_MODELER_RESPONSE_CACHE is set
+_shared_cache: Optional[ResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def response_cache_enabled() -> bool:
+    """Whether RISK_MODELER_RESPONSE_CACHE turns on the shared cache"""
+    return os.environ.get('RISK_MODELER_RESPONSE_CACHE', 'false').lower() in ('true', '1', 'yes')
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """The process-wide cache, or None when RISK_MODELER_RESPONSE_CACHE is not set"""
+    global _shared_cache
+    if not response_cache_enabled():
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache()
+        return _shared_cache
@@ -10,8 +10,11 @@ import requests
 import time
 import os
 from typing import Dict, List, Any, Optional, Union
+from urllib.parse import urlsplit
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
+from helpers.tracing import span
+from .cache import ResponseCache, get_response_cache
 from .constants import  GET_WORKFLOWS, WORKFLOW_COMPLETED_STATUSES, WORKFLOW_IN_PROGRESS_STATUSES, GET_WORKFLOW_BY_ID
 from .exceptions import IRPAPIError, IRPJobError, IRPWorkflowError
 from .validators import validate_list_not_empty, validate_non_empty_string, validate_positive_int
@@ -21,14 +24,19 @@ class Client:
 
     """Client for Moody's Risk Modeler API."""
 
-    def __init__(self) -> None:
+    def __init__(self, response_cache: Optional[ResponseCache] = None) -> None:
         """
         Initialize API client with credentials from environment.
 
+        Args:
+            response_cache: Cache for read-heavy GET endpoints (see cache.py);
+                defaults to the shared cache when RISK_MODELER_RESPONSE_CACHE is set
+
         Environment variables:
             RISK_MODELER_BASE_URL: API base URL
             RISK_MODELER_API_KEY: API authentication key
             RISK_MODELER_RESOURCE_GROUP_ID: Resource group ID
+            RISK_MODELER_RESPONSE_CACHE: 'true' to cache GET responses (default: false)
         """
         self.base_url = os.environ.get('RISK_MODELER_BASE_URL', 'https://api-euw1.rms-ppe.com')
         self.api_key = os.environ.get('RISK_MODELER_API_KEY', 'your_api_key')
@@ -52,6 +60,7 @@ class Client:
         session.mount("https://", HTTPAdapter(max_retries=retry))
         session.mount("http://", HTTPAdapter(max_retries=retry))
         self.session = session
+        self.response_cache = response_cache if response_cache is not None else get_response_cache()
 
     def request(
         self,
@@ -69,6 +78,9 @@ class Client:
         """
         Make HTTP request to API.
 
+        With a response cache, GETs of cacheable endpoints may be answered
+        from it, and other methods invalidate the resource family they change.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
             path: API path (e.g., '/api/v1/datasources')
@@ -96,19 +108,35 @@ class Client:
             else:
                 url = f"{self.base_url}/{path.lstrip('/')}"
 
+        def send(conditional_headers: Dict[str, str]) -> requests.Response:
+            with span('moodys.request', **{'http.method': method, 'http.path': urlsplit(url).path}) as s:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json,
+                    headers=self.headers | headers | conditional_headers,
+                    timeout=timeout or self.timeout,
+                    stream=stream,
+                )
+                s.set_attribute('http.status_code', response.status_code)
+                response.raise_for_status()
+                return response
+
+        cache = self.response_cache
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json,
-                headers=self.headers | headers,
-                timeout=timeout or self.timeout,
-                stream=stream,
-            )
-            response.raise_for_status()
+            if cache is None:
+                response = send({})
+            elif method.upper() == 'GET':
+                response = send({}) if stream else cache.get(url, params, headers, send)
+            else:
+                try:
+                    response = send({})
+                finally:
+                    cache.invalidate(url)
         except requests.HTTPError as e:
             # Enrich with server message if available
+            response = e.response
             msg = ""
             try:
                 body = response.json()
@@ -1,5 +1,41 @@
 # API Endpoint Constants
 
+# Pagination
+DEFAULT_PAGE_SIZE = 100
+PAGINATION_MAX_WORKERS = 4  # Concurrent page requests per paginated search
+TOTAL_COUNT_HEADER = 'x-total-count'
+
+# Name searches
+NAME_FILTER_CHUNK_SIZE = 25  # Names per IN filter (URL length limits)
+
+# Bulk deletion
+BULK_DELETE_MAX_WORKERS = 8
+BULK_DELETE_MAX_REQUESTS_PER_SECOND = 10
+
+# Analysis submission planning
+ANALYSIS_PLAN_MAX_WORKERS = 8
+
+# RDM export planning
+RDM_EXPORT_PLAN_MAX_WORKERS = 8
+
+# Bulk entity creation (create_treaties, create_portfolios)
+BULK_CREATE_MAX_WORKERS = 8
+BULK_CREATE_MAX_REQUESTS_PER_SECOND = 10
+
+# Streaming decode of ELT/PLT pages into DataFrames (get_elt_table, get_plt_table)
+JSON_STREAM_CHUNK_BYTES = 256 * 1024  # Bytes read from the connection at a time
+JSON_STREAM_BATCH_BYTES = 1024 * 1024  # Bytes of records decoded per batch
+
+# ELT/PLT records returned when get_elt/get_plt are called without a limit (API and loss store)
+LOSS_TABLE_DEFAULT_LIMIT = 100000
+
+# Local loss-table store (RISK_MODELER_LOSS_STORE=true, see loss_store.py)
+LOSS_STORE_PAGE_SIZE = 100000  # Records per request when downloading a whole ELT/PLT
+LOSS_STORE_ROW_GROUP_SIZE = 10000  # Parquet row group size (eventId filters skip whole groups)
+
+# Portfolios known to have locations are not re-probed for this long (seconds)
+LOCATION_STATUS_CACHE_TTL = 900
+
 # Workflow / Job endpoints
 GET_WORKFLOWS = '/riskmodeler/v1/workflows'
 GET_WORKFLOW_BY_ID = '/riskmodeler/v1/workflows/{workflow_id}'
@@ -104,3 +140,40 @@ SEARCH_CURRENCY_SCHEME_VINTAGES = '/data-store/referencetables/currencyschemevin
 SEARCH_SIMULATION_SETS = '/data-store/referenceTables/SimulationSet'
 SEARCH_PET_METADATA = '/data-store/referenceTables/PETMetadata'
 SEARCH_SOFTWARE_MODEL_VERSION_MAP = '/data-store/referenceTables/SoftwareModelVersionMap'
+
+# Opt-in response cache (RISK_MODELER_RESPONSE_CACHE=true, see cache.py)
+RESPONSE_CACHE_MAX_ENTRIES = 2000
+# GET endpoints served from the cache for this long (seconds) before being
+# revalidated; endpoints not listed (job/workflow status, ELT/PLT) are never cached
+RESPONSE_CACHE_TTLS = {
+    SEARCH_DATABASE_SERVERS: 3600,
+    SEARCH_EDMS: 120,
+    SEARCH_PORTFOLIOS: 120,
+    SEARCH_TREATIES: 300,
+    GET_CEDANTS: 600,
+    GET_LOBS: 600,
+    SEARCH_ANALYSIS_RESULTS: 120,
+    GET_ANALYSIS_RESULT: 600,
+    GET_ANALYSIS_EP: 3600,
+    GET_ANALYSIS_STATS: 3600,
+    GET_ANALYSIS_REGIONS: 3600,
+    GET_MODEL_PROFILES: 3600,
+    GET_OUTPUT_PROFILES: 3600,
+    GET_EVENT_RATE_SCHEME: 3600,
+    GET_TAGS: 600,
+    SEARCH_CURRENCIES: 3600,
+    SEARCH_CURRENCY_SCHEME_VINTAGES: 3600,
+}
+# POST/PUT/PATCH/DELETE requests invalidate cached responses of their own
+# resource family (e.g. /platform/riskdata/v1/analyses) and of the families
+# listed here, for jobs that create or change resources elsewhere
+RESPONSE_CACHE_RELATED_FAMILIES = {
+    '/platform/riskdata/v1/exposuresets': ['/platform/riskdata/v1/exposures'],
+    '/platform/import/v1/jobs': ['/platform/riskdata/v1/exposures'],
+    '/riskmodeler/v1/imports': ['/platform/riskdata/v1/exposures'],
+    '/platform/geohaz/v1/jobs': ['/platform/riskdata/v1/exposures'],
+    '/platform/model/v1/jobs': ['/platform/riskdata/v1/analyses'],
+    '/platform/grouping/v1/jobs': ['/platform/riskdata/v1/analyses'],
+    '/platform/export/v1/jobs': ['/platform/riskdata/v1/dataservers'],
+    '/databridge/v1/sql-instances': ['/platform/riskdata/v1/dataservers'],
+}
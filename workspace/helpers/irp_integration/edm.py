@@ -7,12 +7,13 @@ associated data retrieval (cedants, LOBs).
 
 import json
 import time
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from .client import Client
 from .constants import SEARCH_DATABASE_SERVERS, SEARCH_EXPOSURE_SETS, CREATE_EXPOSURE_SET, SEARCH_EDMS, CREATE_EDM, UPGRADE_EDM_DATA_VERSION, DELETE_EDM, GET_CEDANTS, GET_LOBS, WORKFLOW_IN_PROGRESS_STATUSES
 from .exceptions import IRPAPIError, IRPJobError, IRPReferenceDataError
 from .validators import validate_non_empty_string, validate_positive_int, validate_list_not_empty
-from .utils import extract_id_from_location_header
+from .pagination import fetch_all_pages, iter_paginated
+from .utils import extract_id_from_location_header, get_total_count
 
 class EDMManager:
     """Manager for EDM (Exposure Data Management) operations."""
@@ -197,12 +198,17 @@ class EDMManager:
         Returns:
             List of EDM dictionaries
         """
+        return self._search_edms_page(filter, limit, offset)[0]
+
+    def _search_edms_page(self, filter: str, limit: int, offset: int) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Fetch one page of EDMs, returning (records, total_count or None)."""
         params = {'limit': limit, 'offset': offset}
         if filter:
             params['filter'] = filter
         try:
             response = self.client.request('GET', SEARCH_EDMS, params=params)
-            return response.json()
+            records = response.json()
+            return records, get_total_count(response, records)
         except Exception as e:
             raise IRPAPIError(f"Failed to search EDMs: {e}")
 
@@ -218,20 +224,19 @@ class EDMManager:
         Returns:
             Complete list of all matching EDMs across all pages
         """
-        all_results = []
-        offset = 0
-        limit = 100
+        return fetch_all_pages(lambda offset, limit: self._search_edms_page(filter, limit, offset))
 
-        while True:
-            results = self.search_edms(filter=filter, limit=limit, offset=offset)
-            all_results.extend(results)
+    def iter_edms(self, filter: str = "") -> Iterator[Dict[str, Any]]:
+        """
+        Stream all EDMs matching the filter, fetching pages concurrently.
 
-            # If we got fewer results than the limit, we've reached the end
-            if len(results) < limit:
-                break
-            offset += limit
+        Args:
+            filter: Optional filter string for EDM names
 
-        return all_results
+        Yields:
+            EDM dictionaries in result order
+        """
+        yield from iter_paginated(lambda offset, limit: self._search_edms_page(filter, limit, offset))
         
 
     def submit_create_edm_job(self, edm_name: str, server_name: str = "databridge-1") -> Tuple[int, Dict[str, Any]]:
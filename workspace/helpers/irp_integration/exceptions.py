@@ -21,6 +21,25 @@ class IRPAPIError(IRPIntegrationError):
     pass
 
 
+class IRPBulkCreateError(IRPAPIError):
+    """
+    Bulk creation errors.
+
+    Raised by create_treaties / create_portfolios when some entities could
+    not be created. The ones that were are kept so callers can reconcile or
+    clean them up.
+
+    Attributes:
+        created_ids: Entity ID per input item (None where creation failed)
+        errors: Exception per input item (None where creation succeeded)
+    """
+
+    def __init__(self, message: str, created_ids: list, errors: list) -> None:
+        super().__init__(message)
+        self.created_ids = created_ids
+        self.errors = errors
+
+
 class IRPValidationError(IRPIntegrationError):
     """
     Input validation errors.
@@ -0,0 +1,312 @@
+"""
+Local store of analysis loss tables (ELT, PLT, EP, stats).
+
+Results validation, control totals and ad-hoc notebooks fetch the same
+results for an analysis many times across a cycle. With the store enabled,
+AnalysisManager.get_elt/get_plt/get_ep/get_stats (and the *_table variants)
+read from local files and only call the API the first time:
+
+- ELT and PLT are downloaded whole on first use (in pages of
+  LOSS_STORE_PAGE_SIZE) and written as Parquet, sorted by eventId in row
+  groups of LOSS_STORE_ROW_GROUP_SIZE with the API's row order kept in a
+  _row column. 'eventId = n' and 'eventId IN (...)' filters are pushed down to
+  the Parquet reader, which skips row groups that cannot match; limit and
+  offset apply to the filtered rows in API order. Other filters go to the API.
+- EP and stats responses are nested and small, and are stored as JSON.
+- Tables are indexed in a SQLite database (index.sqlite) next to the files.
+  Empty results are not stored. AnalysisManager.delete_analysis removes the
+  analysis's tables.
+
+Files live in {cycle}/files/loss_tables (see get_cycle_file_directories).
+Enable the store with RISK_MODELER_LOSS_STORE=true, or pass a LossTableStore
+to AnalysisManager. Requires pyarrow.
+"""
+
+import json
+import os
+import re
+import shutil
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .constants import LOSS_STORE_ROW_GROUP_SIZE
+
+
+PARQUET_TABLES = ('elt', 'plt')
+JSON_TABLES = ('ep', 'stats')
+
+ROW_COLUMN = '_row'
+
+_EVENT_FILTER = re.compile(
+    r'^\s*eventId\s*(?:=\s*(-?\d+)|IN\s*\(\s*(-?\d+(?:\s*,\s*-?\d+)*)\s*\))\s*$',
+    re.IGNORECASE
+)
+
+
+def event_ids_from_filter(filter: str) -> Optional[List[int]]:
+    """
+    Event IDs selected by an API filter of the form 'eventId = 123' or
+    'eventId IN (1, 2, 3)'; None for any other filter.
+    """
+    match = _EVENT_FILTER.match(filter)
+    if match is None:
+        return None
+    single, many = match.groups()
+    if single is not None:
+        return [int(single)]
+    return [int(value) for value in many.split(',')]
+
+
+@dataclass(frozen=True)
+class LossTableKey:
+    """Identifies one stored result table"""
+    analysis_id: int
+    perspective_code: str
+    exposure_resource_id: int
+    table: str
+
+    @property
+    def file_name(self) -> str:
+        extension = 'parquet' if self.table in PARQUET_TABLES else 'json'
+        return f"{self.analysis_id}/{self.perspective_code}_{self.exposure_resource_id}_{self.table}.{extension}"
+
+
+class LossTableStore:
+    """Parquet/JSON files per analysis, perspective and table, with a SQLite index."""
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        """
+        Initialize store, creating the directory and index if needed.
+
+        Args:
+            root: Directory for the files and index.sqlite
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "pyarrow is required for the loss-table store. "
+                "Install it with: pip install pyarrow"
+            ) from e
+
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / 'index.sqlite'
+        self._lock = threading.Lock()
+        self._key_locks: Dict[LossTableKey, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+        with self._index() as index:
+            index.execute("""
+                CREATE TABLE IF NOT EXISTS loss_tables (
+                    analysis_id INTEGER NOT NULL,
+                    perspective_code TEXT NOT NULL,
+                    exposure_resource_id INTEGER NOT NULL,
+                    table_name TEXT NOT NULL,
+                    file_name TEXT NOT NULL,
+                    records INTEGER NOT NULL,
+                    bytes INTEGER NOT NULL,
+                    stored_ts TEXT NOT NULL,
+                    PRIMARY KEY (analysis_id, perspective_code, exposure_resource_id, table_name)
+                )
+            """)
+
+    # --------------------------------------------------------------------------
+    # Tables (ELT, PLT)
+    # --------------------------------------------------------------------------
+
+    def get_table(
+        self,
+        key: LossTableKey,
+        event_ids: Optional[List[int]] = None,
+        count: bool = True
+    ) -> Optional[pd.DataFrame]:
+        """
+        Read a stored ELT/PLT in API row order.
+
+        Args:
+            key: Table to read
+            event_ids: Only rows with these eventIds (pushed down to the reader)
+            count: Count the read in stats() (False when re-reading a table just stored)
+
+        Returns:
+            DataFrame, or None if the table is not stored
+        """
+        path = self._stored_path(key, count)
+        if path is None:
+            return None
+        filters = [('eventId', 'in', list(event_ids))] if event_ids is not None else None
+        table = pd.read_parquet(path, filters=filters)
+        return table.sort_values(ROW_COLUMN, kind='stable').drop(columns=ROW_COLUMN).reset_index(drop=True)
+
+    def put_table(self, key: LossTableKey, table: pd.DataFrame) -> bool:
+        """
+        Store a complete ELT/PLT (as returned by the API, in its row order).
+
+        Returns:
+            False if the table is empty and was not stored
+        """
+        if table.empty:
+            return False
+        table = table.assign(**{ROW_COLUMN: np.arange(len(table), dtype='int64')})
+        if 'eventId' in table.columns:
+            table = table.sort_values('eventId', kind='stable')
+
+        def write(path: Path) -> None:
+            table.to_parquet(path, index=False, row_group_size=LOSS_STORE_ROW_GROUP_SIZE)
+
+        self._write(key, write, len(table))
+        return True
+
+    # --------------------------------------------------------------------------
+    # Records (EP, stats)
+    # --------------------------------------------------------------------------
+
+    def get_records(self, key: LossTableKey) -> Optional[Any]:
+        """Stored EP/stats response, or None if not stored."""
+        path = self._stored_path(key)
+        if path is None:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def put_records(self, key: LossTableKey, records: Any) -> bool:
+        """
+        Store an EP/stats response.
+
+        Returns:
+            False if the response is empty and was not stored
+        """
+        if not records:
+            return False
+
+        def write(path: Path) -> None:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(records, f)
+
+        self._write(key, write, len(records) if isinstance(records, list) else 1)
+        return True
+
+    # --------------------------------------------------------------------------
+    # Index
+    # --------------------------------------------------------------------------
+
+    @contextmanager
+    def lock(self, key: LossTableKey) -> Iterator[None]:
+        """Serialize filling one table, so concurrent misses download it once."""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            yield
+
+    def list_tables(self, analysis_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Index entries, optionally for one analysis."""
+        query = "SELECT * FROM loss_tables"
+        params: tuple = ()
+        if analysis_id is not None:
+            query += " WHERE analysis_id = ?"
+            params = (analysis_id,)
+        with self._index() as index:
+            index.row_factory = sqlite3.Row
+            return [dict(row) for row in index.execute(query + " ORDER BY analysis_id, table_name", params)]
+
+    def remove(self, analysis_id: int) -> int:
+        """
+        Remove every stored table of an analysis.
+
+        Returns:
+            Number of tables removed
+        """
+        with self._index() as index:
+            removed = index.execute("DELETE FROM loss_tables WHERE analysis_id = ?", (analysis_id,)).rowcount
+        shutil.rmtree(self.root / str(analysis_id), ignore_errors=True)
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """Reads answered locally (hits) and tables fetched from the API (misses)."""
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def _stored_path(self, key: LossTableKey, count: bool = True) -> Optional[Path]:
+        with self._index() as index:
+            row = index.execute(
+                """SELECT file_name FROM loss_tables
+                   WHERE analysis_id = ? AND perspective_code = ? AND exposure_resource_id = ? AND table_name = ?""",
+                (key.analysis_id, key.perspective_code, key.exposure_resource_id, key.table)
+            ).fetchone()
+        path = self.root / row[0] if row else None
+        found = path is not None and path.exists()
+        if count:
+            with self._lock:
+                if found:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+        return path if found else None
+
+    def _write(self, key: LossTableKey, write: Callable[[Path], None], records: int) -> None:
+        """Write through a temporary file, then record the table in the index."""
+        path = self.root / key.file_name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            write(temporary)
+            os.replace(temporary, path)
+        finally:
+            temporary.unlink(missing_ok=True)
+
+        with self._index() as index:
+            index.execute(
+                """INSERT OR REPLACE INTO loss_tables
+                   (analysis_id, perspective_code, exposure_resource_id, table_name, file_name, records, bytes, stored_ts)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (key.analysis_id, key.perspective_code, key.exposure_resource_id, key.table,
+                 key.file_name, records, path.stat().st_size, datetime.now().isoformat())
+            )
+
+    @contextmanager
+    def _index(self) -> Iterator[sqlite3.Connection]:
+        """Connection per operation (the store is shared between threads); commits on success."""
+        connection = sqlite3.connect(self.index_path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+
+# Stores shared by every AnalysisManager when RISK_MODELER_LOSS_STORE is set: directory -> store
+_shared_stores: Dict[str, LossTableStore] = {}
+_shared_stores_lock = threading.Lock()
+
+
+def loss_store_enabled() -> bool:
+    """Whether RISK_MODELER_LOSS_STORE turns on the shared store"""
+    return os.environ.get('RISK_MODELER_LOSS_STORE', 'false').lower() in ('true', '1', 'yes')
+
+
+def get_loss_store() -> Optional[LossTableStore]:
+    """
+    The store in the active cycle's files/loss_tables directory, or None when
+    RISK_MODELER_LOSS_STORE is not set.
+    """
+    if not loss_store_enabled():
+        return None
+    from .utils import get_cycle_file_directories
+
+    root = get_cycle_file_directories()['loss_tables']
+    with _shared_stores_lock:
+        if root not in _shared_stores:
+            _shared_stores[root] = LossTableStore(root)
+        return _shared_stores[root]
@@ -6,13 +6,12 @@ to AWS S3 and import execution via Moody's Risk Modeler API.
 """
 
 from typing import Dict, Any, List, Optional, Tuple
-import boto3
-from boto3.s3.transfer import TransferConfig
 import requests
 import json
 import os
 import time
 import pandas as pd
+from helpers.tracing import span
 from .client import Client
 from .constants import (
     CREATE_AWS_BUCKET,
@@ -211,6 +210,11 @@ class MRIImportManager:
                 f"credentials missing required fields: {', '.join(missing)}"
             )
 
+        # boto3 is only needed here; importing it lazily keeps it off the
+        # import path of notebooks that never upload files
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+
         try:
             print(f'Uploading file {file_path} to s3...')
             session = boto3.Session(
@@ -237,13 +241,14 @@ class MRIImportManager:
             )
 
             # Use upload_file for automatic multipart handling and better performance
-            s3.upload_file(
-                file_path,
-                bucket,
-                key,
-                ExtraArgs={'ContentType': 'text/csv'},
-                Config=config
-            )
+            with span('s3.upload', file=os.path.basename(file_path), bytes=os.path.getsize(file_path)):
+                s3.upload_file(
+                    file_path,
+                    bucket,
+                    key,
+                    ExtraArgs={'ContentType': 'text/csv'},
+                    Config=config
+                )
             print('File uploaded!')
         except FileNotFoundError:
             raise IRPFileError(f"File not found: {file_path}")
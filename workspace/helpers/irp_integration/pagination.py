@@ -0,0 +1,124 @@
+"""
+Pagination helpers for IRP Integration search endpoints.
+
+Search endpoints take limit/offset parameters. The paginators here issue the
+first request, then fetch the remaining pages concurrently (bounded by
+max_workers) while yielding results in offset order:
+
+- When the API reports a total count, exactly the pages needed are requested.
+- Otherwise pages are prefetched max_workers at a time until a short page
+  arrives; at most max_workers - 1 requests past the end are wasted.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from .constants import DEFAULT_PAGE_SIZE, PAGINATION_MAX_WORKERS
+from .validators import validate_positive_int
+
+# fetch_page(offset, limit) -> (records, total_count or None)
+PageFetcher = Callable[[int, int], Tuple[List[Dict[str, Any]], Optional[int]]]
+
+
+def iter_pages(
+    fetch_page: PageFetcher,
+    limit: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = PAGINATION_MAX_WORKERS
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield pages of search results in offset order.
+
+    Args:
+        fetch_page: Callable taking (offset, limit) and returning a tuple of
+            (records, total_count); total_count is None when unknown
+        limit: Page size
+        max_workers: Maximum concurrent page requests (1 = sequential)
+
+    Yields:
+        Lists of records, one per page
+
+    Raises:
+        IRPValidationError: If limit or max_workers is invalid
+        IRPAPIError: Propagated from fetch_page
+    """
+    validate_positive_int(limit, "limit")
+    validate_positive_int(max_workers, "max_workers")
+
+    records, total = fetch_page(0, limit)
+    yield records
+    if len(records) < limit or (total is not None and total <= limit):
+        return
+
+    offsets = _remaining_offsets(limit, total)
+    pending: Deque[Future] = deque()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        while True:
+            while len(pending) < max_workers:
+                offset = next(offsets, None)
+                if offset is None:
+                    break
+                pending.append(executor.submit(fetch_page, offset, limit))
+
+            if not pending:
+                return
+            records, _ = pending.popleft().result()
+            yield records
+
+            if len(records) < limit:
+                return
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _remaining_offsets(limit: int, total: Optional[int]) -> Iterator[int]:
+    """Offsets after the first page: bounded by total when known, else unbounded."""
+    offset = limit
+    while total is None or offset < total:
+        yield offset
+        offset += limit
+
+
+def iter_paginated(
+    fetch_page: PageFetcher,
+    limit: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = PAGINATION_MAX_WORKERS
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield individual search results across all pages, in offset order.
+
+    Streaming form of fetch_all_pages: records are yielded as their page
+    arrives, so callers can stop early without materialising the full list.
+
+    Args:
+        fetch_page: Callable taking (offset, limit) and returning (records, total_count)
+        limit: Page size
+        max_workers: Maximum concurrent page requests
+
+    Yields:
+        Result records
+    """
+    for page in iter_pages(fetch_page, limit=limit, max_workers=max_workers):
+        yield from page
+
+
+def fetch_all_pages(
+    fetch_page: PageFetcher,
+    limit: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = PAGINATION_MAX_WORKERS
+) -> List[Dict[str, Any]]:
+    """
+    Fetch all search results across all pages.
+
+    Args:
+        fetch_page: Callable taking (offset, limit) and returning (records, total_count)
+        limit: Page size
+        max_workers: Maximum concurrent page requests
+
+    Returns:
+        Complete list of results in offset order
+    """
+    return list(iter_paginated(fetch_page, limit=limit, max_workers=max_workers))
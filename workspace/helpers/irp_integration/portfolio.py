@@ -4,19 +4,51 @@ Portfolio management operations.
 Handles portfolio creation, retrieval, and geocoding/hazard operations.
 """
 
+import threading
 import time
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from helpers.constants import WORKSPACE_PATH
 from helpers.sqlserver import execute_query_from_file, sql_file_exists
 
 from .client import Client
-from .constants import CREATE_PORTFOLIO, GET_GEOHAZ_JOB, SEARCH_PORTFOLIOS, GEOHAZ_PORTFOLIO, WORKFLOW_COMPLETED_STATUSES, WORKFLOW_IN_PROGRESS_STATUSES, SEARCH_ACCOUNTS_BY_PORTFOLIO
+from .constants import BULK_CREATE_MAX_REQUESTS_PER_SECOND, BULK_CREATE_MAX_WORKERS, CREATE_PORTFOLIO, GET_GEOHAZ_JOB, SEARCH_PORTFOLIOS, GEOHAZ_PORTFOLIO, WORKFLOW_COMPLETED_STATUSES, WORKFLOW_IN_PROGRESS_STATUSES, SEARCH_ACCOUNTS_BY_PORTFOLIO, LOCATION_STATUS_CACHE_TTL
 from .exceptions import IRPAPIError, IRPJobError, IRPValidationError
 from .validators import validate_list_not_empty, validate_non_empty_string, validate_positive_int
-from .utils import extract_id_from_location_header
+from .pagination import fetch_all_pages, iter_paginated
+from .utils import (
+    BulkCreateContext, create_concurrently, extract_id_from_location_header, get_total_count,
+    memoized_lookup, raise_for_bulk_errors
+)
+
+
+# Portfolios found to have locations, shared by every PortfolioManager in the
+# process so GeoHaz submission reuses what validation already probed:
+# (exposure_id, portfolio_id) -> expiry (time.monotonic())
+_portfolios_with_locations: Dict[Tuple[int, int], float] = {}
+_portfolios_with_locations_lock = threading.Lock()
+
+
+def clear_location_status_cache() -> None:
+    """Forget which portfolios are known to have locations (e.g. after deleting accounts)."""
+    with _portfolios_with_locations_lock:
+        _portfolios_with_locations.clear()
+
+
+def _known_to_have_locations(exposure_id: int, portfolio_id: int) -> bool:
+    with _portfolios_with_locations_lock:
+        expires = _portfolios_with_locations.get((exposure_id, portfolio_id))
+        if expires is not None and expires <= time.monotonic():
+            del _portfolios_with_locations[(exposure_id, portfolio_id)]
+            expires = None
+    return expires is not None
+
+
+def _remember_has_locations(exposure_id: int, portfolio_id: int) -> None:
+    with _portfolios_with_locations_lock:
+        _portfolios_with_locations[(exposure_id, portfolio_id)] = time.monotonic() + LOCATION_STATUS_CACHE_TTL
 
 
 def resolve_cycle_type_directory(cycle_type: str) -> str:
@@ -99,7 +131,12 @@ class PortfolioManager:
             List of portfolio dictionaries
         """
         validate_positive_int(exposure_id, "exposure_id")
+        return self._search_portfolios_page(exposure_id, filter, limit, offset)[0]
 
+    def _search_portfolios_page(
+        self, exposure_id: int, filter: str, limit: int, offset: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Fetch one page of portfolios, returning (records, total_count or None)."""
         params = {'limit': limit, 'offset': offset}
         if filter:
             params['filter'] = filter
@@ -110,7 +147,8 @@ class PortfolioManager:
                 SEARCH_PORTFOLIOS.format(exposureId=exposure_id),
                 params=params
             )
-            return response.json()
+            records = response.json()
+            return records, get_total_count(response, records)
         except Exception as e:
             raise IRPAPIError(f"Failed to search portfolios for exposure ID '{exposure_id}': {e}")
 
@@ -129,46 +167,133 @@ class PortfolioManager:
         """
         validate_positive_int(exposure_id, "exposure_id")
 
-        all_results = []
-        offset = 0
-        limit = 100
+        return fetch_all_pages(
+            lambda offset, limit: self._search_portfolios_page(exposure_id, filter, limit, offset)
+        )
 
-        while True:
-            results = self.search_portfolios(exposure_id=exposure_id, filter=filter, limit=limit, offset=offset)
-            all_results.extend(results)
+    def iter_portfolios(self, exposure_id: int, filter: str = "") -> Iterator[Dict[str, Any]]:
+        """
+        Stream all portfolios within an exposure, fetching pages concurrently.
 
-            # If we got fewer results than the limit, we've reached the end
-            if len(results) < limit:
-                break
-            offset += limit
+        Args:
+            exposure_id: Exposure ID
+            filter: Optional filter string for portfolio names
 
-        return all_results
+        Yields:
+            Portfolio dictionaries in result order
+        """
+        validate_positive_int(exposure_id, "exposure_id")
+
+        yield from iter_paginated(
+            lambda offset, limit: self._search_portfolios_page(exposure_id, filter, limit, offset)
+        )
 
 
-    def search_accounts_by_portfolio(self, exposure_id: int, portfolio_id: int) -> List[Dict[str, Any]]:
+    def search_accounts_by_portfolio(
+        self,
+        exposure_id: int,
+        portfolio_id: int,
+        filter: str = "",
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Search portfolios within an exposure.
+        Search accounts within a portfolio.
 
         Args:
             exposure_id: Exposure ID
             portfolio_id: Portfolio ID
+            filter: Optional filter string (e.g. 'locationsCount > 0')
+            limit: Optional maximum number of accounts to return (default: all)
 
         Returns:
-            Dict containing list of accounts
+            List of account dictionaries
         """
         validate_positive_int(exposure_id, "exposure_id")
         validate_positive_int(portfolio_id, "portfolio_id")
 
+        params = {}
+        if filter:
+            params['filter'] = filter
+        if limit is not None:
+            params['limit'] = limit
+
         try:
-            response = self.client.request('GET', SEARCH_ACCOUNTS_BY_PORTFOLIO.format(exposureId=exposure_id, id=portfolio_id))
+            response = self.client.request(
+                'GET',
+                SEARCH_ACCOUNTS_BY_PORTFOLIO.format(exposureId=exposure_id, id=portfolio_id),
+                params=params or None
+            )
             return response.json()
         except Exception as e:
             raise IRPAPIError(f"Failed to search portfolio accounts for exposure ID '{exposure_id}' and portfolio ID '{portfolio_id}': {e}")
 
+    def portfolio_has_accounts(self, exposure_id: int, portfolio_id: int) -> bool:
+        """
+        Check whether a portfolio has any accounts, fetching at most one.
+
+        Args:
+            exposure_id: Exposure ID
+            portfolio_id: Portfolio ID
+
+        Returns:
+            True if the portfolio has at least one account
+        """
+        validate_positive_int(exposure_id, "exposure_id")
+        validate_positive_int(portfolio_id, "portfolio_id")
+
+        if _known_to_have_locations(exposure_id, portfolio_id):
+            return True
+        return len(self.search_accounts_by_portfolio(exposure_id, portfolio_id, limit=1)) > 0
+
+    def get_location_status(self, exposure_id: int, portfolio_id: int) -> Dict[str, bool]:
+        """
+        Check whether a portfolio has accounts and locations, fetching one account when it has locations.
+
+        Asks for one account matching 'locationsCount > 0' and trusts the answer
+        only if the returned account really has locations. The filter is not part
+        of the documented account search syntax, so when nothing verifiable comes
+        back (no match, filter ignored or rejected) every account is fetched and
+        locationsCount summed, as before the probe. Portfolios with locations are
+        remembered process-wide for LOCATION_STATUS_CACHE_TTL seconds (see
+        clear_location_status_cache), so GeoHaz submission after validation
+        doesn't probe them again. Portfolios without locations are always
+        re-checked, as an import may add them.
+
+        Args:
+            exposure_id: Exposure ID
+            portfolio_id: Portfolio ID
+
+        Returns:
+            Dict with 'has_accounts' and 'has_locations' booleans
+        """
+        validate_positive_int(exposure_id, "exposure_id")
+        validate_positive_int(portfolio_id, "portfolio_id")
+
+        if _known_to_have_locations(exposure_id, portfolio_id):
+            return {'has_accounts': True, 'has_locations': True}
+
+        try:
+            accounts = self.search_accounts_by_portfolio(
+                exposure_id, portfolio_id, filter='locationsCount > 0', limit=1
+            )
+        except IRPAPIError:
+            accounts = []
+        if not any((account.get('locationsCount') or 0) > 0 for account in accounts):
+            accounts = self.search_accounts_by_portfolio(exposure_id, portfolio_id)
+            has_locations = sum(account.get('locationsCount') or 0 for account in accounts) > 0
+            if not has_locations:
+                return {'has_accounts': len(accounts) > 0, 'has_locations': False}
+
+        _remember_has_locations(exposure_id, portfolio_id)
+        return {'has_accounts': True, 'has_locations': True}
+
 
     def create_portfolios(self, portfolio_data_list: List[Dict[str, Any]]) -> List[int]:
         """
-        Create multiple portfolios.
+        Create multiple portfolios concurrently.
+
+        Each EDM is looked up once for the whole list and portfolio POSTs share
+        a rate limiter. A failure does not stop the other portfolios.
 
         Args:
             portfolio_data_list: List of portfolio data dicts, each containing:
@@ -178,35 +303,49 @@ class PortfolioManager:
                 - description: str
 
         Returns:
-            List of portfolio IDs
+            List of portfolio IDs (in input order)
 
         Raises:
             IRPValidationError: If portfolio_data_list is empty or invalid
-            IRPAPIError: If portfolio creation fails or duplicate names exist
+            IRPAPIError: If portfolio data is incomplete or duplicate names exist
+            IRPBulkCreateError: If any portfolio failed; created_ids holds the
+                portfolios that were created
         """
         validate_list_not_empty(portfolio_data_list, "portfolio_data_list")
 
-        portfolio_ids = []
+        portfolio_kwargs_list = []
         for portfolio_data in portfolio_data_list:
             try:
-                edm_name = portfolio_data['edm_name']
-                portfolio_name = portfolio_data['portfolio_name']
-                portfolio_number = portfolio_data['portfolio_number']
-                description = portfolio_data['description']
+                portfolio_kwargs_list.append({
+                    'edm_name': portfolio_data['edm_name'],
+                    'portfolio_name': portfolio_data['portfolio_name'],
+                    'portfolio_number': portfolio_data['portfolio_number'],
+                    'description': portfolio_data['description'],
+                })
             except (KeyError, TypeError) as e:
                 raise IRPAPIError(
                     f"Missing value in create portfolio data: {e}"
                 ) from e
-            
-            # Returns tuple of (portfolio_id, request_body) - we only need portfolio_id here
-            portfolio_id, _ = self.create_portfolio(
-                edm_name=edm_name,
-                portfolio_name=portfolio_name,
-                portfolio_number=portfolio_number,
-                description=description
-            )
-            portfolio_ids.append(portfolio_id)
 
+        # Concurrent creates can't see each other in the duplicate-name search
+        seen = set()
+        for portfolio_kwargs in portfolio_kwargs_list:
+            key = (portfolio_kwargs['edm_name'], portfolio_kwargs['portfolio_name'])
+            if key in seen:
+                raise IRPAPIError(
+                    f"Portfolio name {key[1]} appears more than once for EDM {key[0]}, please use a unique name"
+                )
+            seen.add(key)
+
+        with BulkCreateContext(BULK_CREATE_MAX_WORKERS, BULK_CREATE_MAX_REQUESTS_PER_SECOND) as context:
+            def create(portfolio_kwargs: Dict[str, Any]) -> int:
+                # Returns tuple of (portfolio_id, request_body) - we only need portfolio_id here
+                portfolio_id, _ = self.create_portfolio(**portfolio_kwargs, context=context)
+                return portfolio_id
+
+            portfolio_ids, errors = create_concurrently(create, portfolio_kwargs_list, BULK_CREATE_MAX_WORKERS)
+
+        raise_for_bulk_errors(portfolio_ids, errors, "portfolio")
         return portfolio_ids
 
 
@@ -215,7 +354,8 @@ class PortfolioManager:
         edm_name: str,
         portfolio_name: str,
         portfolio_number: str = "1",
-        description: str = ""
+        description: str = "",
+        context: Optional[BulkCreateContext] = None
     ) -> Tuple[int, Dict[str, Any]]:
         """
         Create new portfolio in EDM.
@@ -225,6 +365,9 @@ class PortfolioManager:
             portfolio_name: Name for new portfolio
             portfolio_number: Portfolio number (default: "1")
             description: Portfolio description (default: "")
+            context: Optional BulkCreateContext (from create_portfolios or a
+                batch) memoizing the EDM lookup, rate-limiting the POST and
+                rejecting a name already created in the same run
 
         Returns:
             Tuple of (portfolio_id, request_body) where request_body is the HTTP request payload
@@ -237,7 +380,10 @@ class PortfolioManager:
         validate_non_empty_string(portfolio_name, "portfolio_name")
         validate_non_empty_string(portfolio_number, "portfolio_number")
 
-        edms = self.edm_manager.search_edms(filter=f"exposureName=\"{edm_name}\"")
+        edms = memoized_lookup(
+            context, 'edm', edm_name,
+            lambda: self.edm_manager.search_edms(filter=f"exposureName=\"{edm_name}\"")
+        )
         if (len(edms) != 1):
             raise IRPAPIError(f"Expected 1 EDM with name {edm_name}, found {len(edms)}")
         try:
@@ -247,6 +393,11 @@ class PortfolioManager:
                 f"Failed to extract exposure ID for EDM '{edm_name}': {e}"
             ) from e
 
+        if context is not None and not context.reserve('portfolio', (edm_name, portfolio_name)):
+            raise IRPAPIError(
+                f"Portfolio name {portfolio_name} appears more than once for EDM {edm_name}, please use a unique name"
+            )
+
         portfolios = self.search_portfolios(exposure_id=exposure_id, filter=f"portfolioName=\"{portfolio_name}\"")
         if (len(portfolios) > 0):
             raise IRPAPIError(f"{len(portfolios)} portfolios found with name {portfolio_name}, please use a unique name")
@@ -258,6 +409,8 @@ class PortfolioManager:
         }
 
         try:
+            if context is not None:
+                context.acquire()
             response = self.client.request('POST', CREATE_PORTFOLIO.format(exposureId=exposure_id), json=data)
             portfolio_id = extract_id_from_location_header(response, "portfolio creation")
             return int(portfolio_id), data
@@ -361,21 +514,13 @@ class PortfolioManager:
             raise IRPAPIError(f"Failed to extract portfolio details for portfolio '{portfolio_name}': {e}") from e
 
         # Check if portfolio has locations to GeoHaz
-        accounts = self.search_accounts_by_portfolio(exposure_id=exposure_id, portfolio_id=portfolio_id)
-        if len(accounts) == 0:
-            raise IRPAPIError(f"Portfolio '{portfolio_name}' does not have any Accounts/Locations to be GeoHaz'd")
-
-        # Validate locations count
         try:
-            locations_count = 0
-            for account in accounts:
-                locations_count += account['locationsCount']
-                if locations_count > 0:
-                    break
-        except (KeyError, TypeError, IndexError) as e:
+            location_status = self.get_location_status(exposure_id=exposure_id, portfolio_id=portfolio_id)
+        except (AttributeError, TypeError) as e:
             raise IRPAPIError(f"Failed to validate locations count for portfolio '{portfolio_name}': {e}") from e
-
-        if locations_count == 0:
+        if not location_status['has_accounts']:
+            raise IRPAPIError(f"Portfolio '{portfolio_name}' does not have any Accounts/Locations to be GeoHaz'd")
+        if not location_status['has_locations']:
             raise IRPAPIError(f"Portfolio '{portfolio_name}' has accounts but no locations to be GeoHaz'd")
 
         if geocode_layer_options is None:
@@ -6,12 +6,18 @@ Handles exporting analysis results to RDM via databridge.
 
 import os
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 
-from helpers.irp_integration.utils import extract_id_from_location_header
+from helpers.irp_integration.utils import (
+    LookupCache, extract_id_from_location_header, get_total_count, name_in_filter, quote_filter_value
+)
 from .client import Client
-from .constants import CREATE_RDM_EXPORT_JOB, GET_EXPORT_JOB, SEARCH_DATABASES, WORKFLOW_COMPLETED_STATUSES, DELETE_RDM, GET_DATABRIDGE_JOB, UPDATE_GROUP_ACCESS
+from .constants import (
+    CREATE_RDM_EXPORT_JOB, GET_EXPORT_JOB, SEARCH_DATABASES, WORKFLOW_COMPLETED_STATUSES, DELETE_RDM, GET_DATABRIDGE_JOB, UPDATE_GROUP_ACCESS,
+    NAME_FILTER_CHUNK_SIZE, RDM_EXPORT_PLAN_MAX_WORKERS
+)
 from .exceptions import IRPAPIError, IRPJobError
+from .pagination import fetch_all_pages, iter_paginated
 from .validators import validate_non_empty_string, validate_list_not_empty, validate_positive_int
 
 class RDMManager:
@@ -84,6 +90,27 @@ class RDMManager:
         return self.poll_rdm_export_job_to_completion(rdm_export_job_id)
 
 
+    def plan_rdm_export_jobs(self, export_data_list: List[Dict[str, Any]]) -> 'RDMExportPlan':
+        """
+        Resolve the lookups for a batch of RDM export submissions up front.
+
+        Per job, submit_rdm_export_job otherwise looks up the database server and
+        searches for each analysis or group by name. The plan looks up each server
+        once and resolves all names with chunked 'analysisName IN (...)' searches
+        (per EDM for analyses, engineType = "Group" for groups); pass it as plan=
+        to each submission.
+
+        Args:
+            export_data_list: Export job data dicts, with the same keys as the
+                submit_rdm_export_job arguments (server_name, analysis_names,
+                analysis_edm_map, group_names)
+
+        Returns:
+            RDMExportPlan; plan.report() gives the API calls issued versus the
+            per-job lookups it replaced
+        """
+        return RDMExportPlan(self).resolve(export_data_list)
+
     def submit_rdm_export_job(
             self,
             server_name: str,
@@ -92,7 +119,8 @@ class RDMManager:
             database_id: Optional[int] = None,
             analysis_edm_map: Optional[Dict[str, str]] = None,
             group_names: Optional[set] = None,
-            skip_missing: bool = True
+            skip_missing: bool = True,
+            plan: Optional['RDMExportPlan'] = None
     ) -> Dict[str, Any]:
         """
         Submit RDM export job.
@@ -114,6 +142,8 @@ class RDMManager:
             skip_missing: If True (default), skip analyses/groups that don't exist
                 instead of raising an error. If all items are missing, returns
                 a result with job_id=None and skipped=True.
+            plan: Optional RDMExportPlan from plan_rdm_export_jobs(); the server
+                and name lookups are answered from it instead of per-job searches
 
         Returns:
             Dict containing:
@@ -138,7 +168,10 @@ class RDMManager:
             group_names = set()
 
         # Look up server ID
-        database_servers = self.edm_manager.search_database_servers(filter=f"serverName=\"{server_name}\"")
+        if plan is not None:
+            database_servers = plan.find_database_servers(server_name)
+        else:
+            database_servers = self.edm_manager.search_database_servers(filter=f"serverName=\"{server_name}\"")
         try:
             server_id = database_servers[0]['serverId']
         except (KeyError, IndexError, TypeError) as e:
@@ -171,7 +204,10 @@ class RDMManager:
             if name in group_names:
                 # Group names are globally unique - search by name only
                 # Must filter by engineType = "Group" to find groups specifically
-                analysis_response = self.analysis_manager.search_analyses(filter=f'analysisName = "{name}" AND engineType = "Group"')
+                if plan is not None:
+                    analysis_response = plan.find_groups(name)
+                else:
+                    analysis_response = self.analysis_manager.search_analyses(filter=f'analysisName = "{name}" AND engineType = "Group"')
                 if len(analysis_response) == 0:
                     if skip_missing:
                         skipped_items.append(name)
@@ -183,8 +219,11 @@ class RDMManager:
                 # Analysis names - search by name + EDM if mapping provided
                 edm_name = analysis_edm_map.get(name)
                 if edm_name:
-                    filter_str = f"analysisName = \"{name}\" AND exposureName = \"{edm_name}\""
-                    analysis_response = self.analysis_manager.search_analyses(filter=filter_str)
+                    if plan is not None:
+                        analysis_response = plan.find_analyses(name, edm_name)
+                    else:
+                        filter_str = f"analysisName = \"{name}\" AND exposureName = \"{edm_name}\""
+                        analysis_response = self.analysis_manager.search_analyses(filter=filter_str)
                     if len(analysis_response) == 0:
                         if skip_missing:
                             skipped_items.append(name)
@@ -194,7 +233,10 @@ class RDMManager:
                         raise IRPAPIError(f"Multiple analyses found with name '{name}' for EDM '{edm_name}'")
                 else:
                     # Fallback to name-only search (legacy behavior)
-                    analysis_response = self.analysis_manager.search_analyses(filter=f"analysisName = \"{name}\"")
+                    if plan is not None:
+                        analysis_response = plan.find_analyses(name)
+                    else:
+                        analysis_response = self.analysis_manager.search_analyses(filter=f"analysisName = \"{name}\"")
                     if len(analysis_response) == 0:
                         if skip_missing:
                             skipped_items.append(name)
@@ -407,16 +449,24 @@ class RDMManager:
         Raises:
             IRPAPIError: If request fails
         """
-        # Look up server ID first
+        server_id = self._get_server_id(server_name)
+        return self._search_databases_page(server_id, filter, limit, offset)[0]
+
+    def _get_server_id(self, server_name: str) -> int:
+        """Look up the server ID for a database server name."""
         database_servers = self.edm_manager.search_database_servers(filter=f"serverName=\"{server_name}\"")
         if not database_servers:
             raise IRPAPIError(f"Database server '{server_name}' not found")
 
         try:
-            server_id = database_servers[0]['serverId']
+            return database_servers[0]['serverId']
         except (KeyError, IndexError) as e:
             raise IRPAPIError(f"Failed to extract server ID: {e}")
 
+    def _search_databases_page(
+        self, server_id: int, filter: str, limit: int, offset: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Fetch one page of databases, returning (records, total_count or None)."""
         params: Dict[str, Any] = {'limit': limit, 'offset': offset}
         if filter:
             params['filter'] = filter
@@ -427,7 +477,8 @@ class RDMManager:
                 SEARCH_DATABASES.format(serverId=server_id),
                 params=params
             )
-            return response.json()
+            records = response.json()
+            return records, get_total_count(response, records)
         except Exception as e:
             raise IRPAPIError(f"Failed to search databases: {e}")
 
@@ -447,20 +498,30 @@ class RDMManager:
         Raises:
             IRPAPIError: If request fails
         """
-        all_results = []
-        offset = 0
-        limit = 100
+        # Resolve the server once rather than once per page
+        server_id = self._get_server_id(server_name)
+        return fetch_all_pages(
+            lambda offset, limit: self._search_databases_page(server_id, filter, limit, offset)
+        )
 
-        while True:
-            results = self.search_databases(server_name=server_name, filter=filter, limit=limit, offset=offset)
-            all_results.extend(results)
+    def iter_databases(self, server_name: str, filter: str = "") -> Iterator[Dict[str, Any]]:
+        """
+        Stream all databases on a server, fetching pages concurrently.
+
+        Args:
+            server_name: Name of the database server
+            filter: Optional filter string (e.g., 'databaseName="MyRDM"')
 
-            # If we got fewer results than the limit, we've reached the end
-            if len(results) < limit:
-                break
-            offset += limit
+        Yields:
+            Database records in result order
 
-        return all_results
+        Raises:
+            IRPAPIError: If request fails
+        """
+        server_id = self._get_server_id(server_name)
+        yield from iter_paginated(
+            lambda offset, limit: self._search_databases_page(server_id, filter, limit, offset)
+        )
 
     def submit_delete_rdm_job(self, rdm_name: str, server_name: str = "databridge-1") -> str:
         """
@@ -482,7 +543,25 @@ class RDMManager:
         # Get the full RDM name (with random suffix)
         rdm_full_name = self.get_rdm_database_full_name(rdm_name, server_name)
 
-        # Submit delete request
+        return self.submit_delete_rdm_job_by_full_name(rdm_full_name, server_name)
+
+    def submit_delete_rdm_job_by_full_name(self, rdm_full_name: str, server_name: str = "databridge-1") -> str:
+        """
+        Submit job to delete an RDM by its full database name (no name lookup).
+
+        Args:
+            rdm_full_name: Full database name of the RDM (including random suffix)
+            server_name: Name of the database server (default: "databridge-1")
+
+        Returns:
+            Job ID for the delete operation
+
+        Raises:
+            IRPAPIError: If delete request fails
+        """
+        validate_non_empty_string(rdm_full_name, "rdm_full_name")
+        validate_non_empty_string(server_name, "server_name")
+
         try:
             response = self.client.request(
                 'DELETE',
@@ -496,7 +575,7 @@ class RDMManager:
 
             return job_id
         except Exception as e:
-            raise IRPAPIError(f"Failed to delete RDM '{rdm_name}': {e}") from e
+            raise IRPAPIError(f"Failed to delete RDM '{rdm_full_name}': {e}") from e
 
     def get_databridge_job(self, job_id: str) -> str:
         """
@@ -641,3 +720,103 @@ class RDMManager:
             raise IRPAPIError(
                 f"Failed to add group access to RDM '{database_name}': {e}"
             ) from e
+
+
+class RDMExportPlan(LookupCache):
+    """
+    Pre-resolved lookups for a batch of RDM export submissions.
+
+    Built by RDMManager.plan_rdm_export_jobs(): each database server is looked
+    up once, and analyses and groups are resolved with chunked IN-filter
+    searches run concurrently (see LookupCache). submit_rdm_export_job(plan=...)
+    then only has to POST the export (plus the RDM existence check when
+    creating a new RDM).
+
+    Names that were not planned, or whose search failed while planning, are
+    searched for when a job needs them, so errors are raised for that job only.
+    Lookups are thread-safe, so jobs can be submitted concurrently.
+    """
+
+    # Scope of group searches in the name cache (analyses are scoped by EDM name)
+    _GROUP_SCOPE = ('group',)
+
+    def __init__(
+        self,
+        manager: 'RDMManager',
+        max_workers: int = RDM_EXPORT_PLAN_MAX_WORKERS,
+        chunk_size: int = NAME_FILTER_CHUNK_SIZE
+    ):
+        """
+        Initialize an empty plan.
+
+        Args:
+            manager: RDMManager whose managers are used for API calls
+            max_workers: Maximum concurrent searches while planning
+            chunk_size: Maximum names per IN-filter search
+        """
+        super().__init__(max_workers, chunk_size)
+        self._manager = manager
+
+        # Database server search results, keyed by server name
+        self._servers: Dict[str, List[Dict[str, Any]]] = {}
+        # Analysis/group search results, keyed by (scope, name): scope is the
+        # EDM name for analyses (None for name-only lookups) or _GROUP_SCOPE
+        self._analyses: Dict[Tuple[Any, str], List[Dict[str, Any]]] = {}
+
+    def resolve(self, export_data_list: List[Dict[str, Any]]) -> 'RDMExportPlan':
+        """
+        Resolve everything the given submissions need.
+
+        Args:
+            export_data_list: Export job data dicts (see RDMManager.plan_rdm_export_jobs)
+
+        Returns:
+            This plan
+        """
+        jobs = [data for data in export_data_list if isinstance(data, dict)]
+
+        self.fetch_keys(self._servers, [data.get('server_name') for data in jobs], self._search_servers)
+
+        names_by_scope: Dict[Any, List[str]] = {}
+        for data in jobs:
+            group_names = data.get('group_names') or set()
+            analysis_edm_map = data.get('analysis_edm_map') or {}
+            for name in data.get('analysis_names') or []:
+                scope = self._GROUP_SCOPE if name in group_names else analysis_edm_map.get(name) or None
+                names_by_scope.setdefault(scope, []).append(name)
+
+        self.fetch_names(self._analyses, names_by_scope, self._search_analyses, 'analysisName')
+        return self
+
+    # -------------------------------------------------------------------------
+    # Search functions
+    # -------------------------------------------------------------------------
+
+    def _search_servers(self, server_name: str) -> List[Dict[str, Any]]:
+        return self._manager.edm_manager.search_database_servers(
+            filter=f"serverName={quote_filter_value(server_name)}"
+        )
+
+    def _search_analyses(self, scope, names: List[str]) -> List[Dict[str, Any]]:
+        filter_str = name_in_filter('analysisName', names)
+        if scope == self._GROUP_SCOPE:
+            filter_str += ' AND engineType = "Group"'
+        elif scope:
+            filter_str += f' AND exposureName = {quote_filter_value(scope)}'
+        return self._manager.analysis_manager.search_analyses_paginated(filter=filter_str)
+
+    # -------------------------------------------------------------------------
+    # Lookups (used by submit_rdm_export_job)
+    # -------------------------------------------------------------------------
+
+    def find_database_servers(self, server_name: str) -> List[Dict[str, Any]]:
+        """Get database server records with the given name."""
+        return self.lookup_key(self._servers, server_name, self._search_servers)
+
+    def find_groups(self, group_name: str) -> List[Dict[str, Any]]:
+        """Get group records (engineType = "Group") with the given name."""
+        return self.lookup_names(self._analyses, self._GROUP_SCOPE, [group_name], self._search_analyses, 'analysisName')
+
+    def find_analyses(self, analysis_name: str, edm_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get analysis records with the given name, optionally scoped to an EDM (exposureName)."""
+        return self.lookup_names(self._analyses, edm_name or None, [analysis_name], self._search_analyses, 'analysisName')
@@ -0,0 +1,1006 @@
+"""
+Local Moody's API simulator for performance testing.
+
+A stand-in HTTP server for the Risk Modeler / Intelligent Risk Platform
+endpoints in constants.py that the managers call: workflows and risk data
+jobs, EDM/portfolio/treaty search and creation, analysis jobs, search and
+results (ELT, EP, stats, PLT), grouping, RDM export, reference data and MRI
+import buckets. State is kept in memory and jobs finish after a configurable
+duration, so whole batches can be submitted, tracked and reconciled without
+the live API.
+
+Latency, throttling (HTTP 429 above a request rate), ETags (conditional GETs
+answered with 304) and result payload sizes are set with SimulatorConfig. Request counts per endpoint are kept for
+reporting (stats()).
+
+Not simulated: S3 uploads for MRI imports (file credentials point to a
+dummy bucket) and analysis regions (always empty).
+
+Usage:
+    from helpers.irp_integration.simulator import MoodysAPISimulator, SimulatorConfig
+
+    with MoodysAPISimulator(SimulatorConfig(latency=0.02)) as simulator:
+        simulator.add_edm('EDM1', portfolios=['Portfolio1'])
+        os.environ['RISK_MODELER_BASE_URL'] = simulator.base_url
+        client = IRPClient()
+
+Or as a standalone server for notebooks:
+    python -m helpers.irp_integration.simulator --port 8765 --latency 0.05
+    export RISK_MODELER_BASE_URL=http://127.0.0.1:8765
+"""
+
+import argparse
+import base64
+import fnmatch
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .constants import (
+    CREATE_ANALYSIS_GROUP,
+    CREATE_ANALYSIS_JOB,
+    CREATE_AWS_BUCKET,
+    CREATE_EDM,
+    CREATE_EXPOSURE_SET,
+    CREATE_MAPPING,
+    CREATE_PORTFOLIO,
+    CREATE_RDM_EXPORT_JOB,
+    CREATE_TAG,
+    CREATE_TREATY,
+    CREATE_TREATY_LOB,
+    DELETE_ANALYSIS,
+    DELETE_EDM,
+    DELETE_RDM,
+    EXECUTE_IMPORT,
+    GEOHAZ_PORTFOLIO,
+    GET_ANALYSIS_ELT,
+    GET_ANALYSIS_EP,
+    GET_ANALYSIS_GROUPING_JOB,
+    GET_ANALYSIS_JOB,
+    GET_ANALYSIS_PLT,
+    GET_ANALYSIS_REGIONS,
+    GET_ANALYSIS_RESULT,
+    GET_ANALYSIS_STATS,
+    GET_CEDANTS,
+    GET_DATABRIDGE_JOB,
+    GET_EVENT_RATE_SCHEME,
+    GET_EXPORT_JOB,
+    GET_GEOHAZ_JOB,
+    GET_LOBS,
+    GET_MODEL_PROFILES,
+    GET_OUTPUT_PROFILES,
+    GET_PORTFOLIO_BY_ID,
+    GET_RISK_DATA_JOB_BY_ID,
+    GET_TAGS,
+    GET_WORKFLOW_BY_ID,
+    GET_WORKFLOWS,
+    SEARCH_ACCOUNTS_BY_PORTFOLIO,
+    SEARCH_ANALYSIS_JOBS,
+    SEARCH_ANALYSIS_RESULTS,
+    SEARCH_CURRENCIES,
+    SEARCH_CURRENCY_SCHEME_VINTAGES,
+    SEARCH_DATABASE_SERVERS,
+    SEARCH_DATABASES,
+    SEARCH_EDMS,
+    SEARCH_EXPOSURE_SETS,
+    SEARCH_PORTFOLIOS,
+    SEARCH_RISK_DATA_JOBS,
+    SEARCH_TREATIES,
+    TOTAL_COUNT_HEADER,
+    UPDATE_GROUP_ACCESS,
+    UPGRADE_EDM_DATA_VERSION,
+)
+
+
+@dataclass
+class SimulatorConfig:
+    """Simulator behaviour: latency, throttling, job duration and payload sizes."""
+
+    latency: float = 0.0                 # Seconds added to every response
+    latency_per_record: float = 0.0      # Seconds added per record in list responses
+    max_requests_per_second: float = 0   # Requests above this rate get HTTP 429 (<= 0: unlimited)
+    job_duration: float = 0.0            # Seconds from job submission to a terminal status
+    job_failure_rate: float = 0.0        # Fraction of jobs that end FAILED (deterministic per job ID)
+    elt_events: int = 1000               # ELT records per analysis and perspective
+    plt_records: int = 2000              # PLT records per analysis and perspective
+    ep_points: int = 20                  # Return periods per EP curve
+    accounts_per_portfolio: int = 10     # Accounts for portfolios created through the API
+    locations_per_account: int = 5
+    seed: int = 0
+    etags: bool = False                  # GET responses carry an ETag; a matching If-None-Match gets 304
+    model_profiles: List[Dict[str, Any]] = field(default_factory=lambda: [
+        {'id': 1, 'name': 'DLM Profile', 'softwareVersionCode': 'RL23', 'perilCode': 'WS', 'modelRegionCode': 'NAWS'},
+        {'id': 2, 'name': 'HD Profile', 'softwareVersionCode': 'HD23', 'perilCode': 'WS', 'modelRegionCode': 'NAWS'},
+    ])
+    output_profiles: List[Dict[str, Any]] = field(default_factory=lambda: [
+        {'id': 1, 'name': 'Default Output'},
+    ])
+    event_rate_schemes: List[Dict[str, Any]] = field(default_factory=lambda: [
+        {'eventRateSchemeId': 1, 'eventRateSchemeName': 'RMS 2023 Stochastic Event Rates',
+         'perilCode': 'WS', 'modelRegionCode': 'NAWS'},
+    ])
+    currencies: List[Dict[str, Any]] = field(default_factory=lambda: [
+        {'currencyId': 1, 'currencyCode': 'USD', 'currencyName': 'US Dollar'},
+        {'currencyId': 2, 'currencyCode': 'EUR', 'currencyName': 'Euro'},
+    ])
+
+
+# Jobs report this status until job_duration has elapsed
+RUNNING_STATUS = 'RUNNING'
+FINISHED_STATUS = 'FINISHED'
+FAILED_STATUS = 'FAILED'
+
+
+# ==============================================================================
+# FILTERS
+# ==============================================================================
+
+_CLAUSE = re.compile(r'^\s*(\w+)\s*(=|!=|>=|<=|>|<|\bIN\b|\bLIKE\b)\s*(.+?)\s*$', re.IGNORECASE)
+
+
+def _parse_value(text: str) -> Any:
+    """Parse a filter value: quoted string (backslash escapes), number, or parenthesized list of either."""
+    text = text.strip()
+    if text.startswith('(') and text.endswith(')'):
+        return [_parse_value(item) for item in re.findall(r'"(?:[^"\\]|\\.)*"|\'[^\']*\'|[^,\s]+', text[1:-1])]
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        return re.sub(r'\\(.)', r'\1', text[1:-1])
+    if len(text) >= 2 and text[0] == text[-1] == "'":
+        return text[1:-1]
+    try:
+        return float(text) if '.' in text else int(text)
+    except ValueError:
+        return text
+
+
+def parse_filter(filter_str: Optional[str]) -> List[Tuple[str, str, Any]]:
+    """
+    Parse an API filter into (field, operator, value) clauses joined by AND.
+
+    Supports =, !=, <, <=, >, >=, IN (...) and LIKE "prefix*", e.g.
+    'analysisName IN ("A1", "A2") AND exposureName = "EDM1"'.
+    """
+    if not filter_str:
+        return []
+    clauses = []
+    for part in re.split(r'\s+AND\s+', filter_str.strip(), flags=re.IGNORECASE):
+        match = _CLAUSE.match(part)
+        if not match:
+            raise ValueError(f"Unsupported filter clause: {part}")
+        name, operator, value = match.groups()
+        clauses.append((name, operator.upper(), _parse_value(value)))
+    return clauses
+
+
+def _field(record: Dict[str, Any], name: str) -> Any:
+    if name in record:
+        return record[name]
+    lowered = name.lower()
+    for key, value in record.items():
+        if key.lower() == lowered:
+            return value
+    return None
+
+
+def matches(record: Dict[str, Any], clauses: List[Tuple[str, str, Any]]) -> bool:
+    """Whether a record satisfies every parsed filter clause."""
+    for name, operator, value in clauses:
+        actual = _field(record, name)
+        if operator == '=':
+            ok = str(actual) == str(value)
+        elif operator == '!=':
+            ok = str(actual) != str(value)
+        elif operator == 'IN':
+            ok = str(actual) in {str(v) for v in value}
+        elif operator == 'LIKE':
+            ok = actual is not None and fnmatch.fnmatchcase(str(actual), str(value).replace('%', '*'))
+        else:
+            try:
+                actual, value = float(actual), float(value)
+            except (TypeError, ValueError):
+                return False
+            ok = {'>': actual > value, '>=': actual >= value, '<': actual < value, '<=': actual <= value}[operator]
+        if not ok:
+            return False
+    return True
+
+
+# ==============================================================================
+# SIMULATOR
+# ==============================================================================
+
+class SimulatedResponse:
+    """Handler result: status code, body (dict/list as JSON, str as text) and headers."""
+
+    def __init__(self, status: int = 200, body: Any = None, headers: Optional[Dict[str, str]] = None) -> None:
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+
+class SimulatorError(Exception):
+    """Raised by handlers to return an HTTP error response."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class MoodysAPISimulator:
+    """
+    In-memory Moody's API served over HTTP on 127.0.0.1.
+
+    Use as a context manager (or call start()/stop()); point the IRP client
+    at it with RISK_MODELER_BASE_URL=simulator.base_url.
+    """
+
+    def __init__(self, config: Optional[SimulatorConfig] = None, port: int = 0) -> None:
+        """
+        Initialize simulator.
+
+        Args:
+            config: Simulator behaviour (defaults to SimulatorConfig())
+            port: Port to listen on (0 picks a free port)
+        """
+        self.config = config or SimulatorConfig()
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.RLock()
+        self._next_ids: Counter = Counter()
+        self._request_times: deque = deque()
+        self._stats: Counter = Counter()
+        self._results: Dict[Tuple[str, int, str], Any] = {}
+
+        self.database_servers: Dict[int, Dict[str, Any]] = {}
+        self.databases: Dict[int, Dict[str, Any]] = {}
+        self.exposure_sets: Dict[int, Dict[str, Any]] = {}
+        self.edms: Dict[int, Dict[str, Any]] = {}
+        self.portfolios: Dict[int, Dict[str, Any]] = {}
+        self.accounts: Dict[int, List[Dict[str, Any]]] = {}
+        self.treaties: Dict[int, Dict[str, Any]] = {}
+        self.analyses: Dict[int, Dict[str, Any]] = {}
+        self.tags: Dict[int, Dict[str, Any]] = {}
+        self.jobs: Dict[int, Dict[str, Any]] = {}
+
+        self._routes = [self._route(method, template, handler) for method, template, handler in [
+            ('GET', GET_WORKFLOWS, self._search_workflows),
+            ('GET', GET_WORKFLOW_BY_ID, self._get_workflow),
+            ('GET', GET_RISK_DATA_JOB_BY_ID, self._get_job),
+            ('GET', SEARCH_RISK_DATA_JOBS, self._search_jobs),
+            ('GET', SEARCH_DATABASE_SERVERS, self._search_database_servers),
+            ('GET', SEARCH_EXPOSURE_SETS, self._search_exposure_sets),
+            ('POST', CREATE_EXPOSURE_SET, self._create_exposure_set),
+            ('GET', SEARCH_EDMS, self._search_edms),
+            ('POST', CREATE_EDM, self._create_edm),
+            ('POST', UPGRADE_EDM_DATA_VERSION, self._upgrade_edm),
+            ('DELETE', DELETE_EDM, self._delete_edm),
+            ('GET', GET_CEDANTS, self._get_cedants),
+            ('GET', GET_LOBS, self._get_lobs),
+            ('GET', SEARCH_PORTFOLIOS, self._search_portfolios),
+            ('POST', CREATE_PORTFOLIO, self._create_portfolio),
+            ('GET', GET_PORTFOLIO_BY_ID, self._get_portfolio),
+            ('GET', SEARCH_ACCOUNTS_BY_PORTFOLIO, self._search_accounts),
+            ('POST', GEOHAZ_PORTFOLIO, self._submit_geohaz),
+            ('GET', GET_GEOHAZ_JOB, self._get_job),
+            ('GET', SEARCH_TREATIES, self._search_treaties),
+            ('POST', CREATE_TREATY, self._create_treaty),
+            ('POST', CREATE_TREATY_LOB, self._create_treaty_lob),
+            ('GET', SEARCH_ANALYSIS_JOBS, self._search_jobs),
+            ('POST', CREATE_ANALYSIS_JOB, self._submit_analysis),
+            ('GET', GET_ANALYSIS_JOB, self._get_job),
+            ('GET', SEARCH_ANALYSIS_RESULTS, self._search_analyses),
+            ('GET', GET_ANALYSIS_RESULT, self._get_analysis),
+            ('DELETE', DELETE_ANALYSIS, self._delete_analysis),
+            ('POST', CREATE_ANALYSIS_GROUP, self._submit_grouping),
+            ('GET', GET_ANALYSIS_GROUPING_JOB, self._get_job),
+            ('GET', GET_ANALYSIS_ELT, self._get_elt),
+            ('GET', GET_ANALYSIS_EP, self._get_ep),
+            ('GET', GET_ANALYSIS_STATS, self._get_stats),
+            ('GET', GET_ANALYSIS_PLT, self._get_plt),
+            ('GET', GET_ANALYSIS_REGIONS, lambda request: SimulatedResponse(body=[])),
+            ('GET', GET_MODEL_PROFILES, self._get_model_profiles),
+            ('GET', GET_OUTPUT_PROFILES, self._get_output_profiles),
+            ('GET', GET_EVENT_RATE_SCHEME, self._get_event_rate_schemes),
+            ('GET', SEARCH_CURRENCIES, self._search_currencies),
+            ('GET', SEARCH_CURRENCY_SCHEME_VINTAGES, self._search_currency_scheme_vintages),
+            ('GET', GET_TAGS, self._get_tags),
+            ('POST', CREATE_TAG, self._create_tag),
+            ('POST', CREATE_RDM_EXPORT_JOB, self._submit_rdm_export),
+            ('GET', GET_EXPORT_JOB, self._get_job),
+            ('GET', SEARCH_DATABASES, self._search_databases),
+            ('DELETE', DELETE_RDM, self._delete_rdm),
+            ('GET', GET_DATABRIDGE_JOB, self._get_databridge_job),
+            ('PATCH', UPDATE_GROUP_ACCESS, lambda request: SimulatedResponse(204)),
+            ('POST', CREATE_AWS_BUCKET, self._create_bucket),
+            ('POST', CREATE_AWS_BUCKET + '/{bucketId}/path', self._get_file_credentials),
+            ('POST', CREATE_MAPPING, self._upload_mapping),
+            ('POST', EXECUTE_IMPORT, self._submit_import),
+        ]]
+
+        self.add_database_server('databridge-1')
+
+    # --------------------------------------------------------------------------
+    # Lifecycle
+    # --------------------------------------------------------------------------
+
+    def start(self) -> 'MoodysAPISimulator':
+        """Start serving in a background thread."""
+        self._server = ThreadingHTTPServer(('127.0.0.1', self.port), self._handler_class())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'MoodysAPISimulator':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Request counts since start (or the last reset_stats()).
+
+        Returns:
+            Dict with 'requests', 'throttled' and 'by_endpoint'
+            ({'GET /platform/...': count})
+        """
+        with self._lock:
+            by_endpoint = {k: v for k, v in self._stats.items() if k not in ('requests', 'throttled')}
+            return {
+                'requests': self._stats['requests'],
+                'throttled': self._stats['throttled'],
+                'by_endpoint': dict(sorted(by_endpoint.items())),
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    # --------------------------------------------------------------------------
+    # Seeding state
+    # --------------------------------------------------------------------------
+
+    def _new_id(self, kind: str) -> int:
+        with self._lock:
+            self._next_ids[kind] += 1
+            return self._next_ids[kind]
+
+    def add_database_server(self, server_name: str) -> int:
+        """Add a database server; returns its serverId."""
+        server_id = self._new_id('server')
+        self.database_servers[server_id] = {'serverId': server_id, 'serverName': server_name}
+        return server_id
+
+    def add_edm(
+        self,
+        edm_name: str,
+        server_name: str = 'databridge-1',
+        portfolios: Optional[List[str]] = None,
+        treaties: Optional[List[str]] = None
+    ) -> int:
+        """
+        Add an EDM (with one cedant and two LOBs) and optionally portfolios and treaties.
+
+        Returns:
+            exposureId of the EDM
+        """
+        with self._lock:
+            exposure_set_id = self._new_id('exposure_set')
+            self.exposure_sets[exposure_set_id] = {'exposureSetId': exposure_set_id, 'exposureSetName': edm_name}
+            exposure_id = self._new_id('edm')
+            self.edms[exposure_id] = {
+                'exposureId': exposure_id,
+                'exposureName': edm_name,
+                'exposureSetId': exposure_set_id,
+                'serverName': server_name,
+                'databaseName': edm_name,
+                'edmDataVersion': '23',
+                'uri': f'/platform/riskdata/v1/exposures/{exposure_id}',
+            }
+        for portfolio_name in portfolios or []:
+            self.add_portfolio(edm_name, portfolio_name)
+        for treaty_name in treaties or []:
+            self.add_treaty(edm_name, treaty_name)
+        return exposure_id
+
+    def add_portfolio(self, edm_name: str, portfolio_name: str, accounts: Optional[int] = None) -> int:
+        """Add a portfolio with accounts (config.accounts_per_portfolio by default); returns portfolioId."""
+        exposure_id = self._edm_id(edm_name)
+        with self._lock:
+            portfolio_id = self._new_id('portfolio')
+            self.portfolios[portfolio_id] = {
+                'portfolioId': portfolio_id,
+                'portfolioName': portfolio_name,
+                'portfolioNumber': portfolio_name[:20],
+                'exposureId': exposure_id,
+                'uri': f'/platform/riskdata/v1/exposures/{exposure_id}/portfolios/{portfolio_id}',
+            }
+            count = self.config.accounts_per_portfolio if accounts is None else accounts
+            self.accounts[portfolio_id] = [
+                {'accountId': i + 1, 'accountName': f'Account{i + 1}',
+                 'locationsCount': self.config.locations_per_account}
+                for i in range(count)
+            ]
+        return portfolio_id
+
+    def add_treaty(self, edm_name: str, treaty_name: str) -> int:
+        """Add a treaty; returns treatyId."""
+        exposure_id = self._edm_id(edm_name)
+        treaty_id = self._new_id('treaty')
+        self.treaties[treaty_id] = {'treatyId': treaty_id, 'treatyName': treaty_name, 'exposureId': exposure_id}
+        return treaty_id
+
+    def add_analysis(
+        self,
+        analysis_name: str,
+        edm_name: Optional[str],
+        portfolio_name: Optional[str] = None,
+        engine_type: str = 'DLM'
+    ) -> int:
+        """Add an analysis result (edm_name=None and engine_type='Group' for groups); returns analysisId."""
+        portfolio_id = None
+        if portfolio_name is not None:
+            portfolio_id = self._portfolio_id(self._edm_id(edm_name), portfolio_name)
+        return self._store_analysis(analysis_name, edm_name, portfolio_id, engine_type)
+
+    def add_rdm(self, rdm_name: str, server_name: str = 'databridge-1') -> int:
+        """Add an RDM database; returns databaseId."""
+        server_id = self._server_id(server_name)
+        database_id = self._new_id('database')
+        self.databases[database_id] = {'databaseId': database_id, 'databaseName': rdm_name, 'serverId': server_id}
+        return database_id
+
+    def _store_analysis(self, name: str, edm_name: Optional[str], portfolio_id: Optional[int], engine_type: str) -> int:
+        analysis_id = self._new_id('analysis')
+        self.analyses[analysis_id] = {
+            'analysisId': analysis_id,
+            'id': analysis_id,
+            'analysisName': name,
+            'exposureName': edm_name,
+            'engineType': engine_type,
+            'analysisFramework': 'PLT' if engine_type == 'HD' else 'ELT',
+            'exposureResourceId': portfolio_id,
+            'exposureResourceType': 'PORTFOLIO',
+            'uri': f'/platform/riskdata/v1/analyses/{analysis_id}',
+        }
+        return analysis_id
+
+    def _edm_id(self, edm_name: str) -> int:
+        for exposure_id, edm in self.edms.items():
+            if edm['exposureName'] == edm_name:
+                return exposure_id
+        raise SimulatorError(404, f"EDM '{edm_name}' not found")
+
+    def _portfolio_id(self, exposure_id: int, portfolio_name: str) -> int:
+        for portfolio_id, portfolio in self.portfolios.items():
+            if portfolio['exposureId'] == exposure_id and portfolio['portfolioName'] == portfolio_name:
+                return portfolio_id
+        raise SimulatorError(404, f"Portfolio '{portfolio_name}' not found")
+
+    def _server_id(self, server_name: str) -> int:
+        for server_id, server in self.database_servers.items():
+            if server['serverName'] == server_name:
+                return server_id
+        raise SimulatorError(404, f"Database server '{server_name}' not found")
+
+    # --------------------------------------------------------------------------
+    # Jobs
+    # --------------------------------------------------------------------------
+
+    def _create_job(self, job_type: str, **details: Any) -> int:
+        job_id = self._new_id('job')
+        failed = random.Random(self.config.seed * 1_000_003 + job_id).random() < self.config.job_failure_rate
+        self.jobs[job_id] = {
+            'id': job_id,
+            'type': job_type,
+            'submitted': time.monotonic(),
+            'outcome': FAILED_STATUS if failed else FINISHED_STATUS,
+            **details,
+        }
+        return job_id
+
+    def _job_status(self, job: Dict[str, Any]) -> str:
+        if time.monotonic() - job['submitted'] < self.config.job_duration:
+            return RUNNING_STATUS
+        return job['outcome']
+
+    def _job_body(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        status = self._job_status(job)
+        return {
+            'id': job['id'],
+            'jobId': job['id'],
+            'type': job['type'],
+            'status': status,
+            'progress': 100 if status != RUNNING_STATUS else 50,
+            'name': job.get('name'),
+        }
+
+    def _lookup_job(self, request: 'SimulatedRequest') -> Dict[str, Any]:
+        job_id = int(request.path_params.get('jobId') or request.path_params.get('job_id')
+                     or request.path_params.get('workflow_id'))
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise SimulatorError(404, f"Job {job_id} not found")
+        return job
+
+    def _get_job(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return SimulatedResponse(body=self._job_body(self._lookup_job(request)))
+
+    def _get_workflow(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return SimulatedResponse(body=self._job_body(self._lookup_job(request)))
+
+    def _search_workflows(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        ids = [int(i) for i in request.param('ids', '').split(',') if i]
+        workflows = [self._job_body(self.jobs[i]) for i in ids if i in self.jobs]
+        page = self._page(request, workflows)
+        return SimulatedResponse(body={'totalMatchCount': len(workflows), 'workflows': page})
+
+    def _search_jobs(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        jobs = [self._job_body(job) for job in self.jobs.values()]
+        return self._search(request, jobs)
+
+    def _get_databridge_job(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        job = self._lookup_job(request)
+        status = {RUNNING_STATUS: 'Processing', FINISHED_STATUS: 'Succeeded'}.get(self._job_status(job), 'Failed')
+        return SimulatedResponse(body=status)
+
+    def _location(self, path: str, resource_id: Any) -> Dict[str, str]:
+        return {'Location': f"{self.base_url}/{path.strip('/')}/{resource_id}"}
+
+    def _job_created(self, path: str, job_type: str, **details: Any) -> SimulatedResponse:
+        job_id = self._create_job(job_type, **details)
+        return SimulatedResponse(201, headers=self._location(path, job_id))
+
+    # --------------------------------------------------------------------------
+    # Searches
+    # --------------------------------------------------------------------------
+
+    def _page(self, request: 'SimulatedRequest', records: List[Any]) -> List[Any]:
+        offset = int(request.param('offset', 0))
+        limit = request.param('limit')
+        return records[offset:offset + int(limit)] if limit is not None else records[offset:]
+
+    def _search(self, request: 'SimulatedRequest', records: List[Dict[str, Any]], filter_param: str = 'filter') -> SimulatedResponse:
+        try:
+            clauses = parse_filter(request.param(filter_param))
+        except ValueError as e:
+            raise SimulatorError(400, str(e))
+        found = [r for r in records if matches(r, clauses)]
+        return SimulatedResponse(body=self._page(request, found), headers={TOTAL_COUNT_HEADER: str(len(found))})
+
+    def _search_database_servers(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return self._search(request, list(self.database_servers.values()))
+
+    def _search_exposure_sets(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return self._search(request, list(self.exposure_sets.values()))
+
+    def _search_edms(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return self._search(request, list(self.edms.values()))
+
+    def _search_portfolios(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        exposure_id = int(request.path_params['exposureId'])
+        return self._search(request, [p for p in self.portfolios.values() if p['exposureId'] == exposure_id])
+
+    def _get_portfolio(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        portfolio = self.portfolios.get(int(request.path_params['id']))
+        if portfolio is None:
+            raise SimulatorError(404, "Portfolio not found")
+        return SimulatedResponse(body=portfolio)
+
+    def _search_accounts(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return self._search(request, self.accounts.get(int(request.path_params['id']), []))
+
+    def _search_treaties(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        exposure_id = int(request.path_params['exposureId'])
+        return self._search(request, [t for t in self.treaties.values() if t['exposureId'] == exposure_id])
+
+    def _search_analyses(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return self._search(request, list(self.analyses.values()))
+
+    def _get_analysis(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return SimulatedResponse(body=self._analysis(request))
+
+    def _search_databases(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        server_id = int(request.path_params['serverId'])
+        return self._search(request, [d for d in self.databases.values() if d['serverId'] == server_id])
+
+    def _get_cedants(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return SimulatedResponse(body=[{'cedantId': 1, 'cedantName': 'Default Cedant'}])
+
+    def _get_lobs(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return SimulatedResponse(body=[{'lobId': 1, 'lobName': 'Property'}, {'lobId': 2, 'lobName': 'Casualty'}])
+
+    # --------------------------------------------------------------------------
+    # Creation and job submission
+    # --------------------------------------------------------------------------
+
+    def _create_exposure_set(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        exposure_set_id = self._new_id('exposure_set')
+        self.exposure_sets[exposure_set_id] = {
+            'exposureSetId': exposure_set_id, 'exposureSetName': request.json.get('exposureSetName')
+        }
+        return SimulatedResponse(201, headers=self._location(request.path, exposure_set_id))
+
+    def _create_edm(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        edm_name = request.json['exposureName']
+        server = self.database_servers.get(int(request.json['serverId']), {})
+        with self._lock:
+            if any(e['exposureName'] == edm_name for e in self.edms.values()):
+                raise SimulatorError(409, f"EDM '{edm_name}' already exists")
+            self.add_edm(edm_name, server_name=server.get('serverName', 'databridge-1'))
+        return self._job_created(GET_RISK_DATA_JOB_BY_ID.rsplit('/', 1)[0], 'CREATE_EDM', name=edm_name)
+
+    def _upgrade_edm(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return self._job_created(GET_WORKFLOWS, 'EDM_DATA_UPGRADE')
+
+    def _delete_edm(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        self.edms.pop(int(request.path_params['exposureId']), None)
+        return self._job_created(GET_RISK_DATA_JOB_BY_ID.rsplit('/', 1)[0], 'DELETE_EDM')
+
+    def _create_portfolio(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        exposure_id = int(request.path_params['exposureId'])
+        edm = self.edms.get(exposure_id)
+        if edm is None:
+            raise SimulatorError(404, f"Exposure {exposure_id} not found")
+        portfolio_id = self.add_portfolio(edm['exposureName'], request.json['portfolioName'])
+        return SimulatedResponse(201, headers=self._location(request.path, portfolio_id))
+
+    def _submit_geohaz(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return self._job_created(request.path, 'GEOHAZ')
+
+    def _create_treaty(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        exposure_id = int(request.path_params['exposureId'])
+        treaty_id = self._new_id('treaty')
+        self.treaties[treaty_id] = {'treatyId': treaty_id, 'treatyName': request.json['treatyName'], 'exposureId': exposure_id}
+        return SimulatedResponse(201, headers=self._location(request.path, treaty_id))
+
+    def _create_treaty_lob(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return SimulatedResponse(201, headers=self._location(request.path, request.json['lobId']))
+
+    def _submit_analysis(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        resource_uri = request.json['resourceUri']
+        portfolio = next((p for p in self.portfolios.values() if p['uri'] == resource_uri), None)
+        if portfolio is None:
+            raise SimulatorError(404, f"Portfolio {resource_uri} not found")
+        edm_name = self.edms[portfolio['exposureId']]['exposureName']
+        name = request.json['settings']['name']
+        self._store_analysis(name, edm_name, portfolio['portfolioId'], request.json.get('type', 'DLM'))
+        return self._job_created(request.path, 'ANALYSIS', name=name)
+
+    def _submit_grouping(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        name = request.json['settings']['analysisName']
+        self._store_analysis(name, None, None, 'Group')
+        return self._job_created(request.path, 'GROUPING', name=name)
+
+    def _delete_analysis(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        self.analyses.pop(int(request.path_params['analysisId']), None)
+        return SimulatedResponse(204)
+
+    def _submit_rdm_export(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        settings = request.json.get('settings', {})
+        if 'rdmName' in settings:
+            # A new RDM gets a suffix, as in Moody's
+            self.add_rdm(f"{settings['rdmName']}_{self._new_id('rdm_suffix'):04d}", self.database_servers[
+                int(settings['serverId'])]['serverName'])
+        return self._job_created(request.path, 'RDM_EXPORT')
+
+    def _delete_rdm(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        name = request.path_params['rdmName']
+        for database_id, database in list(self.databases.items()):
+            if database['databaseName'] == name:
+                del self.databases[database_id]
+        return SimulatedResponse(202, body={'jobId': str(self._create_job('DELETE_RDM'))})
+
+    def _create_bucket(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return SimulatedResponse(201, headers=self._location(request.path, self._new_id('bucket')))
+
+    def _get_file_credentials(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        def encode(value: str) -> str:
+            return base64.b64encode(value.encode()).decode()
+
+        file_id = self._new_id('file')
+        body = {
+            'accessKeyId': encode('SIMULATOR'),
+            'secretAccessKey': encode('SIMULATOR'),
+            'sessionToken': encode('SIMULATOR'),
+            's3Path': encode(f"simulator-bucket/{request.path_params['bucketId']}/{file_id}"),
+            's3Region': encode('us-east-1'),
+        }
+        return SimulatedResponse(201, body=body, headers=self._location(request.path, file_id))
+
+    def _upload_mapping(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return SimulatedResponse(201, headers=self._location(request.path, self._new_id('file')))
+
+    def _submit_import(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return self._job_created(GET_WORKFLOWS, 'MRI_IMPORT')
+
+    # --------------------------------------------------------------------------
+    # Reference data
+    # --------------------------------------------------------------------------
+
+    def _get_model_profiles(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        name = request.param('name')
+        items = [p for p in self.config.model_profiles if name is None or p['name'] == name]
+        return SimulatedResponse(body={'count': len(items), 'items': items})
+
+    def _get_output_profiles(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        name = request.param('name')
+        return SimulatedResponse(body=[p for p in self.config.output_profiles if name is None or p['name'] == name])
+
+    def _get_event_rate_schemes(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return self._counted_search(request, self.config.event_rate_schemes)
+
+    def _search_currencies(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return self._counted_search(request, self.config.currencies)
+
+    def _search_currency_scheme_vintages(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        vintages = [{'currencySchemeCode': 'RMS', 'vintage': 'RL25', 'effectiveDate': '2025-05-28T00:00:00.000Z'}]
+        return self._counted_search(request, vintages)
+
+    def _counted_search(self, request: 'SimulatedRequest', records: List[Dict[str, Any]]) -> SimulatedResponse:
+        """Reference table search: 'where' filter, {'count', 'items'} body."""
+        items = self._search(request, records, filter_param='where').body
+        return SimulatedResponse(body={'count': len(items), 'items': items})
+
+    def _get_tags(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        return self._search(request, list(self.tags.values()))
+
+    def _create_tag(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        tag_id = self._new_id('tag')
+        self.tags[tag_id] = {'tagId': tag_id, 'tagName': request.json['tagName']}
+        return SimulatedResponse(201, headers=self._location(request.path, tag_id))
+
+    # --------------------------------------------------------------------------
+    # Analysis results
+    # --------------------------------------------------------------------------
+
+    def _analysis(self, request: 'SimulatedRequest') -> Dict[str, Any]:
+        analysis = self.analyses.get(int(request.path_params['analysisId']))
+        if analysis is None:
+            raise SimulatorError(404, f"Analysis {request.path_params['analysisId']} not found")
+        return analysis
+
+    def _result(self, kind: str, request: 'SimulatedRequest', build: Callable[[random.Random], Any]) -> Any:
+        """Results are generated once per analysis, perspective and kind, from a fixed seed."""
+        analysis_id = self._analysis(request)['analysisId']
+        perspective = request.param('perspectiveCode', 'GU')
+        key = (kind, analysis_id, perspective)
+        with self._lock:
+            if key not in self._results:
+                seed = f"{self.config.seed}:{kind}:{analysis_id}:{perspective}"
+                self._results[key] = build(random.Random(seed))
+            return self._results[key]
+
+    def _get_elt(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        def build(rng: random.Random) -> List[Dict[str, Any]]:
+            return [
+                {
+                    'eventId': event_id,
+                    'sourceId': 1,
+                    'positionValue': round(rng.lognormvariate(10, 2), 2),
+                    'stdDevI': round(rng.uniform(0, 1e5), 2),
+                    'stdDevC': round(rng.uniform(0, 1e5), 2),
+                    'expValue': round(rng.uniform(1e6, 1e8), 2),
+                    'rate': rng.uniform(1e-6, 1e-2),
+                    'peril': 'WS',
+                    'region': 'NA',
+                    'oepWUC': 0.0,
+                }
+                for event_id in range(1, self.config.elt_events + 1)
+            ]
+        return self._search(request, self._result('elt', request, build))
+
+    def _get_plt(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        def build(rng: random.Random) -> List[Dict[str, Any]]:
+            start = date(2025, 1, 1)
+            records = []
+            for i in range(self.config.plt_records):
+                event_date = start + timedelta(days=rng.randrange(365))
+                records.append({
+                    'periodId': i // 4 + 1,
+                    'eventId': rng.randrange(1, self.config.elt_events + 1),
+                    'eventDate': event_date.isoformat(),
+                    'lossDate': (event_date + timedelta(days=rng.randrange(3))).isoformat(),
+                    'weight': 1e-5,
+                    'positionValue': round(rng.lognormvariate(10, 2), 2),
+                    'peril': 'WS',
+                    'region': 'NA',
+                })
+            return records
+        return self._search(request, self._result('plt', request, build))
+
+    def _get_ep(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        def build(rng: random.Random) -> List[Dict[str, Any]]:
+            return_periods = [2 * 1.5 ** i for i in range(self.config.ep_points)]
+            curves = []
+            for ep_type in ('OEP', 'AEP', 'CEP', 'TCE'):
+                losses = sorted(rng.lognormvariate(12, 1.5) for _ in return_periods)
+                curves.append({
+                    'epType': ep_type,
+                    'value': {'returnPeriods': return_periods, 'positionValues': losses},
+                })
+            return curves
+        return SimulatedResponse(body=self._result('ep', request, build))
+
+    def _get_stats(self, request: 'SimulatedRequest') -> SimulatedResponse:
+        def build(rng: random.Random) -> List[Dict[str, Any]]:
+            stats = []
+            for ep_type in ('OEP', 'AEP'):
+                pure_premium = round(rng.lognormvariate(12, 1), 2)
+                std_dev = round(pure_premium * rng.uniform(1, 5), 2)
+                stats.append({
+                    'epType': ep_type,
+                    'purePremium': pure_premium,
+                    'totalStdDev': std_dev,
+                    'cv': round(std_dev / pure_premium, 4),
+                })
+            return stats
+        return SimulatedResponse(body=self._result('stats', request, build))
+
+    # --------------------------------------------------------------------------
+    # HTTP
+    # --------------------------------------------------------------------------
+
+    @staticmethod
+    def _route(method: str, template: str, handler: Callable) -> Tuple[str, str, 're.Pattern', Callable]:
+        template = '/' + template.strip('/')
+        pattern = re.sub(r'\\\{(\w+)\\\}', r'(?P<\1>[^/]+)', re.escape(template))
+        return method, template, re.compile(f'^{pattern}$'), handler
+
+    def _throttled(self) -> bool:
+        limit = self.config.max_requests_per_second
+        if limit <= 0:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            while self._request_times and now - self._request_times[0] >= 1.0:
+                self._request_times.popleft()
+            if len(self._request_times) >= limit:
+                return True
+            self._request_times.append(now)
+            return False
+
+    def handle(self, method: str, raw_path: str, body: bytes) -> SimulatedResponse:
+        """Route one request (used by the HTTP handler; callable directly in tests)."""
+        url = urlsplit(raw_path)
+        path = '/' + unquote(url.path).strip('/')
+
+        with self._lock:
+            self._stats['requests'] += 1
+        if self._throttled():
+            with self._lock:
+                self._stats['throttled'] += 1
+            return SimulatedResponse(429, body={'message': 'Too Many Requests'})
+
+        for route_method, template, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if route_method == method and match:
+                with self._lock:
+                    self._stats[f"{method} {template}"] += 1
+                request = SimulatedRequest(path, match.groupdict(), parse_qs(url.query), body)
+                try:
+                    response = handler(request)
+                except SimulatorError as e:
+                    response = SimulatedResponse(e.status, body={'message': str(e)})
+                except (KeyError, ValueError, TypeError) as e:
+                    response = SimulatedResponse(400, body={'message': f"Bad request: {e}"})
+                break
+        else:
+            response = SimulatedResponse(404, body={'message': f"No simulated endpoint for {method} {path}"})
+
+        records = len(response.body) if isinstance(response.body, list) else 1
+        delay = self.config.latency + self.config.latency_per_record * records
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    def _handler_class(self) -> type:
+        simulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _dispatch(self) -> None:
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                response = simulator.handle(self.command, self.path, body)
+
+                if response.body is None:
+                    payload, content_type = b'', None
+                elif isinstance(response.body, str):
+                    payload, content_type = response.body.encode(), 'text/plain'
+                else:
+                    payload, content_type = json.dumps(response.body).encode(), 'application/json'
+
+                headers = dict(response.headers)
+                if simulator.config.etags and self.command == 'GET' and response.status == 200:
+                    headers['ETag'] = f'"{hashlib.sha1(payload).hexdigest()}"'
+                    if self.headers.get('If-None-Match') == headers['ETag']:
+                        response, payload, content_type = SimulatedResponse(304), b'', None
+
+                self.send_response(response.status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if content_type:
+                    self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                if payload and self.command != 'HEAD':
+                    self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+
+class SimulatedRequest:
+    """Parsed request passed to simulator handlers."""
+
+    def __init__(self, path: str, path_params: Dict[str, str], query: Dict[str, List[str]], body: bytes) -> None:
+        self.path = path
+        self.path_params = {k: unquote(v) for k, v in path_params.items()}
+        self.query = query
+        self.json = json.loads(body) if body else {}
+
+    def param(self, name: str, default: Any = None) -> Any:
+        values = self.query.get(name)
+        return values[0] if values else default
+
+
+def main() -> None:
+    """Run the simulator as a standalone server."""
+    parser = argparse.ArgumentParser(description="Local Moody's API simulator")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument('--max-requests-per-second', type=float, default=0, help="HTTP 429 above this rate")
+    parser.add_argument('--job-duration', type=float, default=0.0, help="Seconds until jobs finish")
+    parser.add_argument('--elt-events', type=int, default=1000)
+    parser.add_argument('--plt-records', type=int, default=2000)
+    parser.add_argument('--etags', action='store_true', help="Answer conditional GETs with 304")
+    args = parser.parse_args()
+
+    config = SimulatorConfig(
+        latency=args.latency,
+        max_requests_per_second=args.max_requests_per_second,
+        job_duration=args.job_duration,
+        elt_events=args.elt_events,
+        plt_records=args.plt_records,
+        etags=args.etags,
+    )
+    simulator = MoodysAPISimulator(config, port=args.port).start()
+    print(f"Moody's API simulator listening on {simulator.base_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        simulator.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+"""
+Streaming decode of large JSON array responses into DataFrames.
+
+ELT and PLT pages hold up to 100,000 records. response.json() builds a list
+with a dict per record, which dominates peak memory. read_json_table() instead
+reads the response body in chunks and decodes it about a megabyte of records
+at a time into DataFrame columns, so only one batch of dicts exists at once.
+Numeric fields become int64/float64 columns and text fields (dates, peril and
+region codes) categorical columns, so repeated values are stored once.
+
+Batches are decoded with orjson when it is installed (pip install orjson),
+otherwise with the standard json module.
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from .constants import JSON_STREAM_BATCH_BYTES, JSON_STREAM_CHUNK_BYTES
+
+
+def _json_loads() -> Callable[[bytes], Any]:
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+_loads = _json_loads()
+
+
+def iter_json_array_batches(
+    chunks: Iterable[bytes],
+    batch_bytes: int = JSON_STREAM_BATCH_BYTES
+) -> Iterator[List[Any]]:
+    """
+    Decode a JSON array from byte chunks, yielding its elements in batches.
+
+    Elements are split at the last '}' of each batch_bytes of input that ends
+    a complete element; a '}' inside a string only makes that attempt fail
+    to parse and an earlier one is tried. A body that is not an array is
+    decoded whole and yielded as a single batch.
+
+    Args:
+        chunks: Response body chunks (e.g. response.iter_content())
+        batch_bytes: Approximate bytes of input decoded per batch
+
+    Yields:
+        Lists of decoded array elements, in order
+    """
+    buffer = bytearray()
+    chunks = iter(chunks)
+
+    # Find the opening bracket
+    for chunk in chunks:
+        buffer += chunk
+        stripped = buffer.lstrip()
+        if stripped:
+            break
+    else:
+        return
+    if not stripped.startswith(b'['):
+        for chunk in chunks:
+            buffer += chunk
+        yield [_loads(bytes(buffer))]
+        return
+    del buffer[:len(buffer) - len(stripped) + 1]
+
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) < batch_bytes:
+            continue
+        _strip_separator(buffer)
+        end = buffer.rfind(b'}')
+        while end != -1:
+            try:
+                batch = _loads(b'[' + buffer[:end + 1] + b']')
+            except ValueError:
+                end = buffer.rfind(b'}', 0, end)
+                continue
+            del buffer[:end + 1]
+            yield batch
+            break
+
+    _strip_separator(buffer)
+    rest = bytes(buffer).strip()
+    if not rest.endswith(b']'):
+        raise ValueError("Unterminated JSON array in response")
+    rest = rest[:-1].strip()
+    if rest:
+        yield _loads(b'[' + rest + b']')
+
+
+def _strip_separator(buffer: bytearray) -> None:
+    """Remove whitespace and the comma between the last decoded element and the next"""
+    stripped = buffer.lstrip()
+    if stripped.startswith(b','):
+        stripped = stripped[1:]
+    del buffer[:len(buffer) - len(stripped)]
+
+
+def read_json_table(
+    response: Any,
+    batch_bytes: int = JSON_STREAM_BATCH_BYTES,
+    chunk_bytes: int = JSON_STREAM_CHUNK_BYTES
+) -> pd.DataFrame:
+    """
+    Read a JSON array of flat records from a streamed response into a DataFrame.
+
+    Args:
+        response: requests.Response made with stream=True
+        batch_bytes: Approximate bytes of input decoded per batch
+        chunk_bytes: Bytes read from the connection at a time
+
+    Returns:
+        DataFrame with one row per record and one column per field
+        (missing fields are NaN)
+    """
+    return concat_tables([
+        _batch_frame(batch)
+        for batch in iter_json_array_batches(response.iter_content(chunk_size=chunk_bytes), batch_bytes)
+        if batch
+    ])
+
+
+def concat_tables(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Combine read_json_table() DataFrames (e.g. pages), keeping text columns categorical."""
+    frames = [frame for frame in frames if len(frame.columns)]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+
+    columns = list(dict.fromkeys(column for frame in frames for column in frame.columns))
+    return pd.DataFrame({column: _concat_column(frames, column) for column in columns})
+
+
+def table_records(table: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Rows of a read_json_table() DataFrame as dicts of plain Python values,
+    as response.json() would have returned them (missing values are None).
+    Meant for a filtered subset of rows.
+    """
+    return table.astype(object).where(table.notna(), None).to_dict('records')
+
+
+def _batch_frame(batch: List[Any]) -> pd.DataFrame:
+    """DataFrame for one batch of records, with text columns as categoricals"""
+    frame = pd.DataFrame(batch)
+    for column in frame.columns:
+        if frame[column].dtype == object:
+            try:
+                frame[column] = frame[column].astype('category')
+            except TypeError:
+                pass  # Unhashable values (nested objects) stay as objects
+    return frame
+
+
+def _concat_column(frames: List[pd.DataFrame], column: str) -> Any:
+    """One column of the combined table, keeping categoricals categorical"""
+    parts = [
+        frame[column] if column in frame.columns else pd.Series([None] * len(frame), dtype=object)
+        for frame in frames
+    ]
+    if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+        return union_categoricals(parts)
+    return pd.concat(
+        [part.astype(object) if isinstance(part.dtype, pd.CategoricalDtype) else part for part in parts],
+        ignore_index=True
+    )
@@ -5,9 +5,11 @@ Handles treaty-related operations including creation, retrieval,
 and Line of Business (LOB) assignments.
 """
 
-from typing import Dict, List, Any, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from .client import Client
 from .constants import (
+    BULK_CREATE_MAX_REQUESTS_PER_SECOND,
+    BULK_CREATE_MAX_WORKERS,
     CREATE_TREATY,
     SEARCH_TREATIES,
     TREATY_TYPES,
@@ -17,7 +19,21 @@ from .constants import (
 )
 from .exceptions import IRPAPIError, IRPValidationError, IRPReferenceDataError
 from .validators import validate_list_not_empty, validate_non_empty_string, validate_positive_int, validate_non_negative_float, validate_non_negative_int
-from .utils import extract_id_from_location_header
+from .pagination import fetch_all_pages, iter_paginated
+from .utils import (
+    BulkCreateContext, create_concurrently, extract_id_from_location_header, get_total_count,
+    memoized_lookup, raise_for_bulk_errors
+)
+
+
+# Fields of create_treaties() items, passed to create_treaty() as keyword arguments
+TREATY_DATA_FIELDS = (
+    'edm_name', 'treaty_name', 'treaty_number', 'treaty_type', 'per_risk_limit',
+    'occurrence_limit', 'attachment_point', 'inception_date', 'expiration_date',
+    'currency_name', 'attachment_basis', 'attachment_level', 'pct_covered', 'pct_placed',
+    'pct_share', 'pct_retention', 'premium', 'num_reinstatements',
+    'pct_reinstatement_charge', 'aggregate_limit', 'aggregate_deductible', 'priority',
+)
 
 
 class TreatyManager:
@@ -71,12 +87,19 @@ class TreatyManager:
             IRPAPIError: If API request fails
         """
         validate_positive_int(exposure_id, "exposure_id")
+        return self._search_treaties_page(exposure_id, filter, limit, offset)[0]
+
+    def _search_treaties_page(
+        self, exposure_id: int, filter: str, limit: int, offset: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Fetch one page of treaties, returning (records, total_count or None)."""
         params = {'limit': limit, 'offset': offset}
         if filter:
             params['filter'] = filter
         try:
             response = self.client.request('GET', SEARCH_TREATIES.format(exposureId=exposure_id), params=params)
-            return response.json()
+            records = response.json()
+            return records, get_total_count(response, records)
         except Exception as e:
             raise IRPAPIError(f"Failed to search treaties: {e}")
 
@@ -99,70 +122,78 @@ class TreatyManager:
         """
         validate_positive_int(exposure_id, "exposure_id")
 
-        all_results = []
-        offset = 0
-        limit = 100
+        return fetch_all_pages(
+            lambda offset, limit: self._search_treaties_page(exposure_id, filter, limit, offset)
+        )
 
-        while True:
-            results = self.search_treaties(exposure_id=exposure_id, filter=filter, limit=limit, offset=offset)
-            all_results.extend(results)
+    def iter_treaties(self, exposure_id: int, filter: str = '') -> Iterator[Dict[str, Any]]:
+        """
+        Stream all treaties for a given exposure ID, fetching pages concurrently.
 
-            # If we got fewer results than the limit, we've reached the end
-            if len(results) < limit:
-                break
-            offset += limit
+        Args:
+            exposure_id: Exposure ID
+            filter: Optional filter string
 
-        return all_results
+        Yields:
+            Treaty dictionaries in result order
+
+        Raises:
+            IRPValidationError: If parameters are invalid
+            IRPAPIError: If API request fails
+        """
+        validate_positive_int(exposure_id, "exposure_id")
+
+        yield from iter_paginated(
+            lambda offset, limit: self._search_treaties_page(exposure_id, filter, limit, offset)
+        )
 
 
     def create_treaties(self, treaty_data_list: List[Dict[str, Any]]) -> List[int]:
         """
-        Create multiple treaties.
+        Create multiple treaties concurrently.
+
+        EDM, cedant, currency and LOB lookups are made once per distinct name
+        for the whole list, treaty POSTs share a rate limiter, and each
+        treaty's LOB attachments are submitted as soon as its ID is known.
+        A failure does not stop the other treaties.
 
         Args:
             treaty_data_list: List of treaty data dicts, each containing all required treaty fields
 
         Returns:
-            List of treaty IDs
+            List of treaty IDs (in input order)
 
         Raises:
             IRPValidationError: If treaty_data_list is empty or invalid
-            IRPAPIError: If treaty creation fails or EDM not found
+            IRPAPIError: If treaty data is incomplete
+            IRPBulkCreateError: If any treaty (or its LOB attachments) failed;
+                created_ids holds the treaties that were created
         """
         validate_list_not_empty(treaty_data_list, "treaty_data_list")
 
-        treaty_ids = []
-        for treaty_data in treaty_data_list:
-            try:
-                # Returns tuple of (treaty_id, request_body) - we only need treaty_id here
-                treaty_id, _ = self.create_treaty(
-                    edm_name=treaty_data['edm_name'],
-                    treaty_name=treaty_data['treaty_name'],
-                    treaty_number=treaty_data['treaty_number'],
-                    treaty_type=treaty_data['treaty_type'],
-                    per_risk_limit=treaty_data['per_risk_limit'],
-                    occurrence_limit=treaty_data['occurrence_limit'],
-                    attachment_point=treaty_data['attachment_point'],
-                    inception_date=treaty_data['inception_date'],
-                    expiration_date=treaty_data['expiration_date'],
-                    currency_name=treaty_data['currency_name'],
-                    attachment_basis=treaty_data['attachment_basis'],
-                    attachment_level=treaty_data['attachment_level'],
-                    pct_covered=treaty_data['pct_covered'],
-                    pct_placed=treaty_data['pct_placed'],
-                    pct_share=treaty_data['pct_share'],
-                    pct_retention=treaty_data['pct_retention'],
-                    premium=treaty_data['premium'],
-                    num_reinstatements=treaty_data['num_reinstatements'],
-                    pct_reinstatement_charge=treaty_data['pct_reinstatement_charge'],
-                    aggregate_limit=treaty_data['aggregate_limit'],
-                    aggregate_deductible=treaty_data['aggregate_deductible'],
-                    priority=treaty_data['priority']
-                )
-                treaty_ids.append(treaty_id)
-            except KeyError as e:
-                raise IRPAPIError(f"Missing data in create treaty data: {e}") from e
+        try:
+            treaty_kwargs_list = [
+                {field: treaty_data[field] for field in TREATY_DATA_FIELDS}
+                for treaty_data in treaty_data_list
+            ]
+        except KeyError as e:
+            raise IRPAPIError(f"Missing data in create treaty data: {e}") from e
 
+        with BulkCreateContext(BULK_CREATE_MAX_WORKERS, BULK_CREATE_MAX_REQUESTS_PER_SECOND) as context:
+            def create(treaty_kwargs: Dict[str, Any]) -> int:
+                # Returns tuple of (treaty_id, request_body) - we only need treaty_id here
+                treaty_id, _ = self.create_treaty(**treaty_kwargs, context=context)
+                return treaty_id
+
+            treaty_ids, errors = create_concurrently(create, treaty_kwargs_list, BULK_CREATE_MAX_WORKERS)
+            for i, treaty_id in enumerate(treaty_ids):
+                if treaty_id is not None:
+                    try:
+                        self.wait_for_treaty_lobs(context, treaty_id)
+                    except Exception as e:
+                        errors[i] = e
+
+        raise_for_bulk_errors(treaty_ids, errors, "treaty")
         return treaty_ids
 
 
@@ -190,6 +221,7 @@ class TreatyManager:
             aggregate_limit: float,
             aggregate_deductible: float,
             priority: int,
+            context: Optional[BulkCreateContext] = None,
     ) -> Tuple[int, Dict[str, Any]]:
         """
         Create a treaty with provided parameters.
@@ -217,6 +249,9 @@ class TreatyManager:
             aggregate_limit: Aggregate limit amount
             aggregate_deductible: Aggregate deductible amount
             priority: Priority
+            context: Optional BulkCreateContext (from create_treaties) memoizing
+                lookups and rate-limiting POSTs; LOB attachments are deferred
+                to it, so call wait_for_treaty_lobs() before relying on them
 
         Returns:
             Tuple of (treaty_id, request_body) where request_body is the HTTP request payload
@@ -263,7 +298,10 @@ class TreatyManager:
             )
 
         # Look up EDM to get exposure_id
-        edms = self.edm_manager.search_edms(filter=f"exposureName=\"{edm_name}\"")
+        edms = memoized_lookup(
+            context, 'edm', edm_name,
+            lambda: self.edm_manager.search_edms(filter=f"exposureName=\"{edm_name}\"")
+        )
         if len(edms) != 1:
             raise IRPAPIError(f"Expected 1 EDM with name '{edm_name}', found {len(edms)}")
         try:
@@ -272,7 +310,10 @@ class TreatyManager:
             raise IRPAPIError(f"Failed to extract exposure ID for EDM '{edm_name}': {e}") from e
 
         try:
-            cedant_response = self.edm_manager.get_cedants_by_edm(exposure_id)
+            cedant_response = memoized_lookup(
+                context, 'cedants', exposure_id,
+                lambda: self.edm_manager.get_cedants_by_edm(exposure_id)
+            )
             if not cedant_response:
                 raise IRPReferenceDataError(f"No cedants found for EDM '{edm_name}'")
             if len(cedant_response) > 1:
@@ -292,7 +333,10 @@ class TreatyManager:
             raise IRPAPIError(f"Failed to retrieve cedants for EDM '{edm_name}': {e}")
         
         try:
-            currency_response = self.reference_data_manager.get_currency_by_name(currency_name)
+            currency_response = memoized_lookup(
+                context, 'currency', currency_name,
+                lambda: self.reference_data_manager.get_currency_by_name(currency_name)
+            )
             currency_data = {
                 "id": currency_response["currencyId"],
                 "code": currency_response["currencyCode"],
@@ -329,12 +373,24 @@ class TreatyManager:
         }
 
         try:
+            if context is not None:
+                context.acquire()
             response = self.client.request('POST', CREATE_TREATY.format(exposureId=exposure_id), json=data)
             treaty_id = extract_id_from_location_header(response, "treaty creation")
 
-            lobs = self.edm_manager.get_lobs_by_edm(exposure_id)
+            lobs = memoized_lookup(
+                context, 'lobs', exposure_id,
+                lambda: self.edm_manager.get_lobs_by_edm(exposure_id)
+            )
             for lob in lobs:
-                self.create_treaty_lob(exposure_id, int(treaty_id), int(lob['lobId']), lob['lobName'])
+                if context is None:
+                    self.create_treaty_lob(exposure_id, int(treaty_id), int(lob['lobId']), lob['lobName'])
+                else:
+                    context.defer(
+                        self._attach_treaty_lob,
+                        context, treaty_name, exposure_id, int(treaty_id), int(lob['lobId']), lob['lobName'],
+                        key=('treaty_lobs', int(treaty_id))
+                    )
 
             return int(treaty_id), data
         except KeyError as e:
@@ -343,6 +399,33 @@ class TreatyManager:
             raise IRPAPIError(f"Failed to create treaty '{treaty_name}': {e}")
         
 
+    def wait_for_treaty_lobs(self, context: BulkCreateContext, treaty_id: int) -> None:
+        """
+        Wait for the LOB attachments create_treaty deferred to context for a treaty.
+
+        Raises:
+            IRPAPIError: If an attachment failed
+        """
+        context.wait(key=('treaty_lobs', treaty_id))
+
+
+    def _attach_treaty_lob(
+            self,
+            context: BulkCreateContext,
+            treaty_name: str,
+            exposure_id: int,
+            treaty_id: int,
+            lob_id: int,
+            lob_name: str
+    ) -> int:
+        """Create a treaty LOB under the context's rate limiter (deferred by create_treaty)."""
+        context.acquire()
+        try:
+            return self.create_treaty_lob(exposure_id, treaty_id, lob_id, lob_name)
+        except Exception as e:
+            raise IRPAPIError(f"Failed to create treaty '{treaty_name}': {e}")
+
+
     def create_treaty_lob(self, exposure_id: int, treaty_id: int, lob_id: int, lobName: str) -> int:
         """
         Create a Line of Business (LOB) for a treaty.
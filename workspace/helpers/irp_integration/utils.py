@@ -7,10 +7,407 @@ and reference data lookup operations.
 
 import base64
 import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Hashable, List, Any, Optional, Tuple
 import requests
-from .exceptions import IRPAPIError, IRPReferenceDataError
+from .constants import NAME_FILTER_CHUNK_SIZE, TOTAL_COUNT_HEADER
+from .exceptions import IRPAPIError, IRPBulkCreateError, IRPReferenceDataError
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter spacing request starts to at most max_per_second.
+
+    Shared by concurrent submitters so that parallel workers don't exceed the
+    API's request rate; 429 responses are still retried by the Client session.
+    """
+
+    def __init__(self, max_per_second: float) -> None:
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_per_second: Maximum request starts per second (<= 0 disables limiting)
+        """
+        self.interval = 1.0 / max_per_second if max_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def acquire(self) -> None:
+        """Block until the next request may start."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class BulkCreateContext:
+    """
+    Shared state for creating many entities concurrently (create_treaties,
+    create_portfolios).
+
+    - lookup(): memoizes EDM, cedant, currency and LOB lookups for the run.
+      Concurrent callers of the same key wait for a single request; failed
+      lookups are not cached, so the next caller retries.
+    - acquire(): spaces POSTs with a shared RateLimiter.
+    - reserve(): rejects a second create of the same name in the run
+      (concurrent creates can't see each other in duplicate-name searches).
+    - defer()/wait(): run follow-up requests (e.g. treaty LOB attachments) on
+      a separate pool as soon as the entity they depend on exists.
+
+    Use as a context manager so the follow-up pool is shut down.
+    """
+
+    def __init__(self, max_workers: int, max_requests_per_second: float) -> None:
+        """
+        Initialize context.
+
+        Args:
+            max_workers: Threads for follow-up requests
+            max_requests_per_second: Maximum POST starts per second (<= 0 disables limiting)
+        """
+        self.rate_limiter = RateLimiter(max_requests_per_second)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        self._lock = threading.Lock()
+        self._lookups: Dict[Tuple[str, Any], Future] = {}
+        self._reserved: set = set()
+        self._deferred: List[Tuple[Any, Future]] = []
+        self.lookup_calls = 0
+        self.cache_hits = 0
+
+    def __enter__(self) -> 'BulkCreateContext':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._executor.shutdown(wait=True)
+
+    def lookup(self, kind: str, key: Any, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the memoized result of fetch() for (kind, key), calling it once.
+
+        Args:
+            kind: Lookup type (e.g. 'edm', 'currency')
+            key: Lookup key within the type
+            fetch: Callable performing the lookup
+
+        Returns:
+            Result of fetch()
+        """
+        with self._lock:
+            entry = self._lookups.get((kind, key))
+            owner = entry is None
+            if owner:
+                entry = self._lookups[(kind, key)] = Future()
+                self.lookup_calls += 1
+            else:
+                self.cache_hits += 1
+
+        if owner:
+            try:
+                entry.set_result(fetch())
+            except Exception as e:
+                with self._lock:
+                    del self._lookups[(kind, key)]
+                entry.set_exception(e)
+        return entry.result()
+
+    def acquire(self) -> None:
+        """Block until the next POST may start."""
+        self.rate_limiter.acquire()
+
+    def reserve(self, kind: str, key: Any) -> bool:
+        """Record that (kind, key) is being created; False if it already was in this run."""
+        with self._lock:
+            if (kind, key) in self._reserved:
+                return False
+            self._reserved.add((kind, key))
+            return True
+
+    def defer(self, fn: Callable[..., Any], *args: Any, key: Any = None) -> Future:
+        """Run fn(*args) on the follow-up pool; wait() collects the results."""
+        future = self._executor.submit(fn, *args)
+        with self._lock:
+            self._deferred.append((key, future))
+        return future
+
+    def wait(self, key: Any = None) -> None:
+        """
+        Wait for deferred requests.
+
+        Args:
+            key: Only wait for requests deferred with this key (default: all)
+
+        Raises:
+            Exception: The first error raised by a deferred request (in submission order)
+        """
+        with self._lock:
+            deferred = [future for deferred_key, future in self._deferred if key is None or deferred_key == key]
+            self._deferred = [entry for entry in self._deferred if key is not None and entry[0] != key]
+        errors = [future.exception() for future in deferred]
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def report(self) -> Dict[str, int]:
+        """Lookup request counts: issued and answered from the memo."""
+        return {'lookup_calls': self.lookup_calls, 'cache_hits': self.cache_hits}
+
+
+def memoized_lookup(context: Optional[BulkCreateContext], kind: str, key: Any, fetch: Callable[[], Any]) -> Any:
+    """Call fetch() directly, or through context.lookup() when creating in bulk."""
+    if context is None:
+        return fetch()
+    return context.lookup(kind, key, fetch)
+
+
+def map_concurrently(
+    fn: Callable[[Any], Any],
+    items: List[Any],
+    max_workers: int
+) -> List[Tuple[Any, Any, Optional[Exception]]]:
+    """
+    Call fn(item) for every item on a thread pool, without stopping at the first failure.
+
+    Runs inline when there is at most one item or max_workers <= 1.
+
+    Returns:
+        List of (item, result, error) in input order; each item has either a
+        result or an exception
+    """
+    def attempt(item: Any) -> Tuple[Any, Any, Optional[Exception]]:
+        try:
+            return item, fn(item), None
+        except Exception as e:
+            return item, None, e
+
+    if len(items) <= 1 or max_workers <= 1:
+        return [attempt(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(attempt, items))
+
+
+def chunk_list(items: List[Any], size: int = NAME_FILTER_CHUNK_SIZE) -> List[List[Any]]:
+    """Split items into consecutive lists of at most size items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def create_concurrently(
+    create: Callable[[Any], int],
+    items: List[Any],
+    max_workers: int
+) -> Tuple[List[Optional[int]], List[Optional[Exception]]]:
+    """
+    Call create(item) for every item on a thread pool, without stopping at the first failure.
+
+    Returns:
+        Tuple of (created_ids, errors), both in input order; each item has
+        either an ID or an exception
+    """
+    results = map_concurrently(create, items, max_workers)
+    return [created_id for _, created_id, _ in results], [error for _, _, error in results]
+
+
+def raise_for_bulk_errors(created_ids: List[Optional[int]], errors: List[Optional[Exception]], entity: str) -> None:
+    """
+    Raise IRPBulkCreateError (carrying created_ids and errors) if any creation failed.
+    """
+    failed = [error for error in errors if error is not None]
+    if failed:
+        raise IRPBulkCreateError(
+            f"{len(failed)} of {len(errors)} {entity} creations failed "
+            f"({sum(created_id is not None for created_id in created_ids)} created); first error: {failed[0]}",
+            created_ids,
+            errors
+        )
+
+
+class LookupCache:
+    """
+    Memoized Moody's lookups shared by a batch of work (AnalysisSubmissionPlan,
+    RDMExportPlan, EntitySnapshot).
+
+    Name searches are cached by (scope, name), where scope narrows the search
+    (e.g. None for EDMs, the exposure ID for portfolios, the EDM name for
+    analyses); other lookups are cached by key. Not-found names are cached too.
+
+    - fetch_names() / fetch_keys(): fill a cache up front, running chunked
+      IN-filter searches and single lookups concurrently. Failed fetches are
+      not cached; their errors are returned.
+    - lookup_names() / lookup_key(): answer one request from the cache,
+      fetching misses and raising on API errors.
+    - report(): API calls issued versus those the uncached path would have made.
+
+    Subclasses hold the caches and search functions. All methods are thread-safe.
+    """
+
+    def __init__(self, max_workers: int, chunk_size: int = NAME_FILTER_CHUNK_SIZE) -> None:
+        """
+        Initialize empty counters.
+
+        Args:
+            max_workers: Maximum concurrent fetches
+            chunk_size: Maximum names per IN-filter search
+        """
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+
+        self.api_calls = 0
+        self.legacy_api_calls = 0
+        self.cache_hits = 0
+        self._lock = threading.Lock()
+
+    def store_names(
+        self,
+        cache: Dict[Tuple[Hashable, str], List[Dict[str, Any]]],
+        scope: Hashable,
+        names: List[str],
+        records: Optional[List[Dict[str, Any]]],
+        name_field: str
+    ) -> None:
+        """Cache search records by name; names without records are cached as not found."""
+        found: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records or []:
+            found.setdefault(record.get(name_field), []).append(record)
+        with self._lock:
+            for name in names:
+                cache[(scope, name)] = found.get(name, [])
+
+    def fetch_names(
+        self,
+        cache: Dict[Tuple[Hashable, str], List[Dict[str, Any]]],
+        names_by_scope: Dict[Hashable, List[str]],
+        search: Callable[[Hashable, List[str]], List[Dict[str, Any]]],
+        name_field: str
+    ) -> Dict[Hashable, Exception]:
+        """
+        Fetch uncached names for each scope with search(scope, chunk).
+
+        Returns:
+            Mapping of scope to the first error raised for it
+        """
+        tasks = []
+        with self._lock:
+            for scope, names in names_by_scope.items():
+                unique_names = [name for name in dict.fromkeys(names) if name]
+                missing = [name for name in unique_names if (scope, name) not in cache]
+                self.cache_hits += len(unique_names) - len(missing)
+                tasks.extend((scope, chunk) for chunk in chunk_list(missing, self.chunk_size))
+            self.api_calls += len(tasks)
+
+        errors: Dict[Hashable, Exception] = {}
+        for (scope, chunk), records, error in map_concurrently(lambda task: search(*task), tasks, self.max_workers):
+            if error is not None:
+                errors.setdefault(scope, error)
+            else:
+                self.store_names(cache, scope, chunk, records, name_field)
+        return errors
+
+    def fetch_keys(
+        self,
+        cache: Dict[Hashable, Any],
+        keys: List[Hashable],
+        fetch: Callable[[Hashable], Any]
+    ) -> Dict[Hashable, Exception]:
+        """
+        Fetch uncached keys, one fetch(key) call each.
+
+        Returns:
+            Mapping of key to the error raised for it
+        """
+        with self._lock:
+            unique_keys = [key for key in dict.fromkeys(keys) if key]
+            missing = [key for key in unique_keys if key not in cache]
+            self.cache_hits += len(unique_keys) - len(missing)
+            self.api_calls += len(missing)
+
+        errors: Dict[Hashable, Exception] = {}
+        for key, result, error in map_concurrently(fetch, missing, self.max_workers):
+            if error is not None:
+                errors[key] = error
+            else:
+                with self._lock:
+                    cache[key] = result
+        return errors
+
+    def lookup_names(
+        self,
+        cache: Dict[Tuple[Hashable, str], List[Dict[str, Any]]],
+        scope: Hashable,
+        names: List[str],
+        search: Callable[[Hashable, List[str]], List[Dict[str, Any]]],
+        name_field: str,
+        legacy_calls: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Return cached records for names in one scope, searching for misses.
+
+        Args:
+            legacy_calls: Searches the uncached path would have issued for this request
+
+        Raises:
+            Exception: The first error raised by a search
+        """
+        with self._lock:
+            self.legacy_api_calls += legacy_calls
+        errors = self.fetch_names(cache, {scope: names}, search, name_field)
+        if scope in errors:
+            raise errors[scope]
+        return [record for name in dict.fromkeys(names) if name for record in cache[(scope, name)]]
+
+    def lookup_key(self, cache: Dict[Hashable, Any], key: Hashable, fetch: Callable[[Hashable], Any]) -> Any:
+        """Return the cached result for key, fetching it if needed (raises on API error)."""
+        with self._lock:
+            self.legacy_api_calls += 1
+            if key in cache:
+                self.cache_hits += 1
+                return cache[key]
+            self.api_calls += 1
+        result = fetch(key)
+        with self._lock:
+            cache[key] = result
+        return result
+
+    def report(self) -> Dict[str, int]:
+        """
+        Summarize API usage.
+
+        Returns:
+            Dict with:
+                - api_calls: Lookups actually issued
+                - legacy_api_calls: Lookups the uncached path would have issued
+                - api_calls_saved: legacy_api_calls - api_calls (never negative)
+                - cache_hits: Lookups answered from the cache
+        """
+        with self._lock:
+            return {
+                'api_calls': self.api_calls,
+                'legacy_api_calls': self.legacy_api_calls,
+                'api_calls_saved': max(self.legacy_api_calls - self.api_calls, 0),
+                'cache_hits': self.cache_hits,
+            }
+
+
+def quote_filter_value(value: Any) -> str:
+    """Double-quote a value for a search filter, escaping backslashes and quotes."""
+    escaped = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def name_in_filter(field: str, names: List[str]) -> str:
+    """
+    Build a 'field IN ("a", "b")' search filter for a list of names.
+
+    Callers chunk names to NAME_FILTER_CHUNK_SIZE per filter to stay within
+    URL length limits.
+    """
+    return f"{field} IN ({', '.join(quote_filter_value(name) for name in names)})"
 
 
 def get_workspace_root() -> Path:
@@ -45,10 +442,13 @@ def get_cycle_file_directories() -> Dict[str, str]:
         Dict with keys:
             - 'data': Directory for CSV data files (accounts, locations)
             - 'mapping': Directory for mapping files (mapping.json)
+            - 'loss_tables': Directory for the local loss-table store (loss_store.py)
 
     Directory structure:
-        - Active cycle: {cycle_name}/files/data and {cycle_name}/files/mapping
-        - No active cycle: _Tools/files/working_files and _Tools/files/mapping
+        - Active cycle: {cycle_name}/files/data, {cycle_name}/files/mapping and
+          {cycle_name}/files/loss_tables
+        - No active cycle: _Tools/files/working_files, _Tools/files/mapping and
+          _Tools/files/loss_tables
 
     Example:
         ```python
@@ -68,19 +468,22 @@ def get_cycle_file_directories() -> Dict[str, str]:
             cycle_name = active_cycle['cycle_name']
             return {
                 'data': str(workspace_root / "workflows" / f"Active_{cycle_name}" / "files" / "data"),
-                'mapping': str(workspace_root / "workflows" / f"Active_{cycle_name}" / "files" / "mapping")
+                'mapping': str(workspace_root / "workflows" / f"Active_{cycle_name}" / "files" / "mapping"),
+                'loss_tables': str(workspace_root / "workflows" / f"Active_{cycle_name}" / "files" / "loss_tables")
             }
         else:
             # No active cycle, use _Tools directories
             return {
                 'data': str(workspace_root / "workflows" / "_Tools" / "files" / "working_files"),
-                'mapping': str(workspace_root / "workflows" / "_Tools" / "files" / "mapping")
+                'mapping': str(workspace_root / "workflows" / "_Tools" / "files" / "mapping"),
+                'loss_tables': str(workspace_root / "workflows" / "_Tools" / "files" / "loss_tables")
             }
     except Exception:
         # Fallback to _Tools if cycle lookup fails
         return {
             'data': str(workspace_root / "workflows" / "_Tools" / "files" / "working_files"),
-            'mapping': str(workspace_root / "workflows" / "_Tools" / "files" / "mapping")
+            'mapping': str(workspace_root / "workflows" / "_Tools" / "files" / "mapping"),
+            'loss_tables': str(workspace_root / "workflows" / "_Tools" / "files" / "loss_tables")
         }
 
 
@@ -104,6 +507,36 @@ def get_location_header(
     return response.headers.get('location', '')
 
 
+def get_total_count(response: requests.Response, body: Any = None) -> Optional[int]:
+    """
+    Get the total match count for a search response, if the API returned one.
+
+    Checks the x-total-count header, then a totalMatchCount/totalCount field
+    when the body is a JSON object.
+
+    Args:
+        response: HTTP response object
+        body: The already-parsed response.json(), so the page is not decoded
+            twice (parsed here if not given)
+
+    Returns:
+        Total number of matching records, or None if not available
+    """
+    value: Any = response.headers.get(TOTAL_COUNT_HEADER)
+    if value is None:
+        if body is None:
+            try:
+                body = response.json()
+            except ValueError:
+                return None
+        if isinstance(body, dict):
+            value = body.get('totalMatchCount', body.get('totalCount'))
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
 def extract_id_from_location_header(
     response: requests.Response,
     error_context: str = "response",
@@ -22,18 +22,24 @@ Workflow:
 import gc
 import os
 import json
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 
 from helpers.irp_integration import IRPClient
 from helpers.database import (
     execute_query, execute_command, execute_insert, DatabaseError
 )
-from helpers.constants import JobStatus, BatchType, WORKSPACE_PATH
+from helpers.constants import JobStatus, BatchType, TrackingLogMode, TRACKING_LOG_MODE, WORKSPACE_PATH
 from helpers.configuration import BATCH_TYPE_TRANSFORMERS
 from helpers.sqlserver import execute_query_from_file
 from helpers.csv_export import save_dataframes_to_csv
 from helpers.context import WorkContext
+from helpers.tracing import traced
+
+if TYPE_CHECKING:
+    from helpers.irp_integration.analysis import AnalysisSubmissionPlan
+    from helpers.irp_integration.rdm import RDMExportPlan
+    from helpers.irp_integration.utils import BulkCreateContext
 
 
 class JobError(Exception):
@@ -161,7 +167,15 @@ def create_job(
         raise JobError(f"Failed to create job: {str(e)}")   # pragma: no cover
 
 
-def _submit_job(job_id: int, job_config: Dict[str, Any], batch_type: str, irp_client: IRPClient) -> Tuple[Optional[str], Dict, Dict]:
+def _submit_job(
+    job_id: int,
+    job_config: Dict[str, Any],
+    batch_type: str,
+    irp_client: IRPClient,
+    analysis_plan: Optional['AnalysisSubmissionPlan'] = None,
+    rdm_export_plan: Optional['RDMExportPlan'] = None,
+    bulk_context: Optional['BulkCreateContext'] = None
+) -> Tuple[Optional[str], Dict, Dict]:
     """
     Submit job to Moody's workflow API.
 
@@ -172,6 +186,10 @@ def _submit_job(job_id: int, job_config: Dict[str, Any], batch_type: str, irp_cl
         job_config: Job configuration data
         batch_type: Type of batch (from irp_batch.batch_type)
         irp_client: IRPClient instance
+        analysis_plan: Optional batch plan for Analysis jobs (see plan_analysis_submissions)
+        rdm_export_plan: Optional batch plan for Export to RDM jobs (see plan_rdm_export_submissions)
+        bulk_context: Optional BulkCreateContext shared by the Portfolio Creation
+            or Create Reinsurance Treaties jobs of a batch
 
     Returns:
         Tuple of (workflow_id, request_json, response_json)
@@ -188,7 +206,7 @@ def _submit_job(job_id: int, job_config: Dict[str, Any], batch_type: str, irp_cl
             )
         elif batch_type == BatchType.PORTFOLIO_CREATION:
             workflow_id, request_json, response_json = _submit_portfolio_creation_job(
-                job_id, job_config, irp_client
+                job_id, job_config, irp_client, context=bulk_context
             )
         elif batch_type == BatchType.MRI_IMPORT:
             workflow_id, request_json, response_json = _submit_mri_import_job(
@@ -196,7 +214,7 @@ def _submit_job(job_id: int, job_config: Dict[str, Any], batch_type: str, irp_cl
             )
         elif batch_type == BatchType.CREATE_REINSURANCE_TREATIES:
             workflow_id, request_json, response_json = _submit_create_reinsurance_treaty_job(
-                job_id, job_config, irp_client
+                job_id, job_config, irp_client, context=bulk_context
             )
         elif batch_type == BatchType.EDM_DB_UPGRADE:
             workflow_id, request_json, response_json = _submit_edm_db_upgrade_job(
@@ -212,7 +230,7 @@ def _submit_job(job_id: int, job_config: Dict[str, Any], batch_type: str, irp_cl
             )
         elif batch_type == BatchType.ANALYSIS:
             workflow_id, request_json, response_json = _submit_analysis_job(
-                job_id, job_config, irp_client
+                job_id, job_config, irp_client, plan=analysis_plan
             )
         elif batch_type == BatchType.GROUPING:
             workflow_id, request_json, response_json = _submit_grouping_job(
@@ -226,7 +244,7 @@ def _submit_job(job_id: int, job_config: Dict[str, Any], batch_type: str, irp_cl
             )
         elif batch_type == BatchType.EXPORT_TO_RDM:
             workflow_id, request_json, response_json = _submit_export_to_rdm_job(
-                job_id, job_config, irp_client
+                job_id, job_config, irp_client, plan=rdm_export_plan
             )
         elif batch_type == BatchType.DATA_EXTRACTION:
             workflow_id, request_json, response_json = _submit_data_extraction_job(
@@ -311,7 +329,8 @@ def _submit_edm_creation_job(
 def _submit_portfolio_creation_job(
     job_id: int,
     job_config: Dict[str, Any],
-    client: IRPClient
+    client: IRPClient,
+    context: Optional['BulkCreateContext'] = None
 ) -> Tuple[str, Dict, Dict]:
     """
     Submit Portfolio Creation job to Moody's API.
@@ -328,6 +347,7 @@ def _submit_portfolio_creation_job(
             - portfolio_number: Portfolio number (optional, defaults to portfolio name)
             - description: Portfolio description (optional)
         client: IRPClient instance
+        context: Optional BulkCreateContext shared by the batch's jobs
 
     Returns:
         Tuple of (workflow_id, request_json, response_json)
@@ -353,7 +373,8 @@ def _submit_portfolio_creation_job(
         edm_name=edm_name,
         portfolio_name=portfolio_name,
         portfolio_number=portfolio_number,
-        description=description
+        description=description,
+        context=context
     )
 
     # Build workflow ID - use N/A to indicate synchronous completion
@@ -460,7 +481,8 @@ def _submit_mri_import_job(
 def _submit_create_reinsurance_treaty_job(
     job_id: int,
     job_config: Dict[str, Any],
-    client: IRPClient
+    client: IRPClient,
+    context: Optional['BulkCreateContext'] = None
 ) -> Tuple[str, Dict, Dict]:
     """
     Submit Create Reinsurance Treaty job to Moody's API.
@@ -495,6 +517,8 @@ def _submit_create_reinsurance_treaty_job(
             - Aggregate Deductible: Aggregate deductible amount
             - Priority: Priority
         client: IRPClient instance
+        context: Optional BulkCreateContext shared by the batch's jobs (the
+            treaty's LOB attachments are waited for before returning)
 
     Returns:
         Tuple of (workflow_id, request_json, response_json)
@@ -556,8 +580,11 @@ def _submit_create_reinsurance_treaty_job(
         pct_reinstatement_charge=pct_reinstatement_charge,
         aggregate_limit=aggregate_limit,
         aggregate_deductible=aggregate_deductible,
-        priority=priority
+        priority=priority,
+        context=context
     )
+    if context is not None:
+        client.treaty.wait_for_treaty_lobs(context, treaty_id)
 
     # Build workflow ID - use N/A to indicate synchronous completion
     workflow_id = "N/A"
@@ -779,10 +806,59 @@ def _submit_portfolio_mapping_job(
     return workflow_id, request_json, response_json
 
 
+def _analysis_job_arguments(job_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map an Analysis job configuration to submit_portfolio_analysis_job arguments.
+
+    Treaty and tag names are collected from Reinsurance Treaty 1-5 and Tag 1-5,
+    skipping empty columns. Required fields are not validated here.
+    """
+    return {
+        'edm_name': job_config.get('Database'),
+        'portfolio_name': job_config.get('Portfolio'),
+        'job_name': job_config.get('Analysis Name'),
+        'analysis_profile_name': job_config.get('Analysis Profile'),
+        'output_profile_name': job_config.get('Output Profile'),
+        'event_rate_scheme_name': job_config.get('Event Rate'),
+        'treaty_names': [
+            job_config[f'Reinsurance Treaty {i}'] for i in range(1, 6)
+            if job_config.get(f'Reinsurance Treaty {i}')
+        ],
+        'tag_names': [
+            job_config[f'Tag {i}'] for i in range(1, 6)
+            if job_config.get(f'Tag {i}')
+        ],
+    }
+
+
+def plan_analysis_submissions(
+    job_configs: List[Dict[str, Any]],
+    irp_client: IRPClient
+) -> 'AnalysisSubmissionPlan':
+    """
+    Resolve the Moody's lookups for a batch of Analysis jobs up front.
+
+    EDMs, portfolios, treaties, profiles, event rate schemes, tags and the
+    currency are resolved once for the whole batch, so each submit_job call
+    with analysis_plan= only POSTs its analysis job.
+
+    Args:
+        job_configs: Analysis job configuration data dicts
+        irp_client: IRPClient instance
+
+    Returns:
+        AnalysisSubmissionPlan (its report() gives the API call counts)
+    """
+    return irp_client.analysis.plan_portfolio_analysis_jobs(
+        [_analysis_job_arguments(job_config) for job_config in job_configs]
+    )
+
+
 def _submit_analysis_job(
     job_id: int,
     job_config: Dict[str, Any],
-    client: IRPClient
+    client: IRPClient,
+    plan: Optional['AnalysisSubmissionPlan'] = None
 ) -> Tuple[str, Dict, Dict]:
     """
     Submit Analysis job to Moody's API.
@@ -802,6 +878,7 @@ def _submit_analysis_job(
             - Reinsurance Treaty 1-5: Optional treaty names
             - Tag 1-5: Optional tag names
         client: IRPClient instance
+        plan: Optional AnalysisSubmissionPlan answering the lookups for this job
 
     Returns:
         Tuple of (workflow_id, request_json, response_json)
@@ -810,13 +887,13 @@ def _submit_analysis_job(
         ValueError: If required fields are missing
         JobError: If submission fails
     """
-    # Extract required fields
-    edm_name = job_config.get('Database')
-    portfolio_name = job_config.get('Portfolio')
-    analysis_name = job_config.get('Analysis Name')
-    analysis_profile = job_config.get('Analysis Profile')
-    output_profile = job_config.get('Output Profile')
-    event_rate = job_config.get('Event Rate')
+    # Extract fields
+    arguments = _analysis_job_arguments(job_config)
+    edm_name = arguments['edm_name']
+    portfolio_name = arguments['portfolio_name']
+    analysis_name = arguments['job_name']
+    analysis_profile = arguments['analysis_profile_name']
+    output_profile = arguments['output_profile_name']
 
     # Validate required fields
     if not edm_name:
@@ -832,31 +909,11 @@ def _submit_analysis_job(
     # Note: Event Rate is required for DLM analyses but optional for HD analyses
     # The validation is performed in submit_portfolio_analysis_job after determining job type
 
-    # Extract treaty names (up to 5)
-    treaty_names = []
-    for i in range(1, 6):
-        treaty = job_config.get(f'Reinsurance Treaty {i}')
-        if treaty:
-            treaty_names.append(treaty)
-
-    # Extract tag names (up to 5)
-    tag_names = []
-    for i in range(1, 6):
-        tag = job_config.get(f'Tag {i}')
-        if tag:
-            tag_names.append(tag)
-
     # Submit analysis job
     try:
         moody_job_id, http_request_body = client.analysis.submit_portfolio_analysis_job(
-            edm_name=edm_name,
-            portfolio_name=portfolio_name,
-            job_name=analysis_name,
-            analysis_profile_name=analysis_profile,
-            output_profile_name=output_profile,
-            event_rate_scheme_name=event_rate,
-            treaty_names=treaty_names,
-            tag_names=tag_names
+            **arguments,
+            plan=plan
         )
     except Exception as e:
         raise JobError(f"Failed to submit analysis job: {str(e)}")
@@ -987,10 +1044,54 @@ def _submit_grouping_job(
     return workflow_id, request_json, response_json
 
 
+def _rdm_export_job_arguments(job_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map an Export to RDM job configuration to submit_rdm_export_job arguments.
+
+    Each job exports a single item; is_group and edm_name describe how to look
+    it up. Required fields are not validated here.
+    """
+    analysis_names = job_config.get('analysis_names', [])
+    item_name = analysis_names[0] if analysis_names else None
+    edm_name = job_config.get('edm_name')
+    return {
+        'server_name': job_config.get('server_name'),
+        'rdm_name': job_config.get('rdm_name'),
+        'analysis_names': analysis_names,
+        'database_id': job_config.get('database_id'),  # May be None for seed job
+        'analysis_edm_map': {item_name: edm_name} if item_name and edm_name else {},
+        'group_names': {item_name} if item_name and job_config.get('is_group', False) else set(),
+    }
+
+
+def plan_rdm_export_submissions(
+    job_configs: List[Dict[str, Any]],
+    irp_client: IRPClient
+) -> 'RDMExportPlan':
+    """
+    Resolve the Moody's lookups for a batch of Export to RDM jobs up front.
+
+    Database servers are looked up once and all analysis and group names are
+    resolved with chunked IN-filter searches, so each submit_job call with
+    rdm_export_plan= only POSTs its export job.
+
+    Args:
+        job_configs: Export to RDM job configuration data dicts
+        irp_client: IRPClient instance
+
+    Returns:
+        RDMExportPlan (its report() gives the API call counts)
+    """
+    return irp_client.rdm.plan_rdm_export_jobs(
+        [_rdm_export_job_arguments(job_config) for job_config in job_configs]
+    )
+
+
 def _submit_export_to_rdm_job(
     job_id: int,
     job_config: Dict[str, Any],
-    client: IRPClient
+    client: IRPClient,
+    plan: Optional['RDMExportPlan'] = None
 ) -> Tuple[str, Dict, Dict]:
     """
     Submit Export to RDM job to Moody's API.
@@ -1005,6 +1106,7 @@ def _submit_export_to_rdm_job(
             - edm_name: EDM name for analysis lookup (None for groups)
             - database_id: Optional database ID for appending to existing RDM
         client: IRPClient instance
+        plan: Optional batch plan from plan_rdm_export_submissions
 
     Returns:
         Tuple of (workflow_id, request_json, response_json)
@@ -1014,21 +1116,11 @@ def _submit_export_to_rdm_job(
         ValueError: If required fields are missing
         JobError: If submission fails
     """
-    # Extract required fields
-    rdm_name = job_config.get('rdm_name')
-    server_name = job_config.get('server_name')
-    analysis_names = job_config.get('analysis_names', [])
-    database_id = job_config.get('database_id')  # May be None for seed job
-
-    # Build lookup structures from per-item fields (new minimal format)
-    # Each job now has is_group and edm_name for its single item
-    item_name = analysis_names[0] if analysis_names else None
-    is_group = job_config.get('is_group', False)
-    edm_name = job_config.get('edm_name')
-
-    # Build the maps expected by submit_rdm_export_job
-    analysis_edm_map = {item_name: edm_name} if item_name and edm_name else {}
-    group_names_set = {item_name} if item_name and is_group else set()
+    # Extract required fields and the lookup maps expected by submit_rdm_export_job
+    export_arguments = _rdm_export_job_arguments(job_config)
+    rdm_name = export_arguments['rdm_name']
+    server_name = export_arguments['server_name']
+    analysis_names = export_arguments['analysis_names']
 
     # Validate required fields
     if not rdm_name:
@@ -1049,13 +1141,9 @@ def _submit_export_to_rdm_job(
     # Submit RDM export job (with skip_missing=True to handle missing items gracefully)
     try:
         result = client.rdm.submit_rdm_export_job(
-            server_name=server_name,
-            rdm_name=rdm_name,
-            analysis_names=analysis_names,
-            database_id=database_id,
-            analysis_edm_map=analysis_edm_map,
-            group_names=group_names_set,
-            skip_missing=True
+            **export_arguments,
+            skip_missing=True,
+            plan=plan
         )
     except Exception as e:
         raise JobError(f"Failed to submit RDM export job: {str(e)}")
@@ -1416,6 +1504,27 @@ def _insert_tracking_log(
         raise JobError(f"Failed to insert tracking log: {str(e)}") # pragma: no cover
 
 
+def _touch_last_tracked(job_id: int, schema: str = 'public') -> None:
+    """
+    Record a tracking heartbeat (poll with no status change) on the job row.
+
+    Args:
+        job_id: Job ID
+        schema: Database schema
+
+    Raises:
+        JobError: If update fails
+    """
+    try:
+        execute_command(
+            "UPDATE irp_job SET last_tracked_ts = NOW() WHERE id = %s",
+            (job_id,),
+            schema=schema
+        )
+    except DatabaseError as e: # pragma: no cover
+        raise JobError(f"Failed to update last_tracked_ts: {str(e)}") # pragma: no cover
+
+
 # ============================================================================
 # CORE CRUD OPERATIONS
 # ============================================================================
@@ -1617,6 +1726,42 @@ def update_job_configuration_data(
     )
 
 
+def update_job_configurations_data(
+    job_configuration_ids: List[int],
+    updates: Dict[str, Any],
+    schema: str = 'public'
+) -> int:
+    """
+    Merge the same fields into several job configurations' JSON data at once.
+
+    Equivalent to update_job_configuration_data for each ID, in one UPDATE
+    (top-level JSONB merge) instead of a read and a write per configuration.
+
+    LAYER: 2 (CRUD)
+
+    Args:
+        job_configuration_ids: IDs of the job configurations to update
+        updates: Dict of fields to update/add to each configuration
+        schema: Database schema
+
+    Returns:
+        Number of job configurations updated
+    """
+    ids = [int(job_configuration_id) for job_configuration_id in job_configuration_ids]
+    if not ids:
+        return 0
+
+    return execute_command(
+        """
+        UPDATE irp_job_configuration
+        SET job_configuration_data = job_configuration_data || CAST(%s AS jsonb), updated_ts = NOW()
+        WHERE id = ANY(%s)
+        """,
+        (json.dumps(updates), ids),
+        schema=schema
+    )
+
+
 # ============================================================================
 # JOB WORKFLOW OPERATIONS (Layer 3)
 # ============================================================================
@@ -1790,13 +1935,18 @@ def skip_job_configuration(
 # JOB SUBMISSION AND TRACKING
 # ============================================================================
 
+@traced('job.submit_job', context=lambda job_id, *args, **kwargs: {'job_id': job_id})
 def submit_job(
     job_id: int,
     batch_type: str,
     irp_client: IRPClient,
     force: bool = False,
     track_immediately: bool = False,
-    schema: str = 'public'
+    schema: str = 'public',
+    analysis_plan: Optional['AnalysisSubmissionPlan'] = None,
+    rdm_export_plan: Optional['RDMExportPlan'] = None,
+    job_config: Optional[Dict[str, Any]] = None,
+    bulk_context: Optional['BulkCreateContext'] = None
 ) -> int:
     """
     Submit job to Moody's workflow system.
@@ -1816,6 +1966,12 @@ def submit_job(
         force: Resubmit even if already submitted
         track_immediately: Track status after submission
         schema: Database schema
+        analysis_plan: Optional batch plan for Analysis jobs (see plan_analysis_submissions)
+        rdm_export_plan: Optional batch plan for Export to RDM jobs (see plan_rdm_export_submissions)
+        job_config: Optional job configuration record (as from get_job_config),
+            when the caller already loaded it for the batch
+        bulk_context: Optional BulkCreateContext shared by the Portfolio Creation
+            or Create Reinsurance Treaties jobs of a batch (see batch.submit_batch)
 
     Returns:
         Job ID
@@ -1835,14 +1991,18 @@ def submit_job(
 
     if not already_submitted or force:
         # Get job configuration
-        job_config = get_job_config(job_id, schema=schema)
+        if job_config is None:
+            job_config = get_job_config(job_id, schema=schema)
 
         # Submit job
         workflow_id, request, response = _submit_job(
             job_id,
             job_config['job_configuration_data'],
             batch_type,
-            irp_client
+            irp_client,
+            analysis_plan=analysis_plan,
+            rdm_export_plan=rdm_export_plan,
+            bulk_context=bulk_context
         )
 
         # Check if job should be skipped (e.g., all analyses missing for grouping)
@@ -1905,12 +2065,14 @@ def submit_job(
     return job_id
 
 
+@traced('job.track_job_status', context=lambda job_id, *args, **kwargs: {'job_id': job_id})
 def track_job_status(
     job_id: int,
     batch_type: str,
     irp_client: IRPClient,
     moodys_workflow_id: Optional[str] = None,
-    schema: str = 'public'
+    schema: str = 'public',
+    tracking_mode: Optional[str] = None
 ) -> str:
     """
     Track job status on Moody's workflow system.
@@ -1918,14 +2080,17 @@ def track_job_status(
     Process:
     1. Read job (or use provided workflow_id)
     2. Call Moody's API to get current status
-    3. Insert tracking log entry
-    4. Update job status if changed
+    3. Insert tracking log entry (every poll, or only on status change)
+    4. Update job status if changed, otherwise record the heartbeat
 
     Args:
         job_id: Job ID
         irp_client: IRPClient instance for API calls
         moodys_workflow_id: Optional workflow ID (uses job's if None)
         schema: Database schema
+        tracking_mode: TrackingLogMode.FULL logs every poll; TrackingLogMode.STATUS_CHANGE
+            logs only status transitions and records heartbeats in irp_job.last_tracked_ts.
+            Defaults to TRACKING_LOG_MODE (TRACKING_LOG_MODE environment variable).
 
     Returns:
         Current job status
@@ -1939,6 +2104,12 @@ def track_job_status(
     if batch_type not in BatchType.all():
         raise ValueError(f"Unsupported batch type: {batch_type}")
 
+    tracking_mode = tracking_mode or TRACKING_LOG_MODE
+    if tracking_mode not in TrackingLogMode.all():
+        raise JobError(
+            f"Invalid tracking_mode: {tracking_mode}. Must be one of {TrackingLogMode.all()}"
+        )
+
     # Read job
     job = read_job(job_id, schema=schema)
 
@@ -1994,12 +2165,17 @@ def track_job_status(
         # Other unexpected error
         raise JobError(f"Unexpected error tracking job {job_id}: {str(e)}")
 
-    # Insert tracking log
-    _insert_tracking_log(job_id, workflow_id, new_status, tracking_data, schema=schema)
+    status_changed = new_status != current_status
+
+    # Insert tracking log (heartbeats are skipped in STATUS_CHANGE mode)
+    if status_changed or tracking_mode == TrackingLogMode.FULL:
+        _insert_tracking_log(job_id, workflow_id, new_status, tracking_data, schema=schema)
 
-    # Update job status if changed
-    if new_status != current_status:
+    # Update job status if changed, otherwise just record the heartbeat
+    if status_changed:
         update_job_status(job_id, new_status, schema=schema)
+    else:
+        _touch_last_tracked(job_id, schema=schema)
 
     return new_status
 
@@ -2008,6 +2184,7 @@ def track_job_status(
 # JOB RESUBMISSION (Layer 3)
 # ============================================================================
 
+@traced('job.resubmit_job', context=lambda job_id, *args, **kwargs: {'job_id': job_id})
 def resubmit_job(
     job_id: int,
     irp_client: IRPClient,
@@ -2211,8 +2388,8 @@ def delete_analyses_for_jobs(
     Delete analyses in Moody's for jobs that have existing analyses.
 
     This is used during resubmission workflows when analyses need to be
-    deleted before jobs can be resubmitted. The function looks up the
-    analysis ID from Moody's API using the analysis name and EDM name.
+    deleted before jobs can be resubmitted. Analysis IDs are resolved with
+    batched name searches and deleted concurrently via the bulk delete engine.
 
     Args:
         jobs_to_delete: List of job info dicts with 'analysis_name' and 'edm'
@@ -2232,6 +2409,7 @@ def delete_analyses_for_jobs(
         ...     print(f"{len(errors)} deletion(s) failed")
     """
     errors = []
+    analyses = []
 
     for job in jobs_to_delete:
         analysis_name = job.get('analysis_name')
@@ -2240,23 +2418,22 @@ def delete_analyses_for_jobs(
         if not analysis_name or not edm_name:
             errors.append(f"Invalid job info - missing analysis_name or edm: {job}")
             continue
+        analyses.append((edm_name, analysis_name))
 
-        try:
-            # Look up the analysis ID from Moody's API
-            filter_str = f'analysisName = "{analysis_name}" AND exposureName = "{edm_name}"'
-            found = irp_client.analysis.search_analyses_paginated(filter=filter_str)
+    if not analyses:
+        return errors
 
-            if not found:
-                errors.append(f"{analysis_name} ({edm_name}): Analysis not found in Moody's")
-                continue
+    from helpers.irp_integration.bulk_delete import BulkDeleteStatus
 
-            # Delete the analysis
-            analysis_id = found[0].get('analysisId')
-            irp_client.analysis.delete_analysis(analysis_id)
+    report = irp_client.bulk_delete.plan(analyses=analyses)
+    irp_client.bulk_delete.execute(report)
 
-        except Exception as e:
-            error_msg = f"{analysis_name} ({edm_name}): {e}"
-            errors.append(error_msg)
+    for target in report.targets.values():
+        label = f"{target['name']} ({target['edm_name']})"
+        if target['status'] == BulkDeleteStatus.NOT_FOUND:
+            errors.append(f"{label}: Analysis not found in Moody's")
+        elif target['status'] == BulkDeleteStatus.FAILED:
+            errors.append(f"{label}: {target['error']}")
 
     return errors
 
@@ -2269,8 +2446,8 @@ def delete_groups_for_jobs(
     Delete groups in Moody's for jobs that have existing groups.
 
     This is used during resubmission workflows when groups need to be
-    deleted before jobs can be resubmitted. The function looks up the
-    group (analysis) ID from Moody's API using the group name.
+    deleted before jobs can be resubmitted. Group (analysis) IDs are resolved
+    with batched name searches and deleted concurrently via the bulk delete engine.
 
     Note: In Moody's, groups are stored as analyses, so we use the
     analysis API to search and delete them.
@@ -2292,6 +2469,7 @@ def delete_groups_for_jobs(
         ...     print(f"{len(errors)} deletion(s) failed")
     """
     errors = []
+    groups = []
 
     for job in jobs_to_delete:
         group_name = job.get('group_name')
@@ -2299,23 +2477,21 @@ def delete_groups_for_jobs(
         if not group_name:
             errors.append(f"Invalid job info - missing group_name: {job}")
             continue
+        groups.append(group_name)
 
-        try:
-            # Look up the group (analysis) ID from Moody's API
-            # Groups are global (not scoped to an EDM), so we just search by name
-            filter_str = f'analysisName = "{group_name}"'
-            found = irp_client.analysis.search_analyses_paginated(filter=filter_str)
+    if not groups:
+        return errors
 
-            if not found:
-                errors.append(f"{group_name}: Group not found in Moody's")
-                continue
+    # Groups are global (not scoped to an EDM), so they are resolved by name only
+    from helpers.irp_integration.bulk_delete import BulkDeleteStatus
 
-            # Delete the group (which is an analysis under the hood)
-            analysis_id = found[0].get('analysisId')
-            irp_client.analysis.delete_analysis(analysis_id)
+    report = irp_client.bulk_delete.plan(groups=groups)
+    irp_client.bulk_delete.execute(report)
 
-        except Exception as e:
-            error_msg = f"{group_name}: {e}"
-            errors.append(error_msg)
+    for target in report.targets.values():
+        if target['status'] == BulkDeleteStatus.NOT_FOUND:
+            errors.append(f"{target['name']}: Group not found in Moody's")
+        elif target['status'] == BulkDeleteStatus.FAILED:
+            errors.append(f"{target['name']}: {target['error']}")
 
     return errors
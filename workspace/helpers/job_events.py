@@ -0,0 +1,165 @@
+"""
+IRP Notebook Framework - Live Job Status Events
+
+Every irp_job insert and status/skipped change is published on the PostgreSQL
+NOTIFY channel irp_job_status (trigger installed by db/reporting_views.sql).
+This module lets notebooks react to those deltas instead of repeatedly
+re-querying batches or re-running recon_batch on a timer.
+
+Key Features:
+- Stream job status events for a schema, optionally filtered to specific batches
+- Block until something changes, coalescing bursts into one list of events
+- Events carry only identifiers and the new status; re-read anything else needed
+
+Event format:
+    {'batch_id': int, 'job_id': int, 'job_configuration_id': int, 'status': str,
+     'skipped': bool, 'moodys_workflow_id': str or None, 'updated_ts': str, 'op': 'INSERT'|'UPDATE'}
+
+Workflow:
+1. watch_job_status() - Iterate over events as they arrive (until timeout)
+2. wait_for_job_status_changes() - Wait for the next burst of changes, e.g. to
+   recon only the batches that actually changed
+"""
+
+import json
+import select
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+from helpers.database import get_engine, get_current_schema
+
+
+JOB_STATUS_CHANNEL = 'irp_job_status'
+
+
+class JobEventError(Exception):
+    """Custom exception for job event listening errors"""
+    pass
+
+
+def parse_job_event(payload: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse an irp_job_status notification payload.
+
+    Args:
+        payload: JSON payload from irp_notify_job_status()
+
+    Returns:
+        Event dictionary (including 'schema'), or None if the payload is malformed
+    """
+    try:
+        event = json.loads(payload)
+    except ValueError:
+        return None
+    if not isinstance(event, dict) or 'job_id' not in event:
+        return None
+    return event
+
+
+def _event_matches(event: Dict[str, Any], schema: str, batch_ids: Optional[set]) -> bool:
+    return event.get('schema') == schema and (batch_ids is None or event.get('batch_id') in batch_ids)
+
+
+@contextmanager
+def _listen_connection():
+    """Open a dedicated autocommit connection LISTENing on the job status channel"""
+    try:
+        raw = get_engine().raw_connection()
+        conn = raw.dbapi_connection
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {JOB_STATUS_CHANNEL}")
+    except Exception as e:
+        raise JobEventError(f"Failed to listen for job status events: {str(e)}")
+
+    try:
+        yield conn
+    finally:
+        raw.close()
+
+
+def _receive(conn, deadline: Optional[float], schema: str, batch_ids: Optional[set]) -> Iterator[Dict[str, Any]]:
+    """Yield matching events from a listening connection until the monotonic deadline"""
+    while True:
+        wait = None if deadline is None else deadline - time.monotonic()
+        if wait is not None and wait <= 0:
+            return
+        if not select.select([conn], [], [], wait)[0]:
+            continue
+        conn.poll()
+        while conn.notifies:
+            event = parse_job_event(conn.notifies.pop(0).payload)
+            if event is not None and _event_matches(event, schema, batch_ids):
+                event.pop('schema')
+                yield event
+
+
+def watch_job_status(
+    batch_ids: Optional[Iterable[int]] = None,
+    timeout: Optional[float] = None,
+    schema: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield job status events as they are committed.
+
+    LISTEN starts when iteration starts; changes committed before that are not
+    replayed, so take any snapshot (e.g. read_batch) after the first next().
+
+    Args:
+        batch_ids: Only yield events for these batches (all batches when None)
+        timeout: Stop after this many seconds (run until closed when None)
+        schema: Database schema (uses context if not provided)
+
+    Yields:
+        Event dictionaries (see module docstring), without the 'schema' key
+
+    Raises:
+        JobEventError: If the listening connection cannot be opened
+    """
+    active_schema = schema if schema is not None else get_current_schema()
+    batch_ids = set(batch_ids) if batch_ids is not None else None
+    deadline = time.monotonic() + timeout if timeout is not None else None
+
+    with _listen_connection() as conn:
+        yield from _receive(conn, deadline, active_schema, batch_ids)
+
+
+def wait_for_job_status_changes(
+    batch_ids: Optional[Iterable[int]] = None,
+    timeout: float = 600,
+    settle: float = 1.0,
+    schema: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Wait for the next job status change, then collect the rest of the burst.
+
+    Args:
+        batch_ids: Only consider these batches (all batches when None)
+        timeout: Maximum seconds to wait for the first event
+        settle: After the first event, keep collecting for this many seconds
+        schema: Database schema (uses context if not provided)
+
+    Returns:
+        List of events in commit order (empty if nothing changed before timeout)
+
+    Raises:
+        JobEventError: If the listening connection cannot be opened
+
+    Example:
+        >>> events = wait_for_job_status_changes(batch_ids=[12, 13], timeout=300)
+        >>> for batch_id in {e['batch_id'] for e in events}:
+        ...     recon_batch(batch_id)
+    """
+    active_schema = schema if schema is not None else get_current_schema()
+    batch_ids = set(batch_ids) if batch_ids is not None else None
+
+    events = []
+    with _listen_connection() as conn:
+        for event in _receive(conn, time.monotonic() + timeout, active_schema, batch_ids):
+            events.append(event)
+            break
+        if events:
+            events.extend(_receive(conn, time.monotonic() + settle, active_schema, batch_ids))
+
+    return events
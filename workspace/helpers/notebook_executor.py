@@ -1,16 +1,39 @@
 """
 Notebook execution engine for automatic step chaining.
 
-This module provides functionality to programmatically execute Jupyter notebooks
-using nbconvert, enabling automated workflow execution.
+This module provides functionality to programmatically execute Jupyter notebooks,
+enabling automated workflow execution.
+
+Backends (NOTEBOOK_EXECUTION_BACKEND):
+- nbconvert (default): `jupyter nbconvert --execute --inplace` subprocess per notebook.
+  Chained steps are started from notebooks and scheduled jobs that exit when the step
+  is done, so a kernel pool would not outlive a single run there.
+- kernel_pool (opt-in): notebooks run through nbclient on a small pool of pre-warmed
+  kernels that already have pandas/sqlalchemy/boto3/helpers imported. Only useful in
+  a long-lived orchestrator process (e.g. one driving execute_ready_steps) that calls
+  prewarm_kernel_pool() once and runs many steps. The user namespace, schema context
+  and working directory are reset before every run; kernels are retired after
+  NOTEBOOK_KERNEL_MAX_RUNS runs or any timeout/crash. Notebooks marked isolated,
+  notebooks started from inside a pooled kernel (which would otherwise build a
+  nested, cold pool) and runs where nbclient is unavailable use nbconvert.
 """
 
+import atexit
+import os
 import subprocess
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
+from helpers.constants import (
+    NotebookExecutionBackend, NOTEBOOK_EXECUTION_BACKEND,
+    NOTEBOOK_KERNEL_POOL_SIZE, NOTEBOOK_KERNEL_MAX_RUNS, WORKSPACE_PATH
+)
+from helpers.tracing import traced
+
 logger = logging.getLogger(__name__)
 
 
@@ -114,28 +137,338 @@ class NotebookExecutionError(Exception):
     pass
 
 
+class KernelPoolUnavailable(Exception):
+    """Raised when the kernel pool cannot run a notebook (caller falls back to nbconvert)."""
+    pass
+
+
+# ============================================================================
+# KERNEL POOL
+# ============================================================================
+
+# Modules imported into every pooled kernel before its first notebook
+WARM_MODULES = (
+    'pandas', 'numpy', 'sqlalchemy', 'boto3',
+    'helpers.database', 'helpers.context', 'helpers.ux', 'helpers.step',
+    'helpers.batch', 'helpers.job', 'helpers.irp_integration'
+)
+
+KERNEL_STARTUP_TIMEOUT = 120
+
+# Set in every pooled kernel so notebooks it runs do not start a pool of their own
+POOLED_KERNEL_ENV = 'IRP_POOLED_KERNEL'
+
+_KERNEL_WARMUP_CODE = """
+def _irp_warm_kernel(workspace, modules):
+    import os, sys
+    os.environ[{pooled_env!r}] = '1'
+    if workspace not in sys.path:
+        sys.path.insert(0, workspace)
+    for module in modules:
+        try:
+            __import__(module)
+        except Exception:
+            pass
+
+_irp_warm_kernel({workspace!r}, {modules!r})
+del _irp_warm_kernel
+"""
+
+# Clears the previous notebook's variables but keeps imported modules (the warm part),
+# restores the schema context a fresh import would have, forgets cached WorkContexts
+# and moves to the notebook's directory
+_KERNEL_RESET_CODE = """
+get_ipython().run_line_magic('reset', '-f')
+import os as _os, sys as _sys
+if 'helpers.database' in _sys.modules:
+    _sys.modules['helpers.database'].reset_schema()
+    _sys.modules['helpers.database'].init_from_environment()
+if 'helpers.context' in _sys.modules:
+    _sys.modules['helpers.context'].invalidate_context_cache()
+_os.chdir({cwd!r})
+del _os, _sys
+"""
+
+
+def _run_kernel_code(km, code: str, timeout: float) -> None:
+    """Run setup code on a kernel, raising RuntimeError if it does not complete cleanly."""
+    kc = km.client()
+    kc.start_channels()
+    try:
+        kc.wait_for_ready(timeout=timeout)
+        reply = kc.execute_interactive(code, store_history=False, timeout=timeout, output_hook=lambda msg: None)
+        if reply['content']['status'] != 'ok':
+            raise RuntimeError(f"{reply['content'].get('ename')}: {reply['content'].get('evalue')}")
+    finally:
+        kc.stop_channels()
+
+
+class PooledKernel:
+    """A running kernel owned by the pool."""
+
+    def __init__(self, km):
+        self.km = km
+        self.runs = 0
+
+    def is_alive(self) -> bool:
+        try:
+            return self.km.is_alive()
+        except Exception:
+            return False
+
+    def shutdown(self) -> None:
+        try:
+            self.km.shutdown_kernel(now=True)
+        except Exception as e:
+            logger.debug(f"Kernel shutdown failed: {e}")
+
+
+class KernelPool:
+    """
+    Pool of pre-warmed IPython kernels reused across notebook runs.
+
+    acquire() hands out an idle kernel (or starts one when none is idle) after
+    resetting it for the notebook's directory; release() returns it to the pool
+    or retires it. Retired kernels are replaced in the background so the next
+    chained step finds a warm kernel.
+    """
+
+    def __init__(
+        self,
+        size: int = NOTEBOOK_KERNEL_POOL_SIZE,
+        max_runs: int = NOTEBOOK_KERNEL_MAX_RUNS,
+        kernel_name: str = 'python3',
+        warm_modules: Tuple[str, ...] = WARM_MODULES
+    ):
+        from jupyter_client import KernelManager  # noqa: F401 - fail early if unavailable
+
+        self.size = max(size, 0)
+        self.max_runs = max_runs
+        self.kernel_name = kernel_name
+        self.warm_modules = warm_modules
+        self._idle: List[PooledKernel] = []
+        self._warming = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self.kernels_started = 0
+        self.warm_acquires = 0
+        self.cold_acquires = 0
+
+    def _start_kernel(self) -> PooledKernel:
+        from jupyter_client import KernelManager
+
+        km = KernelManager(kernel_name=self.kernel_name)
+        km.start_kernel(cwd=str(WORKSPACE_PATH))
+        kernel = PooledKernel(km)
+        try:
+            _run_kernel_code(
+                km,
+                _KERNEL_WARMUP_CODE.format(
+                    workspace=str(WORKSPACE_PATH), modules=self.warm_modules, pooled_env=POOLED_KERNEL_ENV
+                ),
+                timeout=KERNEL_STARTUP_TIMEOUT
+            )
+        except Exception:
+            kernel.shutdown()
+            raise
+        with self._lock:
+            self.kernels_started += 1
+        return kernel
+
+    def _prewarm_worker(self, count: int) -> None:
+        for _ in range(count):
+            try:
+                kernel = self._start_kernel()
+            except Exception as e:
+                logger.warning(f"Failed to pre-warm kernel: {e}")
+                with self._lock:
+                    self._warming -= 1
+                continue
+            with self._lock:
+                self._warming -= 1
+                if self._closed or len(self._idle) >= self.size:
+                    retire = True
+                else:
+                    self._idle.append(kernel)
+                    retire = False
+            if retire:
+                kernel.shutdown()
+
+    def prewarm(self, wait: bool = False) -> None:
+        """Start kernels until size kernels are idle or warming (in the background unless wait)."""
+        with self._lock:
+            count = self.size - len(self._idle) - self._warming
+            if self._closed or count <= 0:
+                return
+            self._warming += count
+        if wait:
+            self._prewarm_worker(count)
+        else:
+            threading.Thread(target=self._prewarm_worker, args=(count,), daemon=True).start()
+
+    def acquire(self, cwd: Path) -> Tuple[PooledKernel, bool]:
+        """
+        Get a kernel reset for a notebook in cwd.
+
+        Returns:
+            (kernel, warm) - warm is False when a kernel had to be started for this call
+
+        Raises:
+            KernelPoolUnavailable: If no kernel could be started or reset
+        """
+        reset_code = _KERNEL_RESET_CODE.format(cwd=str(cwd))
+        while True:
+            with self._lock:
+                kernel = self._idle.pop() if self._idle else None
+            if kernel is None:
+                break
+            try:
+                _run_kernel_code(kernel.km, reset_code, timeout=KERNEL_STARTUP_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"Discarding pooled kernel that failed to reset: {e}")
+                kernel.shutdown()
+                continue
+            with self._lock:
+                self.warm_acquires += 1
+            return kernel, True
+
+        try:
+            kernel = self._start_kernel()
+            _run_kernel_code(kernel.km, reset_code, timeout=KERNEL_STARTUP_TIMEOUT)
+        except Exception as e:
+            raise KernelPoolUnavailable(f"Could not start a kernel: {e}")
+        with self._lock:
+            self.cold_acquires += 1
+        return kernel, False
+
+    def release(self, kernel: PooledKernel, reusable: bool = True) -> None:
+        """Return a kernel after a run; it is retired if not reusable, worn out, dead or surplus."""
+        kernel.runs += 1
+        keep = reusable and kernel.runs < self.max_runs and kernel.is_alive()
+        if keep:
+            with self._lock:
+                if not self._closed and len(self._idle) < self.size:
+                    self._idle.append(kernel)
+                    return
+        kernel.shutdown()
+        self.prewarm()
+
+    def shutdown(self) -> None:
+        """Shut down all idle kernels and stop pre-warming."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for kernel in idle:
+            kernel.shutdown()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'idle': len(self._idle),
+                'warming': self._warming,
+                'kernels_started': self.kernels_started,
+                'warm_acquires': self.warm_acquires,
+                'cold_acquires': self.cold_acquires
+            }
+
+
+_kernel_pool: Optional[KernelPool] = None
+_kernel_pool_lock = threading.Lock()
+
+
+def get_kernel_pool() -> KernelPool:
+    """
+    Get the process-wide kernel pool, creating it on first use.
+
+    Raises:
+        KernelPoolUnavailable: If nbclient/jupyter_client are not installed
+    """
+    global _kernel_pool
+    with _kernel_pool_lock:
+        if _kernel_pool is None:
+            try:
+                import nbclient  # noqa: F401
+                _kernel_pool = KernelPool()
+            except ImportError as e:
+                raise KernelPoolUnavailable(f"nbclient is not installed: {e}")
+            atexit.register(shutdown_kernel_pool)
+        return _kernel_pool
+
+
+def prewarm_kernel_pool(wait: bool = False) -> bool:
+    """
+    Start the kernel pool ahead of a chain of notebook runs.
+
+    Args:
+        wait: Block until the kernels are warm
+
+    Returns:
+        True if the kernel pool backend is available
+    """
+    try:
+        get_kernel_pool().prewarm(wait=wait)
+        return True
+    except KernelPoolUnavailable as e:
+        logger.warning(f"Kernel pool unavailable, notebooks will run via nbconvert: {e}")
+        return False
+
+
+def shutdown_kernel_pool() -> None:
+    """Shut down all pooled kernels (registered with atexit)."""
+    global _kernel_pool
+    with _kernel_pool_lock:
+        pool, _kernel_pool = _kernel_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def _requires_isolation(notebook_path: Path) -> bool:
+    """True if the notebook's metadata asks for a fresh process ("isolated_execution": true)."""
+    import nbformat
+
+    try:
+        nb = nbformat.read(str(notebook_path), as_version=4)
+    except Exception:
+        return False
+    return bool(nb.metadata.get('isolated_execution', False))
+
+
+# ============================================================================
+# EXECUTION
+# ============================================================================
+
+@traced('notebook.execute', describe=lambda notebook_path, *args, **kwargs: {'notebook': str(notebook_path)})
 def execute_notebook(
     notebook_path: Path,
     timeout: int = 3600,
-    cwd: Optional[Path] = None
+    cwd: Optional[Path] = None,
+    isolated: Optional[bool] = None
 ) -> Dict[str, Any]:
     """
-    Execute a Jupyter notebook using nbconvert.
+    Execute a Jupyter notebook in place, preserving outputs and execution metadata.
 
-    This function runs a notebook in-place, preserving outputs and execution metadata.
-    The notebook is executed in its parent directory to ensure proper relative path resolution.
+    The notebook is executed in its parent directory to ensure proper relative path
+    resolution. By default it runs via nbconvert; with NOTEBOOK_EXECUTION_BACKEND=kernel_pool
+    (or isolated=False) it runs on a pre-warmed pooled kernel (see module docstring).
 
     Args:
         notebook_path: Path to the notebook file to execute
         timeout: Maximum execution time in seconds (default: 3600 = 1 hour)
         cwd: Working directory for execution (default: notebook's parent directory)
+        isolated: Run in a fresh nbconvert process. None (default) uses the notebook's
+                  "isolated_execution" metadata and NOTEBOOK_EXECUTION_BACKEND; False asks
+                  for the kernel pool regardless of the backend setting.
 
     Returns:
         Dictionary with execution results:
         {
             'success': bool,
             'notebook_path': Path,
-            'execution_time': float,
+            'backend': 'kernel_pool' or 'nbconvert',
+            'execution_time': float (total wall time),
+            'startup_time': float or None (kernel acquisition/reset; None for nbconvert),
+            'run_time': float or None (notebook cells; None for nbconvert),
+            'warm_kernel': bool or None (whether a pre-warmed kernel was used),
             'started_at': datetime,
             'completed_at': datetime,
             'stdout': str,
@@ -145,7 +478,6 @@ def execute_notebook(
 
     Raises:
         FileNotFoundError: If notebook file does not exist
-        NotebookExecutionError: If execution fails
     """
     if not notebook_path.exists():
         raise FileNotFoundError(f"Notebook not found: {notebook_path}")
@@ -154,6 +486,112 @@ def execute_notebook(
     if cwd is None:
         cwd = notebook_path.parent
 
+    if isolated is None:
+        isolated = NOTEBOOK_EXECUTION_BACKEND != NotebookExecutionBackend.KERNEL_POOL
+
+    if not isolated and os.environ.get(POOLED_KERNEL_ENV):
+        logger.info("Already running in a pooled kernel, executing via nbconvert instead of a nested pool")
+        isolated = True
+
+    if not isolated:
+        try:
+            if not _requires_isolation(notebook_path):
+                return _execute_with_kernel_pool(notebook_path, timeout, cwd)
+        except (KernelPoolUnavailable, ImportError) as e:
+            logger.warning(f"Kernel pool unavailable, falling back to nbconvert: {e}")
+
+    return _execute_with_nbconvert(notebook_path, timeout, cwd)
+
+
+def _execute_with_kernel_pool(notebook_path: Path, timeout: int, cwd: Path) -> Dict[str, Any]:
+    """
+    Execute a notebook through nbclient on a pooled kernel.
+
+    Raises:
+        KernelPoolUnavailable: If no kernel could be acquired (nothing has run yet)
+    """
+    import nbformat
+    from nbclient import NotebookClient
+    from nbclient.exceptions import CellExecutionError, CellTimeoutError, DeadKernelError
+
+    pool = get_kernel_pool()
+
+    logger.info(f"Executing notebook on pooled kernel: {notebook_path}")
+    started_at = datetime.now()
+    start = time.monotonic()
+
+    try:
+        nb = nbformat.read(str(notebook_path), as_version=4)
+    except Exception as e:
+        # Let nbconvert report the unreadable notebook through the usual failure path
+        raise KernelPoolUnavailable(f"Could not read notebook: {e}")
+    kernel, warm = pool.acquire(cwd)
+    startup_time = time.monotonic() - start
+
+    def result(success: bool, error: Optional[str]) -> Dict[str, Any]:
+        completed_at = datetime.now()
+        return {
+            'success': success,
+            'notebook_path': notebook_path,
+            'backend': NotebookExecutionBackend.KERNEL_POOL,
+            'execution_time': (completed_at - started_at).total_seconds(),
+            'startup_time': startup_time,
+            'run_time': time.monotonic() - start - startup_time,
+            'warm_kernel': warm,
+            'started_at': started_at,
+            'completed_at': completed_at,
+            'stdout': '',
+            'stderr': '',
+            'error': error
+        }
+
+    reusable = True
+    try:
+        client = NotebookClient(nb, km=kernel.km, timeout=timeout, kernel_name=pool.kernel_name)
+        try:
+            client.execute()
+        finally:
+            if client.kc is not None:
+                client.kc.stop_channels()
+
+        nbformat.write(nb, str(notebook_path))
+        outcome = result(True, None)
+        logger.info(
+            f"Notebook execution completed successfully: {notebook_path} "
+            f"(startup: {outcome['startup_time']:.2f}s {'warm' if warm else 'cold'} kernel, "
+            f"run: {outcome['run_time']:.2f}s)"
+        )
+        return outcome
+
+    except CellTimeoutError as e:
+        # The kernel may still be busy with the timed-out cell
+        reusable = False
+        error_msg = f"Notebook execution timed out after {timeout}s: {notebook_path}\n{e}"
+
+    except CellExecutionError as e:
+        error_msg = f"Notebook execution failed: {notebook_path}\n{e}"
+
+    except DeadKernelError as e:
+        reusable = False
+        error_msg = f"Notebook execution failed, kernel died: {notebook_path}\n{e}"
+
+    except Exception as e:
+        reusable = False
+        error_msg = f"Unexpected error executing notebook {notebook_path}: {str(e)}"
+
+    finally:
+        pool.release(kernel, reusable=reusable)
+
+    logger.error(error_msg)
+
+    # Send Teams notification for failure and mark step as failed
+    _handle_notebook_failure(notebook_path, error_msg)
+
+    return result(False, error_msg)
+
+
+def _execute_with_nbconvert(notebook_path: Path, timeout: int, cwd: Path) -> Dict[str, Any]:
+    """Execute a notebook in a fresh `jupyter nbconvert` process."""
     # Build nbconvert command
     # --execute: Execute the notebook
     # --to notebook: Output as notebook format
@@ -197,7 +635,11 @@ def execute_notebook(
         return {
             'success': True,
             'notebook_path': notebook_path,
+            'backend': NotebookExecutionBackend.NBCONVERT,
             'execution_time': execution_time,
+            'startup_time': None,
+            'run_time': None,
+            'warm_kernel': None,
             'started_at': started_at,
             'completed_at': completed_at,
             'stdout': result.stdout,
@@ -224,7 +666,11 @@ def execute_notebook(
         return {
             'success': False,
             'notebook_path': notebook_path,
+            'backend': NotebookExecutionBackend.NBCONVERT,
             'execution_time': execution_time,
+            'startup_time': None,
+            'run_time': None,
+            'warm_kernel': None,
             'started_at': started_at,
             'completed_at': completed_at,
             'stdout': e.stdout,
@@ -250,7 +696,11 @@ def execute_notebook(
         return {
             'success': False,
             'notebook_path': notebook_path,
+            'backend': NotebookExecutionBackend.NBCONVERT,
             'execution_time': execution_time,
+            'startup_time': None,
+            'run_time': None,
+            'warm_kernel': None,
             'started_at': started_at,
             'completed_at': completed_at,
             'stdout': e.stdout if e.stdout else '',
@@ -271,7 +721,11 @@ def execute_notebook(
         return {
             'success': False,
             'notebook_path': notebook_path,
+            'backend': NotebookExecutionBackend.NBCONVERT,
             'execution_time': execution_time,
+            'startup_time': None,
+            'run_time': None,
+            'warm_kernel': None,
             'started_at': started_at,
             'completed_at': completed_at,
             'stdout': '',
@@ -311,10 +765,10 @@ def execute_next_step(
     result = execute_notebook(notebook_path, timeout=timeout)
 
     if result['success']:
-        logger.info(
-            f"Step {step_num:02d} auto-execution completed successfully "
-            f"(execution time: {result['execution_time']:.2f}s)"
-        )
+        timing = f"execution time: {result['execution_time']:.2f}s"
+        if result.get('startup_time') is not None:
+            timing += f", kernel startup: {result['startup_time']:.2f}s, run: {result['run_time']:.2f}s"
+        logger.info(f"Step {step_num:02d} auto-execution completed successfully ({timing})")
     else:
         logger.error(
             f"Step {step_num:02d} auto-execution failed: {result['error']}"
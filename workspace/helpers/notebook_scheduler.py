@@ -5,40 +5,147 @@ The JupyterLab scheduler stores jobs in a SQLite database at:
 
 Downloaded job outputs are stored in:
     /jovyan/home/
+
+One engine is kept per database URL, and the first use adds indexes on
+jobs (status, create_time) and (create_time) for the listing and cleanup
+queries. Downloaded output directories are tracked in a manifest file in the
+jobs output directory, so orphan detection only looks at directories that are
+new or changed since the last scan.
 """
 
+import json
 import os
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 from jupyter_core.paths import jupyter_data_dir
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
 
+# Indexes added to the scheduler's jobs table (IF NOT EXISTS, so safe to re-run)
+JOB_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_jobs_status_create_time ON jobs (status, create_time)",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_create_time ON jobs (create_time)",
+]
+
+# Job IDs per DELETE / IN-list (below SQLite's default 999 bound parameters)
+DELETE_BATCH_SIZE = 500
+
+# Manifest of downloaded output directories, kept in the jobs output directory
+OUTPUT_MANIFEST_NAME = '.output_manifest.json'
+
+_engines: Dict[str, Engine] = {}
+_indexed_urls = set()
+_engines_lock = threading.Lock()
+
+
 # Default database URL for JupyterLab scheduler
 def get_default_db_url() -> str:
     """Get the default JupyterLab scheduler database URL."""
     return f"sqlite:///{jupyter_data_dir()}/scheduler.sqlite"
 
 
-def get_db_session(db_url: Optional[str] = None):
+def _ensure_job_indexes(engine: Engine) -> bool:
     """
-    Create a database session for the scheduler database.
+    Create JOB_INDEXES on the jobs table.
+
+    Returns:
+        True if the indexes exist, False if the jobs table does not exist yet
+        (the scheduler creates it on first start) or the database is locked
+    """
+    try:
+        if not inspect(engine).has_table('jobs'):
+            return False
+        with engine.begin() as conn:
+            for statement in JOB_INDEXES:
+                conn.execute(text(statement))
+        return True
+    except Exception as e:
+        print(f"Warning: Could not create scheduler job indexes: {e}")
+        return False
+
+
+def get_engine(db_url: Optional[str] = None) -> Engine:
+    """
+    Get the engine for the scheduler database, created once per URL.
+
+    The job indexes are created on first use (retried on later calls until the
+    jobs table exists).
 
     Args:
         db_url: Database URL. If None, uses default JupyterLab location.
 
     Returns:
-        SQLAlchemy session factory
+        SQLAlchemy engine
     """
     if db_url is None:
         db_url = get_default_db_url()
 
-    engine = create_engine(db_url, echo=False)
-    Session = sessionmaker(bind=engine)
-    return Session
+    with _engines_lock:
+        engine = _engines.get(db_url)
+        if engine is None:
+            engine = create_engine(db_url, echo=False)
+            _engines[db_url] = engine
+        if db_url not in _indexed_urls and _ensure_job_indexes(engine):
+            _indexed_urls.add(db_url)
+    return engine
+
+
+def dispose_engines() -> None:
+    """Close all cached scheduler database engines (e.g. after the database file is replaced)."""
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _indexed_urls.clear()
+
+
+def get_db_session(db_url: Optional[str] = None):
+    """
+    Create a database session for the scheduler database.
+
+    Args:
+        db_url: Database URL. If None, uses default JupyterLab location.
+
+    Returns:
+        SQLAlchemy session factory (bound to the cached engine)
+    """
+    return sessionmaker(bind=get_engine(db_url))
+
+
+def _batches(items: List[Any], size: int = DELETE_BATCH_SIZE):
+    """Yield consecutive slices of items with at most size elements."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _directory_usage(path) -> Tuple[int, int]:
+    """
+    Measure a directory tree.
+
+    Returns:
+        (total size of files in bytes, number of entries) - entries counts files
+        and subdirectories, as rglob('*') does
+    """
+    size_bytes = 0
+    entry_count = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    entry_count += 1
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        size_bytes += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return size_bytes, entry_count
 
 
 
@@ -174,6 +281,7 @@ def cleanup_old_jobs(
         - oldest_job_date: Date of oldest job found for cleanup
         - newest_job_date: Date of newest job found for cleanup
         - staging_files_deleted: Number of staging directories deleted
+        - staging_bytes_reclaimed: Disk space freed by deleting staging directories
         - dry_run: Whether this was a dry run
         - message: Summary message
 
@@ -185,12 +293,13 @@ def cleanup_old_jobs(
         >>> # Actually delete
         >>> result = cleanup_old_jobs(days_threshold=30, dry_run=False)
         >>> print(f"Deleted {result['jobs_count']} jobs")
+
+    Jobs are deleted in batches of DELETE_BATCH_SIZE (staging directories, then
+    database rows, committed per batch), so the scheduler database is never
+    locked for the whole cleanup.
     """
     import shutil
 
-    if db_url is None:
-        db_url = get_default_db_url()
-
     # Calculate threshold timestamp (Unix timestamp in milliseconds)
     threshold_date = datetime.utcnow() - timedelta(days=days_threshold)
     threshold_ts = int(threshold_date.timestamp() * 1000)  # Scheduler uses ms
@@ -216,6 +325,7 @@ def cleanup_old_jobs(
                 'oldest_job_date': None,
                 'newest_job_date': None,
                 'staging_files_deleted': 0,
+                'staging_bytes_reclaimed': 0,
                 'dry_run': dry_run,
                 'days_threshold': days_threshold,
                 'message': f'No jobs older than {days_threshold} days found'
@@ -238,6 +348,7 @@ def cleanup_old_jobs(
             'oldest_job_date': oldest_date,
             'newest_job_date': newest_date,
             'staging_files_deleted': 0,
+            'staging_bytes_reclaimed': 0,
             'dry_run': dry_run,
             'days_threshold': days_threshold
         }
@@ -246,33 +357,136 @@ def cleanup_old_jobs(
             result_info['message'] = f'Dry run. Detected {len(job_ids)} jobs for deletion.'
             return result_info
 
-        # Delete staging files if requested
+        # List the staging area once instead of checking each job's directory
+        staging_path = os.path.join(jupyter_data_dir(), "scheduler_staging_area")
+        staging_dirs = set()
+        if delete_staging_files and os.path.isdir(staging_path):
+            with os.scandir(staging_path) as entries:
+                staging_dirs = {entry.name for entry in entries if entry.is_dir(follow_symlinks=False)}
+
         staging_deleted = 0
-        if delete_staging_files:
-            staging_path = os.path.join(jupyter_data_dir(), "scheduler_staging_area")
-            for job_id in job_ids:
+        bytes_reclaimed = 0
+        for batch_ids in _batches(job_ids):
+            # Delete staging files if requested
+            for job_id in batch_ids:
+                if job_id not in staging_dirs:
+                    continue
                 job_staging_dir = os.path.join(staging_path, job_id)
-                if os.path.exists(job_staging_dir):
-                    try:
-                        shutil.rmtree(job_staging_dir)
-                        staging_deleted += 1
-                    except Exception as e:
-                        print(f"Warning: Could not delete staging dir for job {job_id}: {e}")
-
-        # Delete jobs from database
-        delete_query = text("""
-            DELETE FROM jobs
-            WHERE create_time < :threshold
-        """)
-        session.execute(delete_query, {"threshold": threshold_ts})
-        session.commit()
+                size_bytes, _ = _directory_usage(job_staging_dir)
+                try:
+                    shutil.rmtree(job_staging_dir)
+                    staging_deleted += 1
+                    bytes_reclaimed += size_bytes
+                except Exception as e:
+                    print(f"Warning: Could not delete staging dir for job {job_id}: {e}")
+
+            # Delete jobs from database
+            placeholders = ', '.join(f':id{i}' for i in range(len(batch_ids)))
+            delete_query = text(f"DELETE FROM jobs WHERE job_id IN ({placeholders})")
+            session.execute(delete_query, {f'id{i}': job_id for i, job_id in enumerate(batch_ids)})
+            session.commit()
 
         result_info['staging_files_deleted'] = staging_deleted
-        result_info['message'] = f'Successfully deleted {len(job_ids)} jobs and {staging_deleted} staging directories'
+        result_info['staging_bytes_reclaimed'] = bytes_reclaimed
+        result_info['message'] = (
+            f'Successfully deleted {len(job_ids)} jobs and {staging_deleted} staging directories '
+            f'({bytes_reclaimed / 1024 / 1024:.2f} MB reclaimed)'
+        )
 
         return result_info
     
 
+def _job_id_from_output_dir(name: str) -> Optional[str]:
+    """
+    Extract the job_id from a downloaded output directory name.
+
+    The format is notebook_name-job_id, where job_id is a UUID like
+    "abc12345-def6-7890-ghij-klmnopqrstuv" (5 parts separated by -).
+    """
+    name_parts = name.rsplit('-', 5)
+    if len(name_parts) >= 5:
+        # Reconstruct the job_id (last 5 parts)
+        return '-'.join(name_parts[-5:])
+    return None
+
+
+def refresh_output_manifest(jobs_output_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Bring the manifest of downloaded output directories up to date.
+
+    The manifest records each directory's job_id, size, entry count and
+    modification time. A scan is incremental:
+    - If the jobs output directory itself is unmodified since the last scan, no
+      directory was added or removed and the manifest is returned as-is
+    - Otherwise it is listed once; only new directories, or directories whose
+      modification time changed, are measured
+
+    Output directories are written once when downloaded, so a directory's own
+    modification time is used to detect changes (changes deep inside it are
+    not picked up).
+
+    Args:
+        jobs_output_dir: Directory containing downloaded job outputs
+
+    Returns:
+        Dictionary of directory name -> {'job_id', 'size_bytes', 'file_count', 'mtime_ns'}
+    """
+    jobs_output_dir = Path(jobs_output_dir)
+    manifest_path = jobs_output_dir / OUTPUT_MANIFEST_NAME
+
+    manifest = {}
+    if manifest_path.exists():
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read output manifest, rebuilding it: {e}")
+    else:
+        # Create it before reading the directory's mtime (creating a file changes it)
+        manifest_path.touch()
+
+    directory_mtime_ns = jobs_output_dir.stat().st_mtime_ns
+    if manifest.get('directory_mtime_ns') == directory_mtime_ns:
+        return manifest['entries']
+
+    known = manifest.get('entries', {})
+    entries = {}
+    with os.scandir(jobs_output_dir) as listing:
+        for entry in listing:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            mtime_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+            previous = known.get(entry.name)
+            if previous is not None and previous['mtime_ns'] == mtime_ns:
+                entries[entry.name] = previous
+                continue
+            size_bytes, file_count = _directory_usage(entry.path)
+            entries[entry.name] = {
+                'job_id': _job_id_from_output_dir(entry.name),
+                'size_bytes': size_bytes,
+                'file_count': file_count,
+                'mtime_ns': mtime_ns,
+            }
+
+    _save_output_manifest(jobs_output_dir, entries, directory_mtime_ns)
+    return entries
+
+
+def _save_output_manifest(
+    jobs_output_dir: Path,
+    entries: Dict[str, Dict[str, Any]],
+    directory_mtime_ns: Optional[int]
+) -> None:
+    """
+    Write the manifest in place.
+
+    directory_mtime_ns is the jobs output directory's mtime read before it was
+    listed (None forces the next refresh to list it again). Rewriting an existing
+    file leaves the directory's mtime unchanged; an unreadable manifest is rebuilt.
+    """
+    manifest = {'directory_mtime_ns': directory_mtime_ns, 'entries': entries}
+    (jobs_output_dir / OUTPUT_MANIFEST_NAME).write_text(json.dumps(manifest))
+
+
 def get_downloaded_output_directory():
     """
     Get information about downloaded job output directories."""
@@ -280,29 +494,24 @@ def get_downloaded_output_directory():
     jobs_output_dir = jupyter_home / "jobs"
 
     if jobs_output_dir.exists():
-        # List all downloaded job output directories
-        output_dirs = sorted(jobs_output_dir.iterdir(), key=lambda x: x.stat().st_mtime, reverse=True)
+        # Sizes and counts come from the manifest; only new/changed directories are measured
+        entries = refresh_output_manifest(jobs_output_dir)
 
         directories = []
         total_size = 0
-        for d in output_dirs:
-            if d.is_dir():
-                # Calculate directory size
-                dir_size = sum(f.stat().st_size for f in d.rglob('*') if f.is_file())
-                total_size += dir_size
-
-                # Get modification time
-                mtime = datetime.fromtimestamp(d.stat().st_mtime).strftime('%Y-%m-%d %H:%M')
-
-                # Count files
-                file_count = len(list(d.rglob('*')))
-
-                directories.append({
-                    'directory': str(d),
-                    'size': f"{dir_size / 1024:.1f} KB",
-                    'file_count': file_count,
-                    'modified': mtime
-                })
+        for name, entry in sorted(entries.items(), key=lambda item: item[1]['mtime_ns'], reverse=True):
+            dir_size = entry['size_bytes']
+            total_size += dir_size
+
+            # Get modification time
+            mtime = datetime.fromtimestamp(entry['mtime_ns'] / 1e9).strftime('%Y-%m-%d %H:%M')
+
+            directories.append({
+                'directory': str(jobs_output_dir / name),
+                'size': f"{dir_size / 1024:.1f} KB",
+                'file_count': entry['file_count'],
+                'modified': mtime
+            })
 
         print(f"\nTotal size: {total_size / 1024 / 1024:.2f} MB")
 
@@ -315,30 +524,104 @@ def get_downloaded_output_directory():
         raise FileNotFoundError(f"Jobs output directory does not exist: {jobs_output_dir}")
 
 
-def find_orphaned_outputs(jobs_output_dir: Path) -> list:
+def _existing_job_ids(job_ids: List[str], db_url: Optional[str] = None) -> set:
+    """Return the subset of job_ids still present in the scheduler database."""
+    existing = set()
+    Session = get_db_session(db_url)
+    with Session() as session:
+        for batch_ids in _batches(job_ids):
+            placeholders = ', '.join(f':id{i}' for i in range(len(batch_ids)))
+            query = text(f"SELECT job_id FROM jobs WHERE job_id IN ({placeholders})")
+            result = session.execute(query, {f'id{i}': job_id for i, job_id in enumerate(batch_ids)})
+            existing.update(row[0] for row in result.fetchall())
+    return existing
+
+
+def find_orphaned_outputs(jobs_output_dir: Path, db_url: Optional[str] = None) -> list:
     """
     Find downloaded output directories for jobs that no longer exist in the database.
-    
+
+    Uses the output manifest (see refresh_output_manifest) and only looks up
+    the manifest's job IDs in the database.
+
+    Args:
+        jobs_output_dir: Directory containing downloaded job outputs
+        db_url: Database URL. If None, uses default.
+
     Returns:
         List of (directory_path, job_id) tuples for orphaned directories
     """
+    jobs_output_dir = Path(jobs_output_dir)
     if not jobs_output_dir.exists():
         return []
-    
-    # Get all job IDs from database
-    all_jobs = list_jobs(limit=1000000)  # Get all jobs
-    existing_job_ids = {job['job_id'] for job in all_jobs}
-    
-    orphaned = []
-    for d in jobs_output_dir.iterdir():
-        if d.is_dir():
-            # Extract job_id from directory name (format: notebook_name-job_id)
-            # The job_id is a UUID like "abc12345-def6-7890-ghij-klmnopqrstuv"
-            name_parts = d.name.rsplit('-', 5)  # UUID has 5 parts separated by -
-            if len(name_parts) >= 5:
-                # Reconstruct the job_id (last 5 parts)
-                job_id = '-'.join(name_parts[-5:])
-                if job_id not in existing_job_ids:
-                    orphaned.append((d, job_id))
-    
-    return orphaned
\ No newline at end of file
+
+    entries = refresh_output_manifest(jobs_output_dir)
+    job_ids = sorted({entry['job_id'] for entry in entries.values() if entry['job_id']})
+    existing_job_ids = _existing_job_ids(job_ids, db_url)
+
+    return [
+        (jobs_output_dir / name, entry['job_id'])
+        for name, entry in sorted(entries.items())
+        if entry['job_id'] and entry['job_id'] not in existing_job_ids
+    ]
+
+
+def delete_orphaned_outputs(
+    jobs_output_dir: Path,
+    dry_run: bool = True,
+    db_url: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Delete downloaded output directories for jobs that no longer exist in the database.
+
+    Args:
+        jobs_output_dir: Directory containing downloaded job outputs
+        dry_run: If True, returns what would be deleted without actually deleting.
+        db_url: Database URL. If None, uses default.
+
+    Returns:
+        Dictionary with cleanup results:
+        - directories_count: Number of orphaned directories deleted (or would be deleted)
+        - directories: List of orphaned directory paths
+        - bytes_reclaimed: Disk space freed (or that would be freed)
+        - dry_run: Whether this was a dry run
+        - message: Summary message
+    """
+    import shutil
+
+    jobs_output_dir = Path(jobs_output_dir)
+    orphaned = find_orphaned_outputs(jobs_output_dir, db_url)
+    entries = refresh_output_manifest(jobs_output_dir) if orphaned else {}
+
+    deleted = []
+    bytes_reclaimed = 0
+    for directory, job_id in orphaned:
+        if not dry_run:
+            try:
+                shutil.rmtree(directory)
+            except Exception as e:
+                print(f"Warning: Could not delete output dir for job {job_id}: {e}")
+                continue
+        deleted.append(str(directory))
+        bytes_reclaimed += entries[directory.name]['size_bytes']
+
+    if not dry_run and deleted:
+        for directory in deleted:
+            entries.pop(Path(directory).name, None)
+        # Deleting changed the directory's mtime; the next refresh re-lists it
+        # (reusing the recorded sizes)
+        _save_output_manifest(jobs_output_dir, entries, None)
+
+    size_mb = bytes_reclaimed / 1024 / 1024
+    if dry_run:
+        message = f'Dry run. Detected {len(deleted)} orphaned output directories ({size_mb:.2f} MB).'
+    else:
+        message = f'Deleted {len(deleted)} orphaned output directories ({size_mb:.2f} MB reclaimed)'
+
+    return {
+        'directories_count': len(deleted),
+        'directories': deleted,
+        'bytes_reclaimed': bytes_reclaimed,
+        'dry_run': dry_run,
+        'message': message
+    }
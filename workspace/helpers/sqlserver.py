@@ -122,20 +122,31 @@ from contextlib import contextmanager
 from typing import List, Optional, Dict, Any, Union, Tuple
 from string import Template
 from helpers.constants import WORKSPACE_PATH
+from helpers.tracing import traced
 import pandas as pd
 import numpy as np
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-try:
-    import pyodbc
-except ImportError as e:
-    raise ImportError(
-        "pyodbc is required for SQL Server operations. "
-        "Install it with: pip install pyodbc\n"
-        "Note: Microsoft ODBC Driver 18 for SQL Server must also be installed."
-    ) from e
+
+def _import_pyodbc():
+    """
+    Import pyodbc on first connection.
+
+    Loading pyodbc also loads the ODBC driver manager, so it is deferred until a
+    SQL Server connection is actually opened; importing this module (e.g. via
+    irp_integration.portfolio) stays cheap for notebooks that never use MSSQL.
+    """
+    try:
+        import pyodbc
+    except ImportError as e:
+        raise ImportError(
+            "pyodbc is required for SQL Server operations. "
+            "Install it with: pip install pyodbc\n"
+            "Note: Microsoft ODBC Driver 18 for SQL Server must also be installed."
+        ) from e
+    return pyodbc
 
 
 # ============================================================================
@@ -404,6 +415,7 @@ def get_connection(connection_name: str = 'TEST', database: Optional[str] = None
     except SQLServerConfigurationError:
         raise  # Re-raise config errors
 
+    pyodbc = _import_pyodbc()
     connection_string = build_connection_string(connection_name, database=database)
     conn = None
 
@@ -970,6 +982,23 @@ def _substitute_named_parameters(query: str, params: Optional[Dict[str, Any]] =
 # QUERY OPERATIONS
 # ============================================================================
 
+def _statement_attributes(query: str, params: Optional[Dict[str, Any]] = None, connection: str = 'TEST',
+                          database: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+    """Span attributes for execute_* (see helpers.tracing)"""
+    return {
+        'db.statement': ' '.join(str(query).split())[:200],
+        'db.connection': connection,
+        'db.name': database,
+    }
+
+
+def _file_attributes(file_path: Union[str, Path], params: Optional[Dict[str, Any]] = None, connection: str = 'TEST',
+                     database: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+    """Span attributes for execute_query_from_file (see helpers.tracing)"""
+    return {'db.file': str(file_path), 'db.connection': connection, 'db.name': database}
+
+
+@traced('sqlserver.execute_query', describe=_statement_attributes)
 def execute_query(
     query: str,
     params: Optional[Dict[str, Any]] = None,
@@ -1017,6 +1046,7 @@ def execute_query(
         ) from e
 
 
+@traced('sqlserver.execute_scalar', describe=_statement_attributes)
 def execute_scalar(
     query: str,
     params: Optional[Dict[str, Any]] = None,
@@ -1063,6 +1093,7 @@ def execute_scalar(
         ) from e
 
 
+@traced('sqlserver.execute_command', describe=_statement_attributes)
 def execute_command(
     query: str,
     params: Optional[Dict[str, Any]] = None,
@@ -1180,6 +1211,7 @@ def sql_file_exists(file_path: Union[str, Path]) -> bool:
 
 
 
+@traced('sqlserver.execute_query_from_file', describe=_file_attributes)
 def execute_query_from_file(
     file_path: Union[str, Path],
     params: Optional[Dict[str, Any]] = None,
@@ -1344,7 +1376,7 @@ def initialize_database(sql_file_path: Union[str, Path], connection: str = 'TEST
             f"TrustServerCertificate={config['trust_cert']};"
         )
 
-        conn = pyodbc.connect(master_conn_str)
+        conn = _import_pyodbc().connect(master_conn_str)
         conn.autocommit = True  # Required for CREATE DATABASE
         cursor = conn.cursor()
 
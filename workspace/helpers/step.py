@@ -22,6 +22,8 @@ from datetime import datetime
 from .context import WorkContext
 from .database import execute_query, execute_insert, execute_scalar, execute_command
 from .constants import StepStatus, SYSTEM_USER
+from .tracing import set_trace_context, start_summary, stop_summary
+from .irp_integration.cache import format_stats, get_response_cache
 
 
 class StepError(Exception):
@@ -267,6 +269,8 @@ class Step:
         self.run_id = None
         self.run_num = None
         self.logs = []
+        self.trace_summary = None
+        self.response_cache_stats = None
 
         # Auto-start step run (force=True if re-running to create new run entry)
         self.start(force=self.executed)
@@ -307,6 +311,14 @@ class Step:
             )
             
             self.start_time = datetime.now()
+
+            # Spans (when tracing is on) are tagged with the run and summarized at the end
+            set_trace_context(step_run_id=self.run_id)
+            self.trace_summary = start_summary()
+
+            # API round-trips and bytes saved by the response cache are reported per run
+            response_cache = get_response_cache()
+            self.response_cache_stats = response_cache.stats() if response_cache else None
             
             print(f"Starting Step Run #{self.run_num}")
             print(f"{self.context}")
@@ -388,6 +400,14 @@ class Step:
                 'end_time': datetime.now().isoformat(),
                 'logs': self.logs[-10:]  # Last 10 log entries
             }
+            if self.trace_summary is not None:
+                final_output['_meta']['time_sinks'] = [
+                    {'name': name, 'count': count, 'seconds': round(total, 3)}
+                    for name, count, total in self.trace_summary.top()
+                ]
+            cache_stats = self._response_cache_run_stats()
+            if cache_stats:
+                final_output['_meta']['response_cache'] = cache_stats
             
             # Update database
             update_step_run(
@@ -401,6 +421,9 @@ class Step:
             print("\n" + "="*60)
             print(f"STEP COMPLETED")
             print(f"   Run #{self.run_num} completed in {duration:.1f} seconds")
+            self._print_trace_summary()
+            if cache_stats:
+                print(f"   {format_stats(cache_stats)}")
             print("="*60)
             
         except Exception as e:
@@ -436,6 +459,7 @@ class Step:
             print(f"STEP FAILED")
             print(f"Run #{self.run_num} failed after {duration:.1f} seconds")
             print(f"Error: {error_message}")
+            self._print_trace_summary()
             print("="*60)
 
         except Exception as e:
@@ -466,8 +490,34 @@ class Step:
             
         except Exception as e:
             print(f"Failed to skip step: {str(e)}")
+
+        self._end_trace()
+
+
+    def _end_trace(self):
+        """Stop tagging spans with this run and stop its summary"""
+        stop_summary(self.trace_summary)
+        set_trace_context(step_run_id=None)
+
+
+    def _print_trace_summary(self):
+        """Print the run's top time sinks (only when tracing is on)"""
+        self._end_trace()
+        if self.trace_summary is not None:
+            summary = self.trace_summary.format()
+            if summary:
+                print(f"   {summary}")
     
     
+    def _response_cache_run_stats(self) -> Optional[Dict[str, int]]:
+        """Response cache stats since start(), or None without a cache or cached requests"""
+        response_cache = get_response_cache()
+        if response_cache is None or self.response_cache_stats is None:
+            return None
+        stats = response_cache.stats(since=self.response_cache_stats)
+        return stats if any(stats.values()) else None
+
+
     def get_last_output(self) -> Optional[Dict[str, Any]]:
         """Get output data from the last completed run"""
 
@@ -154,24 +154,74 @@ STAGE_CHAINS = {
 }
 
 
-def get_next_step_info(batch_id: int, schema: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    """
-    Get information about the next step to execute after a batch completes.
+def _linear_dependencies(stage_chain: Dict[int, Dict[str, Any]]) -> Dict[int, List[int]]:
+    """Dependencies implied by a linear chain: each next_step depends on the step pointing to it"""
+    return {
+        config['next_step']: [step_num]
+        for step_num, config in stage_chain.items()
+        if config['next_step'] is not None
+    }
 
-    Args:
-        batch_id: The ID of the completed batch
-        schema: Database schema to use
+
+# Step dependency graph by stage, used by the parallel step scheduler
+# (helpers.step_scheduler). Maps step_num -> step_nums whose batches must reach
+# their chain config's wait_for status before the step runs. Defaults to the
+# linear chains above; overrides declare steps that do not need each other.
+STAGE_DEPENDENCIES = {stage_num: _linear_dependencies(chain) for stage_num, chain in STAGE_CHAINS.items()}
+
+# Stage 03: GeoHaz and Portfolio Mapping both only need the upgraded EDMs
+# (mapping splits portfolios on account attributes, not geocoding results),
+# so they run side by side; Control Totals waits for both.
+STAGE_DEPENDENCIES[3].update({
+    7: [5],
+    8: [6, 7],
+})
+
+
+def _validate_stage_dependencies(dependencies: Dict[int, Dict[int, List[int]]]) -> None:
+    """Raise ValueError if a stage's dependency graph references unknown steps or has a cycle"""
+    for stage_num, graph in dependencies.items():
+        chain = STAGE_CHAINS.get(stage_num, {})
+        for step_num, depends_on in graph.items():
+            unknown = [d for d in [step_num] + depends_on if d not in chain]
+            if unknown:
+                raise ValueError(f"Stage {stage_num} dependencies reference unknown steps: {unknown}")
+
+        visiting, done = set(), set()
+
+        def visit(step_num: int) -> None:
+            if step_num in done:
+                return
+            if step_num in visiting:
+                raise ValueError(f"Stage {stage_num} dependencies contain a cycle at step {step_num}")
+            visiting.add(step_num)
+            for dependency in graph.get(step_num, []):
+                visit(dependency)
+            visiting.discard(step_num)
+            done.add(step_num)
+
+        for step_num in graph:
+            visit(step_num)
+
+
+_validate_stage_dependencies(STAGE_DEPENDENCIES)
+
+
+def _status_matches(status: str, wait_for) -> bool:
+    """wait_for can be a single status or a list of statuses"""
+    if isinstance(wait_for, list):
+        return status in wait_for
+    return status == wait_for
+
+
+def _load_chained_batch(batch_id: int, schema: Optional[str] = None) -> Optional[tuple]:
+    """
+    Load a completed batch and check it can trigger chaining.
 
     Returns:
-        Dictionary containing next step information:
-        {
-            'cycle_name': str,
-            'stage_num': int,
-            'step_num': int,
-            'notebook_path': Path,
-            'current_step_num': int
-        }
-        Returns None if no next step exists or conditions not met.
+        (cycle_name, stage_num, step_num, chain_config) or None if the batch is
+        missing, the cycle is not ACTIVE, the step has no chain configuration,
+        or the batch type/status does not match it.
     """
     # Query batch and step information
     query = """
@@ -233,18 +283,41 @@ def get_next_step_info(batch_id: int, schema: Optional[str] = None) -> Optional[
     # Check if batch reached required status
     # wait_for can be a single status or a list of statuses
     wait_for = chain_config['wait_for']
-    if isinstance(wait_for, list):
-        status_match = batch_status in wait_for
-    else:
-        status_match = batch_status == wait_for
-
-    if not status_match:
+    if not _status_matches(batch_status, wait_for):
         logger.debug(
             f"Batch {batch_id} status {batch_status} does not match required "
             f"{wait_for}, skipping chain"
         )
         return None
 
+    return cycle_name, int(stage_num), int(step_num), chain_config
+
+
+def get_next_step_info(batch_id: int, schema: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Get information about the next step to execute after a batch completes.
+
+    Args:
+        batch_id: The ID of the completed batch
+        schema: Database schema to use
+
+    Returns:
+        Dictionary containing next step information:
+        {
+            'cycle_name': str,
+            'stage_num': int,
+            'step_num': int,
+            'notebook_path': Path,
+            'current_step_num': int
+        }
+        Returns None if no next step exists or conditions not met.
+    """
+    loaded = _load_chained_batch(batch_id, schema)
+    if loaded is None:
+        return None
+
+    cycle_name, stage_num, step_num, chain_config = loaded
+
     # Check if there is a next step
     next_step_num = chain_config['next_step']
     if next_step_num is None:
@@ -299,6 +372,83 @@ def should_execute_next_step(
     return True
 
 
+def get_ready_steps(batch_id: int, schema: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Get the steps that become runnable now that a batch has completed.
+
+    Uses STAGE_DEPENDENCIES instead of the linear next_step: every step that
+    depends on this batch's step is returned once all of its other dependencies
+    have also reached their wait_for status. The same checks as
+    get_next_step_info apply to the completed batch (cycle ACTIVE, batch type
+    and status match the chain config).
+
+    Args:
+        batch_id: The ID of the completed batch
+        schema: Database schema to use
+
+    Returns:
+        List of dictionaries in the same format as get_next_step_info, plus
+        'depends_on' (List[int]). Empty if nothing became ready.
+    """
+    loaded = _load_chained_batch(batch_id, schema)
+    if loaded is None:
+        return []
+
+    cycle_name, stage_num, step_num, _ = loaded
+    stage_chain = STAGE_CHAINS[stage_num]
+
+    graph = STAGE_DEPENDENCIES.get(stage_num, {})
+    dependents = sorted(step for step, depends_on in graph.items() if step_num in depends_on)
+    if not dependents:
+        logger.info(f"Step {step_num} has no dependent steps in Stage {stage_num}")
+        return []
+
+    # Latest batch status of every other step the dependents wait for
+    other_steps = sorted({d for step in dependents for d in graph[step]} - {step_num})
+    latest_status = {}
+    if other_steps:
+        placeholders = ', '.join(['%s'] * len(other_steps))
+        status_query = f"""
+            SELECT DISTINCT ON (s.step_num)
+                s.step_num,
+                b.status as batch_status
+            FROM irp_batch b
+            JOIN irp_step s ON b.step_id = s.id
+            JOIN irp_stage st ON s.stage_id = st.id
+            JOIN irp_cycle c ON st.cycle_id = c.id
+            WHERE c.cycle_name = %s
+              AND st.stage_num = %s
+              AND s.step_num IN ({placeholders})
+            ORDER BY s.step_num, b.created_ts DESC, b.id DESC
+        """
+        status_df = execute_query(status_query, (cycle_name, stage_num, *other_steps), schema=schema)
+        latest_status = {int(r['step_num']): r['batch_status'] for _, r in status_df.iterrows()}
+
+    ready = []
+    for next_step_num in dependents:
+        waiting_on = [
+            d for d in graph[next_step_num]
+            if d != step_num and not _status_matches(latest_status.get(d), stage_chain[d]['wait_for'])
+        ]
+        if waiting_on:
+            logger.info(
+                f"Stage {stage_num} Step {next_step_num} still waiting on step(s) {waiting_on}"
+            )
+            continue
+
+        ready.append({
+            'cycle_name': cycle_name,
+            'stage_num': stage_num,
+            'step_num': next_step_num,
+            'notebook_path': _build_notebook_path(cycle_name, stage_num, next_step_num),
+            'current_step_num': step_num,
+            'depends_on': list(graph[next_step_num]),
+            'description': stage_chain[next_step_num]['description']
+        })
+
+    return ready
+
+
 def _build_notebook_path(cycle_name: str, stage_num: int, step_num: int) -> Path:
     """
     Build the path to a notebook file.
@@ -0,0 +1,120 @@
+"""
+IRP Notebook Framework - Parallel Step Scheduler
+
+Runs the steps made ready by completed batches, using the per-stage
+dependency graph in helpers.step_chain.STAGE_DEPENDENCIES rather than the
+strictly linear next_step chain. Steps that do not depend on each other
+(e.g. Stage 03 GeoHaz and Portfolio Mapping) run concurrently, up to a
+configurable number of workers.
+
+Each step still runs through notebook_executor.execute_next_step, so notebook
+failures are handled (step run marked FAILED, Teams notification) exactly as
+in sequential chaining.
+
+Workflow:
+1. plan_ready_steps() - Resolve the completed batches to the steps that are now runnable
+2. execute_ready_steps() - Plan and run them concurrently, returning one result per step
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional
+
+from helpers.database import get_current_schema, schema_context
+from helpers.step_chain import get_ready_steps
+from helpers.notebook_executor import execute_next_step
+from helpers.constants import STEP_SCHEDULER_MAX_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+def plan_ready_steps(batch_ids: Iterable[int], schema: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Collect the steps made runnable by a set of completed batches.
+
+    A step released by more than one of the batches (e.g. Control Totals after
+    both GeoHaz and Portfolio Mapping complete) is only returned once.
+
+    Args:
+        batch_ids: IDs of batches that reached a terminal status
+        schema: Database schema (uses context if not provided)
+
+    Returns:
+        List of step info dictionaries (see step_chain.get_ready_steps), each
+        with the 'batch_id' that released it
+    """
+    planned = {}
+    for batch_id in batch_ids:
+        for step in get_ready_steps(batch_id, schema=schema):
+            key = (step['cycle_name'], step['stage_num'], step['step_num'])
+            if key not in planned:
+                planned[key] = {**step, 'batch_id': batch_id}
+    return list(planned.values())
+
+
+def _run_step(step: Dict[str, Any], timeout: int, schema: str) -> Dict[str, Any]:
+    """Run one step in a worker thread (the schema context is thread-local)"""
+    start_time = time.time()
+    with schema_context(schema):
+        try:
+            return execute_next_step(
+                cycle_name=step['cycle_name'],
+                stage_num=step['stage_num'],
+                step_num=step['step_num'],
+                notebook_path=step['notebook_path'],
+                timeout=timeout
+            )
+        except Exception as e:
+            logger.exception(f"Unexpected error running Step {step['step_num']:02d}")
+            return {
+                'success': False,
+                'notebook_path': step['notebook_path'],
+                'execution_time': time.time() - start_time,
+                'error': f"Unexpected error: {str(e)}"
+            }
+
+
+def execute_ready_steps(
+    batch_ids: Iterable[int],
+    max_workers: int = STEP_SCHEDULER_MAX_WORKERS,
+    timeout: int = 3600,
+    schema: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run every step made ready by the completed batches, independent steps in parallel.
+
+    Args:
+        batch_ids: IDs of batches that reached a terminal status
+        max_workers: Maximum number of notebooks executing at once
+        timeout: Maximum execution time per notebook in seconds
+        schema: Database schema (uses context if not provided)
+
+    Returns:
+        List of {'step': step info, 'result': execute_next_step() result},
+        in the order the steps were planned
+
+    Raises:
+        ValueError: If max_workers is less than 1
+
+    Example:
+        >>> for run in execute_ready_steps(terminal_batch_ids):
+        ...     print(run['step']['step_num'], run['result']['success'])
+    """
+    if max_workers < 1:
+        raise ValueError(f"Invalid max_workers: {max_workers}. Must be >= 1.")
+
+    active_schema = schema if schema is not None else get_current_schema()
+    steps = plan_ready_steps(batch_ids, schema=active_schema)
+    if not steps:
+        return []
+
+    workers = min(max_workers, len(steps))
+    logger.info(f"Executing {len(steps)} ready step(s) with {workers} worker(s)")
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='step-scheduler') as pool:
+        futures = [pool.submit(_run_step, step, timeout, active_schema) for step in steps]
+        return [
+            {'step': step, 'result': future.result()}
+            for step, future in zip(steps, futures)
+        ]
@@ -0,0 +1,439 @@
+"""
+IRP Notebook Framework - Tracing
+
+Lightweight spans for finding where a notebook step spends its time.
+Instrumented calls:
+- Postgres statements (helpers.database execute_*, bulk_insert)
+- SQL Server statements and scripts (helpers.sqlserver execute_*)
+- Moody's API requests (irp_integration Client.request)
+- S3 uploads (irp_integration MRIImportManager.upload_file_to_s3)
+- Notebook execution (helpers.notebook_executor.execute_notebook)
+- Control totals comparisons (helpers.control_totals)
+
+Spans carry the cycle/stage/step ids of the current WorkContext, the step run
+id of the current Step and, inside batch operations, the batch and job ids.
+
+EXPORTERS (TRACE_EXPORTER environment variable):
+------------------------------------------------
+- none (default): tracing off; span() is a single flag check
+- summary: spans are only aggregated for step summaries (Step.complete
+  prints the top time sinks of the run)
+- jsonl: as summary, and every finished span is appended to TRACE_FILE as
+  one JSON object per line
+- otel: as summary, and spans are forwarded to OpenTelemetry. Requires
+  opentelemetry-api; configure the SDK tracer provider and exporter as usual.
+
+TRACE_FILE sets the jsonl file (default: workspace/logs/traces.jsonl). The
+settings live here rather than in helpers.constants so that irp_integration
+can import this module without the database configuration.
+
+Usage:
+    from helpers.tracing import span, traced, trace_context
+
+    with span('post_processing.load', rows=len(df)) as s:
+        ...
+        s.set_attribute('loaded', count)
+
+    @traced('batch.build_plan')
+    def build_plan(...):
+        ...
+
+    with trace_context(batch_id=batch_id):
+        ...  # Spans in here are tagged with batch_id
+"""
+
+import functools
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TraceExporter:
+    """Span exporters (see module docstring)"""
+    NONE = 'none'
+    SUMMARY = 'summary'
+    JSONL = 'jsonl'
+    OTEL = 'otel'
+
+    @classmethod
+    def all(cls):
+        return [cls.NONE, cls.SUMMARY, cls.JSONL, cls.OTEL]
+
+
+TRACE_EXPORTER = os.getenv('TRACE_EXPORTER', TraceExporter.NONE)
+TRACE_FILE = os.getenv('TRACE_FILE', str(Path(__file__).resolve().parent.parent / 'logs' / 'traces.jsonl'))
+
+
+# Ids attached to every span: process-wide ones set by WorkContext and Step
+# (notebook cells do not share context variables), and scoped ones set by
+# trace_context (batch_id, job_id)
+_process_ids: Dict[str, Any] = {}
+_context_ids: ContextVar[Dict[str, Any]] = ContextVar('trace_context_ids', default={})
+_current_span: ContextVar[Optional['Span']] = ContextVar('trace_current_span', default=None)
+
+
+class Span:
+    """A timed operation; use via span() rather than directly."""
+
+    __slots__ = ('name', 'attributes', 'trace_id', 'span_id', 'parent', 'start_time',
+                 '_start', 'duration', 'status', 'error', '_token', '_otel_span')
+
+    def __init__(self, name: str, attributes: Dict[str, Any]) -> None:
+        parent = _current_span.get()
+        self.name = name
+        self.attributes = {**_process_ids, **_context_ids.get(), **attributes}
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent = parent
+        self.start_time: Optional[datetime] = None
+        self._start = 0.0
+        self.duration = 0.0
+        self.status = 'ok'
+        self.error: Optional[str] = None
+        self._otel_span = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self) -> 'Span':
+        self.start_time = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self._token = _current_span.set(self)
+        _tracer.on_start(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.duration = time.perf_counter() - self._start
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.status = 'error'
+            self.error = f"{exc_type.__name__}: {exc_val}"
+        _tracer.on_end(self)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        record = {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent.span_id if self.parent else None,
+            'start': self.start_time.isoformat(),
+            'duration_ms': round(self.duration * 1000, 3),
+            'status': self.status,
+            'thread': threading.current_thread().name,
+            'attributes': self.attributes,
+        }
+        if self.error:
+            record['error'] = self.error
+        return record
+
+
+class _NullSpan:
+    """Returned by span() while tracing is off."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+# ============================================================================
+# EXPORTERS
+# ============================================================================
+
+class JsonLinesExporter:
+    """Appends each finished span as a JSON line to a file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def _import_opentelemetry():
+    """Import the OpenTelemetry API when the otel exporter is selected."""
+    try:
+        from opentelemetry import trace
+    except ImportError as e:
+        raise ImportError(
+            "opentelemetry-api is required for TRACE_EXPORTER=otel. "
+            "Install it with: pip install opentelemetry-api opentelemetry-sdk"
+        ) from e
+    return trace
+
+
+class OpenTelemetryExporter:
+    """Mirrors spans as OpenTelemetry spans on the global tracer provider."""
+
+    def __init__(self) -> None:
+        self._trace = _import_opentelemetry()
+        self._tracer = self._trace.get_tracer('irp-notebook-framework')
+
+    def on_start(self, span: Span) -> None:
+        context = None
+        if span.parent is not None and span.parent._otel_span is not None:
+            context = self._trace.set_span_in_context(span.parent._otel_span)
+        span._otel_span = self._tracer.start_span(
+            span.name,
+            context=context,
+            start_time=int(span.start_time.timestamp() * 1e9),
+        )
+
+    def on_end(self, span: Span) -> None:
+        otel_span = span._otel_span
+        if otel_span is None:
+            return
+        for key, value in span.attributes.items():
+            if value is not None:
+                otel_span.set_attribute(key, value if isinstance(value, (str, bool, int, float)) else str(value))
+        if span.error:
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, span.error))
+        otel_span.end()
+        span._otel_span = None
+
+    def close(self) -> None:
+        pass
+
+
+# ============================================================================
+# STEP SUMMARIES
+# ============================================================================
+
+class TraceSummary:
+    """
+    Time spent per span name while the summary is active.
+
+    Step starts one per run; spans from every thread count toward it, so
+    nested spans (e.g. a notebook containing API calls) overlap in totals.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._totals: Dict[str, List[float]] = {}
+
+    def add(self, span: Span) -> None:
+        key = _summary_key(span)
+        with self._lock:
+            entry = self._totals.setdefault(key, [0, 0.0])
+            entry[0] += 1
+            entry[1] += span.duration
+
+    def top(self, n: int = 5) -> List[Tuple[str, int, float]]:
+        """(name, count, total_seconds) for the n names with the most total time"""
+        with self._lock:
+            items = [(name, int(count), total) for name, (count, total) in self._totals.items()]
+        return sorted(items, key=lambda item: item[2], reverse=True)[:n]
+
+    def format(self, n: int = 5) -> str:
+        rows = self.top(n)
+        if not rows:
+            return ""
+        lines = [f"Top {len(rows)} time sinks:"]
+        for name, count, total in rows:
+            lines.append(f"   {total:8.2f}s  {count:6d} call(s)  {name}")
+        return "\n".join(lines)
+
+
+_ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+
+def _summary_key(span: Span) -> str:
+    """Summaries group API calls by endpoint rather than by span name"""
+    path = span.attributes.get('http.path')
+    if path:
+        return f"{span.name} {span.attributes.get('http.method', '')} {_ID_SEGMENT.sub('/{id}', path)}"
+    return span.name
+
+
+# ============================================================================
+# TRACER
+# ============================================================================
+
+class _Tracer:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.exporter = None
+        self._lock = threading.Lock()
+        self._summaries: List[TraceSummary] = []
+
+    def configure(self, exporter: str, path: Optional[str] = None) -> None:
+        if exporter not in TraceExporter.all():
+            raise ValueError(f"Unknown TRACE_EXPORTER '{exporter}', expected one of {TraceExporter.all()}")
+        if exporter == TraceExporter.JSONL:
+            new_exporter = JsonLinesExporter(path or TRACE_FILE)
+        elif exporter == TraceExporter.OTEL:
+            new_exporter = OpenTelemetryExporter()
+        else:
+            new_exporter = None
+        if self.exporter is not None:
+            self.exporter.close()
+        self.exporter = new_exporter
+        self.enabled = exporter != TraceExporter.NONE
+
+    def on_start(self, span: Span) -> None:
+        if self.exporter is not None:
+            self.exporter.on_start(span)
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            summaries = list(self._summaries)
+        for summary in summaries:
+            summary.add(span)
+        if self.exporter is not None:
+            try:
+                self.exporter.on_end(span)
+            except Exception as e:
+                logger.warning(f"Failed to export span {span.name}: {e}")
+
+    def add_summary(self, summary: TraceSummary) -> None:
+        with self._lock:
+            self._summaries.append(summary)
+
+    def remove_summary(self, summary: TraceSummary) -> None:
+        with self._lock:
+            if summary in self._summaries:
+                self._summaries.remove(summary)
+
+
+_tracer = _Tracer()
+
+
+def configure_tracing(exporter: str = TRACE_EXPORTER, path: Optional[str] = None) -> None:
+    """
+    Select the span exporter (see module docstring).
+
+    Args:
+        exporter: TraceExporter value ('none', 'summary', 'jsonl', 'otel')
+        path: JSON-lines file for the jsonl exporter (default: TRACE_FILE)
+
+    Raises:
+        ValueError: If exporter is unknown
+        ImportError: If exporter is 'otel' and opentelemetry-api is not installed
+    """
+    _tracer.configure(exporter, path)
+
+
+def tracing_enabled() -> bool:
+    return _tracer.enabled
+
+
+def span(name: str, **attributes: Any):
+    """
+    Time a block as a span.
+
+    Args:
+        name: Span name, e.g. 'postgres.execute_query'
+        **attributes: Extra attributes recorded on the span
+
+    Returns:
+        Context manager yielding the span (set_attribute() adds attributes)
+    """
+    if not _tracer.enabled:
+        return _NULL_SPAN
+    return Span(name, attributes)
+
+
+def traced(
+    name: str,
+    describe: Optional[Callable[..., Dict[str, Any]]] = None,
+    context: Optional[Callable[..., Dict[str, Any]]] = None
+) -> Callable:
+    """
+    Decorator running the function inside span(name).
+
+    Args:
+        name: Span name
+        describe: Optional callable taking the function's arguments and
+                  returning span attributes (only called while tracing)
+        context: Like describe, but the returned ids (e.g. batch_id) also tag
+                 every span opened inside the function (see trace_context)
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            attributes = describe(*args, **kwargs) if describe else {}
+            if context is None:
+                with Span(name, attributes):
+                    return func(*args, **kwargs)
+            with trace_context(**context(*args, **kwargs)), Span(name, attributes):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def set_trace_context(**ids: Any) -> None:
+    """Tag all subsequent spans in this process with ids (None removes an id)."""
+    for key, value in ids.items():
+        if value is None:
+            _process_ids.pop(key, None)
+        else:
+            _process_ids[key] = value
+
+
+@contextmanager
+def trace_context(**ids: Any) -> Iterator[None]:
+    """Tag spans inside the block with ids, restoring the previous ids afterwards."""
+    token = _context_ids.set({k: v for k, v in {**_context_ids.get(), **ids}.items() if v is not None})
+    try:
+        yield
+    finally:
+        _context_ids.reset(token)
+
+
+def start_summary() -> Optional[TraceSummary]:
+    """Start aggregating spans for a step run; None while tracing is off."""
+    if not _tracer.enabled:
+        return None
+    summary = TraceSummary()
+    _tracer.add_summary(summary)
+    return summary
+
+
+def stop_summary(summary: Optional[TraceSummary]) -> None:
+    if summary is not None:
+        _tracer.remove_summary(summary)
+
+
+def statement_attributes(query: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """describe= helper for SQL functions: first 200 characters of the statement"""
+    return {'db.statement': ' '.join(str(query).split())[:200]}
+
+
+try:
+    configure_tracing()
+except (ImportError, ValueError, OSError) as e:
+    logger.warning(f"Tracing disabled: {e}")
@@ -0,0 +1,359 @@
+"""
+IRP Notebook Framework - Job Tracking Log Maintenance
+
+irp_job_tracking_log is range-partitioned by month on tracked_ts, with a
+default partition catching rows outside any monthly partition. This module
+keeps that layout healthy and bounded in size.
+
+Key Features:
+- Create monthly partitions ahead of time (moving stray rows out of the default partition)
+- Compact closed months: drop heartbeat rows (polls where the status did not change)
+- Retention: drop whole monthly partitions older than the retention window
+- Report storage before/after so savings are measurable
+
+Workflow:
+1. ensure_tracking_log_partitions() - Run regularly (e.g. monthly) to pre-create partitions
+2. run_tracking_log_maintenance() - Purge + compact, returns storage statistics
+
+Databases created before partitioning are upgraded in place with
+helpers/db/migrate_tracking_log_partitions.sql (see docs/DATABASE_SCHEMA.md).
+"""
+
+from datetime import date
+from typing import Dict, Any, List, Optional
+
+from sqlalchemy import text
+
+from helpers.database import (
+    execute_query, execute_command, get_engine, transaction_context, DatabaseError
+)
+from helpers.constants import TRACKING_LOG_RETENTION_MONTHS, TRACKING_LOG_PARTITION_MONTHS_AHEAD
+
+
+TRACKING_LOG_TABLE = 'irp_job_tracking_log'
+DEFAULT_PARTITION = f'{TRACKING_LOG_TABLE}_default'
+
+
+class TrackingLogError(Exception):
+    """Custom exception for tracking log maintenance errors"""
+    pass
+
+
+# ============================================================================
+# PARTITION HELPERS
+# ============================================================================
+
+def _month_start(value: date) -> date:
+    """First day of the month containing value"""
+    return date(value.year, value.month, 1)
+
+
+def _add_months(month_start: date, months: int) -> date:
+    """Shift a first-of-month date by a number of months"""
+    index = month_start.year * 12 + (month_start.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def tracking_log_partition_name(month_start: date) -> str:
+    """
+    Name of the monthly partition holding rows for the given month.
+
+    Args:
+        month_start: Any date within the month
+
+    Returns:
+        Partition table name (e.g. irp_job_tracking_log_2025_01)
+    """
+    return f"{TRACKING_LOG_TABLE}_{month_start.year:04d}_{month_start.month:02d}"
+
+
+def list_tracking_log_partitions(schema: str = 'public') -> List[Dict[str, Any]]:
+    """
+    List partitions of irp_job_tracking_log with their month and size.
+
+    Args:
+        schema: Database schema
+
+    Returns:
+        List of dicts ordered by month (default partition last):
+        {'name': str, 'month_start': date or None, 'total_bytes': int}
+    """
+    query = """
+        SELECT c.relname AS name, pg_total_relation_size(c.oid) AS total_bytes
+        FROM pg_inherits i
+        INNER JOIN pg_class c ON c.oid = i.inhrelid
+        INNER JOIN pg_class p ON p.oid = i.inhparent
+        INNER JOIN pg_namespace n ON n.oid = p.relnamespace
+        WHERE p.relname = %s AND n.nspname = %s
+    """
+    df = execute_query(query, (TRACKING_LOG_TABLE, schema), schema=schema)
+
+    partitions = []
+    for _, row in df.iterrows():
+        month_start = None
+        if row['name'] != DEFAULT_PARTITION:
+            year, month = row['name'][len(TRACKING_LOG_TABLE) + 1:].split('_')
+            month_start = date(int(year), int(month), 1)
+        partitions.append({
+            'name': row['name'],
+            'month_start': month_start,
+            'total_bytes': int(row['total_bytes'])
+        })
+
+    return sorted(partitions, key=lambda p: (p['month_start'] is None, p['month_start'] or date.min))
+
+
+def get_tracking_log_size(schema: str = 'public') -> int:
+    """
+    Total on-disk size (table + indexes + TOAST) of all tracking log partitions.
+
+    Args:
+        schema: Database schema
+
+    Returns:
+        Size in bytes
+    """
+    return sum(p['total_bytes'] for p in list_tracking_log_partitions(schema))
+
+
+def create_tracking_log_partition(month_start: date, schema: str = 'public') -> str:
+    """
+    Create the monthly partition for month_start.
+
+    Rows for that month already sitting in the default partition are moved into
+    the new partition in the same transaction, so the attach never conflicts.
+
+    Args:
+        month_start: Any date within the month
+        schema: Database schema
+
+    Returns:
+        Name of the created partition
+
+    Raises:
+        TrackingLogError: If the partition cannot be created
+    """
+    month_start = _month_start(month_start)
+    month_end = _add_months(month_start, 1)
+    name = tracking_log_partition_name(month_start)
+
+    try:
+        with transaction_context(schema):
+            execute_command(
+                f"CREATE TABLE {name} (LIKE {TRACKING_LOG_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+            execute_command(
+                f"""INSERT INTO {name}
+                    SELECT * FROM {DEFAULT_PARTITION} WHERE tracked_ts >= %s AND tracked_ts < %s""",
+                (month_start, month_end)
+            )
+            execute_command(
+                f"DELETE FROM {DEFAULT_PARTITION} WHERE tracked_ts >= %s AND tracked_ts < %s",
+                (month_start, month_end)
+            )
+            execute_command(
+                f"""ALTER TABLE {TRACKING_LOG_TABLE} ATTACH PARTITION {name}
+                    FOR VALUES FROM ('{month_start.isoformat()}') TO ('{month_end.isoformat()}')"""
+            )
+    except DatabaseError as e:
+        raise TrackingLogError(f"Failed to create partition {name}: {str(e)}")
+
+    return name
+
+
+def ensure_tracking_log_partitions(
+    months_ahead: int = TRACKING_LOG_PARTITION_MONTHS_AHEAD,
+    schema: str = 'public'
+) -> List[str]:
+    """
+    Make sure monthly partitions exist for the current month and the next months_ahead months.
+
+    Args:
+        months_ahead: Number of future months to pre-create
+        schema: Database schema
+
+    Returns:
+        Names of the partitions created (empty if all existed)
+    """
+    existing = {p['month_start'] for p in list_tracking_log_partitions(schema)}
+    current = _month_start(date.today())
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month_start = _add_months(current, offset)
+        if month_start not in existing:
+            created.append(create_tracking_log_partition(month_start, schema=schema))
+
+    return created
+
+
+# ============================================================================
+# RETENTION AND COMPACTION
+# ============================================================================
+
+def _vacuum_full(partitions: List[str], schema: str) -> None:
+    """Rewrite partitions to return freed space to the OS (needs autocommit)"""
+    engine = get_engine()
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+        for name in partitions:
+            conn.execute(text(f'VACUUM FULL "{schema}".{name}'))
+
+
+def purge_tracking_log(
+    retention_months: int = TRACKING_LOG_RETENTION_MONTHS,
+    schema: str = 'public'
+) -> Dict[str, Any]:
+    """
+    Drop tracking history older than the retention window.
+
+    Whole monthly partitions are dropped (no row-by-row delete); old rows in the
+    default partition are deleted.
+
+    Args:
+        retention_months: Number of months to keep, including the current month
+        schema: Database schema
+
+    Returns:
+        {'partitions_dropped': List[str], 'rows_deleted': int, 'bytes_reclaimed': int}
+
+    Raises:
+        TrackingLogError: If retention_months is invalid or a drop fails
+    """
+    if not isinstance(retention_months, int) or retention_months < 1:
+        raise TrackingLogError(f"Invalid retention_months: {retention_months}. Must be >= 1.")
+
+    cutoff = _add_months(_month_start(date.today()), -(retention_months - 1))
+
+    dropped = []
+    bytes_reclaimed = 0
+    try:
+        for partition in list_tracking_log_partitions(schema):
+            if partition['month_start'] is not None and partition['month_start'] < cutoff:
+                execute_command(f"DROP TABLE {partition['name']}", schema=schema)
+                dropped.append(partition['name'])
+                bytes_reclaimed += partition['total_bytes']
+
+        rows_deleted = execute_command(
+            f"DELETE FROM {DEFAULT_PARTITION} WHERE tracked_ts < %s",
+            (cutoff,),
+            schema=schema
+        )
+    except DatabaseError as e:
+        raise TrackingLogError(f"Failed to purge tracking log: {str(e)}")
+
+    return {
+        'partitions_dropped': dropped,
+        'rows_deleted': rows_deleted,
+        'bytes_reclaimed': bytes_reclaimed
+    }
+
+
+def compact_tracking_log(
+    before: Optional[date] = None,
+    vacuum: bool = True,
+    schema: str = 'public'
+) -> Dict[str, Any]:
+    """
+    Remove heartbeat rows from closed monthly partitions.
+
+    A heartbeat row is a poll whose job_status equals the previous row for the
+    same job within the partition. The first row of each status run is kept, so
+    status transitions (and their API payloads) survive; the latest poll time is
+    kept on irp_job.last_tracked_ts.
+
+    Only partitions for months before `before` (default: the current month) are
+    touched, so compaction never competes with live inserts.
+
+    Args:
+        before: Compact partitions for months strictly before this date's month
+        vacuum: Run VACUUM FULL on compacted partitions so savings show up on disk
+        schema: Database schema
+
+    Returns:
+        {'partitions_compacted': List[str], 'rows_deleted': int,
+         'bytes_before': int, 'bytes_after': int, 'bytes_reclaimed': int}
+
+    Raises:
+        TrackingLogError: If compaction fails
+    """
+    limit = _month_start(before or date.today())
+    targets = [
+        p for p in list_tracking_log_partitions(schema)
+        if p['month_start'] is not None and p['month_start'] < limit
+    ]
+
+    rows_deleted = 0
+    compacted = []
+    try:
+        for partition in targets:
+            rows = execute_command(
+                f"""
+                DELETE FROM {partition['name']} t
+                USING (
+                    SELECT id,
+                           job_status = LAG(job_status) OVER (
+                               PARTITION BY job_id ORDER BY tracked_ts, id
+                           ) AS is_heartbeat
+                    FROM {partition['name']}
+                ) h
+                WHERE t.id = h.id AND h.is_heartbeat
+                """,
+                schema=schema
+            )
+            if rows > 0:
+                compacted.append(partition['name'])
+                rows_deleted += rows
+
+        if vacuum and compacted:
+            _vacuum_full(compacted, schema)
+    except Exception as e:
+        raise TrackingLogError(f"Failed to compact tracking log: {str(e)}")
+
+    sizes_after = {p['name']: p['total_bytes'] for p in list_tracking_log_partitions(schema)}
+    bytes_before = sum(p['total_bytes'] for p in targets)
+    bytes_after = sum(sizes_after.get(p['name'], 0) for p in targets)
+
+    return {
+        'partitions_compacted': compacted,
+        'rows_deleted': rows_deleted,
+        'bytes_before': bytes_before,
+        'bytes_after': bytes_after,
+        'bytes_reclaimed': bytes_before - bytes_after
+    }
+
+
+def run_tracking_log_maintenance(
+    retention_months: int = TRACKING_LOG_RETENTION_MONTHS,
+    months_ahead: int = TRACKING_LOG_PARTITION_MONTHS_AHEAD,
+    compact: bool = True,
+    schema: str = 'public'
+) -> Dict[str, Any]:
+    """
+    Run the full tracking log maintenance cycle: partitions, retention, compaction.
+
+    Args:
+        retention_months: Months of history to keep (see purge_tracking_log)
+        months_ahead: Future monthly partitions to pre-create
+        compact: Also compact closed months (see compact_tracking_log)
+        schema: Database schema
+
+    Returns:
+        Dictionary with 'partitions_created', 'purge', 'compaction' (or None),
+        'bytes_before', 'bytes_after' and 'bytes_reclaimed'
+    """
+    bytes_before = get_tracking_log_size(schema)
+
+    created = ensure_tracking_log_partitions(months_ahead=months_ahead, schema=schema)
+    purge = purge_tracking_log(retention_months=retention_months, schema=schema)
+    compaction = compact_tracking_log(schema=schema) if compact else None
+
+    bytes_after = get_tracking_log_size(schema)
+
+    return {
+        'partitions_created': created,
+        'purge': purge,
+        'compaction': compaction,
+        'bytes_before': bytes_before,
+        'bytes_after': bytes_after,
+        'bytes_reclaimed': bytes_before - bytes_after
+    }
@@ -57,6 +57,7 @@ from helpers.database import (
     set_schema
 )
 from helpers.constants import ConfigurationStatus
+from helpers.context import invalidate_context_cache
 
 
 # ==============================================================================
@@ -222,6 +223,9 @@ def test_schema(request):
     set_schema(schema)
     print(f"✓ Schema context set to '{schema}'\n")
 
+    # The schema was recreated, so WorkContexts resolved against an earlier copy are stale
+    invalidate_context_cache()
+
     # Provide schema to tests
     yield schema
 
@@ -448,6 +452,22 @@ def mock_irp_client(mocker):
     return mock_client
 
 
+@pytest.fixture(autouse=True)
+def configuration_cache_dir(tmp_path, monkeypatch):
+    """
+    Point the configuration parse cache at a per-test directory.
+
+    Keeps tests from reading or writing the user's real cache. The directory
+    is not created; the cache creates it on first write.
+
+    Returns:
+        Path: Cache directory for the current test
+    """
+    cache_dir = tmp_path / 'configuration_cache'
+    monkeypatch.setenv('CONFIGURATION_CACHE_DIR', str(cache_dir))
+    return cache_dir
+
+
 # ==============================================================================
 # HELPER FUNCTIONS (for use in tests)
 # ==============================================================================
@@ -5,6 +5,7 @@ This module provides fixtures specific to testing the irp_integration module:
 - IRPClient instance
 - Unique name generation for test resources
 - Cleanup utilities
+- A local Moody's API simulator (simulator / simulator_config)
 
 Note: Loads .env file from project root to populate environment variables
 for RISK_MODELER_BASE_URL, RISK_MODELER_API_KEY, and RISK_MODELER_RESOURCE_GROUP_ID.
@@ -116,6 +117,42 @@ def cleanup_edms():
                 print(f"⚠ Warning: Failed to delete EDM '{edm_name}': {e}")
 
 
+# ==============================================================================
+# MOODY'S API SIMULATOR FIXTURES
+# ==============================================================================
+
+@pytest.fixture
+def simulator_config():
+    """
+    Configuration for the simulator fixture.
+
+    Loss tables span several pages. Override this fixture in a test module
+    to simulate other settings (e.g. ETags).
+
+    Returns:
+        SimulatorConfig: Simulator settings
+    """
+    from helpers.irp_integration.simulator import SimulatorConfig
+    return SimulatorConfig(elt_events=500, plt_records=2000)
+
+
+@pytest.fixture
+def simulator(simulator_config, monkeypatch):
+    """
+    Run the local Moody's API simulator with EDM EDM1 and portfolio P1.
+
+    RISK_MODELER_BASE_URL points at the simulator, so Client() talks to it.
+
+    Yields:
+        MoodysAPISimulator: Running simulator
+    """
+    from helpers.irp_integration.simulator import MoodysAPISimulator
+    with MoodysAPISimulator(simulator_config) as simulator:
+        simulator.add_edm('EDM1', portfolios=['P1'])
+        monkeypatch.setenv('RISK_MODELER_BASE_URL', simulator.base_url)
+        yield simulator
+
+
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
@@ -128,3 +165,18 @@ def get_workflow_files_dir():
         Path: Path to workflow files directory
     """
     return Path(__file__).parent.parent.parent / "workflows" / "_Tools" / "files" / "working_files"
+
+
+def names_in(filter_str):
+    """
+    Get the quoted names of a 'field IN ("a", "b")' search filter.
+
+    Used by mocked managers that answer chunked IN-filter searches.
+    """
+    inside = filter_str.split('IN (', 1)[1].split(')', 1)[0]
+    return {n.strip().strip('"') for n in inside.split(',')}
+
+
+def name_equals(filter_str):
+    """Get the quoted name of a 'field = "name"' search filter."""
+    return filter_str.split('"')[1]
@@ -0,0 +1,248 @@
+"""
+Test suite for batch-level analysis submission planning (irp_integration.analysis)
+
+This test file validates:
+- Plans resolve EDMs, portfolios, treaties and existing analyses with
+  chunked IN-filter searches, and reference data once per distinct name
+- Planned submissions send the same payload as per-job submissions, with
+  only the POST per job
+- Lookups that failed while planning are retried (and raised) per job
+- API call reporting
+
+All tests use mocked managers and do not require actual API connectivity.
+
+Run these tests:
+    pytest workspace/tests/irp_integration/test_analysis_submission_plan.py
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from helpers.irp_integration.analysis import AnalysisManager
+from helpers.irp_integration.exceptions import IRPAPIError, IRPReferenceDataError
+from tests.irp_integration.conftest import name_equals, names_in
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+@pytest.fixture
+def manager():
+    """AnalysisManager wired to mocked managers with an in-memory Moody's state"""
+    edms = {'EDM1': 11, 'EDM2': 22}
+    portfolios = {(11, 'P1'): 'uri/p1', (11, 'P2'): 'uri/p2', (22, 'P1'): 'uri/p1b'}
+    treaties = {(11, 'T1'): 501, (11, 'T2'): 502}
+    analyses = [{'analysisName': 'Existing', 'exposureName': 'EDM1'}]
+
+    edm = Mock()
+    edm.search_edms_paginated.side_effect = lambda filter: [
+        {'exposureName': n, 'exposureId': i} for n, i in edms.items() if n in names_in(filter)
+    ]
+    edm.search_edms.side_effect = lambda filter: [
+        {'exposureName': n, 'exposureId': i} for n, i in edms.items() if n == name_equals(filter)
+    ]
+
+    portfolio = Mock()
+    portfolio.search_portfolios_paginated.side_effect = lambda exposure_id, filter: [
+        {'portfolioName': n, 'uri': u} for (e, n), u in portfolios.items()
+        if e == exposure_id and n in names_in(filter)
+    ]
+    portfolio.search_portfolios.side_effect = lambda exposure_id, filter: [
+        {'portfolioName': n, 'uri': u} for (e, n), u in portfolios.items()
+        if e == exposure_id and n == name_equals(filter)
+    ]
+
+    def search_treaties(exposure_id, filter):
+        return [
+            {'treatyName': n, 'treatyId': i} for (e, n), i in treaties.items()
+            if e == exposure_id and n in names_in(filter)
+        ]
+
+    treaty = Mock()
+    treaty.search_treaties_paginated.side_effect = search_treaties
+    treaty.search_treaties.side_effect = search_treaties
+
+    reference_data = Mock()
+    reference_data.get_model_profile_by_name.side_effect = lambda name: {
+        'count': 1,
+        'items': [{'id': 7, 'perilCode': 'WS', 'modelRegionCode': 'NA', 'softwareVersionCode': 'RL23'}]
+    }
+    reference_data.get_output_profile_by_name.side_effect = lambda name: [{'id': 8}]
+    reference_data.get_event_rate_scheme_by_name.side_effect = lambda name, peril_code, model_region_code: {
+        'count': 1, 'items': [{'eventRateSchemeId': 9}]
+    }
+    reference_data.get_tag_ids_from_tag_names.side_effect = lambda names: [100 + int(n[-1]) for n in names]
+    reference_data.get_analysis_currency.return_value = {'code': 'USD'}
+
+    client = Mock()
+    client.request.side_effect = lambda method, path, json: Mock(
+        headers={'location': f'/jobs/{1000 + client.request.call_count}'}
+    )
+
+    manager = AnalysisManager(
+        client,
+        reference_data_manager=reference_data,
+        treaty_manager=treaty,
+        edm_manager=edm,
+        portfolio_manager=portfolio
+    )
+
+    def search_analyses(filter=""):
+        results = [a for a in analyses if a['analysisName'] in names_in(filter)]
+        if 'exposureName = "' in filter:
+            edm_name = filter.split('exposureName = "', 1)[1].split('"', 1)[0]
+            results = [a for a in results if a['exposureName'] == edm_name]
+        return results
+
+    manager.search_analyses_paginated = Mock(side_effect=search_analyses)
+    manager.search_analyses = Mock(return_value=[])
+    return manager
+
+
+def analysis_data(job_name, edm_name='EDM1', portfolio_name='P1', treaty_names=None, tag_names=None):
+    return {
+        'edm_name': edm_name,
+        'portfolio_name': portfolio_name,
+        'job_name': job_name,
+        'analysis_profile_name': 'DLM Profile',
+        'output_profile_name': 'Output',
+        'event_rate_scheme_name': 'RMS 2023 Stochastic',
+        'treaty_names': treaty_names if treaty_names is not None else ['T1', 'T2'],
+        'tag_names': tag_names if tag_names is not None else ['Tag1'],
+    }
+
+
+def submit(manager, data, plan=None):
+    return manager.submit_portfolio_analysis_job(**data, plan=plan)
+
+
+# ==============================================================================
+# PLAN TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_plan_resolves_each_name_once(manager):
+    """Lookups for a whole batch are batched searches, one per distinct name or scope"""
+    batch = [analysis_data(f'A{i}', portfolio_name=f'P{i % 2 + 1}') for i in range(10)]
+    batch.append(analysis_data('B1', edm_name='EDM2', treaty_names=[], tag_names=['Tag2']))
+
+    plan = manager.plan_portfolio_analysis_jobs(batch)
+    for data in batch:
+        submit(manager, data, plan=plan)
+
+    manager.edm_manager.search_edms_paginated.assert_called_once()
+    assert manager.portfolio_manager.search_portfolios_paginated.call_count == 2
+    manager.treaty_manager.search_treaties_paginated.assert_called_once()
+    assert manager.search_analyses_paginated.call_count == 2
+    reference_data = manager.reference_data_manager
+    reference_data.get_model_profile_by_name.assert_called_once_with('DLM Profile')
+    reference_data.get_output_profile_by_name.assert_called_once_with('Output')
+    reference_data.get_event_rate_scheme_by_name.assert_called_once()
+    assert reference_data.get_tag_ids_from_tag_names.call_count == 2
+    reference_data.get_analysis_currency.assert_called_once()
+
+    # Per-job lookup methods are never used once planned
+    manager.edm_manager.search_edms.assert_not_called()
+    manager.portfolio_manager.search_portfolios.assert_not_called()
+    manager.treaty_manager.search_treaties.assert_not_called()
+    manager.search_analyses.assert_not_called()
+    assert manager.client.request.call_count == len(batch)
+
+
+@pytest.mark.unit
+def test_planned_payload_matches_per_job_submission(manager):
+    """A planned submission POSTs the same request body as an unplanned one"""
+    data = analysis_data('A1', portfolio_name='P2')
+    plan = manager.plan_portfolio_analysis_jobs([data])
+
+    _, planned = submit(manager, data, plan=plan)
+    _, unplanned = submit(manager, data)
+
+    assert planned == unplanned
+    assert planned['resourceUri'] == 'uri/p2'
+    assert sorted(planned['settings']['treatyIds']) == [501, 502]
+    assert planned['settings']['tagIds'] == [101]
+    assert planned['settings']['eventRateSchemeId'] == 9
+
+
+@pytest.mark.unit
+def test_planned_submission_errors_match_per_job(manager):
+    """Missing entities raise the same errors from the plan as per job"""
+    plan = manager.plan_portfolio_analysis_jobs([
+        analysis_data('Existing'),
+        analysis_data('A1', portfolio_name='Missing'),
+        analysis_data('A2', treaty_names=['T1', 'Nope']),
+    ])
+
+    with pytest.raises(IRPAPIError, match="already exists for EDM 'EDM1'"):
+        submit(manager, analysis_data('Existing'), plan=plan)
+    with pytest.raises(IRPAPIError, match="Expected 1 portfolio with name Missing, found 0"):
+        submit(manager, analysis_data('A1', portfolio_name='Missing'), plan=plan)
+    with pytest.raises(IRPAPIError, match="Expected 2 treaties, found 1"):
+        submit(manager, analysis_data('A2', treaty_names=['T1', 'Nope']), plan=plan)
+
+    manager.reference_data_manager.get_model_profile_by_name.side_effect = lambda name: {'count': 0}
+    plan = manager.plan_portfolio_analysis_jobs([analysis_data('A3')])
+    with pytest.raises(IRPReferenceDataError, match="Analysis profile 'DLM Profile' not found"):
+        submit(manager, analysis_data('A3'), plan=plan)
+    manager.client.request.assert_not_called()
+
+
+@pytest.mark.unit
+def test_failed_planning_lookup_retried_per_job(manager):
+    """A search that fails while planning is not cached; the job that needs it retries"""
+    manager.edm_manager.search_edms_paginated.side_effect = [
+        IRPAPIError("Connection failed"),
+        [{'exposureName': 'EDM1', 'exposureId': 11}],
+    ]
+
+    plan = manager.plan_portfolio_analysis_jobs([analysis_data('A1')])
+    job_id, _ = submit(manager, analysis_data('A1'), plan=plan)
+
+    assert job_id == 1001
+    assert manager.edm_manager.search_edms_paginated.call_count == 2
+
+
+@pytest.mark.unit
+def test_unplanned_names_looked_up_at_submission(manager):
+    """Jobs outside the plan still submit, looking up what the plan lacks"""
+    plan = manager.plan_portfolio_analysis_jobs([analysis_data('A1')])
+
+    submit(manager, analysis_data('B1', edm_name='EDM2', treaty_names=[], tag_names=['Tag3']), plan=plan)
+
+    assert manager.edm_manager.search_edms_paginated.call_count == 2
+    manager.reference_data_manager.get_tag_ids_from_tag_names.assert_called_with(['Tag3'])
+
+
+@pytest.mark.unit
+def test_plan_report(manager):
+    """Report compares issued lookups with the per-job lookups they replaced"""
+    batch = [analysis_data(f'A{i}') for i in range(20)]
+
+    plan = manager.plan_portfolio_analysis_jobs(batch)
+    for data in batch:
+        submit(manager, data, plan=plan)
+    report = plan.report()
+
+    # Per job: duplicate check, EDM, portfolio, treaties, 2 profiles, event rate, 1 tag, currency
+    assert report['legacy_api_calls'] == 20 * 9
+    assert report['api_calls'] == 9
+    assert report['api_calls_saved'] == 20 * 9 - 9
+
+
+@pytest.mark.unit
+def test_submit_jobs_checks_duplicates_in_chunks(manager):
+    """submit_portfolio_analysis_jobs checks all names with chunked searches before submitting"""
+    batch = [analysis_data(f'A{i}') for i in range(30)] + [analysis_data('Existing')]
+
+    with pytest.raises(IRPAPIError, match="Analysis with this name already exists: Existing"):
+        manager.submit_portfolio_analysis_jobs(batch)
+
+    manager.client.request.assert_not_called()
+    unscoped = [
+        c for c in manager.search_analyses_paginated.call_args_list
+        if 'exposureName' not in c.kwargs['filter']
+    ]
+    assert len(unscoped) == 2
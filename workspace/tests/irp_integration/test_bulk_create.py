@@ -0,0 +1,446 @@
+"""
+Test suite for bulk treaty and portfolio creation (irp_integration.treaty, portfolio)
+
+This test file validates:
+- create_treaties / create_portfolios look up each EDM, cedant list,
+  currency and LOB list once per run
+- Entities are created concurrently and returned in input order
+- Treaty LOB attachments start as soon as their treaty exists
+- Missing data and duplicate portfolio names are rejected before any request
+- A failure does not lose the IDs of entities already created
+- Portfolio Creation and Create Reinsurance Treaties batches submit their jobs
+  concurrently through one BulkCreateContext
+- BulkCreateContext memoization (single flight, failures not cached)
+- create_treaties is faster and does fewer lookups than per-item creation on a stub API
+  (slow, run with -m slow)
+
+All tests use a stub client and mocked managers and do not require actual
+API connectivity.
+
+Run these tests:
+    pytest workspace/tests/irp_integration/test_bulk_create.py
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+import helpers.batch as batch_module
+import helpers.irp_integration.portfolio as portfolio_module
+import helpers.irp_integration.treaty as treaty_module
+from helpers import job as job_module
+from helpers.constants import BatchType, JobStatus
+from helpers.irp_integration.exceptions import IRPAPIError, IRPBulkCreateError
+from helpers.irp_integration.portfolio import PortfolioManager
+from helpers.irp_integration.treaty import TreatyManager
+from helpers.irp_integration.utils import BulkCreateContext
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+class StubCreateClient:
+    """Client stub answering POSTs with a Location header and recording them in order"""
+
+    def __init__(self, latency=0.0, fail_paths=()):
+        self.latency = latency
+        self.fail_paths = fail_paths
+        self.posts = []
+        self.bodies = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._next_id = 1000
+
+    def request(self, method, path, json=None, params=None, **kwargs):
+        with self._lock:
+            self._next_id += 1
+            resource_id = self._next_id
+            self.posts.append((path, resource_id))
+            self.bodies[resource_id] = json
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            if any(fail in path for fail in self.fail_paths):
+                raise IRPAPIError("HTTP 500")
+            if method == 'GET':
+                return Mock(json=Mock(return_value=[]), headers={})
+            return Mock(headers={'location': f'{path}/{resource_id}'})
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def edm_manager(latency=0.0):
+    exposure_ids = {'EDM1': 11, 'EDM2': 22, 'EDM3': 33}
+
+    def lookup(value):
+        def call(*args, **kwargs):
+            time.sleep(latency)
+            return value(*args, **kwargs)
+        return Mock(side_effect=call)
+
+    edm = Mock()
+    edm.search_edms = lookup(lambda filter: [{'exposureId': exposure_ids[filter.split('"')[1]]}])
+    edm.get_cedants_by_edm = lookup(lambda exposure_id: [{'cedantId': 1, 'cedantName': 'Cedant'}])
+    edm.get_lobs_by_edm = lookup(lambda exposure_id: [
+        {'lobId': 1, 'lobName': 'Property'}, {'lobId': 2, 'lobName': 'Casualty'}
+    ])
+    return edm
+
+
+def reference_data_manager(latency=0.0):
+    codes = {'US Dollar': 'USD', 'Euro': 'EUR'}
+
+    def get_currency_by_name(name):
+        time.sleep(latency)
+        return {'currencyId': 1, 'currencyCode': codes[name], 'currencyName': name}
+
+    reference_data = Mock()
+    reference_data.get_currency_by_name = Mock(side_effect=get_currency_by_name)
+    return reference_data
+
+
+def treaty_data(i, edm_name='EDM1', currency_name='US Dollar'):
+    return {
+        'edm_name': edm_name, 'treaty_name': f'Treaty{i}', 'treaty_number': str(i),
+        'treaty_type': 'Quota Share', 'per_risk_limit': 1.0, 'occurrence_limit': 1.0,
+        'attachment_point': 0.0, 'inception_date': '2025-01-01', 'expiration_date': '2025-12-31',
+        'currency_name': currency_name, 'attachment_basis': 'Losses Occurring',
+        'attachment_level': 'Location', 'pct_covered': 100.0, 'pct_placed': 100.0,
+        'pct_share': 100.0, 'pct_retention': 0.0, 'premium': 0.0, 'num_reinstatements': 0,
+        'pct_reinstatement_charge': 0.0, 'aggregate_limit': 0.0, 'aggregate_deductible': 0.0,
+        'priority': 1,
+    }
+
+
+def portfolio_data(i, edm_name='EDM1'):
+    return {'edm_name': edm_name, 'portfolio_name': f'Portfolio{i}', 'portfolio_number': str(i), 'description': ''}
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    """Stub requests are not rate limited unless a test opts in"""
+    monkeypatch.setattr(treaty_module, 'BULK_CREATE_MAX_REQUESTS_PER_SECOND', 0)
+    monkeypatch.setattr(portfolio_module, 'BULK_CREATE_MAX_REQUESTS_PER_SECOND', 0)
+    monkeypatch.setattr('helpers.irp_integration.constants.BULK_CREATE_MAX_REQUESTS_PER_SECOND', 0)
+
+
+def treaty_manager(latency=0.0, fail_paths=()):
+    client = StubCreateClient(latency=latency, fail_paths=fail_paths)
+    return TreatyManager(
+        client,
+        edm_manager=edm_manager(latency),
+        reference_data_manager=reference_data_manager(latency)
+    )
+
+
+# ==============================================================================
+# TREATY TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_create_treaties_looks_up_each_name_once():
+    """EDM, cedant, currency and LOB lookups are made once per distinct value"""
+    manager = treaty_manager()
+    batch = [
+        treaty_data(i, edm_name=f'EDM{i % 3 + 1}', currency_name=('US Dollar', 'Euro')[i % 2])
+        for i in range(40)
+    ]
+
+    treaty_ids = manager.create_treaties(batch)
+
+    assert manager.edm_manager.search_edms.call_count == 3
+    assert manager.edm_manager.get_cedants_by_edm.call_count == 3
+    assert manager.edm_manager.get_lobs_by_edm.call_count == 3
+    assert manager.reference_data_manager.get_currency_by_name.call_count == 2
+
+    treaty_posts = dict((resource_id, path) for path, resource_id in manager.client.posts
+                        if path.endswith('/treaties'))
+    lob_posts = [path for path, _ in manager.client.posts if path.endswith('/lob')]
+    assert len(treaty_ids) == 40 and set(treaty_ids) == set(treaty_posts)
+    # Each treaty gets both LOBs, in its own EDM
+    assert sorted(lob_posts) == sorted(
+        f"{treaty_posts[treaty_id]}/{treaty_id}/lob" for treaty_id in treaty_ids for _ in range(2)
+    )
+
+
+@pytest.mark.unit
+def test_create_treaties_returns_ids_in_input_order():
+    """IDs line up with the input even though treaties are created concurrently"""
+    manager = treaty_manager(latency=0.002)
+
+    treaty_ids = manager.create_treaties([treaty_data(i) for i in range(20)])
+
+    bodies = manager.client.bodies
+    assert [bodies[treaty_id]['treatyName'] for treaty_id in treaty_ids] == [f'Treaty{i}' for i in range(20)]
+    assert manager.client.max_in_flight > 1
+
+
+@pytest.mark.unit
+def test_treaty_lobs_attach_while_treaties_are_created():
+    """LOB attachments for early treaties start before the last treaty is created"""
+    manager = treaty_manager(latency=0.005)
+
+    manager.create_treaties([treaty_data(i) for i in range(30)])
+
+    paths = [path for path, _ in manager.client.posts]
+    last_treaty = max(i for i, path in enumerate(paths) if path.endswith('/treaties'))
+    first_lob = min(i for i, path in enumerate(paths) if path.endswith('/lob'))
+    assert first_lob < last_treaty
+
+
+@pytest.mark.unit
+def test_create_treaties_errors():
+    """Missing fields fail before any request; a failed LOB attachment fails the call"""
+    manager = treaty_manager()
+    incomplete = treaty_data(2)
+    del incomplete['premium']
+
+    with pytest.raises(IRPAPIError, match="Missing data in create treaty data: 'premium'"):
+        manager.create_treaties([treaty_data(1), incomplete])
+    assert manager.client.posts == []
+
+    manager = treaty_manager(fail_paths=('/lob',))
+    with pytest.raises(IRPAPIError, match="Failed to create treaty 'Treaty0'.*Failed to create treaty LOB"):
+        manager.create_treaties([treaty_data(0)])
+
+
+@pytest.mark.unit
+def test_treaty_posts_share_rate_limiter(monkeypatch):
+    """Every treaty and LOB POST waits on the shared rate limiter"""
+    monkeypatch.setattr(treaty_module, 'BULK_CREATE_MAX_REQUESTS_PER_SECOND', 1000)
+    acquired = []
+    monkeypatch.setattr(BulkCreateContext, 'acquire', lambda self: acquired.append(1))
+    manager = treaty_manager()
+
+    manager.create_treaties([treaty_data(i) for i in range(5)])
+
+    assert len(acquired) == len(manager.client.posts) == 15
+
+
+@pytest.mark.unit
+def test_create_treaty_without_context_is_unchanged():
+    """Single treaty creation still looks everything up and attaches LOBs inline"""
+    manager = treaty_manager()
+
+    treaty_id, body = manager.create_treaty(**treaty_data(1))
+
+    assert body['currency'] == {'id': 1, 'code': 'USD', 'name': 'US Dollar'}
+    assert [path for path, _ in manager.client.posts][1:] == [
+        f'/platform/riskdata/v1/exposures/11/treaties/{treaty_id}/lob'
+    ] * 2
+
+
+@pytest.mark.unit
+def test_create_treaties_keeps_created_ids_on_failure():
+    """Treaties created before or alongside a failure are reported, not lost"""
+    manager = treaty_manager(fail_paths=('/exposures/22/treaties',))
+    batch = [treaty_data(i, edm_name=('EDM1', 'EDM2')[i % 2]) for i in range(6)]
+
+    with pytest.raises(IRPBulkCreateError, match="3 of 6 treaty creations failed \\(3 created\\)") as raised:
+        manager.create_treaties(batch)
+
+    created = raised.value.created_ids
+    assert [treaty_id is not None for treaty_id in created] == [True, False] * 3
+    assert [error is None for error in raised.value.errors] == [True, False] * 3
+    assert {manager.client.bodies[treaty_id]['treatyName'] for treaty_id in created if treaty_id} == {
+        'Treaty0', 'Treaty2', 'Treaty4'
+    }
+
+
+# ==============================================================================
+# PORTFOLIO TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_create_portfolios_looks_up_each_edm_once():
+    """Portfolios are created concurrently with one EDM search per EDM"""
+    client = StubCreateClient(latency=0.002)
+    manager = PortfolioManager(client, edm_manager=edm_manager())
+    manager.search_portfolios = Mock(return_value=[])
+
+    portfolio_ids = manager.create_portfolios(
+        [portfolio_data(i, edm_name=f'EDM{i % 2 + 1}') for i in range(12)]
+    )
+
+    assert manager.edm_manager.search_edms.call_count == 2
+    created = {resource_id: path for path, resource_id in client.posts}
+    assert [created[pid] for pid in portfolio_ids] == [
+        f'/platform/riskdata/v1/exposures/{(11, 22)[i % 2]}/portfolios' for i in range(12)
+    ]
+    assert client.max_in_flight > 1
+
+
+@pytest.mark.unit
+def test_create_portfolios_rejects_repeated_names():
+    """A name repeated within the list fails before anything is created"""
+    client = StubCreateClient()
+    manager = PortfolioManager(client, edm_manager=edm_manager())
+    manager.search_portfolios = Mock(return_value=[])
+
+    with pytest.raises(IRPAPIError, match="Portfolio name Portfolio1 appears more than once for EDM EDM1"):
+        manager.create_portfolios([portfolio_data(1), portfolio_data(2), portfolio_data(1)])
+    assert client.posts == []
+
+    with pytest.raises(IRPAPIError, match="Missing value in create portfolio data"):
+        manager.create_portfolios([{'edm_name': 'EDM1'}])
+
+
+@pytest.mark.unit
+def test_create_portfolios_keeps_created_ids_on_failure():
+    """A failed portfolio leaves the others created and reported"""
+    client = StubCreateClient(fail_paths=('/exposures/22/',))
+    manager = PortfolioManager(client, edm_manager=edm_manager())
+    manager.search_portfolios = Mock(return_value=[])
+
+    with pytest.raises(IRPBulkCreateError) as raised:
+        manager.create_portfolios([portfolio_data(1), portfolio_data(2, edm_name='EDM2'), portfolio_data(3)])
+
+    assert [created_id is not None for created_id in raised.value.created_ids] == [True, False, True]
+
+
+# ==============================================================================
+# BATCH SUBMISSION TESTS
+# ==============================================================================
+
+def submit_batch(batch_type, job_configs, irp_client):
+    """Run batch.submit_batch with the database patched; submit_job routes through job._submit_job"""
+    jobs = [
+        {'id': i, 'job_configuration_id': 100 + i, 'skipped': False, 'status': JobStatus.INITIATED}
+        for i in range(1, len(job_configs) + 1)
+    ]
+    contexts = []
+
+    def submit_job(job_id, batch_type, irp_client, schema, analysis_plan=None, bulk_context=None):
+        contexts.append(bulk_context)
+        workflow_id, _, response = job_module._submit_job(
+            job_id, job_configs[job_id - 1], batch_type, irp_client, bulk_context=bulk_context
+        )
+        if workflow_id is None:
+            raise RuntimeError(response['error'])
+        return job_id
+
+    with patch.object(batch_module, 'read_batch', return_value={'batch_type': batch_type, 'configuration_id': 3}), \
+         patch.object(batch_module, 'read_configuration', return_value={'id': 3, 'status': 'VALID', 'cycle_id': 1}), \
+         patch('helpers.database.execute_scalar', return_value='ACTIVE'), \
+         patch.object(batch_module, 'get_batch_jobs', return_value=jobs), \
+         patch.object(batch_module, 'execute_command'), \
+         patch.object(batch_module, 'update_configuration_status'), \
+         patch.object(batch_module, 'EntityValidator'), \
+         patch.object(job_module, 'submit_job', side_effect=submit_job):
+        result = batch_module.submit_batch(9, irp_client)
+    return result, contexts
+
+
+@pytest.mark.unit
+def test_treaty_batch_shares_context():
+    """Treaty jobs of a batch run concurrently with one lookup per EDM, cedant, currency and LOB list"""
+    manager = treaty_manager(latency=0.002)
+    configs = [{'Database': f'EDM{i % 2 + 1}', 'Treaty Name': f'Treaty{i}'} for i in range(12)]
+
+    result, contexts = submit_batch(BatchType.CREATE_REINSURANCE_TREATIES, configs, Mock(treaty=manager))
+
+    assert [job['job_id'] for job in result['jobs']] == list(range(1, 13))
+    assert all(job['status'] == 'SUBMITTED' for job in result['jobs'])
+    assert len({id(context) for context in contexts}) == 1 and contexts[0] is not None
+    assert manager.edm_manager.search_edms.call_count == 2
+    assert manager.edm_manager.get_lobs_by_edm.call_count == 2
+    assert manager.reference_data_manager.get_currency_by_name.call_count == 1
+    assert manager.client.max_in_flight > 1
+    # Every treaty's LOBs were attached before its job returned
+    assert sum(path.endswith('/lob') for path, _ in manager.client.posts) == 24
+
+
+@pytest.mark.unit
+def test_portfolio_batch_rejects_repeated_name():
+    """A portfolio name repeated across a batch's jobs is created once; the other job fails"""
+    client = StubCreateClient()
+    manager = PortfolioManager(client, edm_manager=edm_manager())
+    manager.search_portfolios = Mock(return_value=[])
+    configs = [{'Database': 'EDM1', 'Portfolio': name} for name in ('P1', 'P2', 'P1')]
+
+    result, _ = submit_batch(BatchType.PORTFOLIO_CREATION, configs, Mock(portfolio=manager))
+
+    assert [job['status'] for job in result['jobs']].count('FAILED') == 1
+    assert 'appears more than once' in next(job['error'] for job in result['jobs'] if job['status'] == 'FAILED')
+    assert len(client.posts) == 2
+    assert manager.edm_manager.search_edms.call_count == 1
+
+
+# ==============================================================================
+# CONTEXT TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_context_lookup_single_flight():
+    """Concurrent lookups of one key make one call; other keys are separate"""
+    calls = []
+
+    def fetch(key):
+        calls.append(key)
+        time.sleep(0.02)
+        return key.upper()
+
+    with BulkCreateContext(max_workers=2, max_requests_per_second=0) as context:
+        results = []
+        threads = [
+            threading.Thread(target=lambda k=k: results.append(context.lookup('edm', k, lambda: fetch(k))))
+            for k in ['a'] * 6 + ['b']
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sorted(calls) == ['a', 'b']
+    assert sorted(results) == ['A'] * 6 + ['B']
+    assert context.report() == {'lookup_calls': 2, 'cache_hits': 5}
+
+
+@pytest.mark.unit
+def test_context_failed_lookup_not_cached():
+    """A lookup that raised is retried by the next caller"""
+    fetch = Mock(side_effect=[IRPAPIError("Connection failed"), [{'exposureId': 11}]])
+
+    with BulkCreateContext(max_workers=1, max_requests_per_second=0) as context:
+        with pytest.raises(IRPAPIError, match="Connection failed"):
+            context.lookup('edm', 'EDM1', fetch)
+        assert context.lookup('edm', 'EDM1', fetch) == [{'exposureId': 11}]
+        assert context.lookup('edm', 'EDM1', fetch) == [{'exposureId': 11}]
+
+    assert fetch.call_count == 2
+
+
+# ==============================================================================
+# BENCHMARK
+# ==============================================================================
+
+@pytest.mark.unit
+@pytest.mark.slow
+def test_create_treaties_benchmark():
+    """Compare per-treaty creation with create_treaties on a stub API with 10ms latency"""
+    batch = [treaty_data(i, edm_name=f'EDM{i % 3 + 1}') for i in range(60)]
+
+    sequential = treaty_manager(latency=0.01)
+    start = time.perf_counter()
+    for data in batch:
+        sequential.create_treaty(**data)
+    per_treaty = time.perf_counter() - start
+
+    bulk = treaty_manager(latency=0.01)
+    start = time.perf_counter()
+    bulk.create_treaties(batch)
+    bulk_time = time.perf_counter() - start
+
+    lookups = lambda m: (m.edm_manager.search_edms.call_count + m.edm_manager.get_cedants_by_edm.call_count
+                         + m.edm_manager.get_lobs_by_edm.call_count
+                         + m.reference_data_manager.get_currency_by_name.call_count)
+    # 4 lookups per treaty vs. EDM, cedants and LOBs once per EDM plus one currency
+    assert lookups(sequential) == 4 * len(batch)
+    assert lookups(bulk) == 3 * 3 + 1
+    assert bulk_time * 5 < per_treaty, f"create_treaties {bulk_time:.3f}s vs per treaty {per_treaty:.3f}s"
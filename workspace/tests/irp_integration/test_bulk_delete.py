@@ -0,0 +1,282 @@
+"""
+Test suite for bulk entity deletion (irp_integration.bulk_delete)
+
+This test file validates:
+- Target resolution with chunked IN-filter searches
+- Same-named analyses/groups resolve to the first match unless all_matches
+- Deletion order and job submission/polling
+- Idempotent, resumable reports
+- Rate limiting of concurrent submissions
+
+All tests use mocked managers and do not require actual API connectivity.
+
+Run these tests:
+    pytest workspace/tests/irp_integration/test_bulk_delete.py
+"""
+
+import json
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from helpers.irp_integration.bulk_delete import BulkDeleteManager, BulkDeleteReport, BulkDeleteStatus
+from helpers.irp_integration.exceptions import IRPAPIError
+from tests.irp_integration.conftest import names_in
+from helpers.irp_integration.utils import RateLimiter
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+@pytest.fixture
+def managers():
+    """Mocked analysis/edm/rdm/job managers with an in-memory Moody's state"""
+    analyses = {
+        101: {'analysisId': 101, 'analysisName': 'A1', 'exposureName': 'EDM1', 'engineType': 'HD'},
+        102: {'analysisId': 102, 'analysisName': 'A2', 'exposureName': 'EDM1', 'engineType': 'HD'},
+        201: {'analysisId': 201, 'analysisName': 'G1', 'exposureName': None, 'engineType': 'Group'},
+    }
+    edms = {'EDM1': {'exposureName': 'EDM1', 'exposureId': 11}}
+
+    def search_analyses(filter):
+        if filter.startswith('exposureName IN'):
+            return [a for a in analyses.values() if a['exposureName'] in names_in(filter)]
+        results = [a for a in analyses.values() if a['analysisName'] in names_in(filter)]
+        if 'engineType = "Group"' in filter:
+            results = [a for a in results if a['engineType'] == 'Group']
+        if 'exposureName = "' in filter:
+            edm = filter.split('exposureName = "', 1)[1].split('"', 1)[0]
+            results = [a for a in results if a['exposureName'] == edm]
+        return results
+
+    analysis = Mock()
+    analysis.search_analyses_paginated.side_effect = search_analyses
+    analysis.delete_analysis.side_effect = lambda analysis_id: analyses.pop(analysis_id)
+
+    edm = Mock()
+    edm.search_edms_paginated.side_effect = lambda filter: [e for n, e in edms.items() if n in names_in(filter)]
+    edm.submit_delete_edm_job.return_value = 9001
+
+    rdm = Mock()
+    rdm.search_databases_paginated.return_value = [{'databaseName': 'RM_RDM_ABC123'}]
+    rdm.submit_delete_rdm_job_by_full_name.return_value = 'db-job-1'
+    rdm.get_databridge_job.return_value = 'Succeeded'
+
+    job = Mock()
+    job.poll_risk_data_job_batch_to_completion.return_value = [{'jobId': '9001', 'status': 'FINISHED'}]
+
+    return {'analysis': analysis, 'edm': edm, 'rdm': rdm, 'job': job, 'analyses': analyses}
+
+
+@pytest.fixture
+def bulk_delete(managers):
+    """BulkDeleteManager wired to mocked managers, without rate limiting"""
+    return BulkDeleteManager(
+        Mock(),
+        analysis_manager=managers['analysis'],
+        edm_manager=managers['edm'],
+        rdm_manager=managers['rdm'],
+        job_manager=managers['job'],
+        max_requests_per_second=0
+    )
+
+
+# ==============================================================================
+# PLAN TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_plan_resolves_ids_and_marks_missing(bulk_delete):
+    """Targets resolve to IDs; unknown names are NOT_FOUND"""
+    report = bulk_delete.plan(
+        analyses=[('EDM1', 'A1'), ('EDM1', 'Missing')],
+        groups=['G1', 'NoGroup'],
+        edms=['EDM1'],
+        include_edm_analyses=False
+    )
+
+    assert report.targets['analysis:EDM1/A1']['ids'] == [101]
+    assert report.targets['analysis:EDM1/Missing']['status'] == BulkDeleteStatus.NOT_FOUND
+    assert report.targets['group:G1']['ids'] == [201]
+    assert report.targets['group:NoGroup']['status'] == BulkDeleteStatus.NOT_FOUND
+    assert report.targets['edm:EDM1']['ids'] == [11]
+
+
+@pytest.mark.unit
+def test_plan_chunks_name_searches(bulk_delete, managers):
+    """Analysis names are searched in chunks of 25 per EDM"""
+    names = [('EDM1', f'X{i}') for i in range(60)]
+
+    bulk_delete.plan(analyses=names)
+
+    assert managers['analysis'].search_analyses_paginated.call_count == 3
+
+
+@pytest.mark.unit
+def test_plan_includes_edm_analyses(bulk_delete):
+    """Deleting an EDM also targets the analyses it contains"""
+    report = bulk_delete.plan(edms=['EDM1'])
+
+    assert 'analysis:EDM1/A1' in report.targets
+    assert 'analysis:EDM1/A2' in report.targets
+
+
+@pytest.mark.unit
+def test_plan_keeps_first_match_unless_all_matches(bulk_delete, managers):
+    """A listed name resolves to its first match; all_matches and EDM contents take every match"""
+    managers['analyses'][202] = {'analysisId': 202, 'analysisName': 'G1', 'exposureName': None, 'engineType': 'Group'}
+    managers['analyses'][103] = {'analysisId': 103, 'analysisName': 'A1', 'exposureName': 'EDM1', 'engineType': 'HD'}
+
+    report = bulk_delete.plan(analyses=[('EDM1', 'A1')], groups=['G1'], include_edm_analyses=False)
+    assert report.targets['group:G1']['ids'] == [201]
+    assert report.targets['analysis:EDM1/A1']['ids'] == [101]
+
+    report = bulk_delete.plan(groups=['G1'], all_matches=True)
+    assert report.targets['group:G1']['ids'] == [201, 202]
+
+    report = bulk_delete.plan(analyses=[('EDM1', 'A1')], edms=['EDM1'])
+    assert report.targets['analysis:EDM1/A1']['ids'] == [101, 103]
+
+
+@pytest.mark.unit
+def test_plan_lookup_error_marks_failed(bulk_delete, managers):
+    """Search failures mark targets FAILED instead of raising"""
+    managers['edm'].search_edms_paginated.side_effect = IRPAPIError("boom")
+
+    report = bulk_delete.plan(edms=['EDM1'], include_edm_analyses=False)
+
+    assert report.targets['edm:EDM1']['status'] == BulkDeleteStatus.FAILED
+    assert 'boom' in report.errors()[0]
+
+
+# ==============================================================================
+# EXECUTE TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_delete_all_entity_types(bulk_delete, managers):
+    """Groups and analyses are deleted, EDM/RDM jobs submitted and polled"""
+    report = bulk_delete.delete(groups=['G1'], edms=['EDM1'], rdms=['RM_RDM'])
+
+    assert report.is_complete
+    assert report.summary()['analysis'] == {BulkDeleteStatus.DELETED: 2}
+    assert managers['analyses'] == {}
+    managers['edm'].submit_delete_edm_job.assert_called_once_with(11)
+    managers['job'].poll_risk_data_job_batch_to_completion.assert_called_once()
+    assert managers['job'].poll_risk_data_job_batch_to_completion.call_args[0][0] == [9001]
+    managers['rdm'].submit_delete_rdm_job_by_full_name.assert_called_once_with('RM_RDM_ABC123', 'databridge-1')
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("all_matches,remaining", [(False, [202]), (True, [])])
+def test_delete_duplicate_group_names(bulk_delete, managers, all_matches, remaining):
+    """Only the first same-named group is deleted unless all_matches is set"""
+    managers['analyses'][202] = {'analysisId': 202, 'analysisName': 'G1', 'exposureName': None, 'engineType': 'Group'}
+
+    report = bulk_delete.delete(groups=['G1'], all_matches=all_matches, include_edm_analyses=False)
+
+    assert report.targets['group:G1']['status'] == BulkDeleteStatus.DELETED
+    assert [a for a in managers['analyses'] if managers['analyses'][a]['engineType'] == 'Group'] == remaining
+
+
+@pytest.mark.unit
+def test_failed_delete_recorded(bulk_delete, managers):
+    """Delete errors are recorded per target"""
+    managers['analysis'].delete_analysis.side_effect = IRPAPIError("locked")
+
+    report = bulk_delete.delete(analyses=[('EDM1', 'A1')])
+
+    assert report.targets['analysis:EDM1/A1']['status'] == BulkDeleteStatus.FAILED
+    assert not report.is_complete
+    assert 'locked' in report.errors()[0]
+
+
+@pytest.mark.unit
+def test_failed_edm_job_recorded(bulk_delete, managers):
+    """EDM delete jobs finishing with a non-FINISHED status are FAILED"""
+    managers['job'].poll_risk_data_job_batch_to_completion.return_value = [
+        {'jobId': 9001, 'status': 'FAILED'}
+    ]
+
+    report = bulk_delete.delete(edms=['EDM1'], include_edm_analyses=False)
+
+    assert report.targets['edm:EDM1']['status'] == BulkDeleteStatus.FAILED
+
+
+# ==============================================================================
+# RESUMABILITY TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_report_persisted_and_rerun_is_idempotent(bulk_delete, managers, tmp_path):
+    """A second run with the same report path makes no further deletions"""
+    report_path = str(tmp_path / 'reset.json')
+
+    bulk_delete.delete(analyses=[('EDM1', 'A1')], report_path=report_path)
+    saved = json.loads(open(report_path).read())
+    assert saved['targets']['analysis:EDM1/A1']['status'] == BulkDeleteStatus.DELETED
+
+    managers['analysis'].reset_mock()
+    report = bulk_delete.delete(analyses=[('EDM1', 'A1')], report_path=report_path)
+
+    assert report.is_complete
+    managers['analysis'].delete_analysis.assert_not_called()
+    managers['analysis'].search_analyses_paginated.assert_not_called()
+
+
+@pytest.mark.unit
+def test_resume_polls_submitted_jobs_without_resubmitting(bulk_delete, managers, tmp_path):
+    """Jobs left SUBMITTED by an interrupted run are polled, not resubmitted"""
+    report_path = str(tmp_path / 'reset.json')
+    report = BulkDeleteReport(report_path)
+    report.add_target('edm', 'EDM1')
+    report.update('edm:EDM1', ids=[11], job_ids=[9001], status=BulkDeleteStatus.SUBMITTED)
+
+    report = bulk_delete.delete(edms=['EDM1'], include_edm_analyses=False, report_path=report_path)
+
+    managers['edm'].submit_delete_edm_job.assert_not_called()
+    managers['edm'].search_edms_paginated.assert_not_called()
+    assert report.targets['edm:EDM1']['status'] == BulkDeleteStatus.DELETED
+
+
+@pytest.mark.unit
+def test_rerun_retries_failed_targets(bulk_delete, managers, tmp_path):
+    """FAILED targets are re-resolved and retried on the next run"""
+    report_path = str(tmp_path / 'reset.json')
+    managers['analysis'].delete_analysis.side_effect = IRPAPIError("locked")
+    bulk_delete.delete(analyses=[('EDM1', 'A1')], report_path=report_path)
+
+    managers['analysis'].delete_analysis.side_effect = lambda analysis_id: None
+    report = bulk_delete.delete(analyses=[('EDM1', 'A1')], report_path=report_path)
+
+    assert report.targets['analysis:EDM1/A1']['status'] == BulkDeleteStatus.DELETED
+
+
+# ==============================================================================
+# RATE LIMITER TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_rate_limiter_spaces_requests():
+    """Successive acquires are spaced by 1/max_per_second"""
+    limiter = RateLimiter(50)
+
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+
+@pytest.mark.unit
+def test_rate_limiter_disabled():
+    """A non-positive rate disables limiting"""
+    limiter = RateLimiter(0)
+
+    start = time.monotonic()
+    for _ in range(100):
+        limiter.acquire()
+
+    assert time.monotonic() - start < 0.05
@@ -0,0 +1,173 @@
+"""
+Test suite for the local loss-table store (irp_integration.loss_store)
+
+This test file validates:
+- Parsing eventId filters that can be answered locally
+- Parquet round trips keeping the API row order, with eventId pushdown
+- AnalysisManager ELT/PLT/EP/stats getters answered from the store after the
+  first call, matching the API results (including limit, offset, paging and
+  the default limit)
+- Other filters and empty results going to the API
+- delete_analysis removing stored tables, and the RISK_MODELER_LOSS_STORE opt-in
+
+All tests use the local Moody's API simulator and a temporary directory and do
+not require actual API connectivity or a database.
+
+Run these tests:
+    pytest workspace/tests/irp_integration/test_loss_store.py
+"""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from helpers.irp_integration import loss_store as loss_store_module
+from helpers.irp_integration.analysis import AnalysisManager
+from helpers.irp_integration.client import Client
+from helpers.irp_integration.loss_store import LossTableKey, LossTableStore, event_ids_from_filter, get_loss_store
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+@pytest.fixture
+def store(tmp_path):
+    return LossTableStore(tmp_path / 'loss_tables')
+
+
+# ==============================================================================
+# STORE TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_event_ids_from_filter():
+    """Only plain eventId equality and IN filters are answered locally"""
+    assert event_ids_from_filter('eventId = 12') == [12]
+    assert event_ids_from_filter(' eventid in (3, 5,7) ') == [3, 5, 7]
+    assert event_ids_from_filter('eventId IN (3) AND periodId = 1') is None
+    assert event_ids_from_filter('periodId = 1') is None
+    assert event_ids_from_filter('eventId > 5') is None
+
+
+@pytest.mark.unit
+def test_table_round_trip(store):
+    """Tables come back in the order stored; eventId filters keep that order"""
+    table = pd.DataFrame({
+        'eventId': [30, 10, 20, 10, 30],
+        'loss': [1.0, 2.0, 3.0, 4.0, 5.0],
+        'peril': pd.Categorical(['WS', 'EQ', 'WS', 'WS', 'EQ']),
+    })
+    key = LossTableKey(1, 'GU', 7, 'plt')
+
+    assert store.get_table(key) is None
+    assert store.put_table(key, table)
+    pd.testing.assert_frame_equal(store.get_table(key), table)
+
+    subset = store.get_table(key, event_ids=[10, 30])
+    assert subset['loss'].tolist() == [1.0, 2.0, 4.0, 5.0]
+    assert store.get_table(key, event_ids=[99]).empty
+
+    assert not store.put_table(LossTableKey(1, 'GU', 7, 'elt'), pd.DataFrame())
+    assert [(entry['table_name'], entry['records']) for entry in store.list_tables(1)] == [('plt', 5)]
+    assert store.stats() == {'hits': 3, 'misses': 1}
+
+
+# ==============================================================================
+# ANALYSIS MANAGER TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_manager_reads_tables_once(simulator, store, monkeypatch):
+    """ELT/PLT are downloaded once in pages; later calls match the API without requests"""
+    monkeypatch.setattr('helpers.irp_integration.analysis.LOSS_STORE_PAGE_SIZE', 300)
+    analysis_id = simulator.add_analysis('A1', 'EDM1', 'P1')
+    api = AnalysisManager(Client())
+    stored = AnalysisManager(Client(), loss_store=store)
+
+    expected_elt = api.get_elt(analysis_id, 'GU', 1)
+    expected_plt = api.get_plt(analysis_id, 'GU', 1, limit=150, offset=40)
+    expected_events = api.get_plt(analysis_id, 'GU', 1, filter='eventId IN (3, 5)')
+
+    simulator.reset_stats()
+    assert stored.get_elt(analysis_id, 'GU', 1) == expected_elt
+    assert store.stats() == {'hits': 0, 'misses': 1}
+    assert stored.get_plt(analysis_id, 'GU', 1, limit=150, offset=40) == expected_plt
+    assert simulator.stats()['requests'] == 2 + 7  # 500 ELT rows in 2 pages, 2000 PLT rows in 7
+
+    simulator.reset_stats()
+    assert stored.get_plt(analysis_id, 'GU', 1, filter='eventId IN (3, 5)') == expected_events
+    assert len(stored.get_plt_table(analysis_id, 'GU', 1)) == 2000
+    assert stored.get_elt(analysis_id, 'GU', 1, limit=10) == expected_elt[:10]
+    assert simulator.stats()['requests'] == 0
+
+
+@pytest.mark.unit
+def test_manager_applies_default_limit(simulator, store, monkeypatch):
+    """Without a limit, stored results stop at the same default page size as the API"""
+    monkeypatch.setattr('helpers.irp_integration.analysis.LOSS_TABLE_DEFAULT_LIMIT', 100)
+    analysis_id = simulator.add_analysis('A1', 'EDM1', 'P1')
+    api = AnalysisManager(Client())
+    stored = AnalysisManager(Client(), loss_store=store)
+
+    expected_elt = api.get_elt(analysis_id, 'GU', 1, offset=50)
+    assert len(expected_elt) == 100
+    assert stored.get_elt(analysis_id, 'GU', 1, offset=50) == expected_elt
+    assert len(stored.get_elt_table(analysis_id, 'GU', 1)) == 100
+    assert len(stored.get_plt_table(analysis_id, 'GU', 1)) == len(api.get_plt_table(analysis_id, 'GU', 1)) == 100
+
+
+@pytest.mark.unit
+def test_manager_passes_other_requests_to_api(simulator, store):
+    """Non-eventId filters go to the API; EP and stats are stored as returned"""
+    analysis_id = simulator.add_analysis('A1', 'EDM1', 'P1')
+    api = AnalysisManager(Client())
+    stored = AnalysisManager(Client(), loss_store=store)
+
+    expected_ep = api.get_ep(analysis_id, 'GU', 1)
+    expected_stats = api.get_stats(analysis_id, 'GU', 1)
+    expected_periods = api.get_plt(analysis_id, 'GU', 1, filter='periodId = 2')
+
+    simulator.reset_stats()
+    assert stored.get_plt(analysis_id, 'GU', 1, filter='periodId = 2') == expected_periods
+    assert simulator.stats()['requests'] == 1
+    assert store.list_tables(analysis_id) == []
+
+    for _ in range(2):
+        assert stored.get_ep(analysis_id, 'GU', 1) == expected_ep
+        assert stored.get_stats(analysis_id, 'GU', 1) == expected_stats
+    assert simulator.stats()['requests'] == 3
+
+
+@pytest.mark.unit
+def test_delete_analysis_removes_tables(simulator, store):
+    """Deleting an analysis drops its stored files and index entries"""
+    first = simulator.add_analysis('A1', 'EDM1', 'P1')
+    second = simulator.add_analysis('A2', 'EDM1', 'P1')
+    analyses = AnalysisManager(Client(), loss_store=store)
+    analyses.get_elt(first, 'GU', 1)
+    analyses.get_ep(first, 'GU', 1)
+    analyses.get_elt(second, 'GU', 1)
+
+    analyses.delete_analysis(first)
+
+    assert store.list_tables(first) == []
+    assert not (store.root / str(first)).exists()
+    assert len(store.list_tables(second)) == 1
+
+
+@pytest.mark.unit
+def test_opt_in_shared_store(tmp_path, monkeypatch):
+    """The cycle's shared store is only used when RISK_MODELER_LOSS_STORE is set"""
+    monkeypatch.setattr(loss_store_module, '_shared_stores', {})
+    monkeypatch.setattr(
+        'helpers.irp_integration.utils.get_cycle_file_directories',
+        lambda: {'loss_tables': str(tmp_path / 'loss_tables')}
+    )
+    monkeypatch.delenv('RISK_MODELER_LOSS_STORE', raising=False)
+    assert AnalysisManager(Client()).loss_store is None
+
+    monkeypatch.setenv('RISK_MODELER_LOSS_STORE', 'true')
+    assert AnalysisManager(Client()).loss_store is get_loss_store()
+    assert get_loss_store().root == tmp_path / 'loss_tables'
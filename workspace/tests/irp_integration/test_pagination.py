@@ -0,0 +1,230 @@
+"""
+Test suite for search pagination helpers (irp_integration.pagination)
+
+This test file validates:
+- Page fetching with and without a reported total count
+- Result ordering with concurrent page requests
+- Early termination of the streaming (generator) form
+- Total count extraction from responses, reusing the parsed page body
+- Manager *_paginated methods using the shared paginator
+
+All tests use in-memory page fetchers or mocked HTTP responses (responses library)
+and do not require actual API connectivity.
+
+Run these tests:
+    pytest workspace/tests/irp_integration/test_pagination.py
+"""
+
+import json
+import threading
+import time
+
+import pytest
+import requests
+import responses
+
+from helpers.irp_integration.client import Client
+from helpers.irp_integration.edm import EDMManager
+from helpers.irp_integration.exceptions import IRPAPIError, IRPValidationError
+from helpers.irp_integration.pagination import fetch_all_pages, iter_pages, iter_paginated
+from helpers.irp_integration.utils import get_total_count
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+class FakeSearch:
+    """In-memory paged search endpoint that records requested offsets."""
+
+    def __init__(self, count, report_total=True, delay=0.0):
+        self.records = [{'id': i} for i in range(count)]
+        self.report_total = report_total
+        self.delay = delay
+        self.offsets = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, offset, limit):
+        with self._lock:
+            self.offsets.append(offset)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            total = len(self.records) if self.report_total else None
+            return self.records[offset:offset + limit], total
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def mock_env(monkeypatch):
+    """Mock environment variables for testing"""
+    monkeypatch.setenv('RISK_MODELER_BASE_URL', 'https://api.test.com')
+    monkeypatch.setenv('RISK_MODELER_API_KEY', 'test-api-key')
+    monkeypatch.setenv('RISK_MODELER_RESOURCE_GROUP_ID', 'test-resource-group')
+
+
+# ==============================================================================
+# PAGINATOR TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_single_short_page_makes_one_request():
+    """A first page shorter than the limit ends pagination"""
+    search = FakeSearch(42)
+
+    results = fetch_all_pages(search, limit=100)
+
+    assert results == search.records
+    assert search.offsets == [0]
+
+
+@pytest.mark.unit
+def test_total_count_fetches_exact_pages():
+    """With a reported total, only the needed pages are requested"""
+    search = FakeSearch(1000)
+
+    results = fetch_all_pages(search, limit=100, max_workers=4)
+
+    assert results == search.records
+    assert sorted(search.offsets) == list(range(0, 1000, 100))
+
+
+@pytest.mark.unit
+def test_exact_multiple_without_total_stops_on_empty_page():
+    """Without a total, pagination stops at the first short (or empty) page"""
+    search = FakeSearch(300, report_total=False)
+
+    results = fetch_all_pages(search, limit=100, max_workers=1)
+
+    assert results == search.records
+    assert search.offsets == [0, 100, 200, 300]
+
+
+@pytest.mark.unit
+def test_unknown_total_prefetch_bounded_overfetch():
+    """Speculative prefetch requests at most max_workers - 1 pages past the end"""
+    search = FakeSearch(550, report_total=False)
+
+    results = fetch_all_pages(search, limit=100, max_workers=4)
+
+    assert results == search.records
+    assert max(search.offsets) <= 500 + 3 * 100
+
+
+@pytest.mark.unit
+def test_results_preserve_offset_order():
+    """Concurrent pages are yielded in offset order"""
+    search = FakeSearch(2000, delay=0.005)
+
+    pages = list(iter_pages(search, limit=100, max_workers=8))
+
+    assert [page[0]['id'] for page in pages] == list(range(0, 2000, 100))
+
+
+@pytest.mark.unit
+def test_parallelism_is_bounded():
+    """No more than max_workers page requests run at once"""
+    search = FakeSearch(2000, delay=0.01)
+
+    fetch_all_pages(search, limit=100, max_workers=3)
+
+    assert 1 < search.max_in_flight <= 3
+
+
+@pytest.mark.unit
+def test_generator_stops_early():
+    """Closing the generator stops further page requests"""
+    search = FakeSearch(5000, report_total=False)
+
+    stream = iter_paginated(search, limit=100, max_workers=2)
+    first = [next(stream) for _ in range(150)]
+    stream.close()
+
+    assert first == search.records[:150]
+    assert len(search.offsets) <= 4
+
+
+@pytest.mark.unit
+def test_page_error_propagates():
+    """Errors from any page are raised to the caller"""
+    def fetch_page(offset, limit):
+        if offset == 200:
+            raise IRPAPIError("boom")
+        return [{'id': i} for i in range(offset, offset + limit)], 1000
+
+    with pytest.raises(IRPAPIError, match="boom"):
+        fetch_all_pages(fetch_page, limit=100, max_workers=4)
+
+
+@pytest.mark.unit
+def test_invalid_max_workers():
+    """max_workers must be positive"""
+    with pytest.raises(IRPValidationError):
+        fetch_all_pages(FakeSearch(10), max_workers=0)
+
+
+# ==============================================================================
+# TOTAL COUNT / MANAGER TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+@responses.activate
+def test_get_total_count_from_header_and_body(mock_env):
+    """Total count is read from x-total-count header or totalMatchCount field"""
+    client = Client()
+    responses.add(responses.GET, 'https://api.test.com/with-header',
+                  json=[], headers={'X-Total-Count': '250'})
+    responses.add(responses.GET, 'https://api.test.com/with-body',
+                  json={'totalMatchCount': 7, 'items': []})
+    responses.add(responses.GET, 'https://api.test.com/without', json=[])
+
+    assert get_total_count(client.request('GET', '/with-header')) == 250
+    assert get_total_count(client.request('GET', '/with-body')) == 7
+    assert get_total_count(client.request('GET', '/without')) is None
+
+
+@pytest.mark.unit
+@responses.activate
+def test_search_edms_paginated_uses_total_count(mock_env):
+    """search_edms_paginated fetches every page when the total is reported"""
+    url = 'https://api.test.com/platform/riskdata/v1/exposures'
+    edms = [{'exposureName': f'EDM{i}', 'exposureId': i} for i in range(230)]
+
+    def callback(request):
+        offset = int(request.params['offset'])
+        limit = int(request.params['limit'])
+        return 200, {'x-total-count': str(len(edms))}, json.dumps(edms[offset:offset + limit])
+
+    responses.add_callback(responses.GET, url, callback=callback, content_type='application/json')
+
+    manager = EDMManager(Client())
+    results = manager.search_edms_paginated(filter='exposureName LIKE "EDM%"')
+
+    assert results == edms
+    assert len(responses.calls) == 3
+    assert list(manager.iter_edms())[:5] == edms[:5]
+
+
+@pytest.mark.unit
+@responses.activate
+def test_search_page_body_decoded_once(mock_env, monkeypatch):
+    """Each page's JSON is parsed once and reused for the total count lookup"""
+    url = 'https://api.test.com/platform/riskdata/v1/exposures'
+    responses.add(responses.GET, url, json=[{'exposureName': 'EDM1', 'exposureId': 1}])
+    decoded = []
+    original_json = requests.Response.json
+
+    def counting_json(self, **kwargs):
+        decoded.append(self.url)
+        return original_json(self, **kwargs)
+
+    monkeypatch.setattr(requests.Response, 'json', counting_json)
+
+    assert EDMManager(Client()).search_edms_paginated() == [{'exposureName': 'EDM1', 'exposureId': 1}]
+    assert len(decoded) == len(responses.calls) == 1
@@ -0,0 +1,204 @@
+"""
+Test suite for portfolio account/location probes (irp_integration.portfolio)
+
+This test file validates:
+- Probes request at most one account (limit=1), filtering on locationsCount
+- Without a verified match (no match, filter ignored or rejected) every account
+  is fetched and locationsCount summed
+- Portfolios with locations are remembered across PortfolioManager instances,
+  so GeoHaz submission after validation does not probe again
+- Portfolios without accounts or locations are re-probed every time
+- submit_geohaz_job keeps its error messages
+- The probe is faster than the full fetch on a stub API returning large account lists
+
+All tests use a stub client and do not require actual API connectivity.
+
+Run these tests:
+    pytest workspace/tests/irp_integration/test_portfolio_location_probe.py
+"""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from helpers.irp_integration.exceptions import IRPAPIError
+from helpers.irp_integration.portfolio import PortfolioManager, clear_location_status_cache
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+class StubAccountsClient:
+    """Client stub serving the accounts endpoint from an in-memory portfolio -> accounts map"""
+
+    def __init__(self, accounts_by_portfolio, latency_per_account=0.0, filter_support='supported'):
+        self.accounts_by_portfolio = accounts_by_portfolio
+        self.latency_per_account = latency_per_account
+        self.filter_support = filter_support  # 'supported', 'ignored' or 'rejected'
+        self.requests = []
+
+    def request(self, method, path, params=None, **kwargs):
+        self.requests.append((method, path, params))
+        portfolio_id = int(path.rstrip('/').split('/')[-2])
+        accounts = self.accounts_by_portfolio.get(portfolio_id, [])
+        params = params or {}
+        if params.get('filter') == 'locationsCount > 0':
+            if self.filter_support == 'rejected':
+                raise IRPAPIError("400: Invalid filter")
+            if self.filter_support == 'supported':
+                accounts = [a for a in accounts if a['locationsCount'] > 0]
+        if 'limit' in params:
+            accounts = accounts[:params['limit']]
+        # Serializing and transferring the body dominates for large portfolios
+        time.sleep(self.latency_per_account * len(accounts))
+        body = [dict(a) for a in accounts]
+        return Mock(json=Mock(return_value=body))
+
+
+def make_accounts(count, locations_from=0):
+    """Accounts where only those at index >= locations_from have locations"""
+    return [
+        {'accountId': i, 'accountName': f'Account{i}', 'locationsCount': 5 if i >= locations_from else 0}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Each test starts without remembered portfolios"""
+    clear_location_status_cache()
+    yield
+    clear_location_status_cache()
+
+
+# ==============================================================================
+# PROBE TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_location_probe_fetches_one_account():
+    """A portfolio with locations needs a single limit=1 filtered request"""
+    client = StubAccountsClient({10: make_accounts(500, locations_from=400)})
+    manager = PortfolioManager(client)
+
+    assert manager.get_location_status(1, 10) == {'has_accounts': True, 'has_locations': True}
+    assert len(client.requests) == 1
+    _, path, params = client.requests[0]
+    assert '/accounts' in path
+    assert params == {'filter': 'locationsCount > 0', 'limit': 1}
+
+
+@pytest.mark.unit
+def test_location_probe_distinguishes_no_accounts_from_no_locations():
+    """Without a match every account is fetched to confirm and pick the right error"""
+    client = StubAccountsClient({10: make_accounts(3, locations_from=3), 20: []})
+    manager = PortfolioManager(client)
+
+    assert manager.get_location_status(1, 10) == {'has_accounts': True, 'has_locations': False}
+    assert manager.get_location_status(1, 20) == {'has_accounts': False, 'has_locations': False}
+    assert [params for _, _, params in client.requests] == [
+        {'filter': 'locationsCount > 0', 'limit': 1}, None,
+        {'filter': 'locationsCount > 0', 'limit': 1}, None,
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("filter_support", ['ignored', 'rejected'])
+def test_location_probe_falls_back_when_filter_unsupported(filter_support):
+    """If the API ignores or rejects the filter, locations are counted over every account"""
+    client = StubAccountsClient({10: make_accounts(50, locations_from=40)}, filter_support=filter_support)
+    manager = PortfolioManager(client)
+
+    assert manager.get_location_status(1, 10) == {'has_accounts': True, 'has_locations': True}
+    assert [params for _, _, params in client.requests] == [
+        {'filter': 'locationsCount > 0', 'limit': 1}, None
+    ]
+
+
+@pytest.mark.unit
+def test_positive_status_shared_across_managers():
+    """Validation's probe is reused by a separate manager submitting GeoHaz"""
+    client = StubAccountsClient({10: make_accounts(2)})
+
+    PortfolioManager(client).get_location_status(1, 10)
+    submitting = PortfolioManager(client)
+    assert submitting.get_location_status(1, 10)['has_locations'] is True
+    assert submitting.portfolio_has_accounts(1, 10) is True
+    assert len(client.requests) == 1
+
+    clear_location_status_cache()
+    submitting.get_location_status(1, 10)
+    assert len(client.requests) == 2
+
+
+@pytest.mark.unit
+def test_negative_status_not_cached():
+    """A portfolio without locations is probed again, as an import may have added them"""
+    accounts = {10: []}
+    client = StubAccountsClient(accounts)
+    manager = PortfolioManager(client)
+
+    assert manager.get_location_status(1, 10)['has_accounts'] is False
+    accounts[10] = make_accounts(1)
+    assert manager.get_location_status(1, 10)['has_locations'] is True
+
+
+@pytest.mark.unit
+def test_portfolio_has_accounts_fetches_one_account():
+    """portfolio_has_accounts sends limit=1 without a filter"""
+    client = StubAccountsClient({10: make_accounts(100), 20: []})
+    manager = PortfolioManager(client)
+
+    assert manager.portfolio_has_accounts(1, 10) is True
+    assert manager.portfolio_has_accounts(1, 20) is False
+    assert [params for _, _, params in client.requests] == [{'limit': 1}, {'limit': 1}]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("accounts,message", [
+    ([], "does not have any Accounts/Locations to be GeoHaz'd"),
+    (make_accounts(3, locations_from=3), "has accounts but no locations to be GeoHaz'd"),
+])
+def test_submit_geohaz_job_location_errors(accounts, message):
+    """submit_geohaz_job raises the same errors as before the probe"""
+    client = StubAccountsClient({10: accounts})
+    manager = PortfolioManager(client, edm_manager=Mock())
+    manager.edm_manager.search_edms.return_value = [{'exposureId': 1}]
+    manager.search_portfolios = Mock(return_value=[{'portfolioId': 10, 'uri': '/portfolios/10'}])
+
+    with pytest.raises(IRPAPIError, match=message):
+        manager.submit_geohaz_job('Port1', 'EDM1')
+
+
+# ==============================================================================
+# BENCHMARK
+# ==============================================================================
+
+@pytest.mark.unit
+@pytest.mark.slow
+def test_location_probe_benchmark():
+    """Compare fetching every account with the limit=1 probe on large portfolios"""
+    portfolios = {pid: make_accounts(20000, locations_from=10000) for pid in range(1, 6)}
+    client = StubAccountsClient(portfolios, latency_per_account=2e-6)
+    manager = PortfolioManager(client)
+
+    start = time.perf_counter()
+    for pid in portfolios:
+        accounts = manager.search_accounts_by_portfolio(1, pid)
+        assert sum(a['locationsCount'] for a in accounts) > 0
+    full_fetch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for pid in portfolios:
+        assert manager.get_location_status(1, pid)['has_locations']
+    probe = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for pid in portfolios:
+        assert manager.get_location_status(1, pid)['has_locations']
+    cached = time.perf_counter() - start
+
+    assert probe * 5 < full_fetch, f"probe {probe:.4f}s vs full fetch {full_fetch:.3f}s"
+    assert cached < probe
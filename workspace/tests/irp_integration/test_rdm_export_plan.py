@@ -0,0 +1,373 @@
+"""
+Test suite for batch-level RDM export planning (irp_integration.rdm, helpers.batch)
+
+This test file validates:
+- Plans look up each database server once and resolve analysis and group
+  names with chunked IN-filter searches
+- Planned submissions send the same payload as per-job submissions, with
+  only the POST per job
+- Missing and duplicate names behave as before (skipped or raised)
+- The seed-job batch submits only the seed job and parks; the remaining
+  jobs get databaseId in one update and are submitted concurrently once
+  the seed job has finished (at submission or from recon_batch)
+- FAILED and ERROR non-seed jobs are retried; jobs claimed by a concurrent
+  release (advisory lock on the batch) are not submitted twice
+- A failed seed job resolves the batch instead of leaving it ACTIVE
+
+All tests use mocked managers and do not require actual API connectivity.
+
+Run these tests:
+    pytest workspace/tests/irp_integration/test_rdm_export_plan.py
+"""
+
+import threading
+from contextlib import contextmanager
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+import helpers.batch as batch_module
+from helpers.constants import BatchType, JobStatus
+from helpers.irp_integration.exceptions import IRPAPIError
+from helpers.irp_integration.rdm import RDMManager
+from tests.irp_integration.conftest import name_equals, names_in
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+ANALYSES = [
+    {'analysisName': 'A1', 'exposureName': 'EDM1', 'engineType': 'DLM', 'uri': 'uri/a1'},
+    {'analysisName': 'A2', 'exposureName': 'EDM1', 'engineType': 'DLM', 'uri': 'uri/a2'},
+    {'analysisName': 'A1', 'exposureName': 'EDM2', 'engineType': 'DLM', 'uri': 'uri/a1b'},
+    {'analysisName': 'P1', 'exposureName': 'EDM2', 'engineType': 'HD', 'uri': 'uri/p1',
+     'analysisFramework': 'PLT'},
+    {'analysisName': 'G1', 'exposureName': None, 'engineType': 'Group', 'uri': 'uri/g1'},
+    {'analysisName': 'Dup', 'exposureName': None, 'engineType': 'Group', 'uri': 'uri/d1'},
+    {'analysisName': 'Dup', 'exposureName': None, 'engineType': 'Group', 'uri': 'uri/d2'},
+]
+
+
+def matching(filter_str, names):
+    results = [a for a in ANALYSES if a['analysisName'] in names]
+    if 'engineType = "Group"' in filter_str:
+        results = [a for a in results if a['engineType'] == 'Group']
+    if 'exposureName = "' in filter_str:
+        edm_name = filter_str.split('exposureName = "', 1)[1].split('"', 1)[0]
+        results = [a for a in results if a['exposureName'] == edm_name]
+    return results
+
+
+@pytest.fixture
+def manager():
+    """RDMManager wired to mocked EDM/analysis managers over an in-memory analysis list"""
+    edm = Mock()
+    edm.search_database_servers.return_value = [{'serverId': 5}]
+
+    analysis = Mock()
+    analysis.search_analyses_paginated.side_effect = lambda filter: matching(filter, names_in(filter))
+    analysis.search_analyses.side_effect = lambda filter: matching(filter, {name_equals(filter)})
+
+    client = Mock()
+    client.request.side_effect = lambda method, path, json: Mock(
+        headers={'location': f'/jobs/{1000 + client.request.call_count}'}
+    )
+    return RDMManager(client, analysis_manager=analysis, edm_manager=edm)
+
+
+def export_data(name, edm_name=None, is_group=False, database_id=77):
+    return {
+        'server_name': 'databridge-1',
+        'rdm_name': 'RDM_Q1',
+        'analysis_names': [name],
+        'database_id': database_id,
+        'analysis_edm_map': {name: edm_name} if edm_name else {},
+        'group_names': {name} if is_group else set(),
+    }
+
+
+# ==============================================================================
+# PLAN TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_plan_resolves_names_in_chunked_searches(manager):
+    """Lookups for a whole export batch are one server search plus chunked name searches"""
+    batch = [export_data('A1', 'EDM1'), export_data('A2', 'EDM1'), export_data('A1', 'EDM2'),
+             export_data('P1', 'EDM2'), export_data('G1', is_group=True)]
+    batch += [export_data(f'Missing{i}', 'EDM1') for i in range(30)]
+
+    plan = manager.plan_rdm_export_jobs(batch)
+    results = [manager.submit_rdm_export_job(**data, plan=plan) for data in batch]
+
+    manager.edm_manager.search_database_servers.assert_called_once()
+    # EDM1: 32 names in 2 chunks; EDM2: 1 chunk; groups: 1 chunk
+    assert manager.analysis_manager.search_analyses_paginated.call_count == 4
+    manager.analysis_manager.search_analyses.assert_not_called()
+    assert manager.client.request.call_count == 5
+    assert [r['included_items'] for r in results[:5]] == [['A1'], ['A2'], ['A1'], ['P1'], ['G1']]
+    assert all(r['skipped'] for r in results[5:])
+
+    report = plan.report()
+    assert report['api_calls'] == 5
+    assert report['legacy_api_calls'] == 2 * len(batch)
+    assert report['cache_hits'] == 2 * len(batch)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("data", [
+    export_data('A1', 'EDM2'),
+    export_data('P1', 'EDM2'),
+    export_data('G1', is_group=True),
+    export_data('A2'),
+])
+def test_planned_payload_matches_per_job_submission(manager, data):
+    """A planned submission POSTs the same request body as an unplanned one"""
+    plan = manager.plan_rdm_export_jobs([data])
+
+    planned = manager.submit_rdm_export_job(**data, plan=plan)
+    unplanned = manager.submit_rdm_export_job(**data)
+
+    assert planned['http_request_body'] == unplanned['http_request_body']
+    assert planned['included_items'] == unplanned['included_items']
+
+
+@pytest.mark.unit
+def test_planned_duplicates_and_missing_match_per_job(manager):
+    """Duplicates raise and missing names skip or raise exactly as without a plan"""
+    batch = [export_data('Dup', is_group=True), export_data('A1'), export_data('Nope', 'EDM1')]
+    plan = manager.plan_rdm_export_jobs(batch)
+
+    with pytest.raises(IRPAPIError, match="Duplicate groups exist with name: Dup"):
+        manager.submit_rdm_export_job(**batch[0], plan=plan)
+    with pytest.raises(IRPAPIError, match="Duplicate analyses exist with name: A1"):
+        manager.submit_rdm_export_job(**batch[1], plan=plan)
+    with pytest.raises(IRPAPIError, match="Analysis 'Nope' not found for EDM 'EDM1'"):
+        manager.submit_rdm_export_job(**batch[2], skip_missing=False, plan=plan)
+    assert manager.submit_rdm_export_job(**batch[2], plan=plan)['skipped_items'] == ['Nope']
+    manager.client.request.assert_not_called()
+
+
+@pytest.mark.unit
+def test_failed_planning_search_retried_per_job(manager):
+    """A search that fails while planning is not cached; the job that needs it retries"""
+    manager.analysis_manager.search_analyses_paginated.side_effect = [
+        IRPAPIError("Connection failed"),
+        [ANALYSES[0]],
+    ]
+
+    plan = manager.plan_rdm_export_jobs([export_data('A1', 'EDM1')])
+    result = manager.submit_rdm_export_job(**export_data('A1', 'EDM1'), plan=plan)
+
+    assert result['included_items'] == ['A1']
+    assert manager.analysis_manager.search_analyses_paginated.call_count == 2
+
+
+# ==============================================================================
+# SEED BATCH SUBMISSION
+# ==============================================================================
+
+def seed_batch(seed_status=JobStatus.INITIATED):
+    """Six-job RDM export batch; job 1 is the seed job"""
+    jobs = [
+        {'id': i, 'job_configuration_id': 100 + i, 'skipped': False,
+         'status': seed_status if i == 1 else JobStatus.INITIATED}
+        for i in range(1, 7)
+    ]
+    configs = [
+        {'id': 100 + i, 'skipped': False, 'job_configuration_data': {
+            'rdm_name': 'RDM_Q1', 'server_name': 'databridge-1', 'analysis_names': [f'A{i}'],
+            'edm_name': 'EDM1', 'is_seed_job': i == 1
+        }}
+        for i in range(1, 7)
+    ]
+    return jobs, configs
+
+
+@pytest.fixture
+def job_module():
+    """Mocked helpers.job whose non-seed submissions only return once all five are in flight"""
+    all_in_flight = threading.Barrier(5, timeout=5)
+    module = Mock()
+    module.submitted = []
+
+    def submit_job(job_id, batch_type, irp_client, schema, job_config, rdm_export_plan=None):
+        assert batch_type == BatchType.EXPORT_TO_RDM
+        module.submitted.append((job_id, job_config['job_configuration_data'].get('database_id')))
+        if job_id != 1:
+            assert rdm_export_plan is module.plan_rdm_export_submissions.return_value
+            all_in_flight.wait()
+        return job_id
+
+    module.plan_rdm_export_submissions.return_value.report.return_value = {'api_calls': 2}
+    module.submit_job.side_effect = submit_job
+    return module
+
+
+@pytest.fixture
+def irp_client():
+    client = Mock()
+    client.rdm.get_rdm_database_id.return_value = 42
+    return client
+
+
+def claim(claimable=None):
+    """Stand-in for _claim_rdm_export_jobs: claims every candidate, or only claimable"""
+    @contextmanager
+    def claim_jobs(batch_id, job_ids, schema='public'):
+        assert batch_id == 9
+        yield set(job_ids) if claimable is None else set(job_ids) & set(claimable)
+    return patch.object(batch_module, '_claim_rdm_export_jobs', side_effect=claim_jobs)
+
+
+def submit_seed_batch(jobs, configs, irp_client, job_module, claimable=None):
+    with claim(claimable), \
+         patch.object(batch_module, 'get_batch_job_configurations', return_value=configs) as get_configs, \
+         patch.object(batch_module, 'execute_command'), \
+         patch.object(batch_module, 'update_configuration_status'):
+        result = batch_module._submit_rdm_export_batch_with_seed(
+            batch_id=9,
+            batch={'configuration_id': 3},
+            jobs=jobs,
+            irp_client=irp_client,
+            job_module=job_module
+        )
+    get_configs.assert_called_once_with(9, skipped=False, schema='public')
+    return result
+
+
+def assert_remaining_jobs_released(job_module):
+    job_module.update_job_configurations_data.assert_called_once_with(
+        [102, 103, 104, 105, 106], {'database_id': 42}, schema='public'
+    )
+    planned_configs = job_module.plan_rdm_export_submissions.call_args[0][0]
+    assert [c['analysis_names'] for c in planned_configs] == [[f'A{i}'] for i in range(2, 7)]
+    assert sorted(job_module.submitted) == [(i, 42) for i in range(2, 7)]
+
+
+@pytest.mark.unit
+def test_seed_batch_parks_after_submitting_seed(irp_client, job_module):
+    """Only the seed job is submitted; nothing waits for it to finish"""
+    jobs, configs = seed_batch()
+
+    result = submit_seed_batch(jobs, configs, irp_client, job_module)
+
+    job_module.get_job_config.assert_not_called()
+    assert job_module.submitted == [(1, None)]
+    irp_client.rdm.poll_rdm_export_job_to_completion.assert_not_called()
+    irp_client.rdm.get_rdm_database_id.assert_not_called()
+    assert result['batch_status'] == 'ACTIVE'
+    assert result['seed_job_id'] == 1
+    assert result['pending_jobs'] == 5
+    assert result['database_id'] is None
+    assert result['jobs'] == [{'job_id': 1, 'status': 'SUBMITTED', 'is_seed': True}]
+
+
+@pytest.mark.unit
+def test_seed_batch_with_finished_seed_releases_remaining_jobs(irp_client, job_module):
+    """A seed job that already finished lets the remaining jobs submit straight away, in parallel"""
+    jobs, configs = seed_batch(seed_status=JobStatus.FINISHED)
+
+    result = submit_seed_batch(jobs, configs, irp_client, job_module)
+
+    assert_remaining_jobs_released(job_module)
+    assert [j['job_id'] for j in result['jobs']] == [2, 3, 4, 5, 6]
+    assert all(j['status'] == 'SUBMITTED' for j in result['jobs'])
+    assert result['pending_jobs'] == 0
+    assert result['database_id'] == 42
+    assert result['api_calls'] == {'api_calls': 2}
+
+
+def recon(jobs_reads, configs, irp_client, job_module, claimable=None):
+    """Run recon_batch with patched queries; jobs_reads are successive get_batch_jobs results"""
+    with claim(claimable), \
+         patch.object(batch_module, 'get_batch_job_configurations', return_value=configs), \
+         patch.object(batch_module, 'get_batch_jobs', side_effect=jobs_reads), \
+         patch.object(batch_module, '_insert_recon_log'), \
+         patch.object(batch_module, 'update_batch_status'), \
+         patch.object(batch_module, '_send_batch_failure_notification'), \
+         patch('helpers.job', job_module, create=True):
+        return batch_module.recon_batch(9, irp_client=irp_client)
+
+
+@pytest.mark.unit
+def test_recon_releases_jobs_once_seed_finishes(irp_client, job_module):
+    """The batch monitor's recon submits the parked jobs after the seed job finishes"""
+    waiting, configs = seed_batch(seed_status=JobStatus.SUBMITTED)
+    assert recon([waiting], configs, irp_client, job_module) == 'ACTIVE'
+    job_module.submit_job.assert_not_called()
+
+    finished, _ = seed_batch(seed_status=JobStatus.FINISHED)
+    released = [{**j, 'status': JobStatus.SUBMITTED} for j in finished[1:]]
+    status = recon([finished, finished[:1] + released], configs, irp_client, job_module)
+
+    assert status == 'ACTIVE'
+    assert_remaining_jobs_released(job_module)
+
+
+@pytest.mark.unit
+def test_recon_fails_batch_when_seed_fails(irp_client, job_module):
+    """Jobs waiting on a failed seed job do not keep the batch ACTIVE"""
+    jobs, configs = seed_batch(seed_status=JobStatus.FAILED)
+
+    assert recon([jobs], configs, irp_client, job_module) == 'FAILED'
+    job_module.submit_job.assert_not_called()
+
+
+@pytest.mark.unit
+def test_failed_and_errored_jobs_are_resubmitted(irp_client):
+    """Submitting the batch again retries FAILED and ERROR non-seed jobs, not finished ones"""
+    jobs, configs = seed_batch(seed_status=JobStatus.FINISHED)
+    jobs[1]['status'] = JobStatus.FAILED
+    jobs[2]['status'] = JobStatus.ERROR
+    jobs[3]['status'] = JobStatus.FINISHED
+    jobs[4]['status'] = JobStatus.SUBMITTED
+    module = Mock()
+    module.submit_job.side_effect = lambda job_id, *args, **kwargs: job_id
+
+    result = submit_seed_batch(jobs, configs, irp_client, module)
+
+    assert sorted(call.args[0] for call in module.submit_job.call_args_list) == [2, 3, 6]
+    module.update_job_configurations_data.assert_called_once_with([102, 103, 106], {'database_id': 42}, schema='public')
+
+
+@pytest.mark.unit
+def test_concurrent_release_submits_nothing_twice(irp_client):
+    """Jobs claimed by another release, or a batch locked by one, are not submitted again"""
+    module = Mock()
+    module.submit_job.side_effect = lambda job_id, *args, **kwargs: job_id
+    finished, configs = seed_batch(seed_status=JobStatus.FINISHED)
+
+    # Another recon holds the lock: nothing is looked up or submitted
+    recon([finished, finished], configs, irp_client, module, claimable=[])
+    module.submit_job.assert_not_called()
+    irp_client.rdm.get_rdm_database_id.assert_not_called()
+
+    # The previous holder already submitted jobs 2-4
+    recon([finished, finished], configs, irp_client, module, claimable=[5, 6])
+    assert sorted(call.args[0] for call in module.submit_job.call_args_list) == [5, 6]
+
+
+@pytest.mark.unit
+def test_claim_takes_batch_lock_before_reading_statuses():
+    """The claim locks the batch and reads ready jobs on one transaction"""
+    conn = MagicMock()
+    conn.execute.side_effect = [Mock(scalar=Mock(return_value=True)), [(3,), (5,)]]
+    engine = MagicMock()
+    engine.connect.return_value.__enter__.return_value = conn
+
+    with patch.object(batch_module, 'get_engine', return_value=engine):
+        with batch_module._claim_rdm_export_jobs(9, [3, 4, 5], schema='test') as claimed:
+            assert claimed == {3, 5}
+
+    lock, select = conn.execute.call_args_list
+    assert 'pg_try_advisory_xact_lock' in str(lock.args[0])
+    assert lock.args[1] == {'namespace': 'test.irp_batch', 'batch_id': 9}
+    assert select.args[1] == {'job_ids': [3, 4, 5], 'statuses': JobStatus.ready_for_submit()}
+    conn.begin.assert_called_once()
+
+    conn.execute.side_effect = [Mock(scalar=Mock(return_value=False))]
+    with patch.object(batch_module, 'get_engine', return_value=engine):
+        with batch_module._claim_rdm_export_jobs(9, [3], schema='test') as claimed:
+            assert claimed == set()
@@ -0,0 +1,227 @@
+"""
+Test suite for the HTTP response cache (irp_integration.cache)
+
+This test file validates:
+- Per-path TTL rules and resource families
+- Repeated GETs answered from the cache, with round-trips and bytes saved
+- ETag revalidation (If-None-Match / 304) once the TTL has passed
+- Invalidation by POST/DELETE of the same or a related resource family
+- What is never cached: unlisted endpoints, empty results, errors
+- Opt-in through RISK_MODELER_RESPONSE_CACHE and per-run stats in Step.complete
+
+All tests run against the local Moody's API simulator and do not require
+actual API connectivity or a database.
+
+Run these tests:
+    pytest workspace/tests/irp_integration/test_response_cache.py
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from helpers.irp_integration import cache as cache_module
+from helpers.irp_integration.cache import ResponseCache, get_response_cache, resource_family
+from helpers.irp_integration.client import Client
+from helpers.irp_integration.constants import (
+    GET_ANALYSIS_EP,
+    GET_ANALYSIS_RESULT,
+    SEARCH_ANALYSIS_RESULTS,
+    SEARCH_EDMS,
+    SEARCH_PORTFOLIOS,
+)
+from helpers.irp_integration.edm import EDMManager
+from helpers.irp_integration.exceptions import IRPAPIError
+from helpers.irp_integration.portfolio import PortfolioManager
+from helpers.irp_integration.simulator import SimulatorConfig
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+@pytest.fixture
+def simulator_config():
+    """Simulator sending ETags"""
+    return SimulatorConfig(etags=True)
+
+
+@pytest.fixture
+def simulator(simulator):
+    """Shared simulator (see conftest) with a second EDM"""
+    simulator.add_edm('EDM2')
+    return simulator
+
+
+def cached_client(**cache_options):
+    return Client(response_cache=ResponseCache(**cache_options))
+
+
+# ==============================================================================
+# RULE TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_ttl_rules():
+    """Only listed endpoint templates are cached, each with its own TTL"""
+    cache = ResponseCache(ttls={SEARCH_EDMS: 60, GET_ANALYSIS_EP: 3600})
+
+    assert cache.ttl_for('https://api.example.com/platform/riskdata/v1/exposures') == 60
+    assert cache.ttl_for('https://api.example.com/platform/riskdata/v1/analyses/12/ep') == 3600
+    assert cache.ttl_for('https://api.example.com/platform/riskdata/v1/analyses/12/elt') is None
+    assert cache.ttl_for('https://api.example.com/platform/riskdata/v1/exposures/3') is None
+
+
+@pytest.mark.unit
+def test_resource_family():
+    """Families end at the first resource after the version segment"""
+    assert resource_family('/platform/riskdata/v1/analyses/12/ep') == '/platform/riskdata/v1/analyses'
+    assert resource_family('/platform/riskdata/v1/exposures/5/portfolios') == '/platform/riskdata/v1/exposures'
+    assert resource_family('/platform/model/v1/jobs') == '/platform/model/v1/jobs'
+    assert resource_family('/data-store/referencetables/currency') == '/data-store/referencetables'
+
+
+# ==============================================================================
+# CACHING TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_repeated_searches_use_cache(simulator):
+    """A repeated search is answered from memory and counted as saved"""
+    client = cached_client()
+    edms = EDMManager(client)
+    simulator.reset_stats()
+
+    first = edms.search_edms(filter='exposureName = "EDM1"')
+    second = edms.search_edms(filter='exposureName = "EDM1"')
+    other = edms.search_edms(filter='exposureName = "EDM2"')
+
+    assert first == second
+    assert other[0]['exposureName'] == 'EDM2'
+    assert simulator.stats()['requests'] == 2
+    stats = client.response_cache.stats()
+    assert stats['hits'] == stats['round_trips_saved'] == 1
+    assert stats['misses'] == 2
+    assert stats['bytes_saved'] > 0
+
+
+@pytest.mark.unit
+def test_etag_revalidation(simulator):
+    """Expired entries with an ETag are revalidated and reused on 304"""
+    client = cached_client(ttls={SEARCH_EDMS: 0})
+    edms = EDMManager(client)
+
+    first = edms.search_edms()
+    with patch.object(client.session, 'request', wraps=client.session.request) as request:
+        second = edms.search_edms()
+
+    assert second == first
+    assert request.call_args.kwargs['headers']['If-None-Match'].startswith('"')
+    stats = client.response_cache.stats()
+    assert stats['revalidated'] == 1
+    assert stats['round_trips_saved'] == 0
+    assert stats['bytes_saved'] > 0
+
+    # Without validators an expired entry is simply fetched again
+    simulator.config.etags = False
+    client = cached_client(ttls={SEARCH_EDMS: 0})
+    EDMManager(client).search_edms()
+    EDMManager(client).search_edms()
+    assert client.response_cache.stats()['misses'] == 2
+
+
+@pytest.mark.unit
+def test_writes_invalidate_resource_family(simulator):
+    """Creating a portfolio drops cached exposure searches; model jobs drop analysis searches"""
+    client = cached_client()
+    portfolios = PortfolioManager(client)
+
+    assert [p['portfolioName'] for p in portfolios.search_portfolios(1)] == ['P1']
+    portfolios.create_portfolio('EDM1', 'P2')
+    assert sorted(p['portfolioName'] for p in portfolios.search_portfolios(1)) == ['P1', 'P2']
+    assert client.response_cache.stats()['invalidated'] >= 1
+
+    cache = ResponseCache(ttls={SEARCH_ANALYSIS_RESULTS: 60, SEARCH_PORTFOLIOS: 60})
+    url = 'https://api.example.com/platform/riskdata/v1/analyses'
+    response = type('Response', (), {'status_code': 200, 'headers': {}, 'content': b'[{"analysisId": 1}]'})()
+    cache.get(url, None, {}, lambda conditional: response)
+    assert len(cache) == 1
+    assert cache.invalidate('https://api.example.com/platform/model/v1/jobs') == 1
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_not_cached(simulator):
+    """Unlisted endpoints, empty results and errors always go to the API"""
+    client = cached_client()
+    edms = EDMManager(client)
+    simulator.reset_stats()
+
+    edms.search_edms(filter='exposureName = "Missing"')
+    edms.search_edms(filter='exposureName = "Missing"')
+    client.request('GET', 'platform/riskdata/v1/jobs')
+    client.request('GET', 'platform/riskdata/v1/jobs')
+    for _ in range(2):
+        with pytest.raises(IRPAPIError):
+            client.request('GET', GET_ANALYSIS_RESULT.format(analysisId=999))
+
+    assert simulator.stats()['requests'] == 6
+    assert len(client.response_cache) == 0
+
+
+@pytest.mark.unit
+def test_max_entries():
+    """The least recently used entries are dropped beyond max_entries"""
+    cache = ResponseCache(ttls={SEARCH_EDMS: 60}, max_entries=2)
+    url = 'https://api.example.com/platform/riskdata/v1/exposures'
+    response = type('Response', (), {'status_code': 200, 'headers': {}, 'content': b'[1]'})()
+
+    for offset in (0, 1, 0, 2):
+        cache.get(url, {'offset': offset}, {}, lambda conditional: response)
+
+    assert len(cache) == 2
+    assert cache.stats()['hits'] == 1
+    cache.get(url, {'offset': 0}, {}, lambda conditional: response)
+    assert cache.stats()['hits'] == 2
+
+
+# ==============================================================================
+# OPT-IN AND REPORTING TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_opt_in_shared_cache(monkeypatch):
+    """Clients share one cache only when RISK_MODELER_RESPONSE_CACHE is set"""
+    monkeypatch.setattr(cache_module, '_shared_cache', None)
+    monkeypatch.delenv('RISK_MODELER_RESPONSE_CACHE', raising=False)
+    assert Client().response_cache is None
+
+    monkeypatch.setenv('RISK_MODELER_RESPONSE_CACHE', 'true')
+    assert Client().response_cache is get_response_cache()
+    assert Client().response_cache is Client().response_cache
+
+
+@pytest.mark.unit
+def test_step_complete_reports_cache_stats(simulator, monkeypatch, capsys):
+    """Step.complete stores and prints the requests saved during the run"""
+    from helpers import step as step_module
+
+    monkeypatch.setattr(cache_module, '_shared_cache', None)
+    monkeypatch.setenv('RISK_MODELER_RESPONSE_CACHE', 'true')
+    edms = EDMManager(Client())
+    edms.search_edms()  # Before the run: not counted
+
+    context = type('Context', (), {'step_id': 3})()
+    with patch.object(step_module, 'get_step_info', return_value={}), \
+         patch.object(step_module, 'get_last_step_run', return_value=None), \
+         patch.object(step_module, 'create_step_run', return_value=(21, 1)), \
+         patch.object(step_module, 'update_step_run') as update_step_run:
+        step = step_module.Step(context)
+        edms.search_edms()
+        edms.search_edms()
+        step.complete({'records': 1})
+
+    stats = update_step_run.call_args.kwargs['output_data']['_meta']['response_cache']
+    assert stats['hits'] == stats['round_trips_saved'] == 2
+    assert stats['misses'] == 0
+    assert "API response cache: 2 hits" in capsys.readouterr().out
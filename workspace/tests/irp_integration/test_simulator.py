@@ -0,0 +1,208 @@
+"""
+Test suite for the local Moody's API simulator (irp_integration.simulator)
+
+This test file validates:
+- Filter parsing and matching (=, IN, LIKE, comparisons, AND)
+- Searches, pagination and the total count header through the real managers
+- Job submission and status: running until job_duration, then FINISHED/FAILED
+- Analysis submission end to end, and deterministic ELT/EP/stats/PLT results
+- Throttling (HTTP 429) and request statistics
+
+All tests run the simulator on 127.0.0.1 and do not require actual API connectivity.
+
+Run these tests:
+    pytest workspace/tests/irp_integration/test_simulator.py
+"""
+
+import time
+
+import pytest
+import requests
+
+from helpers.irp_integration.client import Client
+from helpers.irp_integration.edm import EDMManager
+from helpers.irp_integration.analysis import AnalysisManager
+from helpers.irp_integration.job import JobManager
+from helpers.irp_integration.portfolio import PortfolioManager
+from helpers.irp_integration.simulator import (
+    MoodysAPISimulator,
+    SimulatorConfig,
+    matches,
+    parse_filter,
+)
+from helpers.irp_integration.utils import name_in_filter, quote_filter_value
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+@pytest.fixture
+def simulator():
+    """Simulator with one EDM, two portfolios and a treaty"""
+    with MoodysAPISimulator(SimulatorConfig(elt_events=200, plt_records=300)) as simulator:
+        simulator.add_edm('EDM1', portfolios=['P1', 'P2'], treaties=['T1'])
+        yield simulator
+
+
+@pytest.fixture
+def client(simulator, monkeypatch):
+    """Real API client pointed at the simulator"""
+    monkeypatch.setenv('RISK_MODELER_BASE_URL', simulator.base_url)
+    return Client()
+
+
+def analysis_data(job_name, portfolio_name='P1'):
+    return {
+        'edm_name': 'EDM1',
+        'portfolio_name': portfolio_name,
+        'job_name': job_name,
+        'analysis_profile_name': 'DLM Profile',
+        'output_profile_name': 'Default Output',
+        'event_rate_scheme_name': 'RMS 2023 Stochastic Event Rates',
+        'treaty_names': ['T1'],
+        'tag_names': ['Tag1'],
+    }
+
+
+# ==============================================================================
+# FILTER TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_parse_filter_clauses():
+    """Clauses split on AND, with quoted, numeric and list values"""
+    assert parse_filter('analysisName IN ("A1", "A2") AND exposureName = "EDM1"') == [
+        ('analysisName', 'IN', ['A1', 'A2']),
+        ('exposureName', '=', 'EDM1'),
+    ]
+    assert parse_filter('locationsCount > 0') == [('locationsCount', '>', 0)]
+    assert parse_filter("TAGNAME = 'Tag1'") == [('TAGNAME', '=', 'Tag1')]
+    assert parse_filter(None) == []
+
+    with pytest.raises(ValueError, match="Unsupported filter clause"):
+        parse_filter('not a filter')
+
+
+@pytest.mark.unit
+def test_parse_filter_escaped_quotes():
+    """Quotes and backslashes escaped by name_in_filter parse back to the original names"""
+    names = ['Plain', 'Say "hi"', 'C:\\dir', 'a, b']
+    filter_str = name_in_filter('analysisName', names) + ' AND exposureName = ' + quote_filter_value('E"1')
+    assert parse_filter(filter_str) == [('analysisName', 'IN', names), ('exposureName', '=', 'E"1')]
+
+
+@pytest.mark.unit
+def test_matches():
+    """Field names are case-insensitive; LIKE accepts * and % wildcards"""
+    record = {'databaseName': 'RDM_0001', 'eventId': 12, 'tagName': 'Tag1'}
+
+    assert matches(record, parse_filter('databaseName LIKE "RDM*"'))
+    assert matches(record, parse_filter('databaseName LIKE "RDM%"'))
+    assert matches(record, parse_filter('eventId IN (11, 12) AND eventId >= 12'))
+    assert matches(record, parse_filter("TAGNAME = 'Tag1'"))
+    assert not matches(record, parse_filter('eventId = 13'))
+    assert not matches(record, parse_filter('eventId < 12'))
+
+
+# ==============================================================================
+# API TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_searches_with_pagination(simulator, client):
+    """Managers page through searches using limit/offset and the total count header"""
+    for i in range(25):
+        simulator.add_portfolio('EDM1', f'Bulk{i}')
+    portfolios = PortfolioManager(client)
+
+    found = portfolios.search_portfolios_paginated(1, filter='portfolioName LIKE "Bulk*"')
+    assert sorted(p['portfolioName'] for p in found) == sorted(f'Bulk{i}' for i in range(25))
+
+    response = client.request('GET', 'platform/riskdata/v1/exposures/1/portfolios', params={'limit': 10, 'offset': 20})
+    assert response.headers['x-total-count'] == '27'
+    assert len(response.json()) == 7
+
+
+@pytest.mark.unit
+def test_unknown_endpoint_is_404(client):
+    """Endpoints the simulator does not implement fail like a missing API route"""
+    response = requests.get(f"{client.base_url}/platform/nothing/here")
+    assert response.status_code == 404
+    assert 'No simulated endpoint' in response.json()['message']
+
+
+@pytest.mark.unit
+def test_jobs_run_for_job_duration(simulator, client):
+    """Jobs report RUNNING until job_duration has passed, then their outcome"""
+    simulator.config.job_duration = 0.3
+    edms = EDMManager(client)
+    jobs = JobManager(client)
+
+    job_id, _ = edms.submit_create_edm_job('NewEDM', 'databridge-1')
+    assert jobs.get_risk_data_job(job_id)['status'] == 'RUNNING'
+    time.sleep(0.35)
+    assert jobs.get_risk_data_job(job_id)['status'] == 'FINISHED'
+    assert edms.search_edms(filter='exposureName = "NewEDM"')
+
+
+@pytest.mark.unit
+def test_job_failure_rate(simulator, client):
+    """A failure rate of 1 fails every job"""
+    simulator.config.job_failure_rate = 1.0
+    job_id, _ = EDMManager(client).submit_create_edm_job('NewEDM', 'databridge-1')
+    assert JobManager(client).get_risk_data_job(job_id)['status'] == 'FAILED'
+
+
+@pytest.mark.unit
+def test_analysis_submission_and_results(simulator, client):
+    """Analyses submitted through AnalysisManager produce searchable results"""
+    analyses = AnalysisManager(client)
+
+    job_id, request_body = analyses.submit_portfolio_analysis_job(**analysis_data('A1'))
+    assert request_body['settings']['treatyIds'] == [1]
+    assert analyses.get_analysis_job(job_id)['status'] == 'FINISHED'
+
+    analysis = analyses.search_analyses(filter='analysisName = "A1"')[0]
+    elt = analyses.get_elt(analysis['analysisId'], 'GU', analysis['exposureResourceId'])
+    assert len(elt) == 200
+    assert analyses.get_elt(analysis['analysisId'], 'GU', analysis['exposureResourceId']) == elt
+
+    subset = analyses.get_elt(analysis['analysisId'], 'GU', analysis['exposureResourceId'], filter='eventId IN (3, 5)')
+    assert [r['eventId'] for r in subset] == [3, 5]
+    assert {c['epType'] for c in analyses.get_ep(analysis['analysisId'], 'GU', 1)} == {'OEP', 'AEP', 'CEP', 'TCE'}
+    assert len(analyses.get_stats(analysis['analysisId'], 'GU', 1)) == 2
+    assert len(analyses.get_plt(analysis['analysisId'], 'GU', 1, limit=100)) == 100
+
+    with pytest.raises(Exception, match="already exists"):
+        analyses.submit_portfolio_analysis_job(**analysis_data('A1'))
+
+
+@pytest.mark.unit
+def test_throttling_and_stats(simulator, client):
+    """Requests above max_requests_per_second get 429s, counted in stats"""
+    simulator.config.max_requests_per_second = 3
+    simulator.reset_stats()
+
+    statuses = [
+        requests.get(f"{client.base_url}/platform/riskdata/v1/exposures").status_code
+        for _ in range(5)
+    ]
+
+    assert statuses == [200, 200, 200, 429, 429]
+    stats = simulator.stats()
+    assert stats['requests'] == 5
+    assert stats['throttled'] == 2
+    assert stats['by_endpoint'] == {'GET /platform/riskdata/v1/exposures': 3}
+
+
+@pytest.mark.unit
+def test_latency(simulator, client):
+    """Configured latency is added to each response"""
+    simulator.config.latency = 0.05
+    edms = EDMManager(client)
+
+    start = time.perf_counter()
+    for _ in range(4):
+        edms.search_edms()
+    assert time.perf_counter() - start >= 0.2
@@ -0,0 +1,143 @@
+"""
+Test suite for streaming JSON decoding into DataFrames (irp_integration.streaming)
+
+This test file validates:
+- Splitting a chunked JSON array into batches (whitespace, '}' inside strings,
+  empty and non-array bodies, truncated bodies)
+- read_json_table(): typed and categorical columns, fields missing from some
+  records, and table_records() reproducing response.json()
+- AnalysisManager.get_elt_table / get_plt_table against get_elt / get_plt
+- PLT comparison in AnalysisResultsValidator using the table variant
+
+All tests use in-memory bodies or the local Moody's API simulator and do not
+require actual API connectivity.
+
+Run these tests:
+    pytest workspace/tests/irp_integration/test_streaming.py
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from helpers.irp_integration.analysis import AnalysisManager
+from helpers.irp_integration.client import Client
+from helpers.irp_integration.streaming import iter_json_array_batches, read_json_table, table_records
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+class StreamedResponse:
+    """Stand-in for a streamed requests.Response over a fixed body"""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+
+def chunked(body: bytes, size: int):
+    return [body[start:start + size] for start in range(0, len(body), size)]
+
+
+RECORDS = [
+    {'eventId': i, 'periodId': i // 3 + 1, 'eventDate': f'2025-01-{i % 28 + 1:02d}',
+     'positionValue': i * 1.5, 'peril': 'WS' if i % 2 else 'EQ', 'note': 'a } b' if i == 7 else None}
+    for i in range(1, 201)
+]
+
+
+# ==============================================================================
+# BATCH DECODING TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_batches_preserve_records():
+    """Records come back in order whatever the chunk and batch sizes"""
+    body = json.dumps(RECORDS, indent=1).encode()
+
+    for chunk_size, batch_bytes in [(7, 50), (64, 1000), (len(body), 10 ** 6)]:
+        batches = list(iter_json_array_batches(chunked(body, chunk_size), batch_bytes))
+        assert [r for batch in batches for r in batch] == RECORDS
+    assert len(list(iter_json_array_batches(chunked(body, 64), 1000))) > 1
+
+
+@pytest.mark.unit
+def test_batches_edge_cases():
+    """Empty arrays, non-array bodies and truncated bodies"""
+    assert list(iter_json_array_batches([b'  [', b' ]  '])) == []
+    assert list(iter_json_array_batches([])) == []
+    assert list(iter_json_array_batches([b'{"message": ', b'"x"}'])) == [[{'message': 'x'}]]
+    assert list(iter_json_array_batches([b'[1, 2', b', 3]'], batch_bytes=1)) == [[1, 2, 3]]
+
+    with pytest.raises(ValueError, match="Unterminated"):
+        list(iter_json_array_batches([b'[{"a": 1}, {"a": 2}'], batch_bytes=5))
+
+
+# ==============================================================================
+# TABLE TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_read_json_table_columns():
+    """Numbers become numeric columns, text categorical, across batches"""
+    records = RECORDS + [{'eventId': 999, 'extra': 'late field'}]
+    table = read_json_table(StreamedResponse(json.dumps(records).encode()), batch_bytes=500, chunk_bytes=128)
+
+    assert len(table) == len(records)
+    assert table['eventId'].dtype == 'int64'
+    assert table['positionValue'].dtype == 'float64'
+    assert isinstance(table['peril'].dtype, pd.CategoricalDtype)
+    assert set(table['peril'].cat.categories) == {'WS', 'EQ'}
+    assert table['extra'].isna().sum() == len(RECORDS)
+
+    rows = table_records(table)
+    assert rows[0] == {**RECORDS[0], 'extra': None}
+    assert rows[6]['note'] == 'a } b'
+    assert rows[-1]['extra'] == 'late field'
+    assert rows[-1]['peril'] is None
+    assert type(rows[0]['eventId']) is int
+
+    assert read_json_table(StreamedResponse(b'[]')).empty
+
+
+@pytest.mark.unit
+def test_table_variants_match_list_variants(simulator):
+    """get_elt_table / get_plt_table hold the same records as get_elt / get_plt"""
+    analysis_id = simulator.add_analysis('A1', 'EDM1', 'P1')
+    analyses = AnalysisManager(Client())
+
+    elt = analyses.get_elt(analysis_id, 'GU', 1)
+    assert table_records(analyses.get_elt_table(analysis_id, 'GU', 1)) == elt
+
+    plt = analyses.get_plt(analysis_id, 'GU', 1)
+    plt_table = analyses.get_plt_table(analysis_id, 'GU', 1)
+    assert len(plt_table) == 2000
+    assert table_records(plt_table) == plt
+
+    subset = analyses.get_plt_table(analysis_id, 'GU', 1, filter='eventId IN (3, 5)', limit=50)
+    assert set(subset['eventId']) <= {3, 5}
+    assert table_records(subset) == analyses.get_plt(analysis_id, 'GU', 1, filter='eventId IN (3, 5)', limit=50)
+
+
+@pytest.mark.unit
+def test_validator_plt_comparison(simulator):
+    """PLT comparison keeps only the sampled composite keys from the test table"""
+    from helpers.analysis_results_validator import AnalysisResultsValidator
+
+    first = simulator.add_analysis('A1', 'EDM1', 'P1')
+    second = simulator.add_analysis('A2', 'EDM1', 'P1')
+    irp_client = type('IRPClient', (), {'analysis': AnalysisManager(Client())})()
+    validator = AnalysisResultsValidator(irp_client)
+
+    same = validator._compare_plt(first, first, 'GU', 1, 1, 1e-9, 2, sample_size=100)
+    assert same.passed
+    assert same.total_records_prod == same.total_records_test == 100
+
+    different = validator._compare_plt(first, second, 'GU', 1, 1, 1e-9, 2, sample_size=100)
+    assert not different.passed
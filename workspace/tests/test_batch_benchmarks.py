@@ -0,0 +1,210 @@
+"""
+Performance benchmarks for batch workflows against the local Moody's API simulator
+
+This test file measures, end to end with the real IRPClient:
+- validate_batch for an EDM Creation batch
+- submit_batch for EDM Creation and Analysis batches
+- A track_job_status polling pass over a submitted batch, followed by recon_batch
+
+Requests go over HTTP to MoodysAPISimulator (helpers/irp_integration/simulator.py)
+with a fixed per-request latency, so results reflect the number and shape of API
+calls as well as database work. Batch size and latency are set with
+BENCHMARK_BATCH_SIZE and BENCHMARK_API_LATENCY.
+
+All tests run in the 'test_batch_benchmarks' schema (auto-managed by test_schema
+fixture) and require pytest-benchmark; they are skipped without it.
+
+Run these tests:
+    pytest workspace/tests/test_batch_benchmarks.py -m slow
+    pytest workspace/tests/test_batch_benchmarks.py --benchmark-autosave
+    pytest workspace/tests/test_batch_benchmarks.py --benchmark-compare
+"""
+
+import itertools
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from helpers.database import execute_command, execute_insert
+from helpers.batch import create_batch, get_batch_jobs, recon_batch, submit_batch, validate_batch
+from helpers.job import track_job_status
+from helpers.constants import BatchStatus, BatchType, ConfigurationStatus, JobStatus
+from helpers.irp_integration import IRPClient
+from helpers.irp_integration.simulator import MoodysAPISimulator, SimulatorConfig
+
+
+BATCH_SIZE = int(os.environ.get('BENCHMARK_BATCH_SIZE', 50))
+API_LATENCY = float(os.environ.get('BENCHMARK_API_LATENCY', 0.01))
+
+_names = itertools.count(1)
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+@pytest.fixture(scope='module')
+def simulator():
+    """Simulator shared by the module, seeded with EDMs, portfolios and treaties for analyses"""
+    with MoodysAPISimulator(SimulatorConfig(latency=API_LATENCY)) as simulator:
+        for i in range(5):
+            simulator.add_edm(f'BenchEDM{i}', portfolios=[f'Portfolio{j}' for j in range(10)], treaties=['Treaty1'])
+        previous = os.environ.get('RISK_MODELER_BASE_URL')
+        os.environ['RISK_MODELER_BASE_URL'] = simulator.base_url
+        yield simulator
+        if previous is None:
+            os.environ.pop('RISK_MODELER_BASE_URL', None)
+        else:
+            os.environ['RISK_MODELER_BASE_URL'] = previous
+
+
+@pytest.fixture
+def irp_client(simulator):
+    return IRPClient()
+
+
+def create_benchmark_batch(test_schema, batch_type, config_data):
+    """Create cycle, stage, step, configuration and batch; returns batch_id"""
+    # Only one cycle may be ACTIVE
+    execute_command("UPDATE irp_cycle SET status = 'ARCHIVED' WHERE status = 'ACTIVE'", schema=test_schema)
+    cycle_name = f"bench_{next(_names)}"
+    cycle_id = execute_insert(
+        "INSERT INTO irp_cycle (cycle_name, status) VALUES (%s, %s)",
+        (cycle_name, 'ACTIVE'),
+        schema=test_schema
+    )
+    stage_id = execute_insert(
+        "INSERT INTO irp_stage (cycle_id, stage_num, stage_name) VALUES (%s, %s, %s)",
+        (cycle_id, 1, 'bench_stage'),
+        schema=test_schema
+    )
+    step_id = execute_insert(
+        "INSERT INTO irp_step (stage_id, step_num, step_name) VALUES (%s, %s, %s)",
+        (stage_id, 1, 'bench_step'),
+        schema=test_schema
+    )
+    config_id = execute_insert(
+        """INSERT INTO irp_configuration
+           (cycle_id, configuration_file_name, configuration_data, status, file_last_updated_ts)
+           VALUES (%s, %s, %s, %s, %s)""",
+        (cycle_id, '/test/bench_config.xlsx',
+         json.dumps({'Metadata': {'cycle': cycle_name, 'date': '2024-01-01'}, **config_data}),
+         ConfigurationStatus.VALID, datetime.now()),
+        schema=test_schema
+    )
+    return create_batch(batch_type=batch_type, configuration_id=config_id, step_id=step_id, schema=test_schema)
+
+
+def edm_batch(test_schema):
+    """EDM Creation batch with BATCH_SIZE new databases"""
+    run = next(_names)
+    databases = [{'Database': f'EDM_{run}_{i}', 'Server': 'databridge-1'} for i in range(BATCH_SIZE)]
+    return create_benchmark_batch(test_schema, BatchType.EDM_CREATION, {'Databases': databases})
+
+
+def analysis_batch(test_schema):
+    """Analysis batch with BATCH_SIZE new analyses over the seeded portfolios"""
+    run = next(_names)
+    rows = [
+        {
+            'Database': f'BenchEDM{i % 5}',
+            'Portfolio': f'Portfolio{i % 10}',
+            'Analysis Name': f'Analysis_{run}_{i}',
+            'Analysis Profile': 'DLM Profile',
+            'Output Profile': 'Default Output',
+            'Event Rate': 'RMS 2023 Stochastic Event Rates',
+            'Reinsurance Treaty 1': 'Treaty1',
+            'Tag 1': 'Benchmark',
+        }
+        for i in range(BATCH_SIZE)
+    ]
+    return create_benchmark_batch(test_schema, BatchType.ANALYSIS, {'Analysis Table': rows})
+
+
+def report(simulator, label):
+    """Print API requests per endpoint for the last benchmark"""
+    stats = simulator.stats()
+    print(f"\n{label}: {stats['requests']} API requests ({stats['throttled']} throttled)")
+    for endpoint, count in stats['by_endpoint'].items():
+        print(f"  {count:6d}  {endpoint}")
+
+
+# ==============================================================================
+# BENCHMARKS
+# ==============================================================================
+
+@pytest.mark.database
+@pytest.mark.integration
+@pytest.mark.slow
+def test_benchmark_validate_edm_batch(test_schema, simulator, benchmark):
+    """validate_batch for an EDM Creation batch"""
+    batch_id = edm_batch(test_schema)
+    simulator.reset_stats()
+
+    errors = benchmark(validate_batch, batch_id, schema=test_schema)
+
+    assert errors == []
+    report(simulator, f"validate_batch ({BATCH_SIZE} EDMs, {benchmark.stats.stats.rounds} rounds)")
+
+
+@pytest.mark.database
+@pytest.mark.integration
+@pytest.mark.slow
+def test_benchmark_submit_edm_batch(test_schema, simulator, irp_client, benchmark):
+    """submit_batch for an EDM Creation batch (a new batch each round)"""
+    batch_ids = []
+
+    def setup():
+        batch_ids.append(edm_batch(test_schema))
+        simulator.reset_stats()
+        return (batch_ids[-1], irp_client), {'schema': test_schema}
+
+    benchmark.pedantic(submit_batch, setup=setup, rounds=3, iterations=1)
+
+    jobs = get_batch_jobs(batch_ids[-1], schema=test_schema)
+    assert len(jobs) == BATCH_SIZE
+    assert all(job['status'] == JobStatus.SUBMITTED for job in jobs)
+    report(simulator, f"submit_batch ({BATCH_SIZE} EDMs)")
+
+
+@pytest.mark.database
+@pytest.mark.integration
+@pytest.mark.slow
+def test_benchmark_submit_analysis_batch(test_schema, simulator, irp_client, benchmark):
+    """submit_batch for an Analysis batch, including reference data validation"""
+    batch_ids = []
+
+    def setup():
+        batch_ids.append(analysis_batch(test_schema))
+        simulator.reset_stats()
+        return (batch_ids[-1], irp_client), {'schema': test_schema}
+
+    benchmark.pedantic(submit_batch, setup=setup, rounds=3, iterations=1)
+
+    jobs = get_batch_jobs(batch_ids[-1], schema=test_schema)
+    assert all(job['status'] == JobStatus.SUBMITTED for job in jobs)
+    report(simulator, f"submit_batch ({BATCH_SIZE} analyses)")
+
+
+@pytest.mark.database
+@pytest.mark.integration
+@pytest.mark.slow
+def test_benchmark_track_and_recon(test_schema, simulator, irp_client, benchmark):
+    """One polling pass (track_job_status for every job) followed by recon_batch"""
+    batch_id = edm_batch(test_schema)
+    submit_batch(batch_id, irp_client, schema=test_schema)
+    simulator.reset_stats()
+
+    def poll():
+        for job in get_batch_jobs(batch_id, skipped=False, schema=test_schema):
+            track_job_status(job['id'], BatchType.EDM_CREATION, irp_client, schema=test_schema)
+        return recon_batch(batch_id, schema=test_schema, irp_client=irp_client)
+
+    status = benchmark(poll)
+
+    assert status == BatchStatus.COMPLETED
+    report(simulator, f"track_job_status + recon_batch ({BATCH_SIZE} jobs, {benchmark.stats.stats.rounds} rounds)")
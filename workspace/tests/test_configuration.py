@@ -15,6 +15,8 @@ Run these tests:
     pytest workspace/tests/test_configuration.py --preserve-schema
 """
 
+import os
+import stat
 import pytest
 import json
 import pandas as pd
@@ -1586,4 +1588,153 @@ def test_validate_reference_data_different_model_profiles_different_event_rate_l
     calls = mock_ref_data.get_event_rate_scheme_by_name.call_args_list
     call_args = [(call[0][0], call[1].get('peril_code'), call[1].get('model_region_code')) for call in calls]
     assert ('RMS 2013 Stochastic Event Rates', 'CS', 'NACS') in call_args
-    assert ('RMS 2013 Stochastic Event Rates', 'WS', 'NAWS') in call_args
\ No newline at end of file
+    assert ('RMS 2013 Stochastic Event Rates', 'WS', 'NAWS') in call_args
+
+# ============================================================================
+# Tests - Configuration File Cache
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.skipif(not Path(VALID_EXCEL_PATH).exists(), reason="Test Excel file not found")
+def test_validate_configuration_file_uses_cache(configuration_cache_dir, monkeypatch, mocker):
+    """Test unchanged workbook is served from the on-disk cache without re-parsing"""
+    from helpers import configuration
+
+    monkeypatch.delenv('CONFIGURATION_CACHE_ENABLED', raising=False)
+    monkeypatch.delenv('CONFIGURATION_EXCEL_ENGINE', raising=False)
+
+    first = validate_configuration_file(VALID_EXCEL_PATH, skip_entity_validation=True)
+    assert len(list(configuration_cache_dir.glob('*.json'))) == 1
+
+    parse_spy = mocker.spy(configuration, '_parse_and_validate_workbook')
+    second = validate_configuration_file(VALID_EXCEL_PATH, skip_entity_validation=True)
+
+    assert parse_spy.call_count == 0
+    assert second['configuration_data'] == first['configuration_data']
+    assert second['validation_passed'] is True
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not Path(VALID_EXCEL_PATH).exists(), reason="Test Excel file not found")
+def test_validate_configuration_file_cache_still_runs_entity_validation(monkeypatch, mocker):
+    """Test cache hit still validates entities against Moody's"""
+    monkeypatch.delenv('CONFIGURATION_CACHE_ENABLED', raising=False)
+    validate_configuration_file(VALID_EXCEL_PATH, skip_entity_validation=True)
+
+    mocker.patch('helpers.configuration.validate_reference_data_with_api', return_value=[])
+    mock_validator = mocker.patch('helpers.configuration.EntityValidator')
+    mock_validator.return_value.validate_config_entities_not_exist.return_value = ['EDMs already exist: X']
+
+    with pytest.raises(ConfigurationError, match='EDMs already exist'):
+        validate_configuration_file(VALID_EXCEL_PATH)
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not Path(VALID_EXCEL_PATH).exists(), reason="Test Excel file not found")
+def test_validate_configuration_file_cache_disabled(configuration_cache_dir, monkeypatch, mocker):
+    """Test CONFIGURATION_CACHE_ENABLED=false always re-parses and writes nothing"""
+    from helpers import configuration
+
+    monkeypatch.setenv('CONFIGURATION_CACHE_ENABLED', 'false')
+
+    parse_spy = mocker.spy(configuration, '_parse_and_validate_workbook')
+    validate_configuration_file(VALID_EXCEL_PATH, skip_entity_validation=True)
+    validate_configuration_file(VALID_EXCEL_PATH, skip_entity_validation=True)
+
+    assert parse_spy.call_count == 2
+    assert not configuration_cache_dir.exists()
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not Path(VALID_EXCEL_PATH).exists(), reason="Test Excel file not found")
+def test_configuration_cache_key_changes_with_content_and_schema(tmp_path, monkeypatch):
+    """Test cache key depends on file content and validation schemas"""
+    import shutil
+    from helpers import configuration
+
+    copy_path = tmp_path / 'config.xlsx'
+    shutil.copy(VALID_EXCEL_PATH, copy_path)
+
+    original_key = configuration._configuration_cache_key(copy_path, None)
+    assert configuration._configuration_cache_key(Path(VALID_EXCEL_PATH), None) == original_key
+    assert configuration._configuration_cache_key(copy_path, 'calamine') != original_key
+
+    monkeypatch.setattr(configuration, 'CONFIGURATION_CACHE_VERSION', configuration.CONFIGURATION_CACHE_VERSION + 1)
+    assert configuration._configuration_cache_key(copy_path, None) != original_key
+
+    monkeypatch.undo()
+    with open(copy_path, 'ab') as f:
+        f.write(b'\0')
+    assert configuration._configuration_cache_key(copy_path, None) != original_key
+
+
+@pytest.mark.unit
+def test_invalid_configuration_file_not_cached(configuration_cache_dir, monkeypatch):
+    """Test workbooks failing validation are not cached"""
+    monkeypatch.delenv('CONFIGURATION_CACHE_ENABLED', raising=False)
+
+    bad_path = Path(__file__).parent / 'files/invalid_config_broken_fk_database.xlsx'
+    with pytest.raises(ConfigurationError):
+        validate_configuration_file(str(bad_path), skip_entity_validation=True)
+
+    assert list(configuration_cache_dir.glob('*.json')) == []
+
+
+@pytest.mark.unit
+def test_clear_configuration_cache(configuration_cache_dir):
+    """Test clear_configuration_cache removes cached files"""
+    from helpers.configuration import clear_configuration_cache
+
+    configuration_cache_dir.mkdir()
+    (configuration_cache_dir / 'a.json').write_text('{}')
+    (configuration_cache_dir / 'b.json').write_text('{}')
+
+    assert clear_configuration_cache() == 2
+    assert clear_configuration_cache() == 0
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason="POSIX permissions only")
+def test_configuration_cache_dir_is_private(configuration_cache_dir):
+    """Test the cache directory is created 0700 and a loosened one is tightened before use"""
+    from helpers import configuration
+
+    assert configuration._write_configuration_cache('k', Path('c.xlsx'), {'a': 1}, {'passed': True})
+    assert stat.S_IMODE(configuration_cache_dir.stat().st_mode) == 0o700
+
+    os.chmod(configuration_cache_dir, 0o777)
+    assert configuration._read_configuration_cache('k') is None
+
+    assert configuration._write_configuration_cache('k', Path('c.xlsx'), {'a': 1}, {'passed': True})
+    assert stat.S_IMODE(configuration_cache_dir.stat().st_mode) == 0o700
+    assert configuration._read_configuration_cache('k') == ({'a': 1}, {'passed': True})
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason="POSIX permissions only")
+def test_configuration_cache_dir_owned_by_other_user_is_not_used(configuration_cache_dir, mocker):
+    """Test a cache directory owned by someone else is neither read nor written"""
+    from helpers import configuration
+
+    assert configuration._write_configuration_cache('k', Path('c.xlsx'), {'a': 1}, {'passed': True})
+    mocker.patch('helpers.configuration.os.getuid', return_value=os.getuid() + 1)
+
+    assert configuration._read_configuration_cache('k') is None
+    assert configuration._write_configuration_cache('k2', Path('c.xlsx'), {'a': 1}, {'passed': True}) is False
+    assert not (configuration_cache_dir / 'k2.json').exists()
+
+
+@pytest.mark.unit
+def test_excel_engine_selection(monkeypatch):
+    """Test CONFIGURATION_EXCEL_ENGINE selection and validation"""
+    from helpers.configuration import _get_excel_engine
+
+    monkeypatch.delenv('CONFIGURATION_EXCEL_ENGINE', raising=False)
+    assert _get_excel_engine() is None
+
+    monkeypatch.setenv('CONFIGURATION_EXCEL_ENGINE', 'OpenPyXL')
+    assert _get_excel_engine() == 'openpyxl'
+
+    monkeypatch.setenv('CONFIGURATION_EXCEL_ENGINE', 'xlrd')
+    with pytest.raises(ConfigurationError, match='Unsupported'):
+        _get_excel_engine()
@@ -8,6 +8,7 @@ This module tests:
 - Error handling for invalid paths
 - get_info() method
 - String representations (__repr__, __str__)
+- Per-process caching of resolved contexts and its invalidation
 
 NOTE ON _get_current_notebook_path:
 -----------------------------------
@@ -21,9 +22,13 @@ All tests send explicit paths to WorkContext to avoid calling _get_current_noteb
 
 import pytest
 from pathlib import Path
-from helpers.context import WorkContext, WorkContextError, get_context
+from unittest.mock import patch
+from helpers.context import (
+    CYCLE_STATUS_QUERY, WorkContext, WorkContextError, get_context, invalidate_context_cache
+)
 from helpers.cycle import register_cycle, get_cycle_by_name
 from helpers.cycle import archive_cycle_crud as archive_cycle
+from helpers.stage import get_or_create_stage
 from helpers.database import set_schema, schema_context, execute_query, init_database, get_engine
 from helpers.constants import CycleStatus
 
@@ -45,6 +50,14 @@ def create_test_notebook_path(cycle_name: str, stage_num: int, stage_name: str,
             f"Step_{step_num:02d}_{step_name}.ipynb")
 
 
+@pytest.fixture(autouse=True)
+def clear_context_cache():
+    """Start every test with no cached WorkContext resolutions"""
+    invalidate_context_cache()
+    yield
+    invalidate_context_cache()
+
+
 # ==============================================================================
 # PATH PARSING TESTS
 # ==============================================================================
@@ -201,6 +214,31 @@ class TestErrorHandling:
         with pytest.raises(WorkContextError, match="is ARCHIVED, not active"):
             WorkContext(notebook_path=path)
 
+    @pytest.mark.database
+    @pytest.mark.integration
+    def test_archived_cycle_creates_no_rows(self, test_schema):
+        """No stage or step is created for an archived cycle, even when its stage exists"""
+        cycle_id = register_cycle('ArchivedWithStage')
+        get_or_create_stage(cycle_id, 1, 'Test')
+        archive_cycle(cycle_id)
+
+        def counts():
+            return execute_query(
+                """SELECT (SELECT COUNT(*) FROM irp_stage WHERE cycle_id = %s) AS stages,
+                          (SELECT COUNT(*) FROM irp_step st JOIN irp_stage s ON st.stage_id = s.id
+                           WHERE s.cycle_id = %s) AS steps""",
+                (cycle_id, cycle_id)
+            ).iloc[0].tolist()
+
+        before = counts()
+        for stage_num in (1, 2):
+            path = create_test_notebook_path('ArchivedWithStage', stage_num, 'Test', 1, 'Init')
+            with pytest.raises(WorkContextError, match="is ARCHIVED, not active"):
+                WorkContext(notebook_path=path)
+
+        assert before == [1, 0]
+        assert counts() == before
+
     @pytest.mark.database
     @pytest.mark.integration
     def test_error_on_active_cycle_mismatch(self, test_schema):
@@ -612,4 +650,115 @@ class TestSchemaIsolation:
             engine = get_engine()
             with engine.connect() as conn:
                 conn.execute(text(f"DROP SCHEMA IF EXISTS {isolation_schema} CASCADE"))
-                conn.commit()
\ No newline at end of file
+                conn.commit()
+
+
+# ==============================================================================
+# CACHING TESTS
+# ==============================================================================
+
+class TestContextCache:
+    """Test that resolved contexts are cached per process and can be invalidated"""
+
+    RESOLVED_ROW = {'cycle_id': 1, 'cycle_status': CycleStatus.ACTIVE, 'stage_id': 2, 'step_id': 3}
+
+    @pytest.mark.unit
+    def test_resolves_in_one_statement_and_caches(self):
+        """Test a context resolves with one statement and later constructions reuse it"""
+        path = create_test_notebook_path('CacheUnitCycle', 1, 'Stage1', 1, 'Step1')
+
+        with patch('helpers.context.execute_returning', return_value=self.RESOLVED_ROW) as mock_resolve, \
+                patch('helpers.context.execute_scalar', return_value=CycleStatus.ACTIVE) as mock_status:
+            context1 = WorkContext(notebook_path=path)
+            context2 = WorkContext(notebook_path=path)
+
+        assert mock_resolve.call_count == 1
+        mock_status.assert_called_once_with(CYCLE_STATUS_QUERY, (1,))
+        assert (context2.cycle_id, context2.stage_id, context2.step_id) == (1, 2, 3)
+        assert context2.get_info() == context1.get_info()
+
+    @pytest.mark.unit
+    def test_invalidate_forces_resolution(self):
+        """Test invalidate_context_cache() makes the next construction query again"""
+        path = create_test_notebook_path('CacheUnitCycle', 1, 'Stage1', 1, 'Step1')
+        other_path = create_test_notebook_path('CacheUnitCycle', 1, 'Stage1', 2, 'Step2')
+
+        with patch('helpers.context.execute_returning', return_value=self.RESOLVED_ROW) as mock_resolve, \
+                patch('helpers.context.execute_scalar', return_value=CycleStatus.ACTIVE):
+            WorkContext(notebook_path=path)
+            WorkContext(notebook_path=other_path)
+
+            invalidate_context_cache(path)
+            WorkContext(notebook_path=path)
+            WorkContext(notebook_path=other_path)
+            assert mock_resolve.call_count == 3
+
+            invalidate_context_cache()
+            WorkContext(notebook_path=other_path)
+            assert mock_resolve.call_count == 4
+
+    @pytest.mark.unit
+    def test_errors_are_not_cached(self):
+        """Test a failed resolution is retried on the next construction"""
+        path = create_test_notebook_path('CacheUnitCycle', 1, 'Stage1', 1, 'Step1')
+        archived_row = {**self.RESOLVED_ROW, 'cycle_status': CycleStatus.ARCHIVED}
+
+        with patch('helpers.context.execute_returning', return_value=archived_row):
+            with pytest.raises(WorkContextError, match="is ARCHIVED, not active"):
+                WorkContext(notebook_path=path)
+
+        with patch('helpers.context.execute_returning', return_value=self.RESOLVED_ROW):
+            assert WorkContext(notebook_path=path).step_id == 3
+
+    @pytest.mark.unit
+    def test_cache_hit_refuses_archived_cycle(self):
+        """Test a cached context is not reused once its cycle is no longer active"""
+        path = create_test_notebook_path('CacheUnitCycle', 1, 'Stage1', 1, 'Step1')
+        archived_row = {**self.RESOLVED_ROW, 'cycle_status': CycleStatus.ARCHIVED}
+
+        with patch('helpers.context.execute_returning', return_value=self.RESOLVED_ROW):
+            WorkContext(notebook_path=path)
+
+        with patch('helpers.context.execute_returning', return_value=archived_row) as mock_resolve, \
+                patch('helpers.context.execute_scalar', return_value=CycleStatus.ARCHIVED):
+            with pytest.raises(WorkContextError, match="is ARCHIVED, not active"):
+                WorkContext(notebook_path=path)
+            with pytest.raises(WorkContextError, match="is ARCHIVED, not active"):
+                WorkContext(notebook_path=path)
+
+        assert mock_resolve.call_count == 2
+
+    @pytest.mark.database
+    @pytest.mark.integration
+    def test_idempotent_resolution_without_cache(self, test_schema):
+        """Test resolving the same path twice against the database returns the same rows"""
+        cycle_id = register_cycle('UncachedCycle')
+        path = create_test_notebook_path('UncachedCycle', 1, 'Stage1', 1, 'Step1')
+
+        context1 = WorkContext(notebook_path=path)
+        invalidate_context_cache()
+        context2 = WorkContext(notebook_path=path)
+
+        assert context1.cycle_id == context2.cycle_id == cycle_id
+        assert context1.stage_id == context2.stage_id
+        assert context1.step_id == context2.step_id
+
+        steps = execute_query(
+            "SELECT COUNT(*) AS n FROM irp_step WHERE stage_id = %s", (context1.stage_id,)
+        )
+        assert steps.iloc[0]['n'] == 1
+
+        archive_cycle(cycle_id)
+
+    @pytest.mark.database
+    @pytest.mark.integration
+    def test_archiving_cycle_invalidates_cache(self, test_schema):
+        """Test a cached context is not reused after its cycle is archived"""
+        cycle_id = register_cycle('CacheArchiveCycle')
+        path = create_test_notebook_path('CacheArchiveCycle', 1, 'Stage1', 1, 'Step1')
+
+        WorkContext(notebook_path=path)
+        archive_cycle(cycle_id)
+
+        with pytest.raises(WorkContextError, match="is ARCHIVED, not active"):
+            WorkContext(notebook_path=path)
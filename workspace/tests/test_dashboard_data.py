@@ -0,0 +1,227 @@
+"""
+Test suite for the dashboard data layer (demo/app/dashboard_data.py)
+
+This test file validates:
+- TTLCache hits, misses, expiry and invalidation
+- Single-flight loading: concurrent requests share one loader call
+- Failed loads reach every waiter and are not cached
+- A cancelled load does not leave waiters hanging or an in-flight entry behind
+- The status listener reconnects after a failed connect or a dropped connection,
+  clearing the cache and telling live streams to resync
+
+All tests use asyncio.run and fake connections and do not require a database.
+
+Run these tests:
+    pytest workspace/tests/test_dashboard_data.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("asyncpg")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'demo' / 'app'))
+
+import dashboard_data  # noqa: E402
+from dashboard_data import DashboardData, TTLCache  # noqa: E402
+
+
+def counting_loader(value, calls, delay=0):
+    """Loader returning value after delay, appending to calls each time it runs"""
+    async def load():
+        calls.append(value)
+        await asyncio.sleep(delay)
+        return value
+    return load
+
+
+# ==============================================================================
+# CACHE TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_cache_hit_miss_and_expiry(monkeypatch):
+    """Values are served until their TTL passes, then reloaded"""
+    now = [100.0]
+    monkeypatch.setattr(dashboard_data.time, 'monotonic', lambda: now[0])
+    cache = TTLCache()
+    calls = []
+
+    async def scenario():
+        assert await cache.get_or_load('k', 5, counting_loader(1, calls)) == 1
+        assert await cache.get_or_load('k', 5, counting_loader(2, calls)) == 1
+        now[0] += 6
+        assert await cache.get_or_load('k', 5, counting_loader(3, calls)) == 3
+
+    asyncio.run(scenario())
+    assert calls == [1, 3]
+    assert cache.stats() == {'entries': 1, 'hits': 1, 'misses': 2}
+
+
+@pytest.mark.unit
+def test_cache_invalidate():
+    """invalidate drops only the matching keys"""
+    cache = TTLCache()
+
+    async def scenario():
+        for key in [('batch', 's', 1), ('batch', 's', 2), ('cycles', 's')]:
+            await cache.get_or_load(key, 60, counting_loader(key, []))
+
+    asyncio.run(scenario())
+    assert cache.invalidate(lambda key: key[0] == 'batch' and key[2] == 1) == 1
+    assert cache.stats()['entries'] == 2
+    cache.clear()
+    assert cache.stats()['entries'] == 0
+
+
+@pytest.mark.unit
+def test_concurrent_requests_share_one_load():
+    """Requests arriving while a key loads await the same loader call"""
+    cache = TTLCache()
+    calls = []
+
+    async def scenario():
+        return await asyncio.gather(*[
+            cache.get_or_load('k', 60, counting_loader(7, calls, delay=0.01)) for _ in range(5)
+        ])
+
+    assert asyncio.run(scenario()) == [7] * 5
+    assert calls == [7]
+    assert cache.stats() == {'entries': 1, 'hits': 4, 'misses': 1}
+
+
+@pytest.mark.unit
+def test_failed_load_reaches_waiters_and_is_not_cached():
+    """A loader error is raised to every waiter; the next request loads again"""
+    cache = TTLCache()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ValueError('query failed')
+
+    async def scenario():
+        results = await asyncio.gather(
+            *[cache.get_or_load('k', 60, failing) for _ in range(3)], return_exceptions=True
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+        assert cache._loading == {}
+        return await cache.get_or_load('k', 60, counting_loader(1, []))
+
+    assert asyncio.run(scenario()) == 1
+
+
+@pytest.mark.unit
+def test_cancelled_load_restarts_for_waiters():
+    """Cancelling the request running the loader makes a waiter load instead of hanging"""
+    cache = TTLCache()
+    calls = []
+
+    async def scenario():
+        first = asyncio.create_task(cache.get_or_load('k', 60, counting_loader(1, calls, delay=10)))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_load('k', 60, counting_loader(2, calls)))
+        await asyncio.sleep(0)
+        first.cancel()
+        value = await asyncio.wait_for(waiter, timeout=1)
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert cache._loading == {}
+        return value
+
+    assert asyncio.run(scenario()) == 2
+    assert calls == [1, 2]
+
+
+@pytest.mark.unit
+def test_cancelled_waiter_does_not_cancel_load():
+    """A waiter that goes away leaves the shared load running for the others"""
+    cache = TTLCache()
+    calls = []
+
+    async def scenario():
+        loader = asyncio.create_task(cache.get_or_load('k', 60, counting_loader(1, calls, delay=0.01)))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_load('k', 60, counting_loader(2, calls)))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        return await loader
+
+    assert asyncio.run(scenario()) == 1
+    assert calls == [1]
+
+
+# ==============================================================================
+# LISTENER TESTS
+# ==============================================================================
+
+class FakeListenerConnection:
+    """Stands in for an asyncpg connection used only for LISTEN"""
+
+    def __init__(self):
+        self.channels = []
+        self.closed = False
+        self._on_terminate = []
+
+    def add_termination_listener(self, callback):
+        self._on_terminate.append(callback)
+
+    async def add_listener(self, channel, callback):
+        self.channels.append(channel)
+
+    def is_closed(self):
+        return self.closed
+
+    def terminate(self):
+        self.closed = True
+
+    def drop(self):
+        """Simulate the server closing the connection"""
+        self.closed = True
+        for callback in self._on_terminate:
+            callback(self)
+
+
+@pytest.mark.unit
+def test_listener_reconnects(monkeypatch):
+    """A failed connect and a dropped connection are retried; each reconnect clears the cache"""
+    monkeypatch.setattr(dashboard_data, 'LISTENER_RETRY_MIN', 0)
+    connections = []
+
+    async def connect(**kwargs):
+        if not connections:
+            connections.append(None)
+            raise OSError('connection refused')
+        connection = FakeListenerConnection()
+        connections.append(connection)
+        return connection
+
+    monkeypatch.setattr(dashboard_data.asyncpg, 'connect', connect)
+    monkeypatch.setattr(dashboard_data, '_connect_kwargs', lambda: {})
+
+    async def wait_for_listener(data, connection_count):
+        while not (data.live and len(connections) == connection_count):
+            await asyncio.sleep(0)
+
+    async def scenario():
+        data = DashboardData()
+        subscription = data.events.subscribe('s')
+        task = asyncio.create_task(data._listen())
+        await asyncio.wait_for(wait_for_listener(data, 2), timeout=1)
+        assert connections[1].channels == [dashboard_data.BATCH_STATUS_CHANNEL, dashboard_data.JOB_STATUS_CHANNEL]
+
+        await data.cached(('cycles', 's'), 60, counting_loader([], []))
+        connections[1].drop()
+        await asyncio.wait_for(wait_for_listener(data, 3), timeout=1)
+        assert data.cache.stats()['entries'] == 0
+        assert subscription.queue.qsize() == 2
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not data.live
+        assert connections[2].closed
+
+    asyncio.run(scenario())
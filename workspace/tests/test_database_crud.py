@@ -5,7 +5,10 @@ Tests the cycle/stage/step hierarchy and database operations using schema contex
 All operations use context from the test_schema fixture (no schema= parameters needed).
 """
 
+import time
+
 import pytest
+from helpers.database import execute_command, execute_insert, execute_scalar
 from helpers.cycle import (
     register_cycle, get_cycle_by_name, get_active_cycle, archive_cycle_crud as archive_cycle,
     delete_cycle, get_step_history
@@ -416,6 +419,92 @@ def test_delete_cycle_cascade(test_schema):
     assert get_last_step_run(step_id) is None
 
 
+def _seed_cycle_workload(cycle_name, num_jobs, logs_per_job):
+    """Create a cycle with one batch of num_jobs jobs, each with logs_per_job tracking rows (set-based)"""
+    cycle_id = register_cycle(cycle_name)
+    stage_id = get_or_create_stage(cycle_id, 1, 'Setup')
+    step_id = get_or_create_step(stage_id, 1, 'Submit')
+    config_id = execute_insert(
+        """INSERT INTO irp_configuration
+           (cycle_id, configuration_file_name, configuration_data, file_last_updated_ts)
+           VALUES (%s, %s, %s, NOW())""",
+        (cycle_id, '/test/config.xlsx', '{}')
+    )
+    batch_id = execute_insert(
+        "INSERT INTO irp_batch (step_id, configuration_id, batch_type) VALUES (%s, %s, %s)",
+        (step_id, config_id, 'default')
+    )
+    execute_command(
+        """INSERT INTO irp_job_configuration (batch_id, configuration_id, job_configuration_data)
+           SELECT %s, %s, jsonb_build_object('n', n) FROM generate_series(1, %s) AS n""",
+        (batch_id, config_id, num_jobs)
+    )
+    execute_command(
+        """INSERT INTO irp_job (batch_id, job_configuration_id, moodys_workflow_id, status)
+           SELECT batch_id, id, 'WF' || id, 'SUBMITTED'::job_status_enum FROM irp_job_configuration WHERE batch_id = %s""",
+        (batch_id,)
+    )
+    execute_command(
+        """INSERT INTO irp_job_tracking_log (job_id, moodys_workflow_id, job_status)
+           SELECT j.id, j.moodys_workflow_id, 'RUNNING'::job_status_enum
+           FROM irp_job j CROSS JOIN generate_series(1, %s)
+           WHERE j.batch_id = %s""",
+        (logs_per_job, batch_id)
+    )
+    execute_command(
+        "INSERT INTO irp_batch_recon_log (batch_id, recon_result, recon_summary) VALUES (%s, %s, %s)",
+        (batch_id, 'ACTIVE', '{}')
+    )
+    return cycle_id, batch_id
+
+
+def _cycle_subtree_counts(batch_id):
+    """Row counts left in batch-owned tables for a batch"""
+    return {
+        'batch': execute_scalar("SELECT COUNT(*) FROM irp_batch WHERE id = %s", (batch_id,)),
+        'job_configuration': execute_scalar(
+            "SELECT COUNT(*) FROM irp_job_configuration WHERE batch_id = %s", (batch_id,)),
+        'job': execute_scalar("SELECT COUNT(*) FROM irp_job WHERE batch_id = %s", (batch_id,)),
+        'recon_log': execute_scalar(
+            "SELECT COUNT(*) FROM irp_batch_recon_log WHERE batch_id = %s", (batch_id,)),
+    }
+
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_delete_cycle_removes_batch_subtree(test_schema):
+    """Test that deleting a cycle removes batches, jobs, job configurations and logs"""
+    cycle_id, batch_id = _seed_cycle_workload('test_cycle_subtree', num_jobs=20, logs_per_job=3)
+    tracking_before = execute_scalar("SELECT COUNT(*) FROM irp_job_tracking_log")
+    assert tracking_before >= 60
+
+    assert delete_cycle(cycle_id) is True
+
+    assert _cycle_subtree_counts(batch_id) == {
+        'batch': 0, 'job_configuration': 0, 'job': 0, 'recon_log': 0
+    }
+    assert execute_scalar("SELECT COUNT(*) FROM irp_job_tracking_log") == tracking_before - 60
+    assert get_cycle_by_name('test_cycle_subtree') is None
+
+
+@pytest.mark.database
+@pytest.mark.slow
+def test_delete_cycle_benchmark(test_schema):
+    """Benchmark deleting a cycle with 50k jobs and 1M tracking log rows (run with -m slow)"""
+    cycle_id, batch_id = _seed_cycle_workload('test_cycle_benchmark', num_jobs=50_000, logs_per_job=20)
+    tracking_before = execute_scalar("SELECT COUNT(*) FROM irp_job_tracking_log")
+
+    start = time.perf_counter()
+    assert delete_cycle(cycle_id) is True
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 120, f"delete_cycle took {elapsed:.0f}s for 50,000 jobs / 1,000,000 tracking rows"
+    assert _cycle_subtree_counts(batch_id) == {
+        'batch': 0, 'job_configuration': 0, 'job': 0, 'recon_log': 0
+    }
+    assert execute_scalar("SELECT COUNT(*) FROM irp_job_tracking_log") == tracking_before - 1_000_000
+
+
 # ============================================================================
 # Tests - Database Initialization and Advanced Features
 # ============================================================================
@@ -949,7 +949,7 @@ class TestValidateAccountsNotExist:
         """When portfolios have no accounts, should return no errors."""
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = []
+        validator._portfolio_manager.portfolio_has_accounts.return_value = False
 
         portfolio_ids = {
             'EDM1/Port1': {'exposure_id': 123, 'portfolio_id': 100}
@@ -964,9 +964,7 @@ class TestValidateAccountsNotExist:
         """When portfolios have accounts, should return error."""
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1, 'accountName': 'Account1'}
-        ]
+        validator._portfolio_manager.portfolio_has_accounts.return_value = True
 
         portfolio_ids = {
             'EDM1/Port1': {'exposure_id': 123, 'portfolio_id': 100}
@@ -984,9 +982,7 @@ class TestValidateAccountsNotExist:
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
         # All portfolios have accounts
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1, 'accountName': 'Account1'}
-        ]
+        validator._portfolio_manager.portfolio_has_accounts.return_value = True
 
         portfolio_ids = {
             'EDM1/Port1': {'exposure_id': 123, 'portfolio_id': 100},
@@ -1005,7 +1001,7 @@ class TestValidateAccountsNotExist:
         """API errors should be caught and returned as error messages."""
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
-        validator._portfolio_manager.search_accounts_by_portfolio.side_effect = IRPAPIError("Connection failed")
+        validator._portfolio_manager.portfolio_has_accounts.side_effect = IRPAPIError("Connection failed")
 
         portfolio_ids = {
             'EDM1/Port1': {'exposure_id': 123, 'portfolio_id': 100}
@@ -1120,7 +1116,7 @@ class TestValidateMriImportBatch:
             {'portfolioName': 'Port1', 'portfolioId': 100}
         ]
         # No accounts
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = []
+        validator._portfolio_manager.portfolio_has_accounts.return_value = False
 
         # Create CSV files
         accounts_file = tmp_path / 'accounts.csv'
@@ -1215,9 +1211,7 @@ class TestValidateMriImportBatch:
             {'portfolioName': 'Port1', 'portfolioId': 100}
         ]
         # Accounts exist (should fail)
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1, 'accountName': 'Account1'}
-        ]
+        validator._portfolio_manager.portfolio_has_accounts.return_value = True
 
         # Create CSV files
         accounts_file = tmp_path / 'accounts.csv'
@@ -1254,7 +1248,7 @@ class TestValidateMriImportBatch:
             {'portfolioName': 'Port1', 'portfolioId': 100}
         ]
         # No accounts
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = []
+        validator._portfolio_manager.portfolio_has_accounts.return_value = False
 
         portfolios = [
             {
@@ -1286,9 +1280,7 @@ class TestValidateMriImportBatch:
             {'portfolioName': 'Port1', 'portfolioId': 100}
         ]
         # Accounts exist (should fail)
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1, 'accountName': 'Account1'}
-        ]
+        validator._portfolio_manager.portfolio_has_accounts.return_value = True
 
         # Only create some files
         accounts_file = tmp_path / 'accounts1.csv'
@@ -1779,9 +1771,7 @@ class TestValidatePortfoliosHaveLocations:
         """Portfolio with locations should pass validation."""
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1, 'locationsCount': 10}
-        ]
+        validator._portfolio_manager.get_location_status.return_value = {'has_accounts': True, 'has_locations': True}
 
         portfolio_map = {
             'EDM1/Port1': {'exposure_id': 123, 'portfolio_id': 456}
@@ -1796,7 +1786,7 @@ class TestValidatePortfoliosHaveLocations:
         """Portfolio with no accounts should return error."""
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = []
+        validator._portfolio_manager.get_location_status.return_value = {'has_accounts': False, 'has_locations': False}
 
         portfolio_map = {
             'EDM1/Port1': {'exposure_id': 123, 'portfolio_id': 456}
@@ -1813,10 +1803,7 @@ class TestValidatePortfoliosHaveLocations:
         """Portfolio with accounts but zero locations should return error."""
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1, 'locationsCount': 0},
-            {'accountId': 2, 'locationsCount': 0}
-        ]
+        validator._portfolio_manager.get_location_status.return_value = {'has_accounts': True, 'has_locations': False}
 
         portfolio_map = {
             'EDM1/Port1': {'exposure_id': 123, 'portfolio_id': 456}
@@ -1834,10 +1821,7 @@ class TestValidatePortfoliosHaveLocations:
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
         # Multiple accounts with some locations each
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1, 'locationsCount': 5},
-            {'accountId': 2, 'locationsCount': 3}
-        ]
+        validator._portfolio_manager.get_location_status.return_value = {'has_accounts': True, 'has_locations': True}
 
         portfolio_map = {
             'EDM1/Port1': {'exposure_id': 123, 'portfolio_id': 456}
@@ -1853,9 +1837,9 @@ class TestValidatePortfoliosHaveLocations:
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
         # Port1 has locations, Port2 has none
-        validator._portfolio_manager.search_accounts_by_portfolio.side_effect = [
-            [{'accountId': 1, 'locationsCount': 10}],
-            []
+        validator._portfolio_manager.get_location_status.side_effect = [
+            {'has_accounts': True, 'has_locations': True},
+            {'has_accounts': False, 'has_locations': False}
         ]
 
         portfolio_map = {
@@ -1867,13 +1851,13 @@ class TestValidatePortfoliosHaveLocations:
 
         assert len(no_locations) == 1
         assert 'EDM1/Port2 (no accounts)' in no_locations
-        assert validator._portfolio_manager.search_accounts_by_portfolio.call_count == 2
+        assert validator._portfolio_manager.get_location_status.call_count == 2
 
     def test_api_error_returns_error(self):
         """API error should be captured in error list."""
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
-        validator._portfolio_manager.search_accounts_by_portfolio.side_effect = IRPAPIError("Connection failed")
+        validator._portfolio_manager.get_location_status.side_effect = IRPAPIError("Connection failed")
 
         portfolio_map = {
             'EDM1/Port1': {'exposure_id': 123, 'portfolio_id': 456}
@@ -1910,9 +1894,7 @@ class TestValidateGeohazBatch:
             {'portfolioName': 'Port1', 'portfolioId': 456}
         ]
         # Portfolios have locations
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1, 'locationsCount': 100}
-        ]
+        validator._portfolio_manager.get_location_status.return_value = {'has_accounts': True, 'has_locations': True}
 
         portfolios = [
             {'Database': 'EDM1', 'Portfolio': 'Port1'}
@@ -1972,7 +1954,7 @@ class TestValidateGeohazBatch:
             {'portfolioName': 'Port1', 'portfolioId': 456}
         ]
         # Portfolio has no locations
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = []
+        validator._portfolio_manager.get_location_status.return_value = {'has_accounts': False, 'has_locations': False}
 
         portfolios = [{'Database': 'EDM1', 'Portfolio': 'Port1'}]
 
@@ -1999,9 +1981,7 @@ class TestValidateGeohazBatch:
             [{'portfolioName': 'Port2', 'portfolioId': 200}]
         ]
         # Both have locations
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1, 'locationsCount': 50}
-        ]
+        validator._portfolio_manager.get_location_status.return_value = {'has_accounts': True, 'has_locations': True}
 
         portfolios = [
             {'Database': 'EDM1', 'Portfolio': 'Port1'},
@@ -2026,7 +2006,7 @@ class TestValidateGeohazBatch:
         validator._portfolio_manager.search_portfolios_paginated.return_value = [
             {'portfolioName': 'Port1', 'portfolioId': 456}
         ]
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = []
+        validator._portfolio_manager.get_location_status.return_value = {'has_accounts': False, 'has_locations': False}
 
         portfolios = [
             {'Database': 'EDM1', 'Portfolio': 'Port1'},  # No locations
@@ -2058,7 +2038,7 @@ class TestValidateGeohazBatch:
         assert 'ENT-EDM-002' in errors[0]
         # Portfolio manager should not have been called
         validator._portfolio_manager.search_portfolios_paginated.assert_not_called()
-        validator._portfolio_manager.search_accounts_by_portfolio.assert_not_called()
+        validator._portfolio_manager.get_location_status.assert_not_called()
 
 
 class TestValidatePortfoliosHaveAccounts:
@@ -2075,9 +2055,7 @@ class TestValidatePortfoliosHaveAccounts:
         """Portfolios with accounts should return no errors."""
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1, 'accountName': 'Account1'}
-        ]
+        validator._portfolio_manager.portfolio_has_accounts.return_value = True
 
         portfolio_map = {
             'EDM1/Port1': {'exposure_id': 123, 'portfolio_id': 456}
@@ -2092,7 +2070,7 @@ class TestValidatePortfoliosHaveAccounts:
         """Portfolio without accounts should return error."""
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = []
+        validator._portfolio_manager.portfolio_has_accounts.return_value = False
 
         portfolio_map = {
             'EDM1/Port1': {'exposure_id': 123, 'portfolio_id': 456}
@@ -2109,10 +2087,10 @@ class TestValidatePortfoliosHaveAccounts:
         """Multiple portfolios should all be checked."""
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
-        validator._portfolio_manager.search_accounts_by_portfolio.side_effect = [
-            [{'accountId': 1}],  # Port1 has accounts
-            [],                   # Port2 has no accounts
-            [{'accountId': 2}]   # Port3 has accounts
+        validator._portfolio_manager.portfolio_has_accounts.side_effect = [
+            True,   # Port1 has accounts
+            False,  # Port2 has no accounts
+            True    # Port3 has accounts
         ]
 
         portfolio_map = {
@@ -2131,7 +2109,7 @@ class TestValidatePortfoliosHaveAccounts:
         """API errors should be captured as errors."""
         validator = EntityValidator()
         validator._portfolio_manager = Mock()
-        validator._portfolio_manager.search_accounts_by_portfolio.side_effect = IRPAPIError("API failed")
+        validator._portfolio_manager.portfolio_has_accounts.side_effect = IRPAPIError("API failed")
 
         portfolio_map = {
             'EDM1/Port1': {'exposure_id': 123, 'portfolio_id': 456}
@@ -2158,7 +2136,7 @@ class TestValidatePortfoliosHaveAccounts:
 
         assert no_accounts == []
         assert errors == []
-        validator._portfolio_manager.search_accounts_by_portfolio.assert_not_called()
+        validator._portfolio_manager.portfolio_has_accounts.assert_not_called()
 
 
 class TestValidatePortfolioMappingBatch:
@@ -2213,9 +2191,7 @@ class TestValidatePortfolioMappingBatch:
             []  # Sub doesn't exist
         ]
         # Base portfolio has accounts
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1}
-        ]
+        validator._portfolio_manager.portfolio_has_accounts.return_value = True
 
         portfolios = [
             self._make_base_portfolio('EDM1', 'BasePort', 'USEQ'),
@@ -2286,7 +2262,7 @@ class TestValidatePortfolioMappingBatch:
             {'portfolioName': 'BasePort', 'portfolioId': 456}
         ]
         # No accounts
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = []
+        validator._portfolio_manager.portfolio_has_accounts.return_value = False
 
         portfolios = [
             self._make_base_portfolio('EDM1', 'BasePort', 'USEQ')
@@ -2316,9 +2292,7 @@ class TestValidatePortfolioMappingBatch:
             [{'portfolioName': 'SubPort', 'portfolioId': 789}]    # Sub also exists (bad!)
         ]
         # Base has accounts
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1}
-        ]
+        validator._portfolio_manager.portfolio_has_accounts.return_value = True
 
         portfolios = [
             self._make_base_portfolio('EDM1', 'BasePort', 'USEQ'),
@@ -2352,9 +2326,7 @@ class TestValidatePortfolioMappingBatch:
             []   # Sub2 doesn't exist
         ]
         # Base portfolios have accounts
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1}
-        ]
+        validator._portfolio_manager.portfolio_has_accounts.return_value = True
 
         portfolios = [
             self._make_base_portfolio('EDM1', 'Base1', 'USEQ'),
@@ -2384,9 +2356,7 @@ class TestValidatePortfolioMappingBatch:
             {'portfolioName': 'BasePort', 'portfolioId': 456}
         ]
         # Has accounts
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = [
-            {'accountId': 1}
-        ]
+        validator._portfolio_manager.portfolio_has_accounts.return_value = True
 
         portfolios = [
             self._make_base_portfolio('EDM1', 'BasePort', 'USEQ')
@@ -2435,7 +2405,7 @@ class TestValidatePortfolioMappingBatch:
             [{'portfolioName': 'SubPort', 'portfolioId': 789}]    # Sub exists (error)
         ]
         # No accounts
-        validator._portfolio_manager.search_accounts_by_portfolio.return_value = []
+        validator._portfolio_manager.portfolio_has_accounts.return_value = False
 
         portfolios = [
             self._make_base_portfolio('EDM1', 'BasePort', 'USEQ'),
@@ -2473,7 +2443,7 @@ class TestValidatePortfolioMappingBatch:
         assert 'ENT-EDM-002' in errors[0]
         # Portfolio manager should not have been called
         validator._portfolio_manager.search_portfolios_paginated.assert_not_called()
-        validator._portfolio_manager.search_accounts_by_portfolio.assert_not_called()
+        validator._portfolio_manager.portfolio_has_accounts.assert_not_called()
 
 
 class TestValidatePortfolioMappingSqlScripts:
@@ -3419,3 +3389,129 @@ class TestValidateRdmExportBatch:
         assert errors == []
         # RDM manager should not have been called
         validator._rdm_manager.search_databases.assert_not_called()
+
+
+class TestEntitySnapshot:
+    """Tests for snapshot-backed lookups (EntityValidator(use_snapshot=True))."""
+
+    def test_snapshot_disabled_by_default(self):
+        """Validators without use_snapshot have no snapshot report."""
+        validator = EntityValidator()
+        assert validator.snapshot is None
+        assert validator.get_snapshot_report() is None
+
+    def test_repeated_edm_lookups_use_cache(self):
+        """Found and not-found EDMs are answered from the snapshot on repeat calls."""
+        validator = EntityValidator(use_snapshot=True)
+        validator._edm_manager = Mock()
+        validator._edm_manager.search_edms_paginated.return_value = [
+            {'exposureName': 'EDM1', 'exposureId': 123}
+        ]
+
+        existing, _ = validator.validate_edms_not_exist(['EDM1', 'EDM2'])
+        edm_ids, exist_errors = validator.validate_edms_exist(['EDM1', 'EDM2'])
+        exposure_ids = validator._get_exposure_ids(['EDM1'])
+
+        assert existing == ['EDM1']
+        assert edm_ids == {'EDM1': 123}
+        assert 'EDM2' in exist_errors[0]
+        assert exposure_ids == {'EDM1': 123}
+        validator._edm_manager.search_edms_paginated.assert_called_once()
+
+        report = validator.get_snapshot_report()
+        assert report['api_calls'] == 1
+        assert report['legacy_api_calls'] == 3
+        assert report['api_calls_saved'] == 2
+        assert report['cache_hits'] == 3
+
+    def test_portfolio_prefetch_covers_all_edms(self):
+        """Portfolios for every EDM are fetched up front, once per EDM."""
+        validator = EntityValidator(use_snapshot=True)
+        validator._portfolio_manager = Mock()
+
+        def search(exposure_id, filter):
+            if exposure_id == 1:
+                return [{'portfolioName': 'P1', 'portfolioId': 10}]
+            return []
+
+        validator._portfolio_manager.search_portfolios_paginated.side_effect = search
+
+        portfolios = [
+            {'Database': 'EDM1', 'Portfolio': 'P1'},
+            {'Database': 'EDM2', 'Portfolio': 'P2'},
+        ]
+        edm_exposure_ids = {'EDM1': 1, 'EDM2': 2}
+
+        existing, errors = validator.validate_portfolios_not_exist(portfolios, edm_exposure_ids)
+        portfolio_ids, exist_errors = validator.validate_portfolios_exist(portfolios, edm_exposure_ids)
+
+        assert existing == ['EDM1/P1']
+        assert len(errors) == 1
+        assert portfolio_ids == {'EDM1/P1': {'exposure_id': 1, 'portfolio_id': 10}}
+        assert 'EDM2/P2' in exist_errors[0]
+        assert validator._portfolio_manager.search_portfolios_paginated.call_count == 2
+
+    def test_analysis_names_chunked(self):
+        """Uncached analysis names are searched in chunks of 25."""
+        validator = EntityValidator(use_snapshot=True)
+        validator._analysis_manager = Mock()
+        validator._analysis_manager.search_analyses_paginated.return_value = []
+
+        names = [f'Analysis{i}' for i in range(30)]
+        existing, errors = validator.validate_analyses_not_exist(
+            [{'Database': 'EDM1', 'Analysis Name': name} for name in names]
+        )
+
+        assert existing == []
+        assert errors == []
+        assert validator._analysis_manager.search_analyses_paginated.call_count == 2
+        for call in validator._analysis_manager.search_analyses_paginated.call_args_list:
+            assert 'AND exposureName = "EDM1"' in call[1]['filter']
+
+    def test_groups_filtered_by_engine_type(self):
+        """Snapshot group lookups only treat engineType = Group records as groups."""
+        validator = EntityValidator(use_snapshot=True)
+        validator._analysis_manager = Mock()
+        validator._analysis_manager.search_analyses_paginated.return_value = [
+            {'analysisName': 'Group1', 'engineType': 'Group'},
+            {'analysisName': 'Analysis1', 'engineType': 'HD'},
+        ]
+
+        missing, errors = validator.validate_groups_exist(['Group1', 'Analysis1'])
+        existing, _ = validator.validate_groups_not_exist([{'Group Name': 'Group1'}])
+
+        assert missing == ['Analysis1']
+        assert len(errors) == 1
+        assert existing == ['Group1']
+        validator._analysis_manager.search_analyses_paginated.assert_called_once()
+
+    def test_api_errors_not_cached(self):
+        """A failed search is retried on the next lookup."""
+        validator = EntityValidator(use_snapshot=True)
+        validator._edm_manager = Mock()
+        validator._edm_manager.search_edms_paginated.side_effect = [
+            IRPAPIError("Connection failed"),
+            [{'exposureName': 'EDM1', 'exposureId': 123}],
+        ]
+
+        existing, errors = validator.validate_edms_not_exist(['EDM1'])
+        assert existing == []
+        assert len(errors) == 1
+        assert 'ENT-API-001' in errors[0]
+
+        existing, errors = validator.validate_edms_not_exist(['EDM1'])
+        assert existing == ['EDM1']
+        assert validator._edm_manager.search_edms_paginated.call_count == 2
+
+    def test_reset_snapshot(self):
+        """reset_snapshot discards cached lookups."""
+        validator = EntityValidator(use_snapshot=True)
+        validator._edm_manager = Mock()
+        validator._edm_manager.search_edms_paginated.return_value = []
+
+        validator.validate_edms_not_exist(['EDM1'])
+        validator.reset_snapshot()
+        validator.validate_edms_not_exist(['EDM1'])
+
+        assert validator._edm_manager.search_edms_paginated.call_count == 2
+        assert validator.get_snapshot_report()['api_calls'] == 1
@@ -2,9 +2,28 @@
 Tests for excel_export module.
 """
 
+import resource
+import time
+
+import numpy as np
 import pandas as pd
+import pytest
 from openpyxl import load_workbook
-from helpers.excel_export import save_geohaz_validation_to_excel, _get_peril_from_import_file
+from helpers.excel_export import (
+    save_geohaz_validation_to_excel,
+    save_data_extraction_control_totals_to_excel,
+    _get_peril_from_import_file,
+)
+
+
+def _conditional_rules(worksheet):
+    """Map cell range -> [(operator, formula, fill colour)] for a sheet's conditional formats"""
+    rules = {}
+    for cf in worksheet.conditional_formatting:
+        rules[str(cf.sqref)] = [
+            (rule.operator, rule.formula[0], rule.dxf.fill.bgColor.rgb) for rule in cf.rules
+        ]
+    return rules
 
 
 class TestGetPerilFromImportFile:
@@ -108,3 +127,89 @@ class TestSaveGeohazValidationToExcel:
 
         assert result is None
         assert not list(tmp_path.glob('*.xlsx'))
+
+    def test_formats_sheet_at_write_time(self, tmp_path):
+        """Test headers, alignment, widths and Status rules on a validation sheet."""
+        validation_results = pd.DataFrame([
+            {'Import File': 'USEQ', 'Portfolio': 'USEQ_Long_Portfolio_Name', 'Risk Count': 940, 'Status': 'PASS'},
+            {'Import File': 'USEQ', 'Portfolio': 'USEQ', 'Risk Count': None, 'Status': 'FAIL'},
+        ])
+
+        result = save_geohaz_validation_to_excel(validation_results, '202511', 'Quarterly', tmp_path)
+
+        wb = load_workbook(result)
+        ws = wb['USEQ']
+        assert ws.cell(row=1, column=1).font.b
+        assert ws.cell(row=1, column=1).alignment.horizontal == 'center'
+        assert ws.cell(row=2, column=2).alignment.horizontal == 'center'
+        assert ws.cell(row=3, column=3).value is None
+
+        # Widths fit the longest value (Portfolio) or the header (Import File)
+        assert ws.column_dimensions['B'].width > ws.column_dimensions['A'].width
+        assert ws.column_dimensions['A'].width >= len('Import File') + 2
+
+        # Status colouring is a rule over the column, not per-cell fills
+        assert _conditional_rules(ws) == {
+            'D2:D3': [('equal', '"PASS"', 'FFC6EFCE'), ('notEqual', '"PASS"', 'FFFFC7CE')]
+        }
+        wb.close()
+
+    @pytest.mark.slow
+    def test_million_row_detail_sheet_benchmark(self, tmp_path):
+        """Benchmark writing 1,000,000 location-level rows across perils"""
+        num_rows = 1_000_000
+        import_files = np.array(['USEQ', 'USIF_Commercial', 'USIF_Excess', 'USFL_Other', 'USHU_Full'])
+        validation_results = pd.DataFrame({
+            'Import File': import_files[np.arange(num_rows) % len(import_files)],
+            'Portfolio': 'Detail_Portfolio',
+            'Geocode Level': 'Coordinate',
+            'Expected %': 93.0,
+            'Threshold %': 5.0,
+            'Min %': 88.0,
+            'Max %': 98.0,
+            'Actual %': np.random.default_rng(0).uniform(80, 100, num_rows),
+            'Risk Count': np.arange(num_rows),
+            'Status': np.where(np.arange(num_rows) % 7 == 0, 'FAIL', 'PASS'),
+        })
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        result = save_geohaz_validation_to_excel(validation_results, '202511', 'Quarterly', tmp_path)
+        elapsed = time.perf_counter() - start
+        rss_growth_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024
+
+        # Constant-memory mode keeps peak RSS flat; the previous writer grew by
+        # several hundred MB per 200k rows
+        assert rss_growth_mb < 512, f"peak RSS grew by {rss_growth_mb:.0f}MB"
+        assert elapsed < 600, f"took {elapsed:.0f}s"
+
+        wb = load_workbook(result, read_only=True)
+        assert wb.sheetnames == ['USEQ', 'USIF', 'USFL', 'USHU']
+        assert [wb[name].max_row for name in wb.sheetnames] == [200_001, 400_001, 200_001, 200_001]
+        wb.close()
+
+
+class TestSaveDataExtractionControlTotalsToExcel:
+    """Tests for save_data_extraction_control_totals_to_excel function."""
+
+    def test_splits_flood_and_formats_diff_columns(self, tmp_path):
+        """Test Flood/Non-Flood sheets, right-aligned _Diff columns and MATCH/MISMATCH rules."""
+        comparison_results = pd.DataFrame([
+            {'ExposureGroup': 'USEQ', 'PolicyCount_Diff': 0, 'PolicyPremium_Diff': 0.0, 'Status': 'MATCH'},
+            {'ExposureGroup': 'USFL_Other', 'PolicyCount_Diff': 3, 'PolicyPremium_Diff': 12.5, 'Status': 'MISMATCH'},
+        ])
+
+        result = save_data_extraction_control_totals_to_excel(comparison_results, '202503', 'Quarterly', tmp_path)
+
+        assert result.name == 'Data_Extraction_Control_Totals_202503_Quarterly.xlsx'
+        wb = load_workbook(result)
+        assert wb.sheetnames == ['3a_vs_3b_NonFlood', '3a_vs_3b_Flood']
+
+        ws = wb['3a_vs_3b_Flood']
+        assert [cell.value for cell in ws[2]] == ['USFL_Other', 3, 12.5, 'MISMATCH']
+        assert ws.cell(row=2, column=1).alignment.horizontal == 'center'
+        assert ws.cell(row=2, column=2).alignment.horizontal == 'right'
+        assert _conditional_rules(ws) == {
+            'D2': [('equal', '"MATCH"', 'FFC6EFCE'), ('equal', '"MISMATCH"', 'FFFFC7CE')]
+        }
+        wb.close()
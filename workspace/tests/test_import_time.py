@@ -0,0 +1,115 @@
+"""
+Tests for helpers import cost (notebook kernel cold start)
+
+Each test imports in a fresh interpreter with `python -X importtime`, so the
+result does not depend on what other tests already imported.
+
+Tests cover:
+- `import helpers` does not import any submodule
+- Postgres-only step imports do not load the Moody's API stack (requests, boto3),
+  pyodbc or the Excel libraries
+- IRPClient builds managers on first access
+- Import-time budget for helpers.irp_integration (recorded as a test property)
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+WORKSPACE = Path(__file__).resolve().parent.parent
+
+# Modules only needed for Moody's API calls, S3 uploads, SQL Server and Excel export
+HEAVY_MODULES = ['requests', 'boto3', 'botocore', 'pyodbc', 'openpyxl', 'xlsxwriter']
+
+# Imports made by notebooks that only work with the Postgres tracking database
+POSTGRES_STEP_IMPORTS = 'import helpers.batch, helpers.job, helpers.step, helpers.context, helpers.configuration'
+
+# Cumulative import time budget for the irp_integration package itself (was ~500ms eagerly)
+IRP_INTEGRATION_IMPORT_BUDGET_US = 50_000
+
+
+# ============================================================================
+# Test Helpers
+# ============================================================================
+
+def import_profile(code: str) -> dict:
+    """
+    Run code in a fresh interpreter with -X importtime.
+
+    Returns:
+        Dict of module name -> cumulative import time in microseconds
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(WORKSPACE), env.get('PYTHONPATH')]))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=WORKSPACE, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+@pytest.mark.unit
+def test_import_helpers_imports_no_submodules():
+    """Test the package import is lazy (PEP 562)"""
+    profile = import_profile('import helpers')
+
+    assert not [name for name in profile if name.startswith('helpers.')]
+    assert 'pandas' not in profile
+
+
+@pytest.mark.unit
+def test_postgres_step_imports_skip_heavy_modules():
+    """Test Postgres-only notebooks don't import the API, S3, SQL Server or Excel stacks"""
+    profile = import_profile(POSTGRES_STEP_IMPORTS)
+
+    assert [name for name in HEAVY_MODULES if name in profile] == []
+
+
+@pytest.mark.unit
+def test_irp_client_builds_managers_on_first_use():
+    """Test IRPClient imports a manager (and its dependencies) only when accessed"""
+    code = '\n'.join([
+        'import sys',
+        'from helpers.irp_integration import IRPClient',
+        'client = IRPClient()',
+        'assert "helpers.irp_integration.mri_import" not in sys.modules',
+        'assert client.edm is client.edm',
+        'assert "helpers.irp_integration.edm" in sys.modules',
+        'assert "boto3" not in sys.modules',
+    ])
+    import_profile(code)
+
+
+@pytest.mark.unit
+def test_sqlserver_import_defers_pyodbc():
+    """Test pyodbc is only imported when a SQL Server connection is opened"""
+    profile = import_profile('import helpers.sqlserver')
+
+    assert 'helpers.sqlserver' in profile
+    assert 'pyodbc' not in profile
+
+
+@pytest.mark.unit
+def test_irp_integration_import_budget(record_property):
+    """Test importing helpers.irp_integration stays within the import-time budget"""
+    profile = import_profile('import helpers.irp_integration')
+    elapsed = profile['helpers.irp_integration']
+    record_property('irp_integration_import_us', elapsed)
+
+    assert elapsed < IRP_INTEGRATION_IMPORT_BUDGET_US
@@ -370,6 +370,43 @@ def test_track_job_status(test_schema, mock_irp_client):
     assert status3 in expected_statuses, f"Expected status to be one of {expected_statuses}, but got: '{status3}'"
 
 
+@pytest.mark.database
+@pytest.mark.integration
+def test_track_job_status_status_change_mode(test_schema, mock_irp_client):
+    """Test STATUS_CHANGE tracking mode logs transitions only and records heartbeats on the job"""
+    from helpers.constants import TrackingLogMode
+
+    cycle_id, stage_id, step_id, config_id, batch_id = create_test_hierarchy(test_schema, 'test_track_change')
+
+    job_id = create_job_with_config(
+        batch_id, config_id,
+        job_configuration_data={'Database': 'TestDB'},
+        schema=test_schema
+    )
+    submit_job(job_id, 'EDM Creation', mock_irp_client, schema=test_schema)
+
+    # First poll changes SUBMITTED -> FINISHED, the next two are heartbeats
+    for _ in range(3):
+        track_job_status(job_id, 'EDM Creation', mock_irp_client, schema=test_schema,
+                         tracking_mode=TrackingLogMode.STATUS_CHANGE)
+
+    df = execute_query(
+        "SELECT COUNT(*) as count FROM irp_job_tracking_log WHERE job_id = %s",
+        (job_id,),
+        schema=test_schema
+    )
+    assert df.iloc[0]['count'] == 1
+    assert read_job(job_id, schema=test_schema)['last_tracked_ts'] is not None
+
+
+@pytest.mark.database
+@pytest.mark.unit
+def test_track_job_status_invalid_mode(test_schema, mock_irp_client):
+    """Test track_job_status() rejects an unknown tracking mode"""
+    with pytest.raises(JobError):
+        track_job_status(1, 'EDM Creation', mock_irp_client, schema=test_schema, tracking_mode='sometimes')
+
+
 # ============================================================================
 # Tests - Job Resubmission
 # ============================================================================
@@ -1583,3 +1620,36 @@ def test_resubmit_job_sets_failed_batch_to_active(test_schema, mock_irp_client):
     # Verify batch is now ACTIVE
     batch_after = read_batch(batch_id, schema=test_schema)
     assert batch_after['status'] == BatchStatus.ACTIVE
+
+
+@pytest.mark.database
+@pytest.mark.unit
+def test_update_job_configurations_data(test_schema):
+    """Test update_job_configurations_data() merges fields into several configurations at once"""
+    from helpers.job import create_job_configuration, update_job_configurations_data
+
+    cycle_id, stage_id, step_id, config_id, batch_id = create_test_hierarchy(test_schema, 'test_bulk_config_update')
+
+    config_ids = [
+        create_job_configuration(
+            batch_id=batch_id,
+            configuration_id=config_id,
+            job_configuration_data={'rdm_name': 'RDM1', 'analysis_names': [f'A{i}']},
+            schema=test_schema
+        )
+        for i in range(3)
+    ]
+
+    updated = update_job_configurations_data(config_ids[:2], {'database_id': 42}, schema=test_schema)
+
+    assert updated == 2
+    df = execute_query(
+        "SELECT id, job_configuration_data FROM irp_job_configuration WHERE batch_id = %s ORDER BY id",
+        (batch_id,),
+        schema=test_schema
+    )
+    data = [d if isinstance(d, dict) else json.loads(d) for d in df['job_configuration_data']]
+    assert data[0] == {'rdm_name': 'RDM1', 'analysis_names': ['A0'], 'database_id': 42}
+    assert data[1]['database_id'] == 42
+    assert 'database_id' not in data[2]
+    assert update_job_configurations_data([], {'database_id': 42}, schema=test_schema) == 0
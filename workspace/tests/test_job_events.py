@@ -0,0 +1,159 @@
+"""
+Tests for live job status events (LISTEN/NOTIFY on irp_job_status)
+
+Tests cover:
+- Notification payload parsing and schema/batch filtering
+- Events for job status updates committed while listening
+- Bursts of changes collected by wait_for_job_status_changes
+- Timeout when nothing changes
+"""
+
+import json
+import threading
+
+import pytest
+
+from helpers.database import execute_insert, execute_command, create_reporting_views
+from helpers.job_events import (
+    parse_job_event,
+    _event_matches,
+    watch_job_status,
+    wait_for_job_status_changes
+)
+
+
+# ============================================================================
+# Test Helpers
+# ============================================================================
+
+@pytest.fixture(scope="module")
+def events_schema(test_schema):
+    """Test schema with the job status NOTIFY trigger installed"""
+    assert create_reporting_views(schema=test_schema)
+    return test_schema
+
+
+def create_test_jobs(schema, cycle_name, num_jobs):
+    """Helper to create cycle → stage → step → configuration → batch with jobs"""
+    cycle_id = execute_insert(
+        "INSERT INTO irp_cycle (cycle_name, status) VALUES (%s, %s)",
+        (cycle_name, 'ACTIVE'),
+        schema=schema
+    )
+    stage_id = execute_insert(
+        "INSERT INTO irp_stage (cycle_id, stage_num, stage_name) VALUES (%s, %s, %s)",
+        (cycle_id, 1, 'test_stage'),
+        schema=schema
+    )
+    step_id = execute_insert(
+        "INSERT INTO irp_step (stage_id, step_num, step_name) VALUES (%s, %s, %s)",
+        (stage_id, 1, 'test_step'),
+        schema=schema
+    )
+    config_id = execute_insert(
+        """INSERT INTO irp_configuration
+           (cycle_id, configuration_file_name, configuration_data, file_last_updated_ts)
+           VALUES (%s, %s, %s, NOW())""",
+        (cycle_id, '/test/config.xlsx', '{}'),
+        schema=schema
+    )
+    batch_id = execute_insert(
+        "INSERT INTO irp_batch (step_id, configuration_id, batch_type, status) VALUES (%s, %s, %s, %s)",
+        (step_id, config_id, 'test_default', 'ACTIVE'),
+        schema=schema
+    )
+    job_ids = []
+    for _ in range(num_jobs):
+        job_config_id = execute_insert(
+            """INSERT INTO irp_job_configuration (batch_id, configuration_id, job_configuration_data)
+               VALUES (%s, %s, %s)""",
+            (batch_id, config_id, '{}'),
+            schema=schema
+        )
+        job_ids.append(execute_insert(
+            "INSERT INTO irp_job (batch_id, job_configuration_id, status) VALUES (%s, %s, %s)",
+            (batch_id, job_config_id, 'SUBMITTED'),
+            schema=schema
+        ))
+    return batch_id, job_ids
+
+
+def update_later(schema, job_ids, status, delay=0.5):
+    """Update job statuses from another thread once the listener is running"""
+    def update():
+        for job_id in job_ids:
+            execute_command("UPDATE irp_job SET status = %s WHERE id = %s", (status, job_id), schema=schema)
+    timer = threading.Timer(delay, update)
+    timer.start()
+    return timer
+
+
+# ============================================================================
+# Tests - Payloads
+# ============================================================================
+
+@pytest.mark.unit
+def test_parse_job_event():
+    """Test payload parsing rejects malformed notifications"""
+    event = parse_job_event(json.dumps({'schema': 'demo', 'batch_id': 1, 'job_id': 2, 'status': 'RUNNING'}))
+
+    assert event['job_id'] == 2
+    assert parse_job_event('not json') is None
+    assert parse_job_event(json.dumps({'schema': 'demo'})) is None
+
+
+@pytest.mark.unit
+def test_event_matches_schema_and_batches():
+    """Test events are filtered by schema and (optionally) batch"""
+    event = {'schema': 'demo', 'batch_id': 7, 'job_id': 1}
+
+    assert _event_matches(event, 'demo', None)
+    assert _event_matches(event, 'demo', {7, 8})
+    assert not _event_matches(event, 'demo', {8})
+    assert not _event_matches(event, 'other', None)
+
+
+# ============================================================================
+# Tests - Listening
+# ============================================================================
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_watch_yields_status_change(events_schema):
+    """Test a committed status update is delivered with the new status"""
+    batch_id, job_ids = create_test_jobs(events_schema, 'test_events_watch', 1)
+
+    stream = watch_job_status(batch_ids=[batch_id], timeout=10, schema=events_schema)
+    timer = update_later(events_schema, job_ids, 'RUNNING')
+    event = next(stream)
+    stream.close()
+    timer.join()
+
+    assert event['job_id'] == job_ids[0]
+    assert event['batch_id'] == batch_id
+    assert event['status'] == 'RUNNING'
+    assert event['op'] == 'UPDATE'
+
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_wait_collects_burst(events_schema):
+    """Test a burst of updates is returned as one list, filtered to the batch"""
+    batch_id, job_ids = create_test_jobs(events_schema, 'test_events_burst', 3)
+    _, other_job_ids = create_test_jobs(events_schema, 'test_events_other', 1)
+
+    timer = update_later(events_schema, other_job_ids + job_ids, 'FINISHED')
+    events = wait_for_job_status_changes(batch_ids=[batch_id], timeout=10, settle=1.0, schema=events_schema)
+    timer.join()
+
+    assert [e['job_id'] for e in events] == job_ids
+    assert all(e['status'] == 'FINISHED' for e in events)
+
+
+@pytest.mark.database
+@pytest.mark.unit
+def test_wait_times_out(events_schema):
+    """Test waiting returns no events when nothing changes"""
+    batch_id, _ = create_test_jobs(events_schema, 'test_events_idle', 1)
+
+    assert wait_for_job_status_changes(batch_ids=[batch_id], timeout=0.5, schema=events_schema) == []
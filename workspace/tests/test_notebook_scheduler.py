@@ -0,0 +1,231 @@
+"""
+Tests for notebook_scheduler module (JupyterLab scheduler job utilities)
+
+Each test uses its own SQLite scheduler database with a minimal jobs table,
+plus temporary staging and jobs output directories.
+
+Tests cover:
+- Engine caching and job indexes
+- Batched cleanup of old jobs and their staging directories
+- Incremental orphan detection via the output manifest
+- Reclaimed bytes reporting
+"""
+
+import time
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+
+import helpers.notebook_scheduler as notebook_scheduler
+from helpers.notebook_scheduler import (
+    get_engine,
+    dispose_engines,
+    list_jobs,
+    cleanup_old_jobs,
+    find_orphaned_outputs,
+    delete_orphaned_outputs,
+    refresh_output_manifest,
+)
+
+
+JOBS_TABLE = """
+    CREATE TABLE jobs (
+        job_id VARCHAR PRIMARY KEY,
+        name VARCHAR,
+        status VARCHAR,
+        create_time INTEGER,
+        start_time INTEGER,
+        end_time INTEGER,
+        input_filename VARCHAR,
+        parameters JSON,
+        status_message VARCHAR
+    )
+"""
+
+
+# ============================================================================
+# Fixtures and Helpers
+# ============================================================================
+
+@pytest.fixture(autouse=True)
+def reset_engines():
+    """Each test starts without cached engines"""
+    dispose_engines()
+    yield
+    dispose_engines()
+
+
+@pytest.fixture
+def scheduler_db(tmp_path):
+    """SQLite scheduler database with an empty jobs table"""
+    db_url = f"sqlite:///{tmp_path / 'scheduler.sqlite'}"
+    engine = create_engine(db_url)
+    with engine.begin() as conn:
+        conn.execute(text(JOBS_TABLE))
+    engine.dispose()
+    return db_url
+
+
+def add_jobs(db_url, count, days_old, status='COMPLETED'):
+    """Insert jobs created days_old days ago; returns their job IDs"""
+    create_time = int((datetime.utcnow() - timedelta(days=days_old)).timestamp() * 1000)
+    job_ids = [str(uuid.uuid4()) for _ in range(count)]
+    with get_engine(db_url).begin() as conn:
+        conn.execute(
+            text("INSERT INTO jobs (job_id, name, status, create_time, input_filename) "
+                 "VALUES (:job_id, 'Job', :status, :create_time, 'Job.ipynb')"),
+            [{'job_id': job_id, 'status': status, 'create_time': create_time} for job_id in job_ids]
+        )
+    return job_ids
+
+
+def make_dir(path, size_bytes):
+    """Create a directory holding one file of size_bytes"""
+    path.mkdir(parents=True)
+    (path / 'output.ipynb').write_bytes(b'x' * size_bytes)
+    return path
+
+
+def job_count(db_url):
+    with get_engine(db_url).connect() as conn:
+        return conn.execute(text("SELECT COUNT(*) FROM jobs")).scalar()
+
+
+# ============================================================================
+# Tests - Engine and Indexes
+# ============================================================================
+
+@pytest.mark.unit
+def test_engine_cached_and_job_indexes_created(scheduler_db):
+    """Test one engine per URL, with the (status, create_time) index used for listing"""
+    engine = get_engine(scheduler_db)
+    assert get_engine(scheduler_db) is engine
+
+    with engine.connect() as conn:
+        indexes = {row[0] for row in conn.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'jobs'"
+        ))}
+        plan = conn.execute(text(
+            "EXPLAIN QUERY PLAN SELECT job_id FROM jobs WHERE status = 'FAILED' ORDER BY create_time DESC"
+        )).fetchall()
+
+    assert {'ix_jobs_status_create_time', 'ix_jobs_create_time'} <= indexes
+    assert 'ix_jobs_status_create_time' in str(plan)
+
+
+@pytest.mark.unit
+def test_indexes_created_once_jobs_table_exists(tmp_path):
+    """Test a database without the jobs table yet is indexed on a later call"""
+    db_url = f"sqlite:///{tmp_path / 'scheduler.sqlite'}"
+    engine = get_engine(db_url)
+
+    with engine.begin() as conn:
+        conn.execute(text(JOBS_TABLE))
+    get_engine(db_url)
+
+    with engine.connect() as conn:
+        indexes = conn.execute(text(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name LIKE 'ix_jobs_%'"
+        )).scalar()
+    assert indexes == 2
+
+
+@pytest.mark.unit
+def test_list_jobs_filters_by_status(scheduler_db):
+    """Test list_jobs status filter and limit"""
+    add_jobs(scheduler_db, 3, days_old=1, status='FAILED')
+    add_jobs(scheduler_db, 2, days_old=1, status='COMPLETED')
+
+    assert len(list_jobs(status='FAILED', db_url=scheduler_db)) == 3
+    assert len(list_jobs(limit=4, db_url=scheduler_db)) == 4
+
+
+# ============================================================================
+# Tests - Cleanup
+# ============================================================================
+
+@pytest.mark.unit
+def test_cleanup_old_jobs_deletes_in_batches(scheduler_db, tmp_path):
+    """Test old jobs and staging dirs are deleted batch by batch, with bytes reclaimed"""
+    old_ids = add_jobs(scheduler_db, 25, days_old=40)
+    recent_ids = add_jobs(scheduler_db, 2, days_old=1)
+
+    staging = tmp_path / 'scheduler_staging_area'
+    for job_id in old_ids[:3]:
+        make_dir(staging / job_id, 1000)
+    make_dir(staging / recent_ids[0], 1000)
+
+    with patch.object(notebook_scheduler, 'jupyter_data_dir', return_value=str(tmp_path)), \
+         patch.object(notebook_scheduler, 'DELETE_BATCH_SIZE', 10):
+        preview = cleanup_old_jobs(days_threshold=30, dry_run=True, db_url=scheduler_db)
+        result = cleanup_old_jobs(days_threshold=30, dry_run=False, db_url=scheduler_db)
+
+    assert preview['jobs_count'] == 25
+    assert job_count(scheduler_db) == 2
+    assert result['jobs_count'] == 25
+    assert result['staging_files_deleted'] == 3
+    assert result['staging_bytes_reclaimed'] == 3000
+    assert sorted(p.name for p in staging.iterdir()) == [recent_ids[0]]
+
+
+# ============================================================================
+# Tests - Downloaded Outputs
+# ============================================================================
+
+@pytest.mark.unit
+def test_find_orphaned_outputs(scheduler_db, tmp_path):
+    """Test output dirs are orphaned when their job is no longer in the database"""
+    live_id = add_jobs(scheduler_db, 1, days_old=1)[0]
+    deleted_id = str(uuid.uuid4())
+    jobs_dir = tmp_path / 'jobs'
+    make_dir(jobs_dir / f'My_Notebook-{live_id}', 100)
+    orphan = make_dir(jobs_dir / f'My_Notebook-{deleted_id}', 100)
+    make_dir(jobs_dir / 'not-a-job', 100)
+
+    assert find_orphaned_outputs(jobs_dir, db_url=scheduler_db) == [(orphan, deleted_id)]
+
+
+@pytest.mark.unit
+def test_output_manifest_is_incremental(tmp_path):
+    """Test unchanged output dirs are not re-measured"""
+    jobs_dir = tmp_path / 'jobs'
+    make_dir(jobs_dir / f'A-{uuid.uuid4()}', 10)
+    make_dir(jobs_dir / f'B-{uuid.uuid4()}', 20)
+
+    entries = refresh_output_manifest(jobs_dir)
+    assert sorted(entry['size_bytes'] for entry in entries.values()) == [10, 20]
+
+    with patch.object(notebook_scheduler, '_directory_usage') as usage:
+        refresh_output_manifest(jobs_dir)
+    usage.assert_not_called()
+
+    # A new directory changes the parent's mtime; only the new one is measured
+    time.sleep(0.01)
+    new_dir = make_dir(jobs_dir / f'C-{uuid.uuid4()}', 30)
+    with patch.object(notebook_scheduler, '_directory_usage', return_value=(30, 1)) as usage:
+        entries = refresh_output_manifest(jobs_dir)
+    usage.assert_called_once_with(str(new_dir))
+    assert len(entries) == 3
+
+
+@pytest.mark.unit
+def test_delete_orphaned_outputs_reports_bytes_reclaimed(scheduler_db, tmp_path):
+    """Test orphaned dirs are deleted, reported in bytes and dropped from the manifest"""
+    live_id = add_jobs(scheduler_db, 1, days_old=1)[0]
+    jobs_dir = tmp_path / 'jobs'
+    live = make_dir(jobs_dir / f'Nb-{live_id}', 100)
+    make_dir(jobs_dir / f'Nb-{uuid.uuid4()}', 2048)
+    make_dir(jobs_dir / f'Nb-{uuid.uuid4()}', 1024)
+
+    preview = delete_orphaned_outputs(jobs_dir, dry_run=True, db_url=scheduler_db)
+    result = delete_orphaned_outputs(jobs_dir, dry_run=False, db_url=scheduler_db)
+
+    assert preview['directories_count'] == 2
+    assert preview['bytes_reclaimed'] == 3072
+    assert result['bytes_reclaimed'] == 3072
+    assert [p for p in jobs_dir.iterdir() if p.is_dir()] == [live]
+    assert list(refresh_output_manifest(jobs_dir)) == [live.name]
+    assert find_orphaned_outputs(jobs_dir, db_url=scheduler_db) == []
@@ -0,0 +1,208 @@
+"""
+Tests for reporting views backed by trigger-maintained summary tables
+
+Tests cover:
+- v_irp_job_configuration / v_irp_batch statistics after job inserts and status updates
+- Summary refresh on job configuration skip
+- Summary cleanup on batch deletion
+- Job counts for configurations with more than one job (resubmissions)
+- Incremental totals when jobs move between configurations or are deleted
+"""
+
+import pytest
+
+from helpers.database import execute_insert, execute_command, execute_query, execute_scalar, create_reporting_views
+from helpers.batch import delete_batch
+
+
+# ============================================================================
+# Test Helpers
+# ============================================================================
+
+@pytest.fixture(scope="module")
+def reporting_schema(test_schema):
+    """Test schema with reporting views, summary tables and triggers installed"""
+    assert create_reporting_views(schema=test_schema)
+    return test_schema
+
+
+def create_test_batch(schema, cycle_name, num_configs):
+    """Helper to create cycle → stage → step → configuration → batch with job configurations"""
+    cycle_id = execute_insert(
+        "INSERT INTO irp_cycle (cycle_name, status) VALUES (%s, %s)",
+        (cycle_name, 'ACTIVE'),
+        schema=schema
+    )
+    stage_id = execute_insert(
+        "INSERT INTO irp_stage (cycle_id, stage_num, stage_name) VALUES (%s, %s, %s)",
+        (cycle_id, 1, 'test_stage'),
+        schema=schema
+    )
+    step_id = execute_insert(
+        "INSERT INTO irp_step (stage_id, step_num, step_name) VALUES (%s, %s, %s)",
+        (stage_id, 1, 'test_step'),
+        schema=schema
+    )
+    config_id = execute_insert(
+        """INSERT INTO irp_configuration
+           (cycle_id, configuration_file_name, configuration_data, file_last_updated_ts)
+           VALUES (%s, %s, %s, NOW())""",
+        (cycle_id, '/test/config.xlsx', '{}'),
+        schema=schema
+    )
+    batch_id = execute_insert(
+        "INSERT INTO irp_batch (step_id, configuration_id, batch_type, status) VALUES (%s, %s, %s, %s)",
+        (step_id, config_id, 'test_default', 'ACTIVE'),
+        schema=schema
+    )
+    job_config_ids = [
+        execute_insert(
+            """INSERT INTO irp_job_configuration (batch_id, configuration_id, job_configuration_data)
+               VALUES (%s, %s, %s)""",
+            (batch_id, config_id, '{}'),
+            schema=schema
+        )
+        for _ in range(num_configs)
+    ]
+    return batch_id, job_config_ids
+
+
+def create_test_job(schema, batch_id, job_config_id, status='SUBMITTED'):
+    return execute_insert(
+        "INSERT INTO irp_job (batch_id, job_configuration_id, status) VALUES (%s, %s, %s)",
+        (batch_id, job_config_id, status),
+        schema=schema
+    )
+
+
+def batch_row(schema, batch_id):
+    df = execute_query("SELECT * FROM v_irp_batch WHERE batch_id = %s", (batch_id,), schema=schema)
+    return df.iloc[0].to_dict()
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_summary_tracks_job_status(reporting_schema):
+    """Test batch and configuration statistics follow job status changes"""
+    batch_id, job_config_ids = create_test_batch(reporting_schema, 'test_rv_status', 3)
+    job_ids = [create_test_job(reporting_schema, batch_id, jc_id) for jc_id in job_config_ids]
+
+    row = batch_row(reporting_schema, batch_id)
+    assert row['total_jobs'] == 3
+    assert row['unfulfilled_configs'] == 3
+    assert row['reporting_status'] == 'IN-PROGRESS'
+
+    execute_command(
+        "UPDATE irp_job SET status = 'FINISHED' WHERE id IN (%s, %s)",
+        (job_ids[0], job_ids[1]),
+        schema=reporting_schema
+    )
+    execute_command("UPDATE irp_job SET status = 'FAILED' WHERE id = %s", (job_ids[2],), schema=reporting_schema)
+
+    row = batch_row(reporting_schema, batch_id)
+    assert row['finished_jobs'] == 2
+    assert row['failed_jobs'] == 1
+    assert row['fulfilled_configs'] == 2
+    assert row['reporting_status'] == 'FAILED'
+
+    status = execute_scalar(
+        "SELECT config_report_status FROM v_irp_job_configuration WHERE job_configuration_id = %s",
+        (job_config_ids[2],),
+        schema=reporting_schema
+    )
+    assert status == 'UNFULFILLED'
+
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_summary_tracks_config_skip(reporting_schema):
+    """Test skipping a job configuration refreshes the batch summary"""
+    batch_id, job_config_ids = create_test_batch(reporting_schema, 'test_rv_skip', 2)
+    create_test_job(reporting_schema, batch_id, job_config_ids[0], status='FINISHED')
+
+    execute_command(
+        "UPDATE irp_job_configuration SET skipped = TRUE WHERE id = %s",
+        (job_config_ids[1],),
+        schema=reporting_schema
+    )
+
+    row = batch_row(reporting_schema, batch_id)
+    assert row['skipped_configs'] == 1
+    assert row['non_skipped_configs'] == 1
+    assert row['reporting_status'] == 'COMPLETED'
+
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_resubmitted_config_counts_each_job_once(reporting_schema):
+    """Test a configuration with several jobs contributes each job once to batch totals"""
+    batch_id, job_config_ids = create_test_batch(reporting_schema, 'test_rv_resubmit', 1)
+    for status in ('FAILED', 'FAILED', 'FINISHED'):
+        create_test_job(reporting_schema, batch_id, job_config_ids[0], status=status)
+
+    row = batch_row(reporting_schema, batch_id)
+    assert row['total_jobs'] == 3
+    assert row['finished_jobs'] == 1
+    assert row['failed_jobs'] == 2
+
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_summary_follows_job_move_and_delete(reporting_schema):
+    """Test batch totals stay equal to the job table when jobs change configuration or are deleted"""
+    batch_id, job_config_ids = create_test_batch(reporting_schema, 'test_rv_move', 2)
+    failed_id = create_test_job(reporting_schema, batch_id, job_config_ids[0], status='FAILED')
+    finished_id = create_test_job(reporting_schema, batch_id, job_config_ids[0], status='FINISHED')
+
+    execute_command(
+        "UPDATE irp_job SET job_configuration_id = %s WHERE id = %s",
+        (job_config_ids[1], finished_id),
+        schema=reporting_schema
+    )
+    row = batch_row(reporting_schema, batch_id)
+    assert row['total_jobs'] == 2
+    assert row['fulfilled_configs'] == 1
+    assert row['unfulfilled_configs'] == 1
+    assert row['reporting_status'] == 'FAILED'
+
+    execute_command("DELETE FROM irp_job WHERE id = %s", (failed_id,), schema=reporting_schema)
+    row = batch_row(reporting_schema, batch_id)
+    assert row['total_jobs'] == 1
+    assert row['failed_jobs'] == 0
+    assert not row['has_failed_report_status']
+    assert row['total_jobs'] == execute_scalar(
+        "SELECT COUNT(*) FROM irp_job WHERE batch_id = %s AND NOT skipped", (batch_id,), schema=reporting_schema
+    )
+
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_empty_batch_has_default_summary(reporting_schema):
+    """Test a batch without job configurations reports zero counts"""
+    batch_id, _ = create_test_batch(reporting_schema, 'test_rv_empty', 0)
+
+    row = batch_row(reporting_schema, batch_id)
+    assert row['total_configs'] == 0
+    assert row['total_jobs'] == 0
+    assert row['reporting_status'] == 'IN-PROGRESS'
+
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_delete_batch_removes_summary(reporting_schema):
+    """Test deleting a batch removes its summary rows"""
+    batch_id, job_config_ids = create_test_batch(reporting_schema, 'test_rv_delete', 2)
+    create_test_job(reporting_schema, batch_id, job_config_ids[0])
+
+    delete_batch(batch_id, schema=reporting_schema)
+
+    assert execute_scalar(
+        "SELECT COUNT(*) FROM irp_batch_summary WHERE batch_id = %s", (batch_id,), schema=reporting_schema
+    ) == 0
+    assert execute_scalar(
+        "SELECT COUNT(*) FROM irp_job_configuration_summary WHERE batch_id = %s", (batch_id,), schema=reporting_schema
+    ) == 0
@@ -5,6 +5,8 @@ This module tests the automatic execution of subsequent notebooks when batches c
 """
 
 import json
+import threading
+import time
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -13,10 +15,16 @@ from helpers.step_chain import (
     get_next_step_info,
     should_execute_next_step,
     get_chain_status,
+    get_ready_steps,
     _build_notebook_path,
-    STAGE_03_CHAIN
+    _validate_stage_dependencies,
+    STAGE_03_CHAIN,
+    STAGE_DEPENDENCIES
+)
+from helpers.step_scheduler import plan_ready_steps, execute_ready_steps
+from helpers.notebook_executor import (
+    execute_notebook, execute_next_step, validate_nbconvert_available, KernelPool, KernelPoolUnavailable
 )
-from helpers.notebook_executor import execute_notebook, execute_next_step, validate_nbconvert_available
 from helpers.database import execute_insert, execute_query, execute_command
 from helpers.constants import BatchStatus, CycleStatus, StepStatus
 
@@ -604,6 +612,152 @@ class TestNotebookExecutor:
         with pytest.raises(FileNotFoundError):
             execute_notebook(notebook_path)
 
+    @staticmethod
+    def _write_notebook(path, sources, metadata=None):
+        nbformat = pytest.importorskip('nbformat')
+        nb = nbformat.v4.new_notebook(cells=[nbformat.v4.new_code_cell(src) for src in sources])
+        nb.metadata.update(metadata or {})
+        nbformat.write(nb, str(path))
+        return path
+
+    @pytest.fixture
+    def kernel_pool(self):
+        """Single-kernel pool without warm imports (keeps the test fast)"""
+        pytest.importorskip('nbclient')
+        pytest.importorskip('ipykernel')
+        pool = KernelPool(size=1, warm_modules=())
+        with patch('helpers.notebook_executor.NOTEBOOK_EXECUTION_BACKEND', 'kernel_pool'), \
+                patch('helpers.notebook_executor.get_kernel_pool', return_value=pool):
+            yield pool
+        pool.shutdown()
+
+    @pytest.fixture
+    def mock_kernels(self):
+        """Kernel pool opted in with jupyter_client/nbclient replaced by mocks"""
+        pytest.importorskip('nbclient')
+        with patch('jupyter_client.KernelManager') as kernel_manager, \
+                patch('nbclient.NotebookClient'), \
+                patch('helpers.notebook_executor._run_kernel_code'), \
+                patch('helpers.notebook_executor.NOTEBOOK_EXECUTION_BACKEND', 'kernel_pool'):
+            pool = KernelPool(size=1, warm_modules=())
+            with patch('helpers.notebook_executor.get_kernel_pool', return_value=pool):
+                yield pool, kernel_manager
+
+    @patch('subprocess.run')
+    def test_default_backend_is_nbconvert(self, mock_run, tmp_path):
+        """Without opting in to the kernel pool, notebooks run via nbconvert."""
+        mock_run.return_value = Mock(returncode=0, stdout='', stderr='')
+        notebook = self._write_notebook(tmp_path / 'step.ipynb', ['x = 1'])
+
+        with patch('helpers.notebook_executor.get_kernel_pool') as mock_pool:
+            result = execute_notebook(notebook)
+
+        assert result['backend'] == 'nbconvert'
+        mock_pool.assert_not_called()
+
+    def test_chained_steps_reuse_pooled_kernel(self, mock_kernels, tmp_path):
+        """Steps chained from one long-lived process start a single kernel and reuse it."""
+        pool, kernel_manager = mock_kernels
+        notebooks = [
+            self._write_notebook(tmp_path / f'Step_0{step_num}.ipynb', ['x = 1'])
+            for step_num in (1, 2, 3)
+        ]
+
+        results = [
+            execute_next_step('Test-Cycle', 1, step_num, notebook)
+            for step_num, notebook in enumerate(notebooks, start=1)
+        ]
+
+        assert [result['success'] for result in results] == [True, True, True]
+        assert [result['backend'] for result in results] == ['kernel_pool'] * 3
+        assert [result['warm_kernel'] for result in results] == [False, True, True]
+        kernel_manager.assert_called_once()
+        assert pool.stats()['kernels_started'] == 1
+        assert pool.stats()['idle'] == 1
+
+    @patch('subprocess.run')
+    def test_pooled_kernel_does_not_nest_pool(self, mock_run, mock_kernels, tmp_path, monkeypatch):
+        """A step chained from inside a pooled kernel runs via nbconvert, not a nested pool."""
+        pool, kernel_manager = mock_kernels
+        mock_run.return_value = Mock(returncode=0, stdout='', stderr='')
+        monkeypatch.setenv('IRP_POOLED_KERNEL', '1')
+        notebook = self._write_notebook(tmp_path / 'Step_02.ipynb', ['x = 1'])
+
+        result = execute_notebook(notebook)
+
+        assert result['backend'] == 'nbconvert'
+        kernel_manager.assert_not_called()
+
+    @pytest.mark.slow
+    def test_kernel_pool_reuses_warm_kernel(self, kernel_pool, tmp_path):
+        """Second notebook runs on the same warm kernel with a clean namespace."""
+        first = self._write_notebook(tmp_path / 'first.ipynb', ['leftover = 1'])
+        second_dir = tmp_path / 'second'
+        second_dir.mkdir()
+        second = self._write_notebook(second_dir / 'second.ipynb', [
+            "import os\n"
+            "assert 'leftover' not in globals()\n"
+            "print(os.getcwd())"
+        ])
+
+        first_result = execute_notebook(first)
+        second_result = execute_notebook(second)
+
+        assert first_result['success'] is True
+        assert first_result['backend'] == 'kernel_pool'
+        assert first_result['warm_kernel'] is False
+        assert second_result['success'] is True, second_result['error']
+        assert second_result['warm_kernel'] is True
+        assert second_result['startup_time'] < first_result['startup_time']
+        assert kernel_pool.stats()['kernels_started'] == 1
+
+        import nbformat
+        executed = nbformat.read(str(second), as_version=4)
+        assert executed.cells[0].outputs[0]['text'].strip() == str(second_dir)
+
+    @pytest.mark.slow
+    @patch('helpers.notebook_executor._handle_notebook_failure')
+    def test_kernel_pool_failure_keeps_kernel(self, mock_failure, kernel_pool, tmp_path):
+        """A notebook exiting with SystemExit fails the run but the kernel stays pooled."""
+        notebook = self._write_notebook(tmp_path / 'fails.ipynb', ['raise SystemExit("Validation failed")'])
+
+        result = execute_notebook(notebook)
+
+        assert result['success'] is False
+        assert 'failed' in result['error'].lower()
+        assert 'Validation failed' in result['error']
+        mock_failure.assert_called_once()
+        assert kernel_pool.stats()['idle'] == 1
+
+    @patch('subprocess.run')
+    def test_isolated_notebook_uses_nbconvert(self, mock_run, tmp_path):
+        """Notebooks marked isolated_execution run in an nbconvert subprocess."""
+        mock_run.return_value = Mock(returncode=0, stdout='', stderr='')
+        notebook = self._write_notebook(tmp_path / 'isolated.ipynb', ['x = 1'], {'isolated_execution': True})
+
+        with patch('helpers.notebook_executor.get_kernel_pool') as mock_pool:
+            result = execute_notebook(notebook)
+
+        assert result['success'] is True
+        assert result['backend'] == 'nbconvert'
+        assert result['startup_time'] is None
+        mock_pool.assert_not_called()
+        assert mock_run.call_args[0][0][:2] == ['jupyter', 'nbconvert']
+
+    @patch('subprocess.run')
+    def test_kernel_pool_unavailable_falls_back(self, mock_run, tmp_path):
+        """When no kernel can be started the notebook runs via nbconvert."""
+        mock_run.return_value = Mock(returncode=0, stdout='', stderr='')
+        notebook = self._write_notebook(tmp_path / 'fallback.ipynb', ['x = 1'])
+
+        with patch('helpers.notebook_executor.NOTEBOOK_EXECUTION_BACKEND', 'kernel_pool'), \
+                patch('helpers.notebook_executor.get_kernel_pool', side_effect=KernelPoolUnavailable('no kernel')):
+            result = execute_notebook(notebook)
+
+        assert result['success'] is True
+        assert result['backend'] == 'nbconvert'
+        mock_run.assert_called_once()
+
     @patch('helpers.notebook_executor.execute_notebook')
     def test_execute_next_step(self, mock_execute):
         """Test execute_next_step wrapper function."""
@@ -625,6 +779,177 @@ class TestNotebookExecutor:
         mock_execute.assert_called_once()
 
 
+class TestStageDependencies:
+    """Test the step dependency graph used by the parallel scheduler."""
+
+    def test_linear_stages_follow_chain(self):
+        """Verify stages without overrides depend on the previous step only."""
+        assert STAGE_DEPENDENCIES[5] == {2: [1], 3: [2]}
+
+    def test_stage_03_geohaz_and_mapping_independent(self):
+        """Verify GeoHaz and Portfolio Mapping both depend on EDM DB Upgrade, Control Totals on both."""
+        graph = STAGE_DEPENDENCIES[3]
+        assert graph[6] == [5]
+        assert graph[7] == [5]
+        assert graph[8] == [6, 7]
+
+    def test_cycle_rejected(self):
+        """Verify a dependency cycle is rejected."""
+        with pytest.raises(ValueError, match='cycle'):
+            _validate_stage_dependencies({3: {6: [7], 7: [6]}})
+
+    def test_unknown_step_rejected(self):
+        """Verify dependencies on steps missing from the chain are rejected."""
+        with pytest.raises(ValueError, match='unknown'):
+            _validate_stage_dependencies({2: {2: [9]}})
+
+
+class TestGetReadySteps:
+    """Test get_ready_steps against Stage 03 steps 5-8."""
+
+    @pytest.fixture
+    def stage_03_batches(self, test_schema, test_cycle, test_configuration):
+        """Create Stage 03 steps 5-7 with one batch each; returns {step_num: batch_id}."""
+        stage_id = execute_insert(
+            "INSERT INTO irp_stage (cycle_id, stage_num, stage_name) VALUES (%s, %s, %s)",
+            (test_cycle['id'], 3, 'Stage_03_Data_Import'),
+            schema=test_schema
+        )
+        batches = {}
+        for step_num in (5, 6, 7):
+            step_id = execute_insert(
+                "INSERT INTO irp_step (stage_id, step_num, step_name) VALUES (%s, %s, %s)",
+                (stage_id, step_num, f'Step_{step_num:02d}'),
+                schema=test_schema
+            )
+            execute_insert(
+                "INSERT INTO irp_step_run (step_id, run_num, status) VALUES (%s, %s, %s)",
+                (step_id, 1, StepStatus.ACTIVE),
+                schema=test_schema
+            )
+            batches[step_num] = execute_insert(
+                "INSERT INTO irp_batch (batch_type, configuration_id, step_id, status) VALUES (%s, %s, %s, %s)",
+                (STAGE_03_CHAIN[step_num]['batch_type'], test_configuration['id'], step_id, BatchStatus.ACTIVE),
+                schema=test_schema
+            )
+        return batches
+
+    def _set_status(self, schema, batch_id, status):
+        execute_command("UPDATE irp_batch SET status = %s WHERE id = %s", (status, batch_id), schema=schema)
+
+    def test_upgrade_releases_geohaz_and_mapping(self, test_schema, stage_03_batches):
+        """Test EDM DB Upgrade completion releases steps 6 and 7 together."""
+        self._set_status(test_schema, stage_03_batches[5], BatchStatus.COMPLETED)
+
+        ready = get_ready_steps(stage_03_batches[5], schema=test_schema)
+
+        assert [step['step_num'] for step in ready] == [6, 7]
+        assert all(step['current_step_num'] == 5 for step in ready)
+
+    def test_control_totals_waits_for_both(self, test_schema, stage_03_batches):
+        """Test Control Totals is only released once GeoHaz and Portfolio Mapping are complete."""
+        self._set_status(test_schema, stage_03_batches[6], BatchStatus.COMPLETED)
+        assert get_ready_steps(stage_03_batches[6], schema=test_schema) == []
+
+        self._set_status(test_schema, stage_03_batches[7], BatchStatus.COMPLETED)
+        ready = get_ready_steps(stage_03_batches[7], schema=test_schema)
+
+        assert [step['step_num'] for step in ready] == [8]
+        assert ready[0]['depends_on'] == [6, 7]
+
+    def test_incomplete_batch_releases_nothing(self, test_schema, stage_03_batches):
+        """Test a batch that has not reached wait_for releases nothing."""
+        assert get_ready_steps(stage_03_batches[5], schema=test_schema) == []
+
+
+class TestStepScheduler:
+    """Test concurrent execution of ready steps (executor mocked)."""
+
+    def _step(self, step_num, cycle_name='Test-2025-Q1'):
+        return {
+            'cycle_name': cycle_name,
+            'stage_num': 3,
+            'step_num': step_num,
+            'notebook_path': Path(f'/fake/Step_{step_num:02d}.ipynb'),
+            'current_step_num': 5,
+            'depends_on': [5],
+            'description': 'test'
+        }
+
+    @patch('helpers.step_scheduler.get_ready_steps')
+    def test_plan_deduplicates_steps(self, mock_ready):
+        """Test a step released by two batches is planned once."""
+        mock_ready.side_effect = lambda batch_id, schema=None: [self._step(8)]
+
+        planned = plan_ready_steps([11, 12], schema='test')
+
+        assert [step['step_num'] for step in planned] == [8]
+        assert planned[0]['batch_id'] == 11
+
+    @patch('helpers.step_scheduler.execute_next_step')
+    @patch('helpers.step_scheduler.get_ready_steps')
+    def test_independent_steps_run_concurrently(self, mock_ready, mock_execute):
+        """Test ready steps overlap when workers allow it."""
+        mock_ready.return_value = [self._step(6), self._step(7)]
+        both_running = threading.Barrier(2, timeout=5)
+
+        def execute(**kwargs):
+            both_running.wait()
+            return {'success': True, 'error': None}
+        mock_execute.side_effect = execute
+
+        runs = execute_ready_steps([1], max_workers=2, schema='test')
+
+        assert [run['step']['step_num'] for run in runs] == [6, 7]
+        assert all(run['result']['success'] for run in runs)
+
+    @patch('helpers.step_scheduler.execute_next_step')
+    @patch('helpers.step_scheduler.get_ready_steps')
+    def test_worker_limit_respected(self, mock_ready, mock_execute):
+        """Test no more than max_workers notebooks execute at once."""
+        mock_ready.return_value = [self._step(n) for n in (6, 7, 8)]
+        lock = threading.Lock()
+        state = {'running': 0, 'peak': 0}
+
+        def execute(**kwargs):
+            with lock:
+                state['running'] += 1
+                state['peak'] = max(state['peak'], state['running'])
+            time.sleep(0.05)
+            with lock:
+                state['running'] -= 1
+            return {'success': True, 'error': None}
+        mock_execute.side_effect = execute
+
+        execute_ready_steps([1], max_workers=1, schema='test')
+
+        assert state['peak'] == 1
+        assert mock_execute.call_count == 3
+
+    @patch('helpers.step_scheduler.execute_next_step')
+    @patch('helpers.step_scheduler.get_ready_steps')
+    def test_failure_does_not_stop_other_steps(self, mock_ready, mock_execute):
+        """Test a failing or raising step is reported without cancelling the others."""
+        mock_ready.return_value = [self._step(6), self._step(7)]
+
+        def execute(step_num, **kwargs):
+            if step_num == 6:
+                raise RuntimeError('boom')
+            return {'success': True, 'error': None}
+        mock_execute.side_effect = execute
+
+        runs = execute_ready_steps([1], max_workers=2, schema='test')
+
+        assert runs[0]['result']['success'] is False
+        assert 'boom' in runs[0]['result']['error']
+        assert runs[1]['result']['success'] is True
+
+    def test_invalid_worker_count(self):
+        """Test max_workers below 1 is rejected."""
+        with pytest.raises(ValueError):
+            execute_ready_steps([1], max_workers=0, schema='test')
+
+
 class TestIntegrationStepChaining:
     """Integration tests for complete step chaining workflow."""
 
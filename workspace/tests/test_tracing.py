@@ -0,0 +1,240 @@
+"""
+Test suite for tracing (helpers.tracing)
+
+This test file validates:
+- Tracing is off by default and spans are no-ops
+- JSON-lines export: nesting, attributes, errors
+- Context ids (process-wide and scoped) and the traced decorator
+- Step summaries: top time sinks, API calls grouped by endpoint
+- Instrumented calls: Client.request (against the Moody's API simulator)
+  and Step.complete printing and storing time sinks
+- OpenTelemetry exporter requires opentelemetry-api
+
+All tests use temporary files and mocks and do not require a database.
+
+Run these tests:
+    pytest workspace/tests/test_tracing.py
+"""
+
+import json
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from helpers import tracing
+from helpers.tracing import (
+    TraceExporter,
+    configure_tracing,
+    set_trace_context,
+    span,
+    start_summary,
+    stop_summary,
+    trace_context,
+    traced,
+)
+
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+@pytest.fixture
+def trace_file(tmp_path):
+    """JSON-lines tracing for the test, switched off afterwards"""
+    path = tmp_path / 'traces.jsonl'
+    tracing._process_ids.clear()
+    configure_tracing(TraceExporter.JSONL, str(path))
+    yield path
+    configure_tracing(TraceExporter.NONE)
+    tracing._process_ids.clear()
+
+
+def read_spans(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+# ==============================================================================
+# SPAN TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_tracing_off_by_default(tmp_path):
+    """Without an exporter span() and traced functions do nothing extra"""
+    configure_tracing(TraceExporter.NONE)
+
+    assert span('anything') is tracing._NULL_SPAN
+    assert start_summary() is None
+
+    @traced('noop', describe=lambda: pytest.fail("describe called while tracing is off"))
+    def noop():
+        return 42
+
+    assert noop() == 42
+
+
+@pytest.mark.unit
+def test_jsonl_export_nesting_and_errors(trace_file):
+    """Finished spans are written with parent ids, attributes and errors"""
+    with span('outer', rows=3) as outer:
+        with span('inner'):
+            pass
+        outer.set_attribute('loaded', 2)
+    with pytest.raises(ValueError):
+        with span('failing'):
+            raise ValueError("bad value")
+
+    inner, outer, failing = read_spans(trace_file)
+    assert inner['name'] == 'inner'
+    assert inner['parent_id'] == outer['span_id']
+    assert inner['trace_id'] == outer['trace_id']
+    assert outer['parent_id'] is None
+    assert outer['attributes'] == {'rows': 3, 'loaded': 2}
+    assert failing['status'] == 'error'
+    assert failing['error'] == 'ValueError: bad value'
+    assert failing['trace_id'] != outer['trace_id']
+
+
+@pytest.mark.unit
+def test_context_ids(trace_file):
+    """Process-wide ids tag every span; scoped ids only spans inside the block"""
+    set_trace_context(cycle_id=1, step_id=7)
+    with trace_context(batch_id=5):
+        with span('in_batch'):
+            pass
+    with span('after_batch'):
+        pass
+    set_trace_context(step_id=None)
+    with span('after_step'):
+        pass
+
+    in_batch, after_batch, after_step = read_spans(trace_file)
+    assert in_batch['attributes'] == {'cycle_id': 1, 'step_id': 7, 'batch_id': 5}
+    assert after_batch['attributes'] == {'cycle_id': 1, 'step_id': 7}
+    assert after_step['attributes'] == {'cycle_id': 1}
+
+
+@pytest.mark.unit
+def test_traced_decorator(trace_file):
+    """describe adds span attributes; context ids also reach nested spans"""
+    @traced('job.submit', describe=lambda job_id, **kwargs: {'force': kwargs.get('force', False)},
+            context=lambda job_id, **kwargs: {'job_id': job_id})
+    def submit(job_id, force=False):
+        with span('moodys.request'):
+            return job_id
+
+    assert submit(9, force=True) == 9
+
+    request, submitted = read_spans(trace_file)
+    assert submitted['attributes'] == {'job_id': 9, 'force': True}
+    assert request['attributes'] == {'job_id': 9}
+    assert request['parent_id'] == submitted['span_id']
+
+
+# ==============================================================================
+# SUMMARY TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_summary_top_time_sinks(trace_file):
+    """Summaries rank span names by total time and group API calls by endpoint"""
+    summary = start_summary()
+    for _ in range(3):
+        with span('postgres.execute_query'):
+            time.sleep(0.01)
+    with span('notebook.execute'):
+        time.sleep(0.05)
+    for analysis_id in (11, 12):
+        with span('moodys.request', **{'http.method': 'GET', 'http.path': f'/platform/riskdata/v1/analyses/{analysis_id}/elt'}):
+            pass
+    stop_summary(summary)
+    with span('after_stop'):
+        pass
+
+    top = summary.top(3)
+    assert [name for name, _, _ in top[:2]] == ['notebook.execute', 'postgres.execute_query']
+    assert top[1][1] == 3
+    names = {name for name, _, _ in summary.top(10)}
+    assert 'moodys.request GET /platform/riskdata/v1/analyses/{id}/elt' in names
+    assert 'after_stop' not in names
+    assert summary.format(2).startswith("Top 2 time sinks:")
+
+
+# ==============================================================================
+# INSTRUMENTATION TESTS
+# ==============================================================================
+
+@pytest.mark.unit
+def test_client_request_spans(trace_file, monkeypatch):
+    """Moody's API requests are recorded with method, path and status code"""
+    from helpers.irp_integration.client import Client
+    from helpers.irp_integration.exceptions import IRPAPIError
+    from helpers.irp_integration.simulator import MoodysAPISimulator
+
+    with MoodysAPISimulator() as simulator:
+        monkeypatch.setenv('RISK_MODELER_BASE_URL', simulator.base_url)
+        client = Client()
+        client.request('GET', 'platform/riskdata/v1/exposures', params={'limit': 1})
+        with pytest.raises(IRPAPIError):
+            client.request('GET', 'platform/unknown')
+
+    ok, missing = read_spans(trace_file)
+    assert ok['name'] == 'moodys.request'
+    assert ok['attributes'] == {
+        'http.method': 'GET', 'http.path': '/platform/riskdata/v1/exposures', 'http.status_code': 200
+    }
+    assert missing['status'] == 'error'
+    assert missing['attributes']['http.status_code'] == 404
+
+
+@pytest.mark.unit
+def test_step_complete_reports_time_sinks(trace_file, capsys):
+    """Step.complete prints the run's top time sinks and stores them in _meta"""
+    from helpers import step as step_module
+
+    context = type('Context', (), {'step_id': 3})()
+    with patch.object(step_module, 'get_step_info', return_value={}), \
+         patch.object(step_module, 'get_last_step_run', return_value=None), \
+         patch.object(step_module, 'create_step_run', return_value=(21, 1)), \
+         patch.object(step_module, 'update_step_run') as update_step_run:
+        step = step_module.Step(context)
+        with span('postgres.execute_query'):
+            pass
+        step.complete({'records': 1})
+        with span('after_complete'):
+            pass
+
+    output = capsys.readouterr().out
+    assert "Top 1 time sinks:" in output
+    assert "postgres.execute_query" in output
+    time_sinks = update_step_run.call_args.kwargs['output_data']['_meta']['time_sinks']
+    assert [sink['name'] for sink in time_sinks] == ['postgres.execute_query']
+
+    spans = read_spans(trace_file)
+    assert spans[0]['attributes'] == {'step_run_id': 21}
+    assert spans[-1]['attributes'] == {}
+
+
+@pytest.mark.unit
+def test_sql_statement_attributes():
+    """SQL spans record a whitespace-normalized, truncated statement"""
+    from helpers.sqlserver import _statement_attributes
+
+    attributes = _statement_attributes("SELECT *\n  FROM portfolios\n WHERE x = 1" + " " * 10 + "y" * 300,
+                                       connection='AWS_DW')
+    assert attributes['db.statement'].startswith("SELECT * FROM portfolios WHERE x = 1 yyy")
+    assert len(attributes['db.statement']) == 200
+    assert attributes['db.connection'] == 'AWS_DW'
+
+
+@pytest.mark.unit
+def test_otel_exporter_requires_opentelemetry():
+    """Selecting the otel exporter without opentelemetry-api fails with an install hint"""
+    with patch.dict(sys.modules, {'opentelemetry': None}):
+        with pytest.raises(ImportError, match="pip install opentelemetry-api"):
+            configure_tracing(TraceExporter.OTEL)
+    configure_tracing(TraceExporter.NONE)
+
+    with pytest.raises(ValueError, match="Unknown TRACE_EXPORTER"):
+        configure_tracing('zipkin')
@@ -0,0 +1,266 @@
+"""
+Tests for job tracking log partitioning and maintenance
+
+Tests cover:
+- Monthly partitions created by init_database and ensure_tracking_log_partitions
+- Moving rows out of the default partition when a month's partition is created
+- Compaction of heartbeat rows in closed months
+- Retention by dropping old monthly partitions
+- Migrating an unpartitioned table with migrate_tracking_log_partitions.sql
+"""
+
+import pytest
+from datetime import date, datetime
+
+from helpers.database import execute_insert, execute_command, execute_scalar, init_database
+from helpers.tracking_log import (
+    tracking_log_partition_name,
+    list_tracking_log_partitions,
+    create_tracking_log_partition,
+    ensure_tracking_log_partitions,
+    compact_tracking_log,
+    purge_tracking_log,
+    run_tracking_log_maintenance,
+    TrackingLogError,
+    DEFAULT_PARTITION
+)
+
+
+# ============================================================================
+# Test Helpers
+# ============================================================================
+
+def create_test_job(test_schema, cycle_name):
+    """Helper to create cycle → stage → step → configuration → batch → job"""
+    cycle_id = execute_insert(
+        "INSERT INTO irp_cycle (cycle_name, status) VALUES (%s, %s)",
+        (cycle_name, 'ACTIVE'),
+        schema=test_schema
+    )
+    stage_id = execute_insert(
+        "INSERT INTO irp_stage (cycle_id, stage_num, stage_name) VALUES (%s, %s, %s)",
+        (cycle_id, 1, 'test_stage'),
+        schema=test_schema
+    )
+    step_id = execute_insert(
+        "INSERT INTO irp_step (stage_id, step_num, step_name) VALUES (%s, %s, %s)",
+        (stage_id, 1, 'test_step'),
+        schema=test_schema
+    )
+    config_id = execute_insert(
+        """INSERT INTO irp_configuration
+           (cycle_id, configuration_file_name, configuration_data, file_last_updated_ts)
+           VALUES (%s, %s, %s, NOW())""",
+        (cycle_id, '/test/config.xlsx', '{}'),
+        schema=test_schema
+    )
+    batch_id = execute_insert(
+        "INSERT INTO irp_batch (step_id, configuration_id, batch_type) VALUES (%s, %s, %s)",
+        (step_id, config_id, 'test_default'),
+        schema=test_schema
+    )
+    job_config_id = execute_insert(
+        """INSERT INTO irp_job_configuration (batch_id, configuration_id, job_configuration_data)
+           VALUES (%s, %s, %s)""",
+        (batch_id, config_id, '{}'),
+        schema=test_schema
+    )
+    return execute_insert(
+        "INSERT INTO irp_job (batch_id, job_configuration_id, moodys_workflow_id) VALUES (%s, %s, %s)",
+        (batch_id, job_config_id, 'WF-1'),
+        schema=test_schema
+    )
+
+
+def insert_tracking_rows(test_schema, job_id, rows):
+    """Insert (tracked_ts, job_status) tracking rows with a sizeable, poorly compressible payload"""
+    for tracked_ts, job_status in rows:
+        execute_command(
+            """INSERT INTO irp_job_tracking_log
+               (job_id, tracked_ts, moodys_workflow_id, job_status, tracking_data)
+               SELECT %s, %s, %s, %s, jsonb_build_object('payload', string_agg(md5(random()::text), ''))
+               FROM generate_series(1, 60)""",
+            (job_id, tracked_ts, 'WF-1', job_status),
+            schema=test_schema
+        )
+
+
+def count_rows(test_schema, table):
+    return execute_scalar(f"SELECT COUNT(*) FROM {table}", schema=test_schema)
+
+
+# ============================================================================
+# Tests - Partitions
+# ============================================================================
+
+@pytest.mark.unit
+def test_partition_name():
+    """Test monthly partition naming"""
+    assert tracking_log_partition_name(date(2025, 1, 17)) == 'irp_job_tracking_log_2025_01'
+
+
+@pytest.mark.database
+@pytest.mark.unit
+def test_init_creates_current_month_and_default_partition(test_schema):
+    """Test init_database creates the current month's partition and the default partition"""
+    partitions = list_tracking_log_partitions(schema=test_schema)
+    names = [p['name'] for p in partitions]
+
+    assert tracking_log_partition_name(date.today()) in names
+    assert names[-1] == DEFAULT_PARTITION
+
+
+@pytest.mark.database
+@pytest.mark.unit
+def test_ensure_partitions_is_idempotent(test_schema):
+    """Test ensure_tracking_log_partitions creates nothing when partitions exist"""
+    ensure_tracking_log_partitions(months_ahead=3, schema=test_schema)
+
+    assert ensure_tracking_log_partitions(months_ahead=3, schema=test_schema) == []
+
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_create_partition_moves_default_rows(test_schema):
+    """Test rows in the default partition move into a newly created month partition"""
+    job_id = create_test_job(test_schema, 'test_tracking_move')
+    insert_tracking_rows(test_schema, job_id, [(datetime(2020, 1, 5), 'RUNNING')])
+    assert count_rows(test_schema, DEFAULT_PARTITION) == 1
+
+    name = create_tracking_log_partition(date(2020, 1, 1), schema=test_schema)
+
+    assert count_rows(test_schema, DEFAULT_PARTITION) == 0
+    assert count_rows(test_schema, name) == 1
+
+    purge_tracking_log(retention_months=12, schema=test_schema)
+
+
+# ============================================================================
+# Tests - Compaction and Retention
+# ============================================================================
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_compact_removes_heartbeats(test_schema):
+    """Test compaction keeps only status transitions and reports storage savings"""
+    job_id = create_test_job(test_schema, 'test_tracking_compact')
+    name = create_tracking_log_partition(date(2020, 2, 1), schema=test_schema)
+    insert_tracking_rows(test_schema, job_id, [
+        (datetime(2020, 2, 1, 0, minute), 'RUNNING') for minute in range(50)
+    ] + [(datetime(2020, 2, 2), 'FINISHED')])
+
+    result = compact_tracking_log(schema=test_schema)
+
+    assert name in result['partitions_compacted']
+    assert result['rows_deleted'] == 49
+    assert result['bytes_reclaimed'] > 0
+    statuses = execute_scalar(
+        f"SELECT string_agg(job_status::text, ',' ORDER BY tracked_ts) FROM {name}",
+        schema=test_schema
+    )
+    assert statuses == 'RUNNING,FINISHED'
+
+    purge_tracking_log(retention_months=12, schema=test_schema)
+
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_compact_skips_current_month(test_schema):
+    """Test compaction does not touch the live (current month) partition"""
+    job_id = create_test_job(test_schema, 'test_tracking_live')
+    insert_tracking_rows(test_schema, job_id, [(datetime.now(), 'RUNNING'), (datetime.now(), 'RUNNING')])
+
+    result = compact_tracking_log(vacuum=False, schema=test_schema)
+
+    assert tracking_log_partition_name(date.today()) not in result['partitions_compacted']
+    assert execute_scalar(
+        "SELECT COUNT(*) FROM irp_job_tracking_log WHERE job_id = %s", (job_id,), schema=test_schema
+    ) == 2
+
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_purge_drops_old_partitions(test_schema):
+    """Test retention drops whole monthly partitions and old default-partition rows"""
+    job_id = create_test_job(test_schema, 'test_tracking_purge')
+    name = create_tracking_log_partition(date(2020, 3, 1), schema=test_schema)
+    insert_tracking_rows(test_schema, job_id, [
+        (datetime(2020, 3, 10), 'RUNNING'),
+        (datetime(2019, 6, 1), 'RUNNING')
+    ])
+
+    result = purge_tracking_log(retention_months=12, schema=test_schema)
+
+    assert name in result['partitions_dropped']
+    assert result['rows_deleted'] == 1
+    assert result['bytes_reclaimed'] > 0
+    assert name not in [p['name'] for p in list_tracking_log_partitions(schema=test_schema)]
+
+
+@pytest.mark.database
+@pytest.mark.unit
+def test_purge_invalid_retention(test_schema):
+    """Test purge rejects a retention window below one month"""
+    with pytest.raises(TrackingLogError):
+        purge_tracking_log(retention_months=0, schema=test_schema)
+
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_run_maintenance_reports_sizes(test_schema):
+    """Test full maintenance run returns before/after storage"""
+    result = run_tracking_log_maintenance(retention_months=12, schema=test_schema)
+
+    assert result['partitions_created'] == []
+    assert result['bytes_reclaimed'] == result['bytes_before'] - result['bytes_after']
+
+
+# ============================================================================
+# Tests - Migration
+# ============================================================================
+
+@pytest.mark.database
+@pytest.mark.integration
+def test_migrate_unpartitioned_tracking_log(test_schema):
+    """Test the migration script partitions an old-layout table, keeps its rows and ids, and is idempotent"""
+    job_id = create_test_job(test_schema, 'test_tracking_migrate')
+
+    # Recreate the table as it was before partitioning
+    execute_command("DROP TABLE irp_job_tracking_log", schema=test_schema)
+    execute_command(
+        """CREATE TABLE irp_job_tracking_log (
+               id SERIAL PRIMARY KEY,
+               job_id INTEGER NOT NULL,
+               tracked_ts TIMESTAMPTZ DEFAULT NOW(),
+               moodys_workflow_id VARCHAR(50) NOT NULL,
+               job_status job_status_enum NOT NULL,
+               tracking_data JSONB NULL,
+               CONSTRAINT fk_tracking_job FOREIGN KEY (job_id) REFERENCES irp_job(id) ON DELETE CASCADE
+           )""",
+        schema=test_schema
+    )
+    execute_command("CREATE INDEX idx_tracking_job ON irp_job_tracking_log(job_id)", schema=test_schema)
+    execute_command("CREATE INDEX idx_tracking_ts ON irp_job_tracking_log(tracked_ts DESC)", schema=test_schema)
+    insert_tracking_rows(test_schema, job_id, [
+        (datetime(2020, 3, 5), 'SUBMITTED'),
+        (datetime(2020, 5, 20), 'RUNNING'),
+        (datetime.now(), 'FINISHED'),
+    ])
+    max_id = execute_scalar("SELECT MAX(id) FROM irp_job_tracking_log", schema=test_schema)
+
+    assert init_database(schema=test_schema, sql_file_name='migrate_tracking_log_partitions.sql')
+    assert init_database(schema=test_schema, sql_file_name='migrate_tracking_log_partitions.sql')
+
+    names = [p['name'] for p in list_tracking_log_partitions(schema=test_schema)]
+    for month in [date(2020, 3, 1), date(2020, 4, 1), date(2020, 5, 1), date.today()]:
+        assert tracking_log_partition_name(month) in names
+    assert DEFAULT_PARTITION in names
+    assert count_rows(test_schema, 'irp_job_tracking_log') == 3
+    assert count_rows(test_schema, DEFAULT_PARTITION) == 0
+    assert count_rows(test_schema, 'irp_job_tracking_log_unpartitioned') == 3
+
+    insert_tracking_rows(test_schema, job_id, [(datetime.now(), 'FINISHED')])
+    assert execute_scalar("SELECT MAX(id) FROM irp_job_tracking_log", schema=test_schema) == max_id + 1
+
+    execute_command("DROP TABLE irp_job_tracking_log_unpartitioned", schema=test_schema)
+    assert count_rows(test_schema, 'irp_job_tracking_log') == 4